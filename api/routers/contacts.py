@@ -17,6 +17,7 @@ from fastapi import APIRouter, HTTPException, Depends, Query, Path, Body
 from pydantic import BaseModel, Field, validator
 
 from mwa_core.storage.manager import get_storage_manager
+from mwa_core.storage.pagination import InvalidCursorError
 from mwa_core.storage.models import Contact, ContactType, ContactStatus
 from mwa_core.config.settings import get_settings
 
@@ -133,11 +134,17 @@ async def get_contacts(
     offset: int = Query(0, ge=0, description="Pagination offset"),
     sort_by: str = Query("confidence", pattern="^(confidence|created_at|updated_at|value)$", description="Sort field"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$", description="Pagination mode"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (implies cursor pagination)"),
     storage_manager = Depends(get_storage_manager_instance)
 ):
     """
     Retrieve contacts with optional filtering and pagination.
     
+    With cursor pagination, contacts are returned newest first and each
+    response carries a ``next_cursor`` for the following page; ``offset``
+    and the sort parameters are ignored.
+    
     Args:
         contact_type: Filter by contact type
         status: Filter by contact status
@@ -148,12 +155,43 @@ async def get_contacts(
         offset: Pagination offset
         sort_by: Field to sort by
         sort_order: Sort order (asc/desc)
+        pagination: Pagination mode (offset/cursor)
+        cursor: Opaque cursor returned with the previous page
         storage_manager: Storage manager instance
         
     Returns:
         Paginated list of contacts
     """
+    filters = {
+        "contact_type": contact_type,
+        "status": status,
+        "confidence_min": confidence_min,
+        "confidence_max": confidence_max,
+        "listing_id": listing_id
+    }
+    
     try:
+        if cursor or pagination == "cursor":
+            contacts, next_cursor = storage_manager.get_contacts_by_cursor(
+                cursor=cursor,
+                limit=limit,
+                listing_id=listing_id,
+                contact_type=contact_type,
+                status=status,
+                confidence_min=confidence_min,
+                confidence_max=confidence_max
+            )
+            return {
+                "contacts": contacts,
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "filters": filters,
+                "sort": {
+                    "sort_by": "created_at",
+                    "sort_order": "desc"
+                }
+            }
+        
         # Get contacts from storage
         contacts = storage_manager.get_contacts(
             listing_id=listing_id,
@@ -200,19 +238,15 @@ async def get_contacts(
             "total": total_count,
             "limit": limit,
             "offset": offset,
-            "filters": {
-                "contact_type": contact_type,
-                "status": status,
-                "confidence_min": confidence_min,
-                "confidence_max": confidence_max,
-                "listing_id": listing_id
-            },
+            "filters": filters,
             "sort": {
                 "sort_by": sort_by,
                 "sort_order": sort_order
             }
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving contacts: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving contacts: {str(e)}")
@@ -692,7 +726,7 @@ async def export_contacts(
             search_result = await search_contacts(request.filters, storage_manager)
             contacts = search_result["contacts"]
         else:
-            contacts = storage_manager.get_contacts(limit=10000)
+            contacts = storage_manager.iter_contacts()
         
         # Prepare export data
         export_data = []
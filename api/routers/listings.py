@@ -17,6 +17,7 @@ from fastapi import APIRouter, HTTPException, Depends, Query, Path, Body
 from pydantic import BaseModel, Field, validator
 
 from mwa_core.storage.manager import get_storage_manager
+from mwa_core.storage.pagination import InvalidCursorError
 from mwa_core.storage.models import Listing, ListingStatus
 from mwa_core.config.settings import get_settings
 
@@ -127,11 +128,17 @@ async def get_listings(
     offset: int = Query(0, ge=0, description="Pagination offset"),
     sort_by: str = Query("created_at", pattern="^(created_at|updated_at|price|title)$", description="Sort field"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$", description="Pagination mode"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (implies cursor pagination)"),
     storage_manager = Depends(get_storage_manager_instance)
 ):
     """
     Retrieve listings with optional filtering and pagination.
     
+    With cursor pagination, listings are returned newest first and each
+    response carries a ``next_cursor`` for the following page; ``offset``
+    and the sort parameters are ignored.
+    
     Args:
         provider: Filter by provider name
         status: Filter by listing status
@@ -143,72 +150,73 @@ async def get_listings(
         offset: Pagination offset
         sort_by: Field to sort by
         sort_order: Sort order (asc/desc)
+        pagination: Pagination mode (offset/cursor)
+        cursor: Opaque cursor returned with the previous page
         storage_manager: Storage manager instance
         
     Returns:
         Paginated list of listings
     """
+    filters = {
+        "provider": provider,
+        "status": status,
+        "price_min": price_min,
+        "price_max": price_max,
+        "date_from": date_from.isoformat() if date_from else None,
+        "date_to": date_to.isoformat() if date_to else None
+    }
+    
     try:
-        # Get listings from storage
-        listings = storage_manager.get_listings(
+        if cursor or pagination == "cursor":
+            listings, next_cursor = storage_manager.get_listings_by_cursor(
+                cursor=cursor,
+                limit=limit,
+                provider=provider,
+                status=status,
+                price_min=price_min,
+                price_max=price_max,
+                date_from=date_from,
+                date_to=date_to
+            )
+            return {
+                "listings": listings,
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "filters": filters,
+                "sort": {
+                    "sort_by": "scraped_at",
+                    "sort_order": "desc"
+                }
+            }
+        
+        # Filtering, sorting and counting are done by the database
+        paginated_listings, total_count = storage_manager.get_listings_page(
             limit=limit,
             offset=offset,
             provider=provider,
-            status=status
+            status=status,
+            price_min=price_min,
+            price_max=price_max,
+            date_from=date_from,
+            date_to=date_to,
+            sort_by=sort_by,
+            sort_order=sort_order
         )
         
-        # Apply additional filters (price, date range)
-        filtered_listings = []
-        for listing in listings:
-            # Price filter
-            if price_min is not None and (listing.get('price') is None or listing['price'] < price_min):
-                continue
-            if price_max is not None and (listing.get('price') is None or listing['price'] > price_max):
-                continue
-            
-            # Date filter
-            listing_date = _get_listing_datetime(listing)
-            if date_from and listing_date < date_from:
-                continue
-            if date_to and listing_date > date_to:
-                continue
-            
-            filtered_listings.append(listing)
-        
-        # Apply sorting
-        reverse_order = sort_order == "desc"
-        if sort_by == "price":
-            filtered_listings.sort(key=lambda x: x.get('price', 0), reverse=reverse_order)
-        elif sort_by == "title":
-            filtered_listings.sort(key=lambda x: x.get('title', ''), reverse=reverse_order)
-        else:  # created_at or updated_at
-            filtered_listings.sort(key=lambda x: x.get(sort_by, ''), reverse=reverse_order)
-        
-        # Get total count for pagination
-        total_count = len(filtered_listings)
-        
-        # Apply pagination after filtering and sorting
-        paginated_listings = filtered_listings[offset:offset + limit]
-        
         return {
             "listings": paginated_listings,
             "total": total_count,
             "limit": limit,
             "offset": offset,
-            "filters": {
-                "provider": provider,
-                "status": status,
-                "price_min": price_min,
-                "price_max": price_max,
-                "date_from": date_from.isoformat() if date_from else None,
-                "date_to": date_to.isoformat() if date_to else None
-            },
+            "filters": filters,
             "sort": {
                 "sort_by": sort_by,
                 "sort_order": sort_order
             }
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving listings: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving listings: {str(e)}")
@@ -594,7 +602,7 @@ async def export_listings(
             search_result = await search_listings(request.filters, storage_manager)
             listings = search_result["listings"]
         else:
-            listings = storage_manager.get_listings(limit=10000)
+            listings = storage_manager.iter_listings()
         
         # Prepare export data
         export_data = []
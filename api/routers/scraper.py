@@ -11,21 +11,33 @@ Provides endpoints for managing and controlling scraper operations, including:
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, HTTPException, Depends, Query, Body
 from pydantic import BaseModel, Field, validator
 
 from mwa_core.orchestrator.orchestrator import Orchestrator
+from mwa_core.orchestrator.runs import RunRegistry, ScraperRun
 from mwa_core.scraper.engine import ScraperEngine
 from mwa_core.storage.manager import get_storage_manager
+from mwa_core.storage.pagination import InvalidCursorError
 from mwa_core.config.settings import get_settings
+from mafa.driver import get_driver_pool_metrics
+from api.ws.manager import websocket_manager
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Scraper runs started through the API execute on this pool so they never
+# block the event loop; the registry keeps their status for polling
+SCRAPER_RUN_WORKERS = 2
+run_registry = RunRegistry()
+_run_executor: Optional[ThreadPoolExecutor] = None
+_run_tasks: Set[asyncio.Task] = set()
+
 
 # Pydantic models for scraper requests/responses
 class ScraperStatusResponse(BaseModel):
@@ -100,8 +112,29 @@ class ScraperProviderInfo(BaseModel):
 
 # Dependency to get orchestrator
 def get_orchestrator_instance() -> Orchestrator:
-    """Get the orchestrator instance."""
-    return Orchestrator()
+    """Get an orchestrator whose scraper engine is configured from settings."""
+    settings = get_settings()
+    scraper = ScraperEngine(
+        max_workers=settings.scraper.max_concurrent_providers,
+        provider_timeout=settings.scraper.provider_timeout_seconds
+    )
+    return Orchestrator(scraper=scraper, settings=settings)
+
+
+# Dependency to get the run registry
+def get_run_registry() -> RunRegistry:
+    """Get the registry of background scraper runs."""
+    return run_registry
+
+
+def get_run_executor() -> ThreadPoolExecutor:
+    """Get the worker pool background scraper runs execute on."""
+    global _run_executor
+    if _run_executor is None:
+        _run_executor = ThreadPoolExecutor(
+            max_workers=SCRAPER_RUN_WORKERS, thread_name_prefix="scraper-run"
+        )
+    return _run_executor
 
 
 # Dependency to get storage manager
@@ -131,6 +164,7 @@ async def get_scraper_status(
             "initialized": True,
             "providers_loaded": len(["immoscout", "wg_gesucht"]),  # Simplified
             "contact_discovery_enabled": True,  # From settings
+            "driver_pools": get_driver_pool_metrics(),
         }
         
         # Get orchestrator status
@@ -199,19 +233,25 @@ async def get_scraper_status(
         raise HTTPException(status_code=500, detail=f"Error getting scraper status: {str(e)}")
 
 
-@router.post("/start", response_model=ScraperRunResponse, summary="Start scraper run")
+@router.post("/start", response_model=ScraperRunResponse, status_code=202, summary="Start scraper run")
 async def start_scraper(
     request: ScraperStartRequest,
     orchestrator: Orchestrator = Depends(get_orchestrator_instance),
-    settings = Depends(get_settings)
+    settings = Depends(get_settings),
+    registry: RunRegistry = Depends(get_run_registry)
 ):
     """
     Start a new scraper run with specified providers.
     
+    The run executes on a worker pool; the response only carries its ID.
+    Progress is broadcast to the ``scraper`` WebSocket room, and the run's
+    status and timings are available from ``/runs/{run_id}``.
+    
     Args:
         request: Scraper start request
         orchestrator: Orchestrator instance
         settings: Settings instance
+        registry: Run registry
         
     Returns:
         Scraper run information
@@ -223,44 +263,26 @@ async def start_scraper(
             if provider not in valid_providers:
                 raise HTTPException(status_code=400, detail=f"Invalid provider: {provider}")
         
-        # Prepare configuration
-        config = settings.scraper.dict()
-        if request.config_overrides:
-            config.update(request.config_overrides)
+        # Prepare the configuration of each provider
+        try:
+            config = {
+                provider: settings.get_provider_config(provider, request.config_overrides)
+                for provider in request.providers
+            }
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid configuration overrides: {e}")
         
-        # Run scraper in background
-        run_id = f"manual_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        try:
+            run = registry.create(request.providers, config, run_id=request.job_id)
+        except ValueError as e:
+            raise HTTPException(status_code=409, detail=str(e))
         
-        # Note: This is a simplified implementation
-        # In production, you would run the scraper asynchronously
-        # and return a job ID for tracking
+        # Run scraper in background
+        task = asyncio.create_task(_execute_run(orchestrator, run))
+        _run_tasks.add(task)
+        task.add_done_callback(_run_tasks.discard)
         
-        try:
-            new_count = orchestrator.run(request.providers, config)
-            
-            return ScraperRunResponse(
-                run_id=run_id,
-                status="completed",
-                started_at=datetime.now(),
-                completed_at=datetime.now(),
-                providers=request.providers,
-                config_used=config,
-                results={
-                    "new_listings": new_count,
-                    "providers_used": len(request.providers)
-                },
-                duration_seconds=0.0  # Would calculate actual duration
-            )
-            
-        except Exception as e:
-            return ScraperRunResponse(
-                run_id=run_id,
-                status="failed",
-                started_at=datetime.now(),
-                providers=request.providers,
-                config_used=config,
-                error_details=[str(e)]
-            )
+        return _run_response(run)
         
     except HTTPException:
         raise
@@ -269,6 +291,56 @@ async def start_scraper(
         raise HTTPException(status_code=500, detail=f"Error starting scraper: {str(e)}")
 
 
+async def _execute_run(orchestrator: Orchestrator, run: ScraperRun) -> None:
+    """Execute a registered run on the worker pool and broadcast its progress."""
+    run.start()
+    await _broadcast_run(run)
+    
+    async def on_progress(event: Dict[str, Any]) -> None:
+        run.record_progress(event)
+        await _broadcast_run(run)
+    
+    try:
+        new_count = await orchestrator.run_async(
+            run.providers, run.config, progress=on_progress, executor=get_run_executor()
+        )
+        run.complete(new_count)
+    except Exception as e:
+        logger.error(f"Scraper run {run.run_id} failed: {e}")
+        run.fail(str(e))
+    
+    await _broadcast_run(run)
+
+
+async def _broadcast_run(run: ScraperRun) -> None:
+    """Send a run's status to WebSocket clients."""
+    try:
+        await websocket_manager.broadcast_scraper_progress({
+            "job_id": run.run_id,
+            "status": run.status.value,
+            "progress": run.progress,
+            "results": run.get_results(),
+            "duration_seconds": run.duration_seconds
+        })
+    except Exception as e:
+        logger.warning(f"Could not broadcast progress of run {run.run_id}: {e}")
+
+
+def _run_response(run: ScraperRun) -> ScraperRunResponse:
+    """Build the API response for a registered run."""
+    return ScraperRunResponse(
+        run_id=run.run_id,
+        status=run.status.value,
+        started_at=run.started_at or run.created_at,
+        completed_at=run.completed_at,
+        providers=run.providers,
+        config_used=run.config,
+        results=run.get_results(),
+        error_details=run.errors or None,
+        duration_seconds=run.duration_seconds
+    )
+
+
 @router.get("/statistics", response_model=ScraperStatsResponse, summary="Get scraper statistics")
 async def get_scraper_statistics(
     orchestrator: Orchestrator = Depends(get_orchestrator_instance),
@@ -618,14 +690,20 @@ async def test_scraper_config(
 async def get_recent_runs(
     limit: int = Query(50, ge=1, le=200, description="Number of runs to retrieve"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (replaces offset)"),
     storage_manager = Depends(get_storage_manager_instance)
 ):
     """
     Get information about recent scraper runs.
     
+    Runs are paged newest first by ``(started_at, id)``. Pass the returned
+    ``next_cursor`` to fetch the following page; ``offset`` is only honoured
+    when no cursor is given.
+    
     Args:
         limit: Maximum number of runs to return
         offset: Pagination offset
+        cursor: Opaque cursor returned with the previous page
         storage_manager: Storage manager instance
         
     Returns:
@@ -633,55 +711,99 @@ async def get_recent_runs(
     """
     try:
         try:
+            if offset and not cursor:
+                # Legacy offset paging
+                with storage_manager.get_session() as session:
+                    from mwa_core.storage.models import ScrapingRun
+                    
+                    runs = session.query(ScrapingRun).order_by(
+                        ScrapingRun.started_at.desc(), ScrapingRun.id.desc()
+                    ).offset(offset).limit(limit).all()
+                    runs = [run.to_dict() for run in runs]
+                next_cursor = None
+            else:
+                runs, next_cursor = storage_manager.get_scraping_runs_by_cursor(
+                    cursor=cursor, limit=limit
+                )
+            
+            runs_data = []
+            for run in runs:
+                runs_data.append({
+                    "id": run["id"],
+                    "provider": run["provider"],
+                    "status": run["status"],
+                    "started_at": run["started_at"],
+                    "completed_at": run["completed_at"],
+                    "listings_found": run["listings_found"],
+                    "duration_seconds": _run_duration_seconds(run),
+                    "error_details": run["errors"]
+                })
+            
+            # Get total count for pagination
             with storage_manager.get_session() as session:
                 from mwa_core.storage.models import ScrapingRun
                 
-                # Get recent runs
-                runs = session.query(ScrapingRun).order_by(
-                    ScrapingRun.created_at.desc()
-                ).offset(offset).limit(limit).all()
-                
-                runs_data = []
-                for run in runs:
-                    duration = None
-                    if run.completed_at and run.created_at:
-                        duration = (run.completed_at - run.created_at).total_seconds()
-                    
-                    runs_data.append({
-                        "id": run.id,
-                        "provider": run.provider,
-                        "status": run.status.value,
-                        "started_at": run.created_at.isoformat(),
-                        "completed_at": run.completed_at.isoformat() if run.completed_at else None,
-                        "listings_found": run.listings_found,
-                        "duration_seconds": duration,
-                        "error_details": run.errors
-                    })
-                
-                # Get total count for pagination
                 total_count = session.query(ScrapingRun).count()
+            
+            return {
+                "runs": runs_data,
+                "total": total_count,
+                "limit": limit,
+                "offset": offset,
+                "next_cursor": next_cursor
+            }
                 
-                return {
-                    "runs": runs_data,
-                    "total": total_count,
-                    "limit": limit,
-                    "offset": offset
-                }
-                
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.warning(f"Could not get recent runs: {e}")
             return {
                 "runs": [],
                 "total": 0,
                 "limit": limit,
-                "offset": offset
+                "offset": offset,
+                "next_cursor": None
             }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting recent scraper runs: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting recent scraper runs: {str(e)}")
 
 
+@router.get("/runs/{run_id}", response_model=ScraperRunResponse, summary="Get a scraper run")
+async def get_run(
+    run_id: str,
+    registry: RunRegistry = Depends(get_run_registry)
+):
+    """
+    Get the status, progress and timings of a run started via ``/start``.
+    
+    Args:
+        run_id: Run ID returned by ``/start``
+        registry: Run registry
+        
+    Returns:
+        Scraper run information
+    """
+    run = registry.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
+    return _run_response(run)
+
+
+def _run_duration_seconds(run: Dict[str, Any]) -> Optional[float]:
+    """Compute a run's duration from its serialized timestamps."""
+    if run.get("duration_seconds") is not None:
+        return run["duration_seconds"]
+    if not run.get("completed_at") or not run.get("started_at"):
+        return None
+    started_at = datetime.fromisoformat(run["started_at"])
+    completed_at = datetime.fromisoformat(run["completed_at"])
+    return (completed_at - started_at).total_seconds()
+
+
 # Search Management Endpoints
 @router.get("/configurations", summary="Get search configurations")
 async def get_search_configurations():
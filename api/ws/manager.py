@@ -467,6 +467,8 @@ class WebSocketManager:
                 "status": progress_data.get("status"),
                 "progress": progress_data.get("progress", 0),
                 "estimated_completion": progress_data.get("estimated_completion"),
+                "results": progress_data.get("results", {}),
+                "duration_seconds": progress_data.get("duration_seconds"),
                 "timestamp": datetime.now().isoformat()
             }
         )
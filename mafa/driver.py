@@ -5,16 +5,21 @@ Provides a context manager ``SeleniumDriver`` that automatically installs the
 appropriate ChromeDriver version via ``webdriver_manager`` and configures a
 head‑less Chrome instance with anti-detection measures. The driver is guaranteed
 to be quit on exit, preventing orphaned browser processes.
+
+``SeleniumDriverPool`` keeps such browsers warm and leases them to scrapers so
+that scheduled cycles do not pay for a Chrome launch on every attempt.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import threading
 import time
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
-from typing import Generator, List
+from typing import Any, Callable, Dict, Generator, List
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -374,4 +379,316 @@ class SeleniumDriver(AbstractContextManager):
             raise
         except Exception as e:
             logger.error(f"Error waiting for clickable element {by}='{selector}': {e}")
-            raise SeleniumDriverError(f"Clickable element wait failed: {e}")
\ No newline at end of file
+            raise SeleniumDriverError(f"Clickable element wait failed: {e}")
+
+class _PooledDriver:
+    """Bookkeeping for one browser owned by a ``SeleniumDriverPool``."""
+
+    __slots__ = ("driver", "uses", "created_at")
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+class SeleniumDriverPool:
+    """
+    Pool of warm Chrome instances leased to scrapers.
+
+    Launching Chrome dominates short scraping cycles, so browsers are kept
+    alive between runs. Each lease gets a clean browser: cookies, cache and
+    web storage are cleared when it is returned. A browser is recycled after
+    ``max_uses`` leases, or when it fails a health check (e.g. after a crash).
+
+    Example
+    -------
+    >>> pool = SeleniumDriverPool(size=2)
+    >>> with pool.lease() as driver:
+    ...     driver.get("https://example.com")
+    >>> pool.close()
+    """
+
+    def __init__(self, size: int = 2, max_uses: int = 50, headless: bool = True,
+                 user_agent: str | None = None, timeout: int = 30,
+                 driver_path: Path | None = None,
+                 driver_factory: Callable[[], webdriver.Chrome] | None = None):
+        """
+        Parameters
+        ----------
+        size: int, optional
+            Maximum number of browsers (default: 2).
+        max_uses: int, optional
+            Leases after which a browser is replaced (default: 50).
+        headless, user_agent, timeout, driver_path:
+            Passed to ``SeleniumDriver`` when launching a browser.
+        driver_factory: callable, optional
+            Creates a new driver; overrides the ``SeleniumDriver`` launch.
+        """
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.timeout = timeout
+        self._factory = driver_factory or (
+            lambda: SeleniumDriver(headless=headless, driver_path=driver_path,
+                                   user_agent=user_agent, timeout=timeout).__enter__()
+        )
+        self._idle: List[_PooledDriver] = []
+        self._total = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._metrics = {
+            "created": 0,
+            "recycled": 0,
+            "crashed": 0,
+            "leases": 0,
+            "warm_leases": 0,
+            "lease_wait_seconds": 0.0,
+        }
+
+    def warm_up(self, count: int | None = None) -> int:
+        """
+        Launch browsers ahead of time so the next leases start warm.
+
+        Parameters
+        ----------
+        count: int, optional
+            Number of idle browsers wanted (default: pool size).
+
+        Returns
+        -------
+        int
+            Number of browsers launched.
+        """
+        wanted = min(count or self.size, self.size)
+        launched = 0
+        while True:
+            with self._condition:
+                if self._closed or len(self._idle) >= wanted or self._total >= self.size:
+                    return launched
+                self._total += 1
+            try:
+                pooled = self._launch()
+            except Exception:
+                with self._condition:
+                    self._total -= 1
+                raise
+            with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+            launched += 1
+
+    @contextmanager
+    def lease(self, timeout: float | None = None) -> Generator[webdriver.Chrome, None, None]:
+        """
+        Lease a browser for the duration of the ``with`` block.
+
+        Parameters
+        ----------
+        timeout: float, optional
+            Seconds to wait for a free browser (default: wait indefinitely).
+
+        Raises
+        ------
+        SeleniumDriverError
+            If no browser becomes available in time or the pool is closed.
+        """
+        pooled = self._acquire(timeout)
+        failed = False
+        try:
+            yield pooled.driver
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._release(pooled, failed)
+
+    def _launch(self) -> _PooledDriver:
+        driver = self._factory()
+        with self._condition:
+            self._metrics["created"] += 1
+        logger.info("Launched pooled Chrome driver")
+        return _PooledDriver(driver)
+
+    def _acquire(self, timeout: float | None) -> _PooledDriver:
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise SeleniumDriverError("Driver pool is closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                    self._metrics["warm_leases"] += 1
+                    break
+                if self._total < self.size:
+                    self._total += 1
+                    pooled = None
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise SeleniumDriverError(f"No pooled driver available after {timeout}s")
+                self._condition.wait(remaining)
+
+            self._metrics["leases"] += 1
+            self._metrics["lease_wait_seconds"] += time.monotonic() - start
+
+        if pooled is None:
+            try:
+                pooled = self._launch()
+            except Exception:
+                with self._condition:
+                    self._total -= 1
+                    self._condition.notify()
+                raise
+
+        pooled.uses += 1
+        return pooled
+
+    def _release(self, pooled: _PooledDriver, failed: bool) -> None:
+        keep = not (failed and not self._is_healthy(pooled.driver))
+        if not keep:
+            logger.warning("Pooled Chrome driver failed health check, replacing it")
+            with self._condition:
+                self._metrics["crashed"] += 1
+        elif pooled.uses >= self.max_uses:
+            keep = False
+            with self._condition:
+                self._metrics["recycled"] += 1
+        else:
+            keep = self._reset(pooled.driver)
+
+        with self._condition:
+            if keep and not self._closed:
+                self._idle.append(pooled)
+            else:
+                self._total -= 1
+                keep = False
+            self._condition.notify()
+
+        if not keep:
+            self._quit(pooled.driver)
+
+    def _reset(self, driver: webdriver.Chrome) -> bool:
+        """Clear cookies, cache and web storage so the next lease starts clean."""
+        try:
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # Pages like about:blank have no storage
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            except Exception:
+                driver.delete_all_cookies()
+            driver.get("about:blank")
+            driver.set_page_load_timeout(self.timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not reset pooled Chrome driver: {e}")
+            return False
+
+    @staticmethod
+    def _is_healthy(driver: webdriver.Chrome) -> bool:
+        try:
+            return driver.execute_script("return 1") == 1 and bool(driver.window_handles)
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing pooled Chrome driver: {e}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get pool metrics.
+
+        Returns
+        -------
+        dict
+            Pool size, idle/leased browsers and lifetime counters.
+        """
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics.update({
+                "size": self.size,
+                "max_uses": self.max_uses,
+                "browsers": self._total,
+                "idle": len(self._idle),
+                "leased": self._total - len(self._idle),
+            })
+        leases = metrics["leases"]
+        metrics["warm_lease_ratio"] = metrics["warm_leases"] / leases if leases else 0.0
+        metrics["avg_lease_wait_seconds"] = metrics["lease_wait_seconds"] / leases if leases else 0.0
+        return metrics
+
+    def close(self) -> None:
+        """Quit all idle browsers; leased browsers are quit when returned."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._condition.notify_all()
+        for pooled in idle:
+            self._quit(pooled.driver)
+
+
+_pools: Dict[tuple, SeleniumDriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(headless: bool = True, user_agent: str | None = None,
+                    size: int = 2, max_uses: int = 50, timeout: int = 30) -> SeleniumDriverPool:
+    """
+    Get the shared driver pool for a browser configuration.
+
+    Browsers are launched with fixed options, so there is one pool per
+    ``(headless, user_agent)`` combination. ``size``, ``max_uses`` and
+    ``timeout`` only apply when the pool is first created.
+    """
+    key = (headless, user_agent)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = SeleniumDriverPool(size=size, max_uses=max_uses, headless=headless,
+                                      user_agent=user_agent, timeout=timeout)
+            _pools[key] = pool
+        return pool
+
+
+def get_driver_pool_metrics() -> List[Dict[str, Any]]:
+    """Metrics of all shared driver pools."""
+    with _pools_lock:
+        pools = list(_pools.items())
+    return [
+        dict(pool.get_metrics(), headless=headless, user_agent=user_agent)
+        for (headless, user_agent), pool in pools
+    ]
+
+
+@atexit.register
+def close_driver_pools() -> None:
+    """Quit the browsers of all shared driver pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def driver_session(headless: bool = True, user_agent: str | None = None, timeout: int = 30,
+                   pooled: bool = True, pool_size: int = 2, max_uses: int = 50):
+    """
+    Context manager yielding a Chrome driver for one scraping attempt.
+
+    Leases a warm browser from the shared pool, or launches a dedicated
+    ``SeleniumDriver`` when ``pooled`` is False.
+    """
+    if not pooled:
+        return SeleniumDriver(headless=headless, timeout=timeout, user_agent=user_agent)
+    pool = get_driver_pool(headless=headless, user_agent=user_agent,
+                           size=pool_size, max_uses=max_uses, timeout=timeout)
+    return pool.lease()
@@ -245,7 +245,10 @@ def run(providers: tuple, config: str, dry_run: bool, test_notify: bool):
         enabled_providers = list(providers) if providers else settings.scraper.enabled_providers
         
         # Create components
-        scraper = ScraperEngine()
+        scraper = ScraperEngine(
+            max_workers=settings.scraper.max_concurrent_providers,
+            provider_timeout=settings.scraper.provider_timeout_seconds
+        )
         storage = get_storage_manager()
         
         # Create notification manager (unless dry run)
@@ -263,7 +266,8 @@ def run(providers: tuple, config: str, dry_run: bool, test_notify: bool):
         
         # Run orchestrator
         click.echo(f"Running providers: {', '.join(enabled_providers)}")
-        new_count = orchestrator.run(enabled_providers, settings.dict())
+        # Each provider gets its settings.get_provider_config() from the orchestrator
+        new_count = orchestrator.run(enabled_providers, {})
         
         click.echo(f"✅ Orchestrator completed. {new_count} new listings found.")
         
@@ -376,6 +380,13 @@ def _create_notification_manager(settings: Settings) -> NotificationManager:
     if hasattr(settings, 'notifiers'):
         notifier_config['notifiers'] = settings.notifiers
     
+    # Persist outbound notifications next to the listings
+    notifier_config['queue'] = {
+        "path": settings.database_path,
+        "max_pending": settings.max_notification_queue_size
+    }
+    notifier_config['digest'] = {"window": settings.notification_digest_window}
+    
     return NotificationManager(notifier_config)
 
 
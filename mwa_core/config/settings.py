@@ -65,6 +65,33 @@ class ContactDiscoveryConfig(BaseModel):
     
     # Performance settings
     max_concurrent_requests: int = Field(5, ge=1, le=20, description="Maximum concurrent requests")
+    max_requests_per_domain: int = Field(2, ge=1, le=10, description="Maximum concurrent requests to one domain")
+    html_parser: Literal["auto", "lxml", "html.parser"] = Field(
+        "auto",
+        description="HTML parser for crawled pages; auto uses lxml if installed"
+    )
+    extraction_workers: Optional[int] = Field(
+        None,
+        ge=0,
+        le=32,
+        description="Processes parsing pages and extracting contacts; None uses one per CPU core, 0 extracts on the event loop"
+    )
+    validation_concurrency: int = Field(10, ge=1, le=50, description="Maximum contacts validated at once")
+    
+    # MX lookup cache shared across validation runs
+    mx_cache_enabled: bool = Field(True, description="Cache MX lookups on disk")
+    mx_cache_path: str = Field("data/contact_discovery/mx_cache.db", description="SQLite file of the MX lookup cache")
+    mx_negative_ttl_seconds: int = Field(3600, ge=0, description="Seconds a domain without mail servers is cached")
+    smtp_probe_workers: int = Field(4, ge=1, le=16, description="Mail hosts probed at once during SMTP verification")
+    smtp_verdict_ttl_seconds: int = Field(604800, ge=0, description="Seconds SMTP verification and catch-all results are cached")
+    
+    # Response cache shared by crawler and discovery engine
+    cache_enabled: bool = Field(True, description="Cache fetched pages and robots.txt on disk")
+    cache_path: str = Field("data/contact_discovery/http_cache.db", description="SQLite file of the response cache")
+    cache_ttl_seconds: int = Field(86400, ge=0, description="Seconds a cached page is used without revalidation")
+    robots_ttl_seconds: int = Field(86400, ge=0, description="Seconds a cached robots.txt is used without revalidation")
+    cache_max_entries: int = Field(5000, ge=1, description="Maximum number of cached responses")
+    cache_max_mb: int = Field(100, ge=1, description="Maximum total size of cached responses in MB")
     request_timeout: int = Field(30, ge=5, le=120, description="Request timeout in seconds")
     retry_attempts: int = Field(3, ge=0, le=10, description="Number of retry attempts for failed requests")
     
@@ -257,6 +284,31 @@ class ScraperConfig(BaseModel):
     contact_discovery_timeout: int = Field(
         30, ge=10, le=120, description="Timeout for contact discovery operations"
     )
+    max_concurrent_providers: int = Field(
+        2, ge=1, le=8, description="Maximum number of providers scraped concurrently"
+    )
+    provider_timeout_seconds: int = Field(
+        900, ge=30, description="Time budget per provider before it is cancelled"
+    )
+    use_driver_pool: bool = Field(
+        True, description="Reuse warm browser instances across scraping runs"
+    )
+    driver_pool_size: int = Field(
+        2, ge=1, le=8, description="Maximum number of pooled browser instances"
+    )
+    driver_max_uses: int = Field(
+        50, ge=1, description="Leases after which a pooled browser is replaced"
+    )
+    fetch_mode: str = Field(
+        "http_first", pattern="^(http_first|browser)$",
+        description="Fetch result pages over HTTP first ('http_first') or always use the browser ('browser')"
+    )
+    max_pages: int = Field(
+        10, ge=1, le=100, description="Maximum result pages read per provider (backfill depth)"
+    )
+    stop_at_known: int = Field(
+        3, ge=0, description="Stop paginating after a page with this many already stored listings (0 disables)"
+    )
 
 
 class SchedulerConfig(BaseModel):
@@ -380,6 +432,7 @@ class Settings(BaseSettings):
     notification_system_enabled: bool = Field(True, description="Enable the notification system")
     notification_history_retention_days: int = Field(30, ge=7, description="Days to retain notification history")
     max_notification_queue_size: int = Field(1000, ge=100, description="Maximum notification queue size")
+    notification_digest_window: int = Field(0, ge=0, description="Seconds to collect new listings into one notification (0 sends after each run)")
 
     class Config:
         env_prefix = "MWA_"  # Environment variables prefixed with MWA_
@@ -451,25 +504,37 @@ class Settings(BaseSettings):
             logger.error(f"Error saving config file {path}: {e}")
             raise
 
-    def get_provider_config(self, provider_name: str) -> Dict[str, Any]:
+    def get_provider_config(self, provider_name: str,
+                            overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get provider-specific configuration.
         
         Args:
             provider_name: Name of the provider (e.g., 'immoscout', 'wg_gesucht')
+            overrides: Scraper settings to override for this call, keyed by
+                ``ScraperConfig`` field name (validated)
             
         Returns:
             Dictionary with provider-specific configuration
         """
+        scraper = self.scraper
+        if overrides:
+            scraper = ScraperConfig(**{**scraper.dict(), **overrides})
         # This method can be extended to support provider-specific configs
         return {
             "headless": True,
-            "timeout": self.scraper.timeout_seconds,
-            "user_agent": self.scraper.user_agent,
-            "request_delay": self.scraper.request_delay_seconds,
-            "max_retries": self.scraper.max_retries,
-            "contact_discovery_enabled": self.scraper.contact_discovery_enabled,
-            "contact_discovery_timeout": self.scraper.contact_discovery_timeout,
+            "timeout": scraper.timeout_seconds,
+            "user_agent": scraper.user_agent,
+            "request_delay": scraper.request_delay_seconds,
+            "max_retries": scraper.max_retries,
+            "contact_discovery_enabled": scraper.contact_discovery_enabled,
+            "contact_discovery_timeout": scraper.contact_discovery_timeout,
+            "use_driver_pool": scraper.use_driver_pool,
+            "driver_pool_size": scraper.driver_pool_size,
+            "driver_max_uses": scraper.driver_max_uses,
+            "fetch_mode": scraper.fetch_mode,
+            "max_pages": scraper.max_pages,
+            "stop_at_known": scraper.stop_at_known,
         }
 
     def get_contact_discovery_config(self) -> Dict[str, Any]:
@@ -497,6 +562,21 @@ class Settings(BaseSettings):
             "respect_robots_txt": self.contact_discovery.respect_robots_txt,
             "user_agent": self.contact_discovery.user_agent,
             "max_concurrent_requests": self.contact_discovery.max_concurrent_requests,
+            "max_requests_per_domain": self.contact_discovery.max_requests_per_domain,
+            "html_parser": self.contact_discovery.html_parser,
+            "extraction_workers": self.contact_discovery.extraction_workers,
+            "validation_concurrency": self.contact_discovery.validation_concurrency,
+            "mx_cache_enabled": self.contact_discovery.mx_cache_enabled,
+            "mx_cache_path": self.contact_discovery.mx_cache_path,
+            "mx_negative_ttl_seconds": self.contact_discovery.mx_negative_ttl_seconds,
+            "smtp_probe_workers": self.contact_discovery.smtp_probe_workers,
+            "smtp_verdict_ttl_seconds": self.contact_discovery.smtp_verdict_ttl_seconds,
+            "cache_enabled": self.contact_discovery.cache_enabled,
+            "cache_path": self.contact_discovery.cache_path,
+            "cache_ttl_seconds": self.contact_discovery.cache_ttl_seconds,
+            "robots_ttl_seconds": self.contact_discovery.robots_ttl_seconds,
+            "cache_max_entries": self.contact_discovery.cache_max_entries,
+            "cache_max_mb": self.contact_discovery.cache_max_mb,
             "request_timeout": self.contact_discovery.request_timeout,
             "retry_attempts": self.contact_discovery.retry_attempts,
             "cultural_context": self.contact_discovery.cultural_context,
@@ -514,6 +594,7 @@ class Settings(BaseSettings):
             "notification_system_enabled": self.notification_system_enabled,
             "notification_history_retention_days": self.notification_history_retention_days,
             "max_notification_queue_size": self.max_notification_queue_size,
+            "notification_digest_window": self.notification_digest_window,
         }
         
         # Add legacy notification config if available
@@ -684,6 +765,21 @@ class Settings(BaseSettings):
                 "respect_robots_txt": True,
                 "user_agent": "MWA-ContactDiscovery/1.0 (Compatible; Real Estate Contact Discovery)",
                 "max_concurrent_requests": 5,
+                "max_requests_per_domain": 2,
+                "html_parser": "auto",
+                "extraction_workers": None,
+                "validation_concurrency": 10,
+                "mx_cache_enabled": True,
+                "mx_cache_path": "data/contact_discovery/mx_cache.db",
+                "mx_negative_ttl_seconds": 3600,
+                "smtp_probe_workers": 4,
+                "smtp_verdict_ttl_seconds": 604800,
+                "cache_enabled": True,
+                "cache_path": "data/contact_discovery/http_cache.db",
+                "cache_ttl_seconds": 86400,
+                "robots_ttl_seconds": 86400,
+                "cache_max_entries": 5000,
+                "cache_max_mb": 100,
                 "request_timeout": 30,
                 "retry_attempts": 3,
                 "cultural_context": "german",
@@ -705,7 +801,15 @@ class Settings(BaseSettings):
                 "timeout_seconds": 30,
                 "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "contact_discovery_enabled": True,
-                "contact_discovery_timeout": 30
+                "contact_discovery_timeout": 30,
+                "max_concurrent_providers": 2,
+                "provider_timeout_seconds": 900,
+                "use_driver_pool": True,
+                "driver_pool_size": 2,
+                "driver_max_uses": 50,
+                "fetch_mode": "http_first",
+                "max_pages": 10,
+                "stop_at_known": 3
             },
             "scheduler": {
                 "enabled": True,
@@ -722,6 +826,7 @@ class Settings(BaseSettings):
             "notification_system_enabled": True,
             "notification_history_retention_days": 30,
             "max_notification_queue_size": 1000,
+            "notification_digest_window": 0,
             "log_level": "INFO",
             "performance_tracking": True,
             "metrics_retention_days": 30
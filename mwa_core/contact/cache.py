@@ -0,0 +1,284 @@
+"""
+Shared on-disk response cache for contact discovery.
+
+Pages and robots.txt files fetched by the crawler and the discovery engine
+are stored in an ``HTTPCacheStore`` so that scheduler runs do not re-fetch
+the same agency sites:
+- Fresh responses are served without a request
+- Expired responses are revalidated with ``If-None-Match`` /
+  ``If-Modified-Since`` and reused on ``304 Not Modified``
+- ``Cache-Control: no-store`` and ``max-age`` are honoured
+- The store is bounded by entry count and size (least recently used first)
+"""
+
+import hashlib
+import json
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse, urlunparse
+
+import httpx
+
+from ..storage.http_cache import CachedHTTPResponse, HTTPCacheStore
+
+logger = logging.getLogger(__name__)
+
+# Headers kept with a cached body; the body is stored decoded, so encoding
+# and length headers are dropped
+_STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for duplicate detection.
+    
+    Lowercases scheme and host, drops default ports, fragments and trailing
+    slashes, so that ``https://Example.com:443/kontakt/#top`` and
+    ``https://example.com/kontakt`` are crawled once.
+    
+    Args:
+        url: Absolute URL
+    
+    Returns:
+        Normalized URL
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    if (scheme, port) in (("http", 80), ("https", 443)):
+        netloc = netloc.rsplit(':', 1)[0]
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((scheme, netloc, path, parsed.params, parsed.query, ''))
+
+
+class HTTPResponseCache:
+    """
+    Conditional-GET cache in front of an ``httpx.AsyncClient``.
+    
+    Cache hits are returned as regular ``httpx.Response`` objects, so callers
+    handle cached and fetched responses alike.
+    """
+    
+    def __init__(self, storage_path: str = "data/contact_discovery/http_cache.db",
+                 ttl: int = 86400, robots_ttl: int = 86400,
+                 max_entries: int = 5000, max_bytes: int = 100 * 1024 * 1024):
+        """
+        Initialize the response cache.
+        
+        Args:
+            storage_path: Path to the SQLite cache database (opened on first use)
+            ttl: Seconds a page is used without revalidation
+            robots_ttl: Seconds a robots.txt is used without revalidation
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies in bytes
+        """
+        self.storage_path = storage_path
+        self.ttls = {"page": ttl, "robots": robots_ttl}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._store: Optional[HTTPCacheStore] = None
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "evicted": 0, "errors": 0}
+    
+    @classmethod
+    def from_settings(cls, settings: Any) -> Optional["HTTPResponseCache"]:
+        """
+        Create the cache configured in the contact discovery settings.
+        
+        Args:
+            settings: ``ContactDiscoveryConfig``
+        
+        Returns:
+            HTTPResponseCache, or None if caching is disabled
+        """
+        if not settings.cache_enabled:
+            return None
+        return cls(
+            storage_path=settings.cache_path,
+            ttl=settings.cache_ttl_seconds,
+            robots_ttl=settings.robots_ttl_seconds,
+            max_entries=settings.cache_max_entries,
+            max_bytes=settings.cache_max_mb * 1024 * 1024
+        )
+    
+    @property
+    def store(self) -> HTTPCacheStore:
+        """The underlying store, created on first access."""
+        if self._store is None:
+            self._store = HTTPCacheStore(self.storage_path, self.max_entries, self.max_bytes)
+        return self._store
+    
+    @staticmethod
+    def cache_key(url: str) -> str:
+        """
+        Get the cache key of a URL.
+        
+        Args:
+            url: Absolute URL
+        
+        Returns:
+            SHA-256 hex digest of the normalized URL
+        """
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+    
+    async def get(self, client: httpx.AsyncClient, url: str,
+                  headers: Optional[Dict[str, str]] = None, kind: str = "page",
+                  before_request: Optional[Callable[[], Awaitable[Any]]] = None) -> httpx.Response:
+        """
+        Get a response from the cache or fetch it with ``client``.
+        
+        Args:
+            client: HTTP client used on a miss or for revalidation
+            url: URL to get
+            headers: Request headers
+            kind: ``page`` or ``robots``; selects the default TTL and which
+                status codes are cacheable
+            before_request: Awaited before a request is sent, e.g. to wait
+                for a rate limiter; cache hits skip it
+        
+        Returns:
+            Cached or fetched response
+        
+        Raises:
+            httpx.RequestError: If fetching fails
+        """
+        key = self.cache_key(url)
+        cached = self._lookup(key)
+        if cached is not None and cached.is_fresh:
+            self._stats["hits"] += 1
+            return self._to_response(cached, url)
+        
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+        
+        if before_request is not None:
+            await before_request()
+        response = await client.get(url, headers=request_headers, follow_redirects=True)
+        
+        if response.status_code == 304 and cached is not None:
+            self._stats["revalidated"] += 1
+            ttl = self._ttl(response, kind)
+            if ttl is not None:
+                self._refresh(key, datetime.now() + timedelta(seconds=ttl))
+            return self._to_response(cached, url)
+        
+        self._stats["misses"] += 1
+        if self._is_cacheable(response, kind):
+            ttl = self._ttl(response, kind)
+            if ttl is not None:
+                self._save(key, url, kind, response, ttl)
+        return response
+    
+    def _lookup(self, key: str) -> Optional[CachedHTTPResponse]:
+        try:
+            return self.store.get(key)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"Error reading response cache: {e}")
+            return None
+    
+    def _refresh(self, key: str, expires_at: datetime) -> None:
+        try:
+            self.store.refresh(key, expires_at)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"Error refreshing cached response: {e}")
+    
+    def _save(self, key: str, url: str, kind: str, response: httpx.Response, ttl: int) -> None:
+        stored_headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        if "content-type" in stored_headers:
+            # The body is stored decoded and re-encoded as UTF-8 on a hit
+            mime_type = stored_headers["content-type"].split(";")[0].strip()
+            stored_headers["content-type"] = f"{mime_type}; charset=utf-8"
+        now = datetime.now()
+        try:
+            self._stats["evicted"] += self.store.put(CachedHTTPResponse(
+                key=key,
+                url=url,
+                kind=kind,
+                status_code=response.status_code,
+                headers=json.dumps(stored_headers),
+                body=response.text,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                fetched_at=now,
+                expires_at=now + timedelta(seconds=ttl)
+            ))
+            self._stats["stored"] += 1
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"Error storing response for {url}: {e}")
+    
+    @staticmethod
+    def _is_cacheable(response: httpx.Response, kind: str) -> bool:
+        if response.status_code == 200:
+            return True
+        # A missing or forbidden robots.txt is as stable as an existing one
+        return kind == "robots" and 400 <= response.status_code < 500 and response.status_code != 429
+    
+    def _ttl(self, response: httpx.Response, kind: str) -> Optional[int]:
+        """Get the lifetime of a response, or None if it must not be stored."""
+        cache_control = response.headers.get("cache-control", "").lower()
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            return 0
+        match = _MAX_AGE_PATTERN.search(cache_control)
+        if match:
+            return int(match.group(1))
+        return self.ttls.get(kind, self.ttls["page"])
+    
+    @staticmethod
+    def _to_response(cached: CachedHTTPResponse, url: str) -> httpx.Response:
+        headers = json.loads(cached.headers) if cached.headers else {}
+        return httpx.Response(
+            cached.status_code,
+            headers=headers,
+            text=cached.body,
+            request=httpx.Request("GET", url)
+        )
+    
+    def clear(self) -> int:
+        """
+        Delete all cached responses.
+        
+        Returns:
+            Number of deleted responses
+        """
+        try:
+            return self.store.clear()
+        except Exception as e:
+            logger.error(f"Error clearing response cache: {e}")
+            return 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hit, miss, revalidation and eviction counts and
+            the number and size of cached responses
+        """
+        stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"] + stats["revalidated"]
+        stats["hit_rate"] = (stats["hits"] + stats["revalidated"]) / lookups if lookups else 0.0
+        stats["entries"] = 0
+        stats["size_bytes"] = 0
+        if self._store is not None:
+            try:
+                stats.update(self._store.get_size())
+            except Exception as e:
+                logger.error(f"Error reading response cache size: {e}")
+        stats["max_entries"] = self.max_entries
+        stats["max_bytes"] = self.max_bytes
+        return stats
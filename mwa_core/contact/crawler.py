@@ -12,21 +12,25 @@ Provides intelligent crawling capabilities for finding contact information:
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import re
 import time
+from collections import OrderedDict
 from typing import List, Dict, Optional, Set, Tuple, Any
 from urllib.parse import urljoin, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
-from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 
 import httpx
-from bs4 import BeautifulSoup
 
+from ..ratelimit import TokenBucketLimiter, parse_retry_after
+from .cache import HTTPResponseCache, normalize_url
 from .models import DiscoveryContext, Contact, ContactForm, ConfidenceLevel
-from .extractors import EmailExtractor, PhoneExtractor, FormExtractor, SocialMediaExtractor
+from .parsing import PageLink
+from .workers import ExtractionPool, PagePayload
 from ..config.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -40,6 +44,7 @@ class CrawlResult:
     contacts: List[Contact] = field(default_factory=list)
     forms: List[ContactForm] = field(default_factory=list)
     links_found: List[str] = field(default_factory=list)
+    link_scores: Dict[str, float] = field(default_factory=dict)
     crawl_time: float = 0.0
     error: Optional[str] = None
 
@@ -67,6 +72,107 @@ class CrawlStats:
         return ((self.urls_crawled - self.errors_encountered) / self.urls_crawled) * 100
 
 
+class CrawlFrontier:
+    """
+    Priority queue of URLs to crawl with per-domain concurrency slots.
+    
+    Workers take the highest-priority URL whose domain has a free slot, so
+    a slow or busy domain never stalls crawling of other domains. URLs are
+    deduplicated by their normalized form.
+    """
+    
+    def __init__(self, max_per_domain: int = 2):
+        """
+        Initialize the frontier.
+        
+        Args:
+            max_per_domain: Maximum URLs of one domain crawled concurrently
+        """
+        self.max_per_domain = max(1, max_per_domain)
+        self._heap: List[Tuple[float, int, str, int, str]] = []
+        self._seen: Set[str] = set()
+        self._active: Dict[str, int] = {}
+        self._in_flight = 0
+        self._counter = itertools.count()
+        self._changed = asyncio.Condition()
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def add(self, url: str, depth: int, priority: float = 0.0) -> bool:
+        """
+        Add a URL unless it was added before.
+        
+        Idle workers pick the URL up once the page that found it is
+        reported with ``task_done``.
+        
+        Args:
+            url: Absolute URL
+            depth: Crawl depth of the URL
+            priority: Priority (higher is crawled first)
+            
+        Returns:
+            True if the URL was added
+        """
+        key = normalize_url(url)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        domain = urlparse(key).netloc
+        heapq.heappush(self._heap, (-priority, next(self._counter), url, depth, domain))
+        return True
+    
+    async def get(self) -> Optional[Tuple[str, int]]:
+        """
+        Wait for the next URL that may be crawled now.
+        
+        Returns:
+            Tuple of (url, depth), or None once the frontier is empty and no
+            URL is being crawled anymore
+        """
+        async with self._changed:
+            while True:
+                entry = self._pop_ready()
+                if entry is not None:
+                    _, _, url, depth, domain = entry
+                    self._active[domain] = self._active.get(domain, 0) + 1
+                    self._in_flight += 1
+                    return url, depth
+                if not self._heap and self._in_flight == 0:
+                    self._changed.notify_all()
+                    return None
+                await self._changed.wait()
+    
+    def _pop_ready(self) -> Optional[Tuple[float, int, str, int, str]]:
+        """Pop the best entry whose domain has a free slot."""
+        skipped = []
+        entry = None
+        while self._heap:
+            candidate = heapq.heappop(self._heap)
+            if self._active.get(candidate[4], 0) < self.max_per_domain:
+                entry = candidate
+                break
+            skipped.append(candidate)
+        for candidate in skipped:
+            heapq.heappush(self._heap, candidate)
+        return entry
+    
+    async def task_done(self, url: str) -> None:
+        """
+        Release the domain slot of a URL returned by ``get``.
+        
+        Args:
+            url: The crawled URL
+        """
+        domain = urlparse(normalize_url(url)).netloc
+        async with self._changed:
+            self._active[domain] -= 1
+            if not self._active[domain]:
+                del self._active[domain]
+            self._in_flight -= 1
+            self._changed.notify_all()
+
+
 class ContactCrawler:
     """
     Enhanced web crawler for contact discovery with intelligent link following.
@@ -117,12 +223,18 @@ class ContactCrawler:
         '.css', '.js', '.xml', '.json'
     }
     
-    def __init__(self, config: Settings):
+    # Parsed robots.txt files kept in memory; the files themselves live in
+    # the response cache
+    MAX_ROBOTS_PARSERS = 256
+    
+    def __init__(self, config: Settings, http_cache: Optional[HTTPResponseCache] = None):
         """
         Initialize the contact crawler.
         
         Args:
             config: Application configuration
+            http_cache: Response cache to share (created from the contact
+                discovery settings if omitted)
         """
         self.config = config
         self.settings = config.contact_discovery
@@ -131,43 +243,43 @@ class ContactCrawler:
             limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
         )
         
-        # Initialize extractors
-        self.email_extractor = EmailExtractor(config)
-        self.phone_extractor = PhoneExtractor(config)
-        self.form_extractor = FormExtractor(config)
-        self.social_extractor = SocialMediaExtractor(config)
+        # Pages are parsed and extracted in worker processes
+        self.extraction_pool = ExtractionPool(config)
         
         # Crawling state
         self.visited_urls: Set[str] = set()
-        self.robots_cache: Dict[str, RobotFileParser] = {}
-        self.domain_rate_limits: Dict[str, float] = {}
+        self.http_cache = http_cache if http_cache is not None else HTTPResponseCache.from_settings(self.settings)
+        self.robots_cache: "OrderedDict[str, Tuple[RobotFileParser, float]]" = OrderedDict()
+        # One token bucket per domain
+        self.rate_limiter = TokenBucketLimiter(
+            rate=1.0 / self.settings.rate_limit_seconds if self.settings.rate_limit_seconds > 0 else 0
+        )
         self.crawl_stats = CrawlStats()
         
-        # Queue for URLs to crawl
-        self.url_queue: deque = deque()
+        # Concurrent workers and politeness slots per domain
+        self.max_workers = self.settings.max_concurrent_requests
+        self.max_requests_per_domain = self.settings.max_requests_per_domain
         
         logger.info(f"Contact crawler initialized (max_depth: {self.settings.max_crawl_depth})")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        await self.email_extractor.__aenter__()
-        await self.phone_extractor.__aenter__()
-        await self.form_extractor.__aenter__()
-        await self.social_extractor.__aenter__()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.session.aclose()
-        await self.email_extractor.__aexit__(exc_type, exc_val, exc_tb)
-        await self.phone_extractor.__aexit__(exc_type, exc_val, exc_tb)
-        await self.form_extractor.__aexit__(exc_type, exc_val, exc_tb)
-        await self.social_extractor.__aexit__(exc_type, exc_val, exc_tb)
+        await self.extraction_pool.aclose()
     
     async def crawl_for_contacts(self, start_url: str, context: Optional[DiscoveryContext] = None) -> Tuple[List[Contact], List[ContactForm], CrawlStats]:
         """
         Main crawling method to discover contacts starting from a URL.
         
+        Pages are fetched by ``max_concurrent_requests`` worker tasks from a
+        ``CrawlFrontier`` ordered by link score. Each domain is limited to
+        ``max_requests_per_domain`` concurrent requests and to the crawler's
+        per-domain request rate.
+        
         Args:
             start_url: Starting URL for crawling
             context: Discovery context (optional)
@@ -186,51 +298,33 @@ class ContactCrawler:
         logger.info(f"Starting contact crawl from: {start_url}")
         
         # Initialize crawling
-        self.url_queue.append((start_url, context.current_depth))
+        frontier = CrawlFrontier(max_per_domain=self.max_requests_per_domain)
+        if context.can_crawl_deeper and normalize_url(start_url) not in self.visited_urls:
+            frontier.add(start_url, context.current_depth)
         all_contacts = []
         all_forms = []
         
+        async def worker() -> None:
+            while True:
+                item = await frontier.get()
+                if item is None:
+                    return
+                current_url, current_depth = item
+                try:
+                    await self._crawl_frontier_url(
+                        frontier, current_url, current_depth, context, all_contacts, all_forms
+                    )
+                finally:
+                    await frontier.task_done(current_url)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, self.max_workers))]
         try:
-            while self.url_queue and context.can_crawl_deeper:
-                current_url, current_depth = self.url_queue.popleft()
-                
-                # Skip if already visited
-                if current_url in self.visited_urls:
-                    continue
-                
-                # Check rate limiting
-                await self._enforce_rate_limit(current_url)
-                
-                # Crawl the page
-                result = await self._crawl_page(current_url, context)
-                
-                if result.error:
-                    logger.warning(f"Crawl error for {current_url}: {result.error}")
-                    self.crawl_stats.errors_encountered += 1
-                    continue
-                
-                # Process results
-                self.visited_urls.add(current_url)
-                self.crawl_stats.urls_crawled += 1
-                self.crawl_stats.contacts_found += len(result.contacts)
-                self.crawl_stats.forms_found += len(result.forms)
-                
-                all_contacts.extend(result.contacts)
-                all_forms.extend(result.forms)
-                
-                # Add discovered links to queue
-                for link in result.links_found:
-                    if self._should_crawl_link(link, current_depth, context):
-                        self.url_queue.append((link, current_depth + 1))
-                
-                # Log progress
-                if self.crawl_stats.urls_crawled % 10 == 0:
-                    logger.info(f"Crawl progress: {self.crawl_stats.urls_crawled} URLs, "
-                              f"{self.crawl_stats.contacts_found} contacts, "
-                              f"{self.crawl_stats.forms_found} forms")
-                
+            await asyncio.gather(*workers)
         except Exception as e:
             logger.error(f"Crawling failed: {e}")
+        finally:
+            for task in workers:
+                task.cancel()
         
         logger.info(f"Crawling completed: {self.crawl_stats.urls_crawled} URLs, "
                    f"{self.crawl_stats.contacts_found} contacts, "
@@ -239,6 +333,52 @@ class ContactCrawler:
         
         return all_contacts, all_forms, self.crawl_stats
     
+    async def _crawl_frontier_url(self, frontier: CrawlFrontier, url: str, depth: int,
+                                  context: DiscoveryContext, all_contacts: List[Contact],
+                                  all_forms: List[ContactForm]) -> None:
+        """
+        Crawl one URL taken from the frontier and queue the links it contains.
+        
+        Args:
+            frontier: Frontier the URL was taken from
+            url: URL to crawl
+            depth: Crawl depth of the URL
+            context: Discovery context of the crawl
+            all_contacts: Collected contacts
+            all_forms: Collected forms
+        """
+        # Skip if visited by an earlier crawl
+        if normalize_url(url) in self.visited_urls:
+            return
+        
+        # Crawl the page (rate limited per domain in fetch); links are scored relative to its depth
+        result = await self._crawl_page(url, replace(context, current_depth=depth))
+        
+        if result.error:
+            logger.warning(f"Crawl error for {url}: {result.error}")
+            self.crawl_stats.errors_encountered += 1
+            return
+        
+        # Process results
+        self.visited_urls.add(normalize_url(url))
+        self.crawl_stats.urls_crawled += 1
+        self.crawl_stats.contacts_found += len(result.contacts)
+        self.crawl_stats.forms_found += len(result.forms)
+        
+        all_contacts.extend(result.contacts)
+        all_forms.extend(result.forms)
+        
+        # Add discovered links to the frontier
+        for link in result.links_found:
+            if self._should_crawl_link(link, depth, context):
+                frontier.add(link, depth + 1, result.link_scores.get(link, 0.0))
+        
+        # Log progress
+        if self.crawl_stats.urls_crawled % 10 == 0:
+            logger.info(f"Crawl progress: {self.crawl_stats.urls_crawled} URLs, "
+                      f"{self.crawl_stats.contacts_found} contacts, "
+                      f"{self.crawl_stats.forms_found} forms")
+    
     async def _crawl_page(self, url: str, context: DiscoveryContext) -> CrawlResult:
         """
         Crawl a single page and extract contacts.
@@ -267,35 +407,20 @@ class ContactCrawler:
                 'Connection': 'keep-alive',
             }
             
-            response = await self.session.get(url, headers=headers, follow_redirects=True)
+            response = await self.fetch(url, headers)
+            if response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers)
+                if retry_after is not None:
+                    self.rate_limiter.penalize(urlparse(url).netloc, retry_after)
             response.raise_for_status()
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract contacts
-            contacts = []
-            forms = []
-            
-            # Extract emails
-            page_text = soup.get_text()
-            emails = await self.email_extractor.extract_emails(page_text, url, context)
-            contacts.extend(emails)
-            
-            # Extract phone numbers
-            phones = await self.phone_extractor.extract_phones(page_text, url, context)
-            contacts.extend(phones)
-            
-            # Extract contact forms
-            page_forms = await self.form_extractor.extract_forms(soup, url, context)
-            forms.extend(page_forms)
-            
-            # Extract social media profiles
-            social_profiles = await self.social_extractor.extract_social_media(page_text, url, context)
-            contacts.extend([profile.to_contact() for profile in social_profiles])
+            # Parse HTML and extract contacts in the extraction pool
+            extraction = await self.extraction_pool.extract(PagePayload(url=url, html=response.text, context=context))
+            contacts = extraction.contacts + [profile.to_contact() for profile in extraction.social_profiles]
+            forms = extraction.forms
             
             # Find links for further crawling
-            links = self._extract_links(soup, url, context)
+            scored_links = self._score_links(extraction.links, url, context)
             
             crawl_time = time.time() - start_time
             
@@ -304,7 +429,8 @@ class ContactCrawler:
                 status_code=response.status_code,
                 contacts=contacts,
                 forms=forms,
-                links_found=links,
+                links_found=[link for link, score in scored_links],
+                link_scores=dict(scored_links),
                 crawl_time=crawl_time
             )
             
@@ -315,25 +441,60 @@ class ContactCrawler:
         except Exception as e:
             return CrawlResult(url=url, status_code=0, error=f"Unexpected error: {str(e)}")
     
-    def _extract_links(self, soup: BeautifulSoup, base_url: str, context: DiscoveryContext) -> List[str]:
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None, kind: str = "page") -> httpx.Response:
+        """
+        Fetch a URL through the response cache if one is configured.
+        
+        Requests that reach the server wait for the domain's rate limit;
+        fresh cache hits do not.
+        
+        Args:
+            url: URL to fetch
+            headers: Request headers
+            kind: ``page`` or ``robots``
+            
+        Returns:
+            Cached or fetched response
+        """
+        if self.http_cache is not None:
+            return await self.http_cache.get(
+                self.session, url, headers, kind, before_request=lambda: self._enforce_rate_limit(url)
+            )
+        await self._enforce_rate_limit(url)
+        return await self.session.get(url, headers=headers, follow_redirects=True)
+    
+    def _extract_links(self, page_links: List[PageLink], base_url: str, context: DiscoveryContext) -> List[str]:
         """
         Extract and prioritize links for further crawling.
         
         Args:
-            soup: BeautifulSoup object
+            page_links: Links of the page
             base_url: Base URL for resolving relative links
             context: Discovery context
             
         Returns:
             List of prioritized URLs
         """
+        return [url for url, score in self._score_links(page_links, base_url, context)]
+    
+    def _score_links(self, page_links: List[PageLink], base_url: str, context: DiscoveryContext) -> List[Tuple[str, float]]:
+        """
+        Extract links for further crawling together with their scores.
+        
+        Args:
+            page_links: Links of the page
+            base_url: Base URL for resolving relative links
+            context: Discovery context
+            
+        Returns:
+            List of (url, score) tuples, best first
+        """
         links = []
-        link_elements = soup.find_all('a', href=True)
         
-        for link_elem in link_elements:
+        for link_elem in page_links:
             try:
-                href = link_elem.get('href', '').strip()
-                link_text = link_elem.get_text(strip=True).lower()
+                href = link_elem.href.strip()
+                link_text = link_elem.text.lower()
                 
                 # Skip empty links
                 if not href:
@@ -368,9 +529,9 @@ class ContactCrawler:
             except Exception as e:
                 continue
         
-        # Sort by score and return URLs
+        # Sort by score
         links.sort(key=lambda x: x[1], reverse=True)
-        return [url for url, score in links[:20]]  # Limit to top 20 links
+        return links[:20]  # Limit to top 20 links
     
     def _score_link(self, url: str, link_text: str, context: DiscoveryContext) -> float:
         """
@@ -424,7 +585,7 @@ class ContactCrawler:
             return False
         
         # Check if already visited
-        if url in self.visited_urls:
+        if normalize_url(url) in self.visited_urls:
             return False
         
         # Parse URL
@@ -450,7 +611,7 @@ class ContactCrawler:
         Returns:
             True if crawling is allowed
         """
-        if not self.settings.respect_robots:
+        if not self.settings.respect_robots_txt:
             return True
         
         try:
@@ -459,19 +620,21 @@ class ContactCrawler:
             robots_url = f"{parsed_url.scheme}://{domain}/robots.txt"
             
             # Check cache
-            if domain in self.robots_cache:
-                robots_parser = self.robots_cache[domain]
-            else:
+            robots_parser = self._get_cached_robots(domain)
+            if robots_parser is None:
                 # Fetch and parse robots.txt
-                robots_parser = RobotFileParser()
-                robots_parser.set_url(robots_url)
-                
-                try:
-                    robots_parser.read()
-                    self.robots_cache[domain] = robots_parser
-                except Exception:
+                response = await self.fetch(robots_url, {'User-Agent': self.settings.user_agent}, kind="robots")
+                robots_parser = RobotFileParser(robots_url)
+                if response.status_code in (401, 403):
+                    robots_parser.disallow_all = True
+                elif 400 <= response.status_code < 500:
+                    robots_parser.allow_all = True
+                elif response.status_code >= 500:
                     # If robots.txt can't be fetched, allow crawling
                     return True
+                else:
+                    robots_parser.parse(response.text.splitlines())
+                self._cache_robots(domain, robots_parser)
             
             # Check if our user agent is allowed
             user_agent = self.config.contact_discovery.user_agent or '*'
@@ -481,6 +644,25 @@ class ContactCrawler:
             logger.debug(f"Robots.txt check failed for {url}: {e}")
             return True  # Allow crawling on error
     
+    def _get_cached_robots(self, domain: str) -> Optional[RobotFileParser]:
+        """Get a parsed robots.txt that has not expired yet."""
+        entry = self.robots_cache.get(domain)
+        if entry is None:
+            return None
+        robots_parser, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self.robots_cache[domain]
+            return None
+        self.robots_cache.move_to_end(domain)
+        return robots_parser
+    
+    def _cache_robots(self, domain: str, robots_parser: RobotFileParser) -> None:
+        """Keep a parsed robots.txt, dropping the least recently used ones."""
+        self.robots_cache[domain] = (robots_parser, time.monotonic() + self.settings.robots_ttl_seconds)
+        self.robots_cache.move_to_end(domain)
+        while len(self.robots_cache) > self.MAX_ROBOTS_PARSERS:
+            self.robots_cache.popitem(last=False)
+    
     async def _enforce_rate_limit(self, url: str) -> None:
         """
         Enforce rate limiting for the domain.
@@ -488,23 +670,7 @@ class ContactCrawler:
         Args:
             url: URL being accessed
         """
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-        
-        # Get last access time for this domain
-        last_access = self.domain_rate_limits.get(domain, 0)
-        current_time = time.time()
-        
-        # Calculate time since last access
-        time_since_last = current_time - last_access
-        
-        # If we need to wait, sleep for the required time
-        if time_since_last < self.settings.rate_limit_seconds:
-            sleep_time = self.settings.rate_limit_seconds - time_since_last
-            await asyncio.sleep(sleep_time)
-        
-        # Update last access time
-        self.domain_rate_limits[domain] = time.time()
+        await self.rate_limiter.acquire(urlparse(url).netloc)
     
     def get_crawl_stats(self) -> CrawlStats:
         """Get current crawling statistics."""
@@ -514,7 +680,7 @@ class ContactCrawler:
         """Reset crawling statistics."""
         self.crawl_stats = CrawlStats()
         self.visited_urls.clear()
-        self.domain_rate_limits.clear()
+        self.rate_limiter.reset()
 
 
 class SmartContactCrawler(ContactCrawler):
@@ -528,8 +694,8 @@ class SmartContactCrawler(ContactCrawler):
     - Performance optimization
     """
     
-    def __init__(self, config: Settings):
-        super().__init__(config)
+    def __init__(self, config: Settings, http_cache: Optional[HTTPResponseCache] = None):
+        super().__init__(config, http_cache=http_cache)
         self.contact_page_classifier = self._initialize_classifier()
     
     def _initialize_classifier(self):
@@ -12,6 +12,7 @@ Main orchestration engine that coordinates all contact discovery activities:
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from typing import List, Dict, Optional, Tuple, Any, Set
 from pathlib import Path
 from urllib.parse import urlparse
@@ -19,13 +20,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from .models import Contact, ContactForm, SocialMediaProfile, DiscoveryContext, ExtractionResult, ConfidenceLevel
-from .extractors import (
-    EmailExtractor, PhoneExtractor, FormExtractor, 
-    SocialMediaExtractor, OCRContactExtractor, PDFContactExtractor
-)
+from .extractors import OCRContactExtractor, PDFContactExtractor
+from .cache import HTTPResponseCache
 from .crawler import ContactCrawler, SmartContactCrawler
 from .scoring import ContactScoringEngine
 from .validators import ContactValidator, ValidationResult
+from .workers import PagePayload
 from ..config.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -66,6 +66,9 @@ class ContactDiscoveryEngine:
     - Configurable extraction strategies
     """
     
+    # Number of discovery results kept in memory
+    MAX_CACHED_RESULTS = 256
+    
     def __init__(self, config: Settings, storage_path: Optional[Path] = None):
         """
         Initialize the contact discovery engine.
@@ -78,40 +81,30 @@ class ContactDiscoveryEngine:
         self.settings = config.contact_discovery
         self.storage_path = storage_path or Path("data/contact_discovery")
         
-        # Initialize extractors
-        self.email_extractor = EmailExtractor(config)
-        self.phone_extractor = PhoneExtractor(config)
-        self.form_extractor = FormExtractor(config)
-        self.social_extractor = SocialMediaExtractor(config)
+        # Initialize extractors; pages are parsed and searched for emails,
+        # phones, forms and profiles in the crawler's extraction pool
         self.ocr_extractor = OCRContactExtractor(config)
         self.pdf_extractor = PDFContactExtractor(config)
         
-        # Initialize crawler
+        # Initialize crawler; page and robots.txt fetches share the response cache
+        self.http_cache = HTTPResponseCache.from_settings(self.settings)
         if self.settings.smart_crawling:
-            self.crawler = SmartContactCrawler(config)
+            self.crawler = SmartContactCrawler(config, http_cache=self.http_cache)
         else:
-            self.crawler = ContactCrawler(config)
+            self.crawler = ContactCrawler(config, http_cache=self.http_cache)
         
         # Initialize scoring and validation
         self.scoring_engine = ContactScoringEngine(config)
-        self.validator = ContactValidator(
-            enable_smtp_verification=self.settings.smtp_verification,
-            enable_dns_verification=self.settings.dns_verification,
-            rate_limit_seconds=self.settings.rate_limit_seconds
-        )
+        self.validator = ContactValidator.from_settings(self.settings)
         
         # Discovery state
-        self.discovery_cache = {}
+        self.discovery_cache: "OrderedDict[str, ExtractionResult]" = OrderedDict()
         self.extraction_stats = DiscoveryStats()
         
         logger.info(f"Contact discovery engine initialized (smart_crawling: {self.settings.smart_crawling})")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        await self.email_extractor.__aenter__()
-        await self.phone_extractor.__aenter__()
-        await self.form_extractor.__aenter__()
-        await self.social_extractor.__aenter__()
         await self.ocr_extractor.__aenter__()
         await self.pdf_extractor.__aenter__()
         await self.crawler.__aenter__()
@@ -119,10 +112,6 @@ class ContactDiscoveryEngine:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.email_extractor.__aexit__(exc_type, exc_val, exc_tb)
-        await self.phone_extractor.__aexit__(exc_type, exc_val, exc_tb)
-        await self.form_extractor.__aexit__(exc_type, exc_val, exc_tb)
-        await self.social_extractor.__aexit__(exc_type, exc_val, exc_tb)
         await self.ocr_extractor.__aexit__(exc_type, exc_val, exc_tb)
         await self.pdf_extractor.__aexit__(exc_type, exc_val, exc_tb)
         await self.crawler.__aexit__(exc_type, exc_val, exc_tb)
@@ -160,6 +149,7 @@ class ContactDiscoveryEngine:
             cache_key = f"{url}_{context.language_preference}_{enable_crawling}"
             if cache_key in self.discovery_cache:
                 logger.debug(f"Using cached results for {url}")
+                self.discovery_cache.move_to_end(cache_key)
                 return self.discovery_cache[cache_key]
             
             # Extract contacts from the main URL
@@ -195,6 +185,8 @@ class ContactDiscoveryEngine:
             
             # Cache results
             self.discovery_cache[cache_key] = main_result
+            while len(self.discovery_cache) > self.MAX_CACHED_RESULTS:
+                self.discovery_cache.popitem(last=False)
             
             logger.info(f"Contact discovery completed for {url}: "
                        f"{len(main_result.contacts)} contacts, "
@@ -239,53 +231,28 @@ class ContactDiscoveryEngine:
                     error="Failed to fetch URL"
                 )
             
-            # Parse HTML
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
-            page_text = soup.get_text()
-            
-            # Extract using specified methods
+            # Parse HTML and extract using specified methods in the extraction pool
             methods = extraction_methods or context.extraction_methods
-            
-            # Email extraction
-            if "email" in methods:
-                emails = await self.email_extractor.extract_emails(page_text, url, context)
-                contacts.extend(emails)
-                logger.debug(f"Extracted {len(emails)} emails from {url}")
-            
-            # Phone extraction
-            if "phone" in methods:
-                phones = await self.phone_extractor.extract_phones(page_text, url, context)
-                contacts.extend(phones)
-                logger.debug(f"Extracted {len(phones)} phones from {url}")
-            
-            # Form extraction
-            if "form" in methods:
-                page_forms = await self.form_extractor.extract_forms(soup, url, context)
-                forms.extend(page_forms)
-                logger.debug(f"Extracted {len(page_forms)} forms from {url}")
-            
-            # Social media extraction
-            if "social_media" in methods:
-                profiles = await self.social_extractor.extract_social_media(page_text, url, context)
-                social_profiles.extend(profiles)
-                contacts.extend([profile.to_contact() for profile in profiles])
-                logger.debug(f"Extracted {len(profiles)} social profiles from {url}")
+            extraction = await self.crawler.extraction_pool.extract(
+                PagePayload(url=url, html=response.text, context=context, methods=list(methods))
+            )
+            contacts.extend(extraction.contacts)
+            forms.extend(extraction.forms)
+            social_profiles.extend(extraction.social_profiles)
+            contacts.extend([profile.to_contact() for profile in extraction.social_profiles])
+            logger.debug(f"Extracted {len(extraction.contacts)} contacts, {len(extraction.forms)} forms "
+                        f"and {len(extraction.social_profiles)} social profiles from {url}")
             
             # OCR extraction for images
             if "ocr" in methods:
-                images = soup.find_all('img')
-                for img in images[:5]:  # Limit to first 5 images
-                    img_src = img.get('src')
-                    if img_src:
-                        img_url = self._resolve_url(img_src, url)
-                        ocr_contacts = await self.ocr_extractor.extract_from_image(img_url, url, context)
-                        contacts.extend(ocr_contacts)
+                for img_src in extraction.images[:5]:  # Limit to first 5 images
+                    img_url = self._resolve_url(img_src, url)
+                    ocr_contacts = await self.ocr_extractor.extract_from_image(img_url, url, context)
+                    contacts.extend(ocr_contacts)
             
             # PDF extraction for links
             if "pdf" in methods:
-                pdf_links = [a.get('href') for a in soup.find_all('a', href=True) 
-                           if a.get('href', '').lower().endswith('.pdf')]
+                pdf_links = [link.href for link in extraction.links if link.href.lower().endswith('.pdf')]
                 for pdf_link in pdf_links[:3]:  # Limit to first 3 PDFs
                     pdf_url = self._resolve_url(pdf_link, url)
                     pdf_contacts = await self.pdf_extractor.extract_from_pdf(pdf_url, url, context)
@@ -315,7 +282,7 @@ class ContactDiscoveryEngine:
             )
     
     async def _fetch_url(self, url: str, context: DiscoveryContext) -> Optional[Any]:
-        """Fetch URL with proper headers and timeout."""
+        """Fetch URL with proper headers through the crawler's client and response cache."""
         try:
             headers = {
                 'User-Agent': context.user_agent,
@@ -325,11 +292,10 @@ class ContactDiscoveryEngine:
                 'Connection': 'keep-alive',
             }
             
-            async with httpx.AsyncClient(timeout=context.timeout) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                response.raise_for_status()
-                return response
-                
+            response = await self.crawler.fetch(url, headers)
+            response.raise_for_status()
+            return response
+            
         except Exception as e:
             logger.warning(f"Failed to fetch {url}: {e}")
             return None
@@ -519,16 +485,25 @@ class ContactDiscoveryEngine:
         self.discovery_cache.clear()
     
     def get_cache_info(self) -> Dict[str, Any]:
-        """Get information about the discovery cache."""
+        """Get information about the discovery cache and the response cache."""
         return {
             'cache_size': len(self.discovery_cache),
+            'max_cache_size': self.MAX_CACHED_RESULTS,
             'cache_keys': list(self.discovery_cache.keys()),
-            'performance_history_size': len(self.scoring_engine.performance_history)
+            'performance_history_size': len(self.scoring_engine.performance_history),
+            'http_cache': self.http_cache.get_stats() if self.http_cache else None
         }
     
-    def clear_cache(self) -> None:
-        """Clear the discovery cache."""
+    def clear_cache(self, include_responses: bool = False) -> None:
+        """
+        Clear the discovery cache.
+        
+        Args:
+            include_responses: Also delete the cached pages and robots.txt files
+        """
         self.discovery_cache.clear()
+        if include_responses and self.http_cache:
+            self.http_cache.clear()
         logger.info("Discovery cache cleared")
 
 
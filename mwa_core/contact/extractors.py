@@ -28,10 +28,25 @@ from .models import (
     Contact, ContactMethod, ContactForm, SocialMediaProfile, 
     ConfidenceLevel, DiscoveryContext, SocialMediaPlatform
 )
+from .parsing import ParsedForm, FormElement
+from .scanner import PatternScanner
 from ..config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Email obfuscations resolved by normalize_text, in the order they are applied.
+# A replacement only runs if its marker occurs in the lowercased text; the
+# replacements insert "@" or "." and so never create a later marker.
+OBFUSCATION_REPLACEMENTS = [
+    ('[at]', re.compile(r'\s*\[at\]\s*', re.IGNORECASE), '@'),
+    ('(at)', re.compile(r'\s*\(at\)\s*', re.IGNORECASE), '@'),
+    (' at ', re.compile(r'\s+at\s+', re.IGNORECASE), '@'),
+    ('[dot]', re.compile(r'\s*\[dot\]\s*', re.IGNORECASE), '.'),
+    ('(dot)', re.compile(r'\s*\(dot\)\s*', re.IGNORECASE), '.'),
+    (' dot ', re.compile(r'\s+dot\s+', re.IGNORECASE), '.'),
+]
+NOREPLY_PATTERN = re.compile(r'\b(noreply|no-reply|no_reply|donotreply)\b', re.IGNORECASE)
+
 
 class BaseExtractor:
     """Base class for all contact extractors."""
@@ -61,26 +76,25 @@ class BaseExtractor:
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        # Remove extra whitespace (str.split and \s agree on what whitespace is)
+        text = ' '.join(text.split())
         
         # Replace common email obfuscations
-        text = re.sub(r'\s*\[at\]\s*', '@', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*\(at\)\s*', '@', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s+at\s+', '@', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*\[dot\]\s*', '.', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*\(dot\)\s*', '.', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s+dot\s+', '.', text, flags=re.IGNORECASE)
+        lowered = text.lower()
+        for marker, pattern, replacement in OBFUSCATION_REPLACEMENTS:
+            if marker in lowered:
+                text = pattern.sub(replacement, text)
         
         # Handle Unicode obfuscations
-        text = re.sub(r'&#64;', '@', text)  # @ in HTML entities
-        text = re.sub(r'&#46;', '.', text)  # . in HTML entities
+        text = text.replace('&#64;', '@')  # @ in HTML entities
+        text = text.replace('&#46;', '.')  # . in HTML entities
         
         # Remove HTML entities
         text = html.unescape(text)
         
         # Remove common tracking/analytics markers
-        text = re.sub(r'\b(noreply|no-reply|no_reply|donotreply)\b', '', text, flags=re.IGNORECASE)
+        if 'reply' in text.lower():
+            text = NOREPLY_PATTERN.sub('', text)
         
         return text.strip()
 
@@ -114,6 +128,18 @@ class EmailExtractor(BaseExtractor):
         'javascript': r'document\.write\([\'"]([^\'"]+)[\'"]\)',  # Basic JS obfuscation
     }
     
+    # Standard and obfuscated patterns found in one pass; every match starts
+    # with a local part followed by "@" or an obfuscated separator
+    EMAIL_SCANNER = PatternScanner(
+        [('standard', EMAIL_PATTERNS['standard'])] +
+        [('obfuscated_text', pattern) for pattern in EMAIL_PATTERNS['obfuscated_text']],
+        trigger=r'\b[a-zA-Z0-9][a-zA-Z0-9._%+-]*(?:@|\s*[\[(](?:at|dot)[\])]|\s+at\s)',
+        flags=re.IGNORECASE
+    )
+    MAILTO_PATTERN = re.compile(r'mailto:([^\s?&"<>]+)', re.IGNORECASE)
+    VALID_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    TRAILING_PUNCTUATION_PATTERN = re.compile(r'[.,;:!?]+$')
+    
     # Common German email domains for better context
     GERMAN_DOMAINS = {
         'gmx.de', 'gmx.net', 'web.de', 't-online.de', 'freenet.de',
@@ -141,13 +167,14 @@ class EmailExtractor(BaseExtractor):
         """
         contacts = []
         normalized_text = self.normalize_text(text)
+        matches = self.EMAIL_SCANNER.scan_by_name(normalized_text)
         
         # Extract standard emails
-        standard_emails = self._extract_standard_emails(normalized_text, source_url, context)
+        standard_emails = self._extract_standard_emails(matches['standard'], source_url, context)
         contacts.extend(standard_emails)
         
         # Extract obfuscated emails
-        obfuscated_emails = self._extract_obfuscated_emails(normalized_text, source_url, context)
+        obfuscated_emails = self._extract_obfuscated_emails(matches['obfuscated_text'], source_url, context)
         contacts.extend(obfuscated_emails)
         
         # Extract from mailto links
@@ -166,12 +193,11 @@ class EmailExtractor(BaseExtractor):
         
         return unique_contacts
     
-    def _extract_standard_emails(self, text: str, source_url: str, context: DiscoveryContext) -> List[Contact]:
-        """Extract standard format emails."""
+    def _extract_standard_emails(self, matches: List[re.Match], source_url: str, context: DiscoveryContext) -> List[Contact]:
+        """Extract standard format emails from scanner matches."""
         contacts = []
-        pattern = self.EMAIL_PATTERNS['standard']
         
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+        for match in matches:
             try:
                 email = match.group()
                 
@@ -203,49 +229,45 @@ class EmailExtractor(BaseExtractor):
         
         return contacts
     
-    def _extract_obfuscated_emails(self, text: str, source_url: str, context: DiscoveryContext) -> List[Contact]:
-        """Extract obfuscated emails with various techniques."""
+    def _extract_obfuscated_emails(self, matches: List[re.Match], source_url: str, context: DiscoveryContext) -> List[Contact]:
+        """Extract text-obfuscated emails from scanner matches."""
         contacts = []
         
-        # Text-based obfuscations
-        for pattern in self.EMAIL_PATTERNS['obfuscated_text']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            try:
+                # Reconstruct email from obfuscated parts
+                if len(match.groups()) == 2:
+                    user, domain = match.groups()
+                    email = f"{user}@{domain}"
+                else:
+                    email = match.group()
             
-            for match in matches:
-                try:
-                    # Reconstruct email from obfuscated parts
-                    if len(match.groups()) == 2:
-                        user, domain = match.groups()
-                        email = f"{user}@{domain}"
-                    else:
-                        email = match.group()
-                    
-                    # Clean up email
-                    email = re.sub(r'[.,;:!?]+$', '', email)
-                    email = email.strip()
+                # Clean up email
+                email = self.TRAILING_PUNCTUATION_PATTERN.sub('', email)
+                email = email.strip()
                     
-                    if not self._is_valid_email(email):
-                        continue
+                if not self._is_valid_email(email):
+                    continue
                     
-                    confidence = ConfidenceLevel.MEDIUM  # Obfuscated emails get medium confidence
+                confidence = ConfidenceLevel.MEDIUM  # Obfuscated emails get medium confidence
                     
-                    contact = Contact(
-                        method=ContactMethod.EMAIL,
-                        value=email,
-                        confidence=confidence,
-                        source_url=source_url,
-                        discovery_path=context.discovery_path.copy(),
-                        metadata={
-                            "extraction_pattern": "obfuscated_text",
-                            "obfuscation_type": "text_replacement",
-                            "original_text": match.group()
-                        }
-                    )
+                contact = Contact(
+                    method=ContactMethod.EMAIL,
+                    value=email,
+                    confidence=confidence,
+                    source_url=source_url,
+                    discovery_path=context.discovery_path.copy(),
+                    metadata={
+                        "extraction_pattern": "obfuscated_text",
+                        "obfuscation_type": "text_replacement",
+                        "original_text": match.group()
+                    }
+                )
                     
-                    contacts.append(contact)
+                contacts.append(contact)
                     
-                except Exception as e:
-                    continue
+            except Exception as e:
+                continue
         
         return contacts
     
@@ -254,10 +276,7 @@ class EmailExtractor(BaseExtractor):
         contacts = []
         
         # Simple mailto extraction
-        mailto_pattern = r'mailto:([^\s?&"<>]+)'
-        matches = re.finditer(mailto_pattern, text, re.IGNORECASE)
-        
-        for match in matches:
+        for match in self.MAILTO_PATTERN.finditer(text):
             try:
                 email = match.group(1)
                 
@@ -293,8 +312,7 @@ class EmailExtractor(BaseExtractor):
             return False
         
         # Basic format check
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
+        if not self.VALID_EMAIL_PATTERN.match(email):
             return False
         
         # Skip obviously invalid domains
@@ -370,6 +388,15 @@ class PhoneExtractor(BaseExtractor):
         ]
     }
     
+    # Every phone pattern starts with a literal, which the regex engine finds
+    # faster per pattern than through a shared trigger
+    PHONE_SCANNER = PatternScanner(
+        [(family, pattern) for family, patterns in PHONE_PATTERNS.items() if family != 'generic'
+         for pattern in patterns],
+        flags=re.IGNORECASE
+    )
+    PHONE_CLEANUP_PATTERN = re.compile(r'[^\d+]')
+    
     # German area codes for validation
     GERMAN_AREA_CODES = {
         '089', '030', '040', '069', '0711', '0211', '0221', '0231', '0241',
@@ -396,21 +423,22 @@ class PhoneExtractor(BaseExtractor):
             List of Contact objects for found phone numbers
         """
         contacts = []
+        matches = self.PHONE_SCANNER.scan_by_name(text)
         
         # Extract German national numbers
-        german_numbers = self._extract_german_phones(text, source_url, context)
+        german_numbers = self._extract_german_phones(matches['german_national'], source_url, context)
         contacts.extend(german_numbers)
         
         # Extract Munich local numbers
-        munich_numbers = self._extract_munich_phones(text, source_url, context)
+        munich_numbers = self._extract_munich_phones(matches['munich_local'], source_url, context)
         contacts.extend(munich_numbers)
         
         # Extract international numbers
-        international_numbers = self._extract_international_phones(text, source_url, context)
+        international_numbers = self._extract_international_phones(matches['international'], source_url, context)
         contacts.extend(international_numbers)
         
         # Extract mobile numbers
-        mobile_numbers = self._extract_mobile_phones(text, source_url, context)
+        mobile_numbers = self._extract_mobile_phones(matches['german_mobile'], source_url, context)
         contacts.extend(mobile_numbers)
         
         # Remove duplicates
@@ -424,153 +452,141 @@ class PhoneExtractor(BaseExtractor):
         
         return unique_contacts
     
-    def _extract_german_phones(self, text: str, source_url: str, context: DiscoveryContext) -> List[Contact]:
-        """Extract German national format phone numbers."""
+    def _extract_german_phones(self, matches: List[re.Match], source_url: str, context: DiscoveryContext) -> List[Contact]:
+        """Extract German national format phone numbers from scanner matches."""
         contacts = []
         
-        for pattern in self.PHONE_PATTERNS['german_national']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            try:
+                phone = match.group().strip()
             
-            for match in matches:
-                try:
-                    phone = match.group().strip()
+                # Clean up phone number
+                phone = self.PHONE_CLEANUP_PATTERN.sub('', phone)
                     
-                    # Clean up phone number
-                    phone = re.sub(r'[^\d+]', '', phone)
-                    
-                    # Validate German phone format
-                    if not self._is_valid_german_phone(phone):
-                        continue
+                # Validate German phone format
+                if not self._is_valid_german_phone(phone):
+                    continue
                     
-                    confidence = self._determine_phone_confidence(phone, source_url, context, 'german')
+                confidence = self._determine_phone_confidence(phone, source_url, context, 'german')
                     
-                    contact = Contact(
-                        method=ContactMethod.PHONE,
-                        value=phone,
-                        confidence=confidence,
-                        source_url=source_url,
-                        discovery_path=context.discovery_path.copy(),
-                        metadata={
-                            "extraction_pattern": "german_national",
-                            "format": "national",
-                            "area_code": self._extract_area_code(phone)
-                        }
-                    )
+                contact = Contact(
+                    method=ContactMethod.PHONE,
+                    value=phone,
+                    confidence=confidence,
+                    source_url=source_url,
+                    discovery_path=context.discovery_path.copy(),
+                    metadata={
+                        "extraction_pattern": "german_national",
+                        "format": "national",
+                        "area_code": self._extract_area_code(phone)
+                    }
+                )
                     
-                    contacts.append(contact)
+                contacts.append(contact)
                     
-                except Exception as e:
-                    continue
+            except Exception as e:
+                continue
         
         return contacts
     
-    def _extract_munich_phones(self, text: str, source_url: str, context: DiscoveryContext) -> List[Contact]:
-        """Extract Munich-specific phone numbers."""
+    def _extract_munich_phones(self, matches: List[re.Match], source_url: str, context: DiscoveryContext) -> List[Contact]:
+        """Extract Munich-specific phone numbers from scanner matches."""
         contacts = []
         
-        for pattern in self.PHONE_PATTERNS['munich_local']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            try:
+                phone = match.group().strip()
+                phone = self.PHONE_CLEANUP_PATTERN.sub('', phone)
             
-            for match in matches:
-                try:
-                    phone = match.group().strip()
-                    phone = re.sub(r'[^\d+]', '', phone)
-                    
-                    if not phone.startswith('089') or len(phone) < 10:
-                        continue
+                if not phone.startswith('089') or len(phone) < 10:
+                    continue
                     
-                    contact = Contact(
-                        method=ContactMethod.PHONE,
-                        value=phone,
-                        confidence=ConfidenceLevel.HIGH,  # Munich numbers are high confidence
-                        source_url=source_url,
-                        discovery_path=context.discovery_path.copy(),
-                        metadata={
-                            "extraction_pattern": "munich_local",
-                            "format": "local",
-                            "area_code": "089",
-                            "is_munich": True
-                        }
-                    )
+                contact = Contact(
+                    method=ContactMethod.PHONE,
+                    value=phone,
+                    confidence=ConfidenceLevel.HIGH,  # Munich numbers are high confidence
+                    source_url=source_url,
+                    discovery_path=context.discovery_path.copy(),
+                    metadata={
+                        "extraction_pattern": "munich_local",
+                        "format": "local",
+                        "area_code": "089",
+                        "is_munich": True
+                    }
+                )
                     
-                    contacts.append(contact)
+                contacts.append(contact)
                     
-                except Exception as e:
-                    continue
+            except Exception as e:
+                continue
         
         return contacts
     
-    def _extract_international_phones(self, text: str, source_url: str, context: DiscoveryContext) -> List[Contact]:
-        """Extract international format phone numbers."""
+    def _extract_international_phones(self, matches: List[re.Match], source_url: str, context: DiscoveryContext) -> List[Contact]:
+        """Extract international format phone numbers from scanner matches."""
         contacts = []
         
-        for pattern in self.PHONE_PATTERNS['international']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            try:
+                phone = match.group().strip()
+                phone = self.PHONE_CLEANUP_PATTERN.sub('', phone)
             
-            for match in matches:
-                try:
-                    phone = match.group().strip()
-                    phone = re.sub(r'[^\d+]', '', phone)
-                    
-                    if not self._is_valid_international_phone(phone):
-                        continue
+                if not self._is_valid_international_phone(phone):
+                    continue
                     
-                    confidence = self._determine_phone_confidence(phone, source_url, context, 'international')
+                confidence = self._determine_phone_confidence(phone, source_url, context, 'international')
                     
-                    contact = Contact(
-                        method=ContactMethod.PHONE,
-                        value=phone,
-                        confidence=confidence,
-                        source_url=source_url,
-                        discovery_path=context.discovery_path.copy(),
-                        metadata={
-                            "extraction_pattern": "international",
-                            "format": "international",
-                            "country_code": self._extract_country_code(phone)
-                        }
-                    )
+                contact = Contact(
+                    method=ContactMethod.PHONE,
+                    value=phone,
+                    confidence=confidence,
+                    source_url=source_url,
+                    discovery_path=context.discovery_path.copy(),
+                    metadata={
+                        "extraction_pattern": "international",
+                        "format": "international",
+                        "country_code": self._extract_country_code(phone)
+                    }
+                )
                     
-                    contacts.append(contact)
+                contacts.append(contact)
                     
-                except Exception as e:
-                    continue
+            except Exception as e:
+                continue
         
         return contacts
     
-    def _extract_mobile_phones(self, text: str, source_url: str, context: DiscoveryContext) -> List[Contact]:
-        """Extract mobile phone numbers."""
+    def _extract_mobile_phones(self, matches: List[re.Match], source_url: str, context: DiscoveryContext) -> List[Contact]:
+        """Extract mobile phone numbers from scanner matches."""
         contacts = []
         
-        for pattern in self.PHONE_PATTERNS['german_mobile']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            try:
+                phone = match.group().strip()
+                phone = self.PHONE_CLEANUP_PATTERN.sub('', phone)
             
-            for match in matches:
-                try:
-                    phone = match.group().strip()
-                    phone = re.sub(r'[^\d+]', '', phone)
-                    
-                    # German mobile numbers start with 15, 16, or 17
-                    if not (phone.startswith('+4915') or phone.startswith('+4916') or phone.startswith('+4917') or
-                            phone.startswith('015') or phone.startswith('016') or phone.startswith('017')):
-                        continue
+                # German mobile numbers start with 15, 16, or 17
+                if not (phone.startswith('+4915') or phone.startswith('+4916') or phone.startswith('+4917') or
+                        phone.startswith('015') or phone.startswith('016') or phone.startswith('017')):
+                    continue
                     
-                    contact = Contact(
-                        method=ContactMethod.PHONE,
-                        value=phone,
-                        confidence=ConfidenceLevel.HIGH,  # Mobile numbers are high confidence
-                        source_url=source_url,
-                        discovery_path=context.discovery_path.copy(),
-                        metadata={
-                            "extraction_pattern": "german_mobile",
-                            "format": "mobile",
-                            "is_mobile": True
-                        }
-                    )
+                contact = Contact(
+                    method=ContactMethod.PHONE,
+                    value=phone,
+                    confidence=ConfidenceLevel.HIGH,  # Mobile numbers are high confidence
+                    source_url=source_url,
+                    discovery_path=context.discovery_path.copy(),
+                    metadata={
+                        "extraction_pattern": "german_mobile",
+                        "format": "mobile",
+                        "is_mobile": True
+                    }
+                )
                     
-                    contacts.append(contact)
+                contacts.append(contact)
                     
-                except Exception as e:
-                    continue
+            except Exception as e:
+                continue
         
         return contacts
     
@@ -683,12 +699,23 @@ class FormExtractor(BaseExtractor):
         Returns:
             List of ContactForm objects
         """
-        forms = []
+        return self.analyze_forms([ParsedForm.from_tag(form) for form in soup.find_all('form')], source_url, context)
+    
+    def analyze_forms(self, parsed_forms: List[ParsedForm], source_url: str, context: DiscoveryContext) -> List[ContactForm]:
+        """
+        Analyze forms collected by a page parser.
         
-        # Find all forms
-        form_elements = soup.find_all('form')
+        Args:
+            parsed_forms: Forms of the page
+            source_url: URL of the page
+            context: Discovery context
+            
+        Returns:
+            List of ContactForm objects for the contact forms
+        """
+        forms = []
         
-        for form in form_elements:
+        for form in parsed_forms:
             try:
                 form_obj = self._analyze_form(form, source_url, context)
                 if form_obj:
@@ -700,7 +727,7 @@ class FormExtractor(BaseExtractor):
         
         return forms
     
-    def _analyze_form(self, form, source_url: str, context: DiscoveryContext) -> Optional[ContactForm]:
+    def _analyze_form(self, form: ParsedForm, source_url: str, context: DiscoveryContext) -> Optional[ContactForm]:
         """Analyze a single form for contact characteristics."""
         try:
             # Extract basic form attributes
@@ -718,10 +745,8 @@ class FormExtractor(BaseExtractor):
             fields = []
             required_fields = []
             
-            # Find all input elements
-            inputs = form.find_all(['input', 'textarea', 'select'])
-            
-            for input_elem in inputs:
+            # Check all input elements
+            for input_elem in form.fields:
                 field_name = input_elem.get('name')
                 if not field_name:
                     continue
@@ -729,7 +754,7 @@ class FormExtractor(BaseExtractor):
                 fields.append(field_name)
                 
                 # Check if field is required
-                if self._is_required_field(input_elem):
+                if self._is_required_field(input_elem, form):
                     required_fields.append(field_name)
             
             # Extract CSRF token if present
@@ -758,7 +783,7 @@ class FormExtractor(BaseExtractor):
                 user_friendly_score=user_friendly_score,
                 metadata={
                     "form_id": form.get('id'),
-                    "form_class": form.get('class'),
+                    "form_class": form.classes,
                     "total_fields": len(fields),
                     "required_fields_count": len(required_fields)
                 }
@@ -770,7 +795,7 @@ class FormExtractor(BaseExtractor):
             logger.debug(f"Form analysis failed: {e}")
             return None
     
-    def _is_required_field(self, input_elem) -> bool:
+    def _is_required_field(self, input_elem: FormElement, form: ParsedForm) -> bool:
         """Check if an input field is required."""
         # Check standard required attribute
         if input_elem.get('required') is not None:
@@ -781,10 +806,9 @@ class FormExtractor(BaseExtractor):
             return True
         
         # Check for asterisk in labels
-        labels = input_elem.find_parent('form').find_all('label')
-        for label in labels:
-            if 'for' in label.attrs and label['for'] == input_elem.get('id', ''):
-                if '*' in label.get_text():
+        for label in form.labels:
+            if 'for' in label.attrs and label.attrs['for'] == input_elem.get('id', ''):
+                if '*' in label.text:
                     return True
         
         # Check field name against common required fields
@@ -794,7 +818,7 @@ class FormExtractor(BaseExtractor):
         
         return False
     
-    def _extract_csrf_token(self, form) -> Optional[str]:
+    def _extract_csrf_token(self, form: ParsedForm) -> Optional[str]:
         """Extract CSRF token from form."""
         # Look for common CSRF token field names
         csrf_patterns = [
@@ -802,7 +826,7 @@ class FormExtractor(BaseExtractor):
             r'__RequestVerificationToken', r'csrf_token'
         ]
         
-        inputs = form.find_all('input', {'type': 'hidden'})
+        inputs = [elem for elem in form.fields if elem.tag == 'input' and elem.get('type') == 'hidden']
         
         for input_elem in inputs:
             name = input_elem.get('name', '').lower()
@@ -812,10 +836,10 @@ class FormExtractor(BaseExtractor):
         
         return None
     
-    def _is_contact_form(self, form, fields: List[str]) -> bool:
+    def _is_contact_form(self, form: ParsedForm, fields: List[str]) -> bool:
         """Determine if a form is likely a contact form."""
         # Check form text for contact keywords
-        form_text = form.get_text(strip=True).lower()
+        form_text = form.text.lower()
         if any(keyword in form_text for keyword in self.CONTACT_FORM_KEYWORDS):
             return True
         
@@ -855,33 +879,29 @@ class FormExtractor(BaseExtractor):
         # Combine scores
         return (field_complexity + required_complexity + type_complexity) / 3
     
-    def _calculate_user_friendly_score(self, form, fields: List[str]) -> float:
+    def _calculate_user_friendly_score(self, form: ParsedForm, fields: List[str]) -> float:
         """Calculate user-friendliness score (0-1)."""
         score = 0.5  # Base score
         
         # Check for labels
-        labels = form.find_all('label')
-        if labels:
+        if form.labels:
             score += 0.2
         
         # Check for placeholder text
-        inputs_with_placeholder = form.find_all(attrs={'placeholder': True})
-        if inputs_with_placeholder:
+        if form.has_placeholder:
             score += 0.1
         
         # Check for fieldsets/organization
-        fieldsets = form.find_all('fieldset')
-        if fieldsets:
+        if form.has_fieldset:
             score += 0.1
         
         # Check for help text
-        help_texts = form.find_all(class_=re.compile(r'help|hint|info'))
-        if help_texts:
+        if form.has_help_text:
             score += 0.1
         
         return min(score, 1.0)
     
-    def _determine_form_confidence(self, form, fields: List[str], source_url: str) -> ConfidenceLevel:
+    def _determine_form_confidence(self, form: ParsedForm, fields: List[str], source_url: str) -> ConfidenceLevel:
         """Determine confidence level for form extraction."""
         # Forms on contact pages are high confidence
         contact_keywords = ['contact', 'kontakt', 'impressum']
@@ -952,6 +972,13 @@ class SocialMediaExtractor(BaseExtractor):
         ],
     }
     
+    # Each platform pattern starts with a host literal and is scanned on its own
+    SOCIAL_SCANNER = PatternScanner(
+        [(platform, pattern) for platform, patterns in PLATFORM_PATTERNS.items() for pattern in patterns],
+        flags=re.IGNORECASE
+    )
+    DISPLAY_NAME_PATTERN = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+    
     # Business-related keywords for profile filtering
     BUSINESS_KEYWORDS = {
         'immobilien', 'verwaltung', 'makler', 'realtor', 'estate',
@@ -972,40 +999,36 @@ class SocialMediaExtractor(BaseExtractor):
         """
         profiles = []
         
-        for platform, patterns in self.PLATFORM_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+        for platform, match in self.SOCIAL_SCANNER.scan(text):
+            try:
+                username = match.group(1)
                 
-                for match in matches:
-                    try:
-                        username = match.group(1)
-                        
-                        # Construct full profile URL
-                        profile_url = self._construct_profile_url(platform, username)
+                # Construct full profile URL
+                profile_url = self._construct_profile_url(platform, username)
                         
-                        # Extract display name if available
-                        display_name = self._extract_display_name(text, match)
+                # Extract display name if available
+                display_name = self._extract_display_name(text, match)
                         
-                        # Determine confidence
-                        confidence = self._determine_social_confidence(platform, username, source_url)
+                # Determine confidence
+                confidence = self._determine_social_confidence(platform, username, source_url)
                         
-                        profile = SocialMediaProfile(
-                            platform=platform,
-                            username=username,
-                            profile_url=profile_url,
-                            display_name=display_name,
-                            source_url=source_url,
-                            confidence=confidence,
-                            metadata={
-                                "extraction_pattern": pattern,
-                                "is_business_related": self._is_business_profile(username, display_name)
-                            }
-                        )
+                profile = SocialMediaProfile(
+                    platform=platform,
+                    username=username,
+                    profile_url=profile_url,
+                    display_name=display_name,
+                    source_url=source_url,
+                    confidence=confidence,
+                    metadata={
+                        "extraction_pattern": match.re.pattern,
+                        "is_business_related": self._is_business_profile(username, display_name)
+                    }
+                )
                         
-                        profiles.append(profile)
+                profiles.append(profile)
                         
-                    except Exception as e:
-                        continue
+            except Exception as e:
+                continue
         
         # Remove duplicates
         seen = set()
@@ -1041,8 +1064,7 @@ class SocialMediaExtractor(BaseExtractor):
             context_text = text[start:end]
             
             # Look for name patterns
-            name_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-            name_matches = re.findall(name_pattern, context_text)
+            name_matches = self.DISPLAY_NAME_PATTERN.findall(context_text)
             
             if name_matches:
                 return name_matches[0]
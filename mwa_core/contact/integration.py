@@ -62,11 +62,7 @@ class ContactDiscoveryIntegration:
         
         # Initialize scoring and validation
         self.scoring_engine = ContactScoringEngine(config)
-        self.validator = ContactValidator(
-            enable_smtp_verification=self.settings.smtp_verification,
-            enable_dns_verification=self.settings.dns_verification,
-            rate_limit_seconds=self.settings.rate_limit_seconds
-        )
+        self.validator = ContactValidator.from_settings(self.settings)
         
         # Initialize deduplication
         self.deduplication_engine = DeduplicationEngine(config)
@@ -0,0 +1,272 @@
+"""
+Asynchronous MX resolution with a shared TTL cache for contact validation.
+
+Validating a batch of email contacts used to resolve the MX records of
+every contact's domain with the blocking ``dns.resolver``, freezing the
+event loop and repeating the lookup for each gmx.de or web.de address.
+``MXResolver`` resolves each domain once:
+- Lookups use ``dns.asyncresolver`` and do not block the event loop
+- Answers are kept in memory and in an ``MXCacheStore`` for the TTL of the
+  DNS record (clamped to a minimum and maximum), so later runs reuse them
+- Concurrent lookups of the same domain share one query
+- ``NXDOMAIN`` is cached for ``negative_ttl``; timeouts and server failures
+  are not cached
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+
+from ..storage.mx_cache import CachedMXLookup, MXCacheStore
+
+logger = logging.getLogger(__name__)
+
+
+class MXResolver:
+    """
+    Resolves and caches the mail hosts of email domains.
+    
+    A domain without MX records but with an A record accepts mail at the
+    domain itself (implicit MX, RFC 5321), so its host list is the domain.
+    """
+    
+    def __init__(self, storage_path: Optional[str] = "data/contact_discovery/mx_cache.db",
+                 min_ttl: int = 300, max_ttl: int = 7 * 86400, negative_ttl: int = 3600,
+                 timeout: float = 5.0, max_memory_entries: int = 10000,
+                 resolver: Optional[Any] = None):
+        """
+        Initialize the MX resolver.
+        
+        Args:
+            storage_path: Path to the SQLite cache database (opened on first
+                use), or None to cache in memory only
+            min_ttl: Minimum seconds an answer is cached
+            max_ttl: Maximum seconds an answer is cached
+            negative_ttl: Seconds a non-existent domain is cached
+            timeout: Seconds a lookup may take
+            max_memory_entries: Maximum number of domains kept in memory
+            resolver: ``dns.asyncresolver.Resolver`` to use (created if omitted)
+        """
+        self.storage_path = storage_path
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.max_memory_entries = max_memory_entries
+        self._resolver = resolver
+        self._store: Optional[MXCacheStore] = None
+        self._memory: "OrderedDict[str, CachedMXLookup]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats = {"hits": 0, "disk_hits": 0, "lookups": 0, "errors": 0}
+    
+    @classmethod
+    def from_settings(cls, settings: Any) -> "MXResolver":
+        """
+        Create the resolver configured in the contact discovery settings.
+        
+        Args:
+            settings: ``ContactDiscoveryConfig``
+        
+        Returns:
+            MXResolver
+        """
+        return cls(
+            storage_path=settings.mx_cache_path if settings.mx_cache_enabled else None,
+            negative_ttl=settings.mx_negative_ttl_seconds
+        )
+    
+    @property
+    def resolver(self) -> Any:
+        """The DNS resolver, created on first access."""
+        if self._resolver is None:
+            self._resolver = dns.asyncresolver.Resolver()
+        return self._resolver
+    
+    @property
+    def store(self) -> Optional[MXCacheStore]:
+        """The underlying store, created on first access."""
+        if self._store is None and self.storage_path:
+            self._store = MXCacheStore(self.storage_path)
+        return self._store
+    
+    async def lookup(self, domain: str) -> Optional[CachedMXLookup]:
+        """
+        Get the mail hosts of a domain from the cache or DNS.
+        
+        Args:
+            domain: Email domain
+        
+        Returns:
+            CachedMXLookup, or None if the domain could not be resolved
+            (timeout, server failure)
+        """
+        domain = domain.lower().rstrip('.')
+        cached = self._memory.get(domain)
+        if cached is not None and cached.is_fresh:
+            self._memory.move_to_end(domain)
+            self._stats["hits"] += 1
+            return cached
+        
+        pending = self._inflight.get(domain)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The task resolving the domain was cancelled, not this one
+                return await self.lookup(domain)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[domain] = future
+        try:
+            result = self._load(domain)
+            if result is not None:
+                self._stats["disk_hits"] += 1
+            else:
+                result = await self._resolve(domain)
+                if result is not None:
+                    self._save(result)
+            if result is not None:
+                self._remember(result)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved for the owner
+            future.exception()
+            raise
+        finally:
+            del self._inflight[domain]
+    
+    async def lookup_many(self, domains: Iterable[str]) -> Dict[str, Optional[CachedMXLookup]]:
+        """
+        Resolve several domains concurrently, each once.
+        
+        Domains found in the disk cache are loaded with one query before the
+        others are resolved.
+        
+        Args:
+            domains: Email domains
+        
+        Returns:
+            Mapping of lowercase domain to its lookup (None if unresolved)
+        """
+        unique = list(dict.fromkeys(domain.lower().rstrip('.') for domain in domains))
+        missing = [domain for domain in unique
+                   if domain not in self._memory or not self._memory[domain].is_fresh]
+        if missing and self.store is not None:
+            try:
+                for item in self.store.get_many(missing):
+                    if item.is_fresh:
+                        self._remember(item)
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"Error reading MX cache: {e}")
+        results = await asyncio.gather(*(self.lookup(domain) for domain in unique))
+        return dict(zip(unique, results))
+    
+    async def accepts_mail(self, domain: str) -> bool:
+        """
+        Check whether a domain has MX records, or an A record to fall back to.
+        
+        Args:
+            domain: Email domain
+        
+        Returns:
+            True if mail can be delivered to the domain
+        """
+        result = await self.lookup(domain)
+        return result is not None and result.accepts_mail
+    
+    async def _resolve(self, domain: str) -> Optional[CachedMXLookup]:
+        """Resolve a domain's MX records, falling back to its A record."""
+        self._stats["lookups"] += 1
+        try:
+            answer = await self.resolver.resolve(domain, 'MX', lifetime=self.timeout)
+            records = sorted(answer, key=lambda record: record.preference)
+            hosts = [str(record.exchange).rstrip('.') for record in records]
+            # A null MX ("0 .") means the domain accepts no mail (RFC 7505)
+            hosts = [host for host in hosts if host]
+            return self._result(domain, hosts, bool(hosts), answer.rrset.ttl)
+        except dns.resolver.NXDOMAIN:
+            return self._result(domain, [], False, self.negative_ttl)
+        except dns.resolver.NoAnswer:
+            pass
+        except (dns.exception.DNSException, OSError) as e:
+            self._stats["errors"] += 1
+            logger.debug(f"MX lookup failed for {domain}: {e}")
+            return None
+        
+        # No MX records, check A records as fallback
+        try:
+            answer = await self.resolver.resolve(domain, 'A', lifetime=self.timeout)
+            return self._result(domain, [domain], True, answer.rrset.ttl)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return self._result(domain, [], False, self.negative_ttl)
+        except (dns.exception.DNSException, OSError) as e:
+            self._stats["errors"] += 1
+            logger.debug(f"A lookup failed for {domain}: {e}")
+            return None
+    
+    def _result(self, domain: str, hosts: List[str], accepts_mail: bool, ttl: int) -> CachedMXLookup:
+        ttl = min(max(ttl, self.min_ttl), self.max_ttl)
+        now = datetime.now()
+        return CachedMXLookup(domain=domain, accepts_mail=accepts_mail, hosts=hosts,
+                              resolved_at=now, expires_at=now + timedelta(seconds=ttl))
+    
+    def _remember(self, item: CachedMXLookup) -> None:
+        self._memory[item.domain] = item
+        self._memory.move_to_end(item.domain)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+    
+    def _load(self, domain: str) -> Optional[CachedMXLookup]:
+        if self.store is None:
+            return None
+        try:
+            cached = self.store.get(domain)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"Error reading MX cache: {e}")
+            return None
+        return cached if cached is not None and cached.is_fresh else None
+    
+    def _save(self, item: CachedMXLookup) -> None:
+        if self.store is None:
+            return
+        try:
+            self.store.put(item)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"Error storing MX lookup for {item.domain}: {e}")
+    
+    def clear(self) -> None:
+        """Forget all cached lookups, in memory and on disk."""
+        self._memory.clear()
+        if self.store is not None:
+            try:
+                self.store.clear()
+            except Exception as e:
+                logger.error(f"Error clearing MX cache: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get resolver statistics.
+        
+        Returns:
+            Dictionary with memory hits, disk hits, DNS lookups, errors and
+            the number of domains held in memory
+        """
+        stats = dict(self._stats)
+        stats["memory_entries"] = len(self._memory)
+        return stats
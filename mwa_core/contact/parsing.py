@@ -0,0 +1,327 @@
+"""
+HTML parser backends for the contact crawler.
+
+The crawler needs four things from a page: its text, its links, its forms
+and its images. ``ParsedPage`` holds them so that a page is parsed once:
+- ``LxmlPageParser`` collects them while libxml2 parses the page, without
+  building a tree
+- ``SoupPageParser`` builds a BeautifulSoup tree with ``html.parser`` and is
+  used when lxml is not installed or cannot parse a page
+
+Both follow BeautifulSoup's ``get_text()``: text inside ``script``,
+``style``, ``template``, ``rt`` and ``rp`` elements and comments are left out,
+and whitespace between elements becomes a single newline or space.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Elements whose strings BeautifulSoup does not count as page text
+EXCLUDED_TEXT_ELEMENTS = frozenset({'script', 'style', 'template', 'rt', 'rp'})
+# Elements in which BeautifulSoup keeps whitespace-only strings as they are
+PRESERVE_WHITESPACE_ELEMENTS = frozenset({'pre', 'textarea'})
+ASCII_WHITESPACE = ' \n\t\x0c\r'
+FORM_FIELD_ELEMENTS = frozenset({'input', 'textarea', 'select'})
+HELP_CLASS_PATTERN = re.compile(r'help|hint|info')
+
+
+@dataclass
+class PageLink:
+    """An ``<a href>`` element."""
+    href: str
+    text: str
+
+
+@dataclass
+class FormElement:
+    """An element inside a form."""
+    tag: str
+    attrs: Dict[str, str]
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get an attribute value."""
+        return self.attrs.get(name, default)
+
+
+@dataclass
+class FormLabel:
+    """A ``<label>`` element inside a form."""
+    attrs: Dict[str, str]
+    text: str = ""
+
+
+@dataclass
+class ParsedForm:
+    """
+    A ``<form>`` element with what contact form detection needs.
+    
+    Attributes:
+        attrs: Attributes of the form element
+        fields: ``input``, ``textarea`` and ``select`` elements in the form
+        labels: ``label`` elements in the form
+        text: Stripped text of the form, as ``get_text(strip=True)``
+        has_placeholder: Whether an element in the form has a placeholder
+        has_fieldset: Whether the form contains a fieldset
+        has_help_text: Whether an element in the form has a help/hint/info class
+    """
+    attrs: Dict[str, str] = field(default_factory=dict)
+    fields: List[FormElement] = field(default_factory=list)
+    labels: List[FormLabel] = field(default_factory=list)
+    text: str = ""
+    has_placeholder: bool = False
+    has_fieldset: bool = False
+    has_help_text: bool = False
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get an attribute value of the form element."""
+        return self.attrs.get(name, default)
+    
+    @property
+    def classes(self) -> Optional[List[str]]:
+        """The form's classes, or None without a class attribute."""
+        if 'class' not in self.attrs:
+            return None
+        return self.attrs['class'].split()
+    
+    @classmethod
+    def from_tag(cls, form) -> "ParsedForm":
+        """
+        Create a parsed form from a BeautifulSoup ``form`` tag.
+        
+        Args:
+            form: BeautifulSoup tag
+        
+        Returns:
+            ParsedForm
+        """
+        return cls(
+            attrs=_flatten_attrs(form.attrs),
+            fields=[FormElement(elem.name, _flatten_attrs(elem.attrs))
+                    for elem in form.find_all(list(FORM_FIELD_ELEMENTS))],
+            labels=[FormLabel(_flatten_attrs(label.attrs), label.get_text()) for label in form.find_all('label')],
+            text=form.get_text(strip=True),
+            has_placeholder=form.find(attrs={'placeholder': True}) is not None,
+            has_fieldset=form.find('fieldset') is not None,
+            has_help_text=form.find(class_=HELP_CLASS_PATTERN) is not None,
+        )
+
+
+@dataclass
+class ParsedPage:
+    """Text, links, forms and image sources of an HTML page."""
+    text: str = ""
+    links: List[PageLink] = field(default_factory=list)
+    forms: List[ParsedForm] = field(default_factory=list)
+    images: List[str] = field(default_factory=list)
+
+
+def _flatten_attrs(attrs: Dict[str, Any]) -> Dict[str, str]:
+    """Join BeautifulSoup's multi-valued attributes (e.g. class) into strings."""
+    return {name: ' '.join(value) if isinstance(value, list) else value for name, value in attrs.items()}
+
+
+class PageParser:
+    """Base class for HTML parser backends."""
+    
+    name = "base"
+    
+    def parse(self, html: str) -> ParsedPage:
+        """
+        Parse an HTML page.
+        
+        Args:
+            html: Page markup
+        
+        Returns:
+            ParsedPage with text, links and forms
+        """
+        raise NotImplementedError
+
+
+class SoupPageParser(PageParser):
+    """BeautifulSoup with Python's ``html.parser``."""
+    
+    name = "html.parser"
+    
+    def parse(self, html: str) -> ParsedPage:
+        """Parse a page into a BeautifulSoup tree and walk it."""
+        soup = BeautifulSoup(html, 'html.parser')
+        return ParsedPage(
+            text=soup.get_text(),
+            links=[PageLink(href=link.get('href', ''), text=link.get_text(strip=True))
+                   for link in soup.find_all('a', href=True)],
+            forms=[ParsedForm.from_tag(form) for form in soup.find_all('form')],
+            images=[img['src'] for img in soup.find_all('img', src=True)],
+        )
+
+
+class _PageCollector:
+    """lxml parser target collecting text, links, forms and images in one pass."""
+    
+    def __init__(self):
+        self.text: List[str] = []
+        self.links: List[PageLink] = []
+        self.forms: List[ParsedForm] = []
+        self.images: List[str] = []
+        # Open elements with the strings collected for them so far; None for
+        # elements that are not collected (links without href, labels
+        # outside forms)
+        self._open: Dict[str, List[Optional[Tuple[Any, List[str]]]]] = {'a': [], 'label': [], 'form': []}
+        self._pending: List[str] = []
+        self._excluded_depth = 0
+        self._preserve_depth = 0
+    
+    def start(self, tag: str, attrib) -> None:
+        self._flush()
+        if tag in EXCLUDED_TEXT_ELEMENTS:
+            self._excluded_depth += 1
+        elif tag in PRESERVE_WHITESPACE_ELEMENTS:
+            self._preserve_depth += 1
+        attrs = dict(attrib)
+        if 'class' in attrs:
+            attrs['class'] = ' '.join(attrs['class'].split())
+        open_forms = [entry[0] for entry in self._open['form'] if entry is not None]
+        
+        for form in open_forms:
+            if tag in FORM_FIELD_ELEMENTS:
+                form.fields.append(FormElement(tag, attrs))
+            elif tag == 'fieldset':
+                form.has_fieldset = True
+            if 'placeholder' in attrs:
+                form.has_placeholder = True
+            if HELP_CLASS_PATTERN.search(attrs.get('class', '')):
+                form.has_help_text = True
+        
+        if tag == 'img' and 'src' in attrs:
+            self.images.append(attrs['src'])
+        elif tag == 'a':
+            self._open['a'].append((PageLink(href=attrs['href'], text=""), []) if 'href' in attrs else None)
+        elif tag == 'label':
+            label = FormLabel(attrs) if open_forms else None
+            for form in open_forms:
+                form.labels.append(label)
+            self._open['label'].append((label, []) if label else None)
+        elif tag == 'form':
+            self._open['form'].append((ParsedForm(attrs=attrs), []))
+    
+    def end(self, tag: str) -> None:
+        self._flush()
+        if tag in EXCLUDED_TEXT_ELEMENTS and self._excluded_depth:
+            self._excluded_depth -= 1
+        elif tag in PRESERVE_WHITESPACE_ELEMENTS and self._preserve_depth:
+            self._preserve_depth -= 1
+        if tag not in self._open or not self._open[tag]:
+            return
+        
+        entry = self._open[tag].pop()
+        if entry is None:
+            return
+        element, strings = entry
+        if tag == 'a':
+            element.text = ''.join(string.strip() for string in strings)
+            self.links.append(element)
+        elif tag == 'label':
+            element.text = ''.join(strings)
+        else:
+            element.text = ''.join(string.strip() for string in strings)
+            self.forms.append(element)
+    
+    def data(self, data: str) -> None:
+        # libxml2 reports a text node in several chunks, e.g. around entities
+        self._pending.append(data)
+    
+    def comment(self, text: str) -> None:
+        self._flush()
+    
+    def close(self) -> ParsedPage:
+        self._flush()
+        # Elements left open at the end of a truncated page
+        for tag, entries in self._open.items():
+            while entries:
+                self.end(tag)
+        return ParsedPage(text=''.join(self.text), links=self.links, forms=self.forms, images=self.images)
+    
+    def _flush(self) -> None:
+        """Hand a complete text node to the open elements."""
+        if not self._pending:
+            return
+        string = ''.join(self._pending)
+        self._pending = []
+        if self._excluded_depth:
+            return
+        if not self._preserve_depth and not string.strip(ASCII_WHITESPACE):
+            string = '\n' if '\n' in string else ' '
+        self.text.append(string)
+        for entries in self._open.values():
+            for entry in entries:
+                if entry is not None:
+                    entry[1].append(string)
+
+
+class LxmlPageParser(PageParser):
+    """Streaming parse with libxml2's HTML parser through lxml."""
+    
+    name = "lxml"
+    
+    def __init__(self, fallback: Optional[PageParser] = None):
+        """
+        Initialize the parser.
+        
+        Args:
+            fallback: Parser for pages lxml fails on (BeautifulSoup by default)
+        """
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml is not installed")
+        self.fallback = fallback or SoupPageParser()
+    
+    def parse(self, html: str) -> ParsedPage:
+        """Parse a page, collecting text, links, forms and images as elements are read."""
+        try:
+            parser = etree.HTMLParser(target=_PageCollector())
+            parser.feed(html)
+            return parser.close()
+        except Exception as e:
+            logger.debug(f"lxml could not parse page, using {self.fallback.name}: {e}")
+            return self.fallback.parse(html)
+
+
+PAGE_PARSERS = {
+    LxmlPageParser.name: LxmlPageParser,
+    SoupPageParser.name: SoupPageParser,
+}
+
+
+def get_page_parser(name: str = "auto") -> PageParser:
+    """
+    Get an HTML parser backend.
+    
+    Args:
+        name: ``lxml``, ``html.parser``, or ``auto`` for lxml if installed
+    
+    Returns:
+        PageParser instance
+    
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if name == "auto":
+        name = LxmlPageParser.name if LXML_AVAILABLE else SoupPageParser.name
+    if name not in PAGE_PARSERS:
+        raise ValueError(f"Unknown HTML parser: {name}")
+    if name == LxmlPageParser.name and not LXML_AVAILABLE:
+        logger.warning("lxml is not installed, parsing pages with html.parser")
+        return SoupPageParser()
+    return PAGE_PARSERS[name]()
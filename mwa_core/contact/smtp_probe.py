@@ -0,0 +1,367 @@
+"""
+Mailbox probing over SMTP for contact validation.
+
+Verifying an address means connecting to the domain's mail server and
+asking whether it would accept ``RCPT TO`` for it, without sending a
+message. Opening a session per address is slow and looks abusive to mail
+servers, so ``SMTPProber`` batches the work:
+- Pending addresses are grouped by the primary MX host of their domain and
+  each host is probed in one session, with one ``MAIL FROM`` transaction
+  per domain and many ``RCPT TO`` probes
+- Each domain is checked once for accepting any address (catch-all), in
+  which case its addresses cannot be verified and are not probed
+- Sessions run in a thread pool, so the event loop is never blocked
+- Verdicts are cached per mailbox, catch-all results per domain; temporary
+  failures (greylisting, timeouts) are cached for a shorter time
+"""
+
+import asyncio
+import logging
+import secrets
+import smtplib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .mx import MXResolver
+
+logger = logging.getLogger(__name__)
+
+# RCPT TO replies of one probed host: address -> (code, message)
+Replies = Dict[str, Tuple[int, str]]
+
+DELIVERABLE = "deliverable"
+UNDELIVERABLE = "undeliverable"
+CATCH_ALL = "catch_all"
+UNKNOWN = "unknown"
+
+
+@dataclass
+class SMTPVerdict:
+    """
+    Result of probing a mailbox.
+    
+    Attributes:
+        email: Probed address
+        status: ``deliverable``, ``undeliverable``, ``catch_all`` or ``unknown``
+        code: SMTP reply code to ``RCPT TO``, if the server answered
+        message: SMTP reply text or error description
+        mx_host: Mail server that was asked
+        checked_at: When the mailbox was probed
+        expires_at: When the verdict should be probed again
+    """
+    email: str
+    status: str
+    code: Optional[int] = None
+    message: str = ""
+    mx_host: Optional[str] = None
+    checked_at: datetime = field(default_factory=datetime.now)
+    expires_at: datetime = field(default_factory=datetime.now)
+    
+    @property
+    def is_deliverable(self) -> bool:
+        """Whether the server confirmed the mailbox."""
+        return self.status == DELIVERABLE
+    
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the verdict can be used without probing again."""
+        return self.expires_at > datetime.now()
+
+
+class SMTPProber:
+    """
+    Probes mailboxes with ``RCPT TO``, reusing one session per MX host.
+    
+    ``probe_many`` is the batch entry point; ``probe`` checks a single
+    address and is served from the cache when a batch already covered it.
+    """
+    
+    def __init__(self, mx_resolver: MXResolver,
+                 helo_host: str = "mwa-contact-validator.local",
+                 mail_from: str = "validation@mwacontact.local",
+                 port: int = 25, timeout: float = 10.0, max_workers: int = 4,
+                 max_recipients_per_session: int = 50,
+                 verdict_ttl: int = 7 * 86400, unknown_ttl: int = 900,
+                 max_cache_entries: int = 10000):
+        """
+        Initialize the SMTP prober.
+        
+        Args:
+            mx_resolver: Resolver for the mail hosts of a domain
+            helo_host: Host name sent with EHLO/HELO
+            mail_from: Envelope sender of the probes
+            port: SMTP port of the mail servers
+            timeout: Socket timeout in seconds
+            max_workers: Maximum hosts probed at once
+            max_recipients_per_session: ``RCPT TO`` probes before reconnecting
+            verdict_ttl: Seconds definite verdicts and catch-all results are cached
+            unknown_ttl: Seconds inconclusive verdicts are cached
+            max_cache_entries: Maximum number of cached verdicts
+        """
+        self.mx_resolver = mx_resolver
+        self.helo_host = helo_host
+        self.mail_from = mail_from
+        self.port = port
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.max_recipients_per_session = max(1, max_recipients_per_session)
+        self.verdict_ttl = verdict_ttl
+        self.unknown_ttl = unknown_ttl
+        self.max_cache_entries = max_cache_entries
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._verdicts: "OrderedDict[str, SMTPVerdict]" = OrderedDict()
+        # Domain -> (accepts any address, expires at)
+        self._catch_all: Dict[str, Tuple[bool, datetime]] = {}
+        self._stats = {"cache_hits": 0, "sessions": 0, "verdicts": 0, "catch_all_checks": 0}
+    
+    async def probe(self, email: str) -> SMTPVerdict:
+        """
+        Probe a single mailbox.
+        
+        Args:
+            email: Address to probe
+        
+        Returns:
+            SMTPVerdict of the address
+        """
+        email = email.lower().strip()
+        return (await self.probe_many([email]))[email]
+    
+    async def probe_many(self, emails: Iterable[str]) -> Dict[str, SMTPVerdict]:
+        """
+        Probe mailboxes, one session per MX host.
+        
+        Args:
+            emails: Addresses to probe
+        
+        Returns:
+            Mapping of lowercase address to its verdict
+        """
+        verdicts: Dict[str, SMTPVerdict] = {}
+        pending: Dict[str, List[str]] = {}
+        for email in dict.fromkeys(email.lower().strip() for email in emails):
+            cached = self._cached_verdict(email)
+            if cached is not None:
+                self._stats["cache_hits"] += 1
+                verdicts[email] = cached
+            elif '@' not in email:
+                verdicts[email] = self._verdict(email, UNDELIVERABLE, message="Invalid address")
+            else:
+                pending.setdefault(email.rsplit('@', 1)[1], []).append(email)
+        if not pending:
+            return verdicts
+        
+        # Group domains by their primary mail host
+        hosts: Dict[str, Dict[str, List[str]]] = {}
+        check_catch_all: Set[str] = set()
+        lookups = await self.mx_resolver.lookup_many(pending)
+        for domain, domain_emails in pending.items():
+            lookup = lookups.get(domain)
+            if lookup is None:
+                self._store_all(verdicts, domain_emails, UNKNOWN, message="MX lookup failed")
+            elif not lookup.hosts:
+                self._store_all(verdicts, domain_emails, UNDELIVERABLE, message="Domain accepts no mail")
+            else:
+                accepts_any = self._cached_catch_all(domain)
+                if accepts_any:
+                    self._store_all(verdicts, domain_emails, CATCH_ALL, message="Domain accepts any address",
+                                    mx_host=lookup.hosts[0])
+                    continue
+                if accepts_any is None:
+                    check_catch_all.add(domain)
+                hosts.setdefault(lookup.hosts[0], {})[domain] = domain_emails
+        
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, self._probe_host, host, domains, check_catch_all)
+            for host, domains in hosts.items()
+        ))
+        
+        for (host, domains), (replies, catch_all, sessions) in zip(hosts.items(), results):
+            self._stats["sessions"] += sessions
+            for domain, domain_emails in domains.items():
+                accepts_any = catch_all.get(domain)
+                if accepts_any is not None:
+                    self._stats["catch_all_checks"] += 1
+                    self._catch_all[domain] = (accepts_any, datetime.now() + timedelta(seconds=self.verdict_ttl))
+                if accepts_any:
+                    self._store_all(verdicts, domain_emails, CATCH_ALL, message="Domain accepts any address",
+                                    mx_host=host)
+                    continue
+                for email in domain_emails:
+                    reply = replies.get(email)
+                    if reply is None:
+                        verdict = self._verdict(email, UNKNOWN, message="No reply from mail server", mx_host=host)
+                    else:
+                        verdict = self._verdict(email, self._classify(reply[0]), reply[0], reply[1], host)
+                    self._store(verdict)
+                    verdicts[email] = verdict
+        return verdicts
+    
+    @staticmethod
+    def _classify(code: int) -> str:
+        """Map a ``RCPT TO`` reply code to a verdict status."""
+        if code in (250, 251):
+            return DELIVERABLE
+        if 500 <= code < 600:
+            return UNDELIVERABLE
+        # 4xx: greylisting, rate limits, mailbox temporarily unavailable
+        return UNKNOWN
+    
+    def _probe_host(self, host: str, domains: Dict[str, List[str]],
+                    check_catch_all: Set[str]) -> Tuple[Replies, Dict[str, Optional[bool]], int]:
+        """
+        Probe the addresses of several domains on one mail host.
+        
+        Runs in a worker thread. Each domain gets its own ``MAIL FROM``
+        transaction. For domains in ``check_catch_all`` it starts with a
+        probe of a random address; if that is accepted, the domain's
+        addresses are skipped.
+        
+        Args:
+            host: Mail host
+            domains: Addresses to probe by domain
+            check_catch_all: Domains not yet known to be catch-all or not
+        
+        Returns:
+            Tuple of ``RCPT TO`` replies by address, catch-all results by
+            domain (None if inconclusive) and number of sessions opened
+        """
+        replies: Replies = {}
+        catch_all: Dict[str, Optional[bool]] = {}
+        sessions = 0
+        server: Optional[smtplib.SMTP] = None
+        recipients = 0
+        
+        try:
+            for domain, emails in domains.items():
+                in_transaction = False
+                # None stands for the catch-all probe
+                probes = ([None] if domain in check_catch_all else []) + emails
+                for email in probes:
+                    if server is None or recipients >= self.max_recipients_per_session:
+                        self._close(server)
+                        server = None
+                        server = self._connect(host)
+                        sessions += 1
+                        recipients = 0
+                        in_transaction = False
+                    if not in_transaction:
+                        code, message = server.mail(self.mail_from)
+                        if code != 250:
+                            raise smtplib.SMTPSenderRefused(code, message, self.mail_from)
+                        in_transaction = True
+                    
+                    code, message = server.rcpt(email or self._random_address(domain))
+                    recipients += 1
+                    if email is not None:
+                        replies[email] = (code, message.decode("utf-8", "replace"))
+                    elif code in (250, 251):
+                        catch_all[domain] = True
+                        break
+                    else:
+                        catch_all[domain] = False if 500 <= code < 600 else None
+                
+                if in_transaction:
+                    server.rset()
+        except (smtplib.SMTPException, OSError) as e:
+            # Addresses without a reply are reported as unknown
+            logger.debug(f"SMTP probing of {host} stopped: {e}")
+        finally:
+            self._close(server)
+        return replies, catch_all, sessions
+    
+    def _connect(self, host: str) -> smtplib.SMTP:
+        server = smtplib.SMTP(local_hostname=self.helo_host, timeout=self.timeout)
+        server.set_debuglevel(0)
+        try:
+            server.connect(host, self.port)
+            server.ehlo_or_helo_if_needed()
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    @staticmethod
+    def _close(server: Optional[smtplib.SMTP]) -> None:
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    @staticmethod
+    def _random_address(domain: str) -> str:
+        """Get an address that almost certainly does not exist at ``domain``."""
+        return f"mwa-probe-{secrets.token_hex(8)}@{domain}"
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="smtp-probe")
+        return self._executor
+    
+    def _verdict(self, email: str, status: str, code: Optional[int] = None, message: str = "",
+                 mx_host: Optional[str] = None) -> SMTPVerdict:
+        ttl = self.unknown_ttl if status == UNKNOWN else self.verdict_ttl
+        now = datetime.now()
+        return SMTPVerdict(email=email, status=status, code=code, message=message, mx_host=mx_host,
+                           checked_at=now, expires_at=now + timedelta(seconds=ttl))
+    
+    def _store_all(self, verdicts: Dict[str, SMTPVerdict], emails: List[str], status: str,
+                   message: str = "", mx_host: Optional[str] = None) -> None:
+        for email in emails:
+            verdict = self._verdict(email, status, message=message, mx_host=mx_host)
+            self._store(verdict)
+            verdicts[email] = verdict
+    
+    def _store(self, verdict: SMTPVerdict) -> None:
+        self._stats["verdicts"] += 1
+        self._verdicts[verdict.email] = verdict
+        self._verdicts.move_to_end(verdict.email)
+        while len(self._verdicts) > self.max_cache_entries:
+            self._verdicts.popitem(last=False)
+    
+    def _cached_verdict(self, email: str) -> Optional[SMTPVerdict]:
+        verdict = self._verdicts.get(email)
+        if verdict is None:
+            return None
+        if not verdict.is_fresh:
+            del self._verdicts[email]
+            return None
+        return verdict
+    
+    def _cached_catch_all(self, domain: str) -> Optional[bool]:
+        """Whether a domain accepts any address, or None if not known."""
+        cached = self._catch_all.get(domain)
+        if cached is None:
+            return None
+        accepts_any, expires_at = cached
+        if expires_at <= datetime.now():
+            del self._catch_all[domain]
+            return None
+        return accepts_any
+    
+    def shutdown(self) -> None:
+        """Stop the worker threads; the next probe starts new ones."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get probing statistics.
+        
+        Returns:
+            Dictionary with cache hits, sessions opened, verdicts stored,
+            catch-all checks and the number of cached verdicts and
+            catch-all domains
+        """
+        stats = dict(self._stats)
+        stats["cached_verdicts"] = len(self._verdicts)
+        stats["catch_all_domains"] = sum(1 for accepts_any, _ in self._catch_all.values() if accepts_any)
+        return stats
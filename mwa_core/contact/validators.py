@@ -6,22 +6,23 @@ Provides comprehensive validation for different contact types:
 - Phone number validation with format checking
 - Form validation with accessibility testing
 - Social media profile validation
-- Bulk validation with rate limiting
+- Bulk validation with bounded concurrency and rate limiting
 - Verification result tracking
 """
 
 import re
 import asyncio
 import logging
-import dns.resolver
-import smtplib
 import socket
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 import httpx
 
+from ..ratelimit import TokenBucketLimiter
 from .models import Contact, ContactMethod, ContactStatus, ConfidenceLevel
+from .mx import MXResolver
+from .smtp_probe import CATCH_ALL, SMTPProber, SMTPVerdict
 from .scoring import ContactScoringEngine
 
 logger = logging.getLogger(__name__)
@@ -66,7 +67,8 @@ class ContactValidator:
     - Form accessibility validation
     - Social media profile verification
     - Rate limiting for external validations
-    - Bulk validation with progress tracking
+    - Concurrent bulk validation with progress tracking
+    - Cached asynchronous MX lookups, one per domain
     - Validation result persistence
     """
     
@@ -99,7 +101,10 @@ class ContactValidator:
     def __init__(self, enable_smtp_verification: bool = False, 
                  enable_dns_verification: bool = True,
                  rate_limit_seconds: float = 1.0,
-                 max_validation_attempts: int = 3):
+                 max_validation_attempts: int = 3,
+                 max_concurrency: int = 10,
+                 mx_resolver: Optional[MXResolver] = None,
+                 smtp_prober: Optional[SMTPProber] = None):
         """
         Initialize contact validator.
         
@@ -108,14 +113,22 @@ class ContactValidator:
             enable_dns_verification: Whether to perform DNS verification
             rate_limit_seconds: Minimum seconds between validation attempts
             max_validation_attempts: Maximum attempts for failed validations
+            max_concurrency: Maximum contacts validated at once in a batch
+            mx_resolver: Resolver for MX lookups (in-memory cache only if omitted)
+            smtp_prober: Prober for SMTP verification (uses ``mx_resolver`` if omitted)
         """
         self.enable_smtp_verification = enable_smtp_verification
         self.enable_dns_verification = enable_dns_verification
         self.rate_limit_seconds = rate_limit_seconds
         self.max_validation_attempts = max_validation_attempts
+        self.max_concurrency = max(1, max_concurrency)
+        self.mx_resolver = mx_resolver or MXResolver(storage_path=None)
+        self.smtp_prober = smtp_prober or SMTPProber(self.mx_resolver)
         
-        # Rate limiting state
-        self.last_validation_time = 0
+        # Rate limiting state: one token bucket per target domain
+        self.rate_limiter = TokenBucketLimiter(
+            rate=1.0 / rate_limit_seconds if rate_limit_seconds > 0 else 0
+        )
         self.validation_counts = {}
         
         # Scoring engine for confidence calculation
@@ -123,6 +136,31 @@ class ContactValidator:
         
         logger.info(f"Contact validator initialized (SMTP: {enable_smtp_verification}, DNS: {enable_dns_verification})")
     
+    @classmethod
+    def from_settings(cls, settings: Any) -> "ContactValidator":
+        """
+        Create the validator configured in the contact discovery settings.
+        
+        Args:
+            settings: ``ContactDiscoveryConfig``
+        
+        Returns:
+            ContactValidator sharing the on-disk MX cache
+        """
+        mx_resolver = MXResolver.from_settings(settings)
+        return cls(
+            enable_smtp_verification=settings.smtp_verification,
+            enable_dns_verification=settings.dns_verification,
+            rate_limit_seconds=settings.rate_limit_seconds,
+            max_concurrency=settings.validation_concurrency,
+            mx_resolver=mx_resolver,
+            smtp_prober=SMTPProber(
+                mx_resolver,
+                max_workers=settings.smtp_probe_workers,
+                verdict_ttl=settings.smtp_verdict_ttl_seconds
+            )
+        )
+    
     async def validate_contact(self, contact: Contact, validation_level: str = "standard") -> ValidationResult:
         """
         Validate a single contact with specified validation level.
@@ -136,7 +174,7 @@ class ContactValidator:
         """
         try:
             # Rate limiting
-            await self._enforce_rate_limit()
+            await self._enforce_rate_limit(contact)
             
             # Validate based on contact method
             if contact.method == ContactMethod.EMAIL:
@@ -173,30 +211,78 @@ class ContactValidator:
                                     validation_level: str = "standard",
                                     progress_callback: Optional[callable] = None) -> List[ValidationResult]:
         """
-        Validate multiple contacts with progress tracking.
+        Validate multiple contacts concurrently with progress tracking.
+        
+        The MX records of all email domains are resolved first, each domain
+        once, so contacts sharing a domain do not repeat the lookup. With
+        comprehensive validation and SMTP verification enabled, the
+        addresses are then probed together, one session per mail host. Up
+        to ``max_concurrency`` contacts are then validated at once.
         
         Args:
             contacts: List of contacts to validate
             validation_level: Validation level
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates, called
+                as contacts complete
             
         Returns:
-            List of ValidationResult objects
+            List of ValidationResult objects in the order of ``contacts``
         """
-        results = []
         total = len(contacts)
+        results: List[Optional[ValidationResult]] = [None] * total
         
-        for i, contact in enumerate(contacts):
-            result = await self.validate_contact(contact, validation_level)
-            results.append(result)
+        if self.enable_dns_verification and validation_level in ["standard", "comprehensive"]:
+            domains = self._email_domains(contacts)
+            if domains:
+                await self.mx_resolver.lookup_many(domains)
+        
+        if self.enable_smtp_verification and validation_level == "comprehensive":
+            emails = self._smtp_probe_candidates(contacts)
+            if emails:
+                try:
+                    await self.smtp_prober.probe_many(emails)
+                except Exception as e:
+                    logger.debug(f"SMTP batch verification failed: {e}")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        completed = 0
+        
+        async def validate(index: int, contact: Contact) -> None:
+            nonlocal completed
+            async with semaphore:
+                results[index] = await self.validate_contact(contact, validation_level)
+            completed += 1
             
             # Progress callback
             if progress_callback:
-                progress = (i + 1) / total * 100
-                progress_callback(progress, i + 1, total)
+                progress = completed / total * 100
+                progress_callback(progress, completed, total)
         
+        await asyncio.gather(*(validate(i, contact) for i, contact in enumerate(contacts)))
         return results
     
+    def _email_domains(self, contacts: List[Contact]) -> List[str]:
+        """Get the distinct domains of email contacts that pass the offline checks."""
+        return list(dict.fromkeys(email.rsplit('@', 1)[1] for email in self._checkable_emails(contacts)))
+    
+    def _smtp_probe_candidates(self, contacts: List[Contact]) -> List[str]:
+        """Get the email addresses that ``_validate_email`` would probe over SMTP."""
+        return [email for email in self._checkable_emails(contacts)
+                if email.rsplit('@', 1)[1] not in self.BLOCKED_VERIFICATION_DOMAINS]
+    
+    def _checkable_emails(self, contacts: List[Contact]) -> List[str]:
+        """Get the distinct email addresses that pass the offline checks."""
+        emails = {}
+        for contact in contacts:
+            if contact.method != ContactMethod.EMAIL:
+                continue
+            email = (contact.value or "").lower().strip()
+            if '@' not in email or not self._validate_email_syntax(email):
+                continue
+            if not self._is_invalid_domain(email.rsplit('@', 1)[1]):
+                emails[email] = None
+        return list(emails)
+    
     async def _validate_email(self, contact: Contact, validation_level: str) -> ValidationResult:
         """
         Validate email address with multiple levels of checks.
@@ -279,13 +365,18 @@ class ContactValidator:
             validation_level == "comprehensive" and
             domain.lower() not in self.BLOCKED_VERIFICATION_DOMAINS):
             
-            smtp_valid = await self._verify_email_smtp(email, domain)
-            if smtp_valid:
+            verdict = await self._verify_email_smtp(email, domain)
+            if verdict is not None:
+                metadata['smtp_status'] = verdict.status
+            if verdict is not None and verdict.is_deliverable:
                 metadata['smtp_verified'] = True
                 confidence = 0.95
                 validation_method = "smtp"
             else:
-                warnings.append("SMTP verification inconclusive")
+                if verdict is not None and verdict.status == CATCH_ALL:
+                    warnings.append("Domain accepts any address (catch-all)")
+                else:
+                    warnings.append("SMTP verification inconclusive")
                 confidence = 0.7
                 validation_method = "dns+smtp"
         else:
@@ -349,56 +440,21 @@ class ContactValidator:
         return False
     
     async def _verify_domain_mx_records(self, domain: str) -> bool:
-        """Verify domain has valid MX records."""
+        """Verify domain has valid MX records (or an A record as fallback)."""
         try:
-            # Check MX records
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            return len(mx_records) > 0
-        except dns.resolver.NXDOMAIN:
-            return False
-        except dns.resolver.NoAnswer:
-            # No MX records, check A records as fallback
-            try:
-                dns.resolver.resolve(domain, 'A')
-                return True
-            except:
-                return False
+            return await self.mx_resolver.accepts_mail(domain)
         except Exception as e:
             logger.debug(f"DNS verification failed for {domain}: {e}")
             return False
     
-    async def _verify_email_smtp(self, email: str, domain: str) -> bool:
+    async def _verify_email_smtp(self, email: str, domain: str) -> Optional[SMTPVerdict]:
         """Verify email address using SMTP (with extreme caution)."""
         try:
-            # Get MX records
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            if not mx_records:
-                return False
-            
-            # Use the highest priority MX server
-            mx_host = str(sorted(mx_records, key=lambda x: x.preference)[0].exchange)
-            
-            # Connect to SMTP server
-            server = smtplib.SMTP(timeout=10)
-            server.set_debuglevel(0)
-            
-            try:
-                server.connect(mx_host)
-                server.helo('mwa-contact-validator.local')
-                server.mail('validation@mwacontact.local')
-                
-                # Try to verify the email (without actually sending)
-                code, message = server.rcpt(email)
-                
-                # Acceptable response codes
-                return code in [250, 251]
-                
-            finally:
-                server.quit()
-                
+            # Served from the prober's cache when a batch already probed it
+            return await self.smtp_prober.probe(email)
         except Exception as e:
             logger.debug(f"SMTP verification failed for {email}: {e}")
-            return False
+            return None
     
     async def _validate_phone(self, contact: Contact, validation_level: str) -> ValidationResult:
         """
@@ -864,16 +920,28 @@ class ContactValidator:
             metadata=metadata
         )
     
-    async def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting for validation attempts."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_validation_time
+    async def _enforce_rate_limit(self, contact: Optional[Contact] = None) -> None:
+        """
+        Enforce rate limiting for validation attempts.
         
-        if time_since_last < self.rate_limit_seconds:
-            sleep_time = self.rate_limit_seconds - time_since_last
-            await asyncio.sleep(sleep_time)
+        Attempts against the same domain (email domain or website host) are
+        spaced by ``rate_limit_seconds``; other domains are not delayed.
         
-        self.last_validation_time = time.time()
+        Args:
+            contact: Contact about to be validated
+        """
+        await self.rate_limiter.acquire(self._rate_limit_key(contact))
+    
+    @staticmethod
+    def _rate_limit_key(contact: Optional[Contact]) -> str:
+        if contact is None:
+            return "default"
+        value = contact.value or ""
+        if "@" in value:
+            return value.rsplit("@", 1)[1].lower()
+        if "://" in value:
+            return urlparse(value).netloc.lower()
+        return contact.method.value
     
     def get_validation_summary(self, results: List[ValidationResult]) -> Dict[str, Any]:
         """
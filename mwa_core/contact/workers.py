@@ -0,0 +1,204 @@
+"""
+Process pool for CPU-bound contact extraction.
+
+Parsing a page and running the regex extractors over it takes tens of
+milliseconds per page. Done in a coroutine, it blocks the event loop and
+with it every other fetch of the crawl. The crawler and the discovery engine
+therefore only fetch pages and hand the raw HTML to an ``ExtractionPool``:
+- ``PagePayload`` is the picklable input: URL, HTML, context and methods
+- ``PageExtractor`` parses the page and runs the extractors; every worker
+  process has one
+- ``PageExtraction`` is the picklable result sent back to the event loop
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+from .extractors import EmailExtractor, PhoneExtractor, FormExtractor, SocialMediaExtractor
+from .models import Contact, ContactForm, SocialMediaProfile
+from .parsing import PageLink, get_page_parser
+from ..config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXTRACTION_METHODS = ("email", "phone", "form", "social_media")
+
+
+@dataclass
+class PagePayload:
+    """
+    A fetched page to extract contacts from.
+    
+    Attributes:
+        url: URL of the page
+        html: Page markup
+        context: Discovery context passed to the extractors
+        methods: Extraction methods to run
+    """
+    url: str
+    html: str
+    context: Any
+    methods: List[str] = field(default_factory=lambda: list(DEFAULT_EXTRACTION_METHODS))
+
+
+@dataclass
+class PageExtraction:
+    """
+    Contacts, forms and follow-up targets found on a page.
+    
+    Attributes:
+        url: URL of the page
+        contacts: Email and phone contacts
+        forms: Contact forms
+        social_profiles: Social media profiles
+        links: Links of the page, for crawling and PDF extraction
+        images: Image sources of the page, for OCR
+    """
+    url: str
+    contacts: List[Contact] = field(default_factory=list)
+    forms: List[ContactForm] = field(default_factory=list)
+    social_profiles: List[SocialMediaProfile] = field(default_factory=list)
+    links: List[PageLink] = field(default_factory=list)
+    images: List[str] = field(default_factory=list)
+
+
+class PageExtractor:
+    """Parses pages and runs the text and form extractors over them."""
+    
+    def __init__(self, config: Settings):
+        """
+        Initialize the page extractor.
+        
+        Args:
+            config: Application configuration
+        """
+        self.page_parser = get_page_parser(config.contact_discovery.html_parser)
+        self.email_extractor = EmailExtractor(config)
+        self.phone_extractor = PhoneExtractor(config)
+        self.form_extractor = FormExtractor(config)
+        self.social_extractor = SocialMediaExtractor(config)
+    
+    def extract(self, payload: PagePayload) -> PageExtraction:
+        """
+        Parse a page and extract its contacts.
+        
+        Args:
+            payload: Page to extract from
+        
+        Returns:
+            PageExtraction with the results of the requested methods
+        """
+        page = self.page_parser.parse(payload.html)
+        result = PageExtraction(url=payload.url, links=page.links, images=page.images)
+        
+        if "email" in payload.methods:
+            result.contacts.extend(self.email_extractor.extract_emails(page.text, payload.url, payload.context))
+        if "phone" in payload.methods:
+            result.contacts.extend(self.phone_extractor.extract_phones(page.text, payload.url, payload.context))
+        if "form" in payload.methods:
+            result.forms = self.form_extractor.analyze_forms(page.forms, payload.url, payload.context)
+        if "social_media" in payload.methods:
+            result.social_profiles = self.social_extractor.extract_social_media(page.text, payload.url, payload.context)
+        
+        return result
+    
+    async def aclose(self) -> None:
+        """Close the extractors' HTTP clients."""
+        for extractor in (self.email_extractor, self.phone_extractor, self.form_extractor, self.social_extractor):
+            await extractor.session.aclose()
+
+
+# Page extractor of a worker process, created by the pool's initializer
+_worker_extractor: Optional[PageExtractor] = None
+
+
+def _init_worker(config: Settings) -> None:
+    """Create the page extractor of a new worker process."""
+    global _worker_extractor
+    _worker_extractor = PageExtractor(config)
+
+
+def _extract_in_worker(payload: PagePayload) -> PageExtraction:
+    """Extract a page in a worker process."""
+    return _worker_extractor.extract(payload)
+
+
+class ExtractionPool:
+    """
+    Runs page extraction in worker processes.
+    
+    Worker processes are started with ``spawn`` on first use, so creating a
+    pool is cheap and no event loop or open connection is inherited. With
+    zero workers, or after the pool broke, pages are extracted in the calling
+    process.
+    """
+    
+    def __init__(self, config: Settings, max_workers: Optional[int] = None):
+        """
+        Initialize the extraction pool.
+        
+        Args:
+            config: Application configuration, sent to every worker process
+            max_workers: Number of worker processes (``extraction_workers``
+                setting if omitted; one per CPU core if that is None too)
+        """
+        self.config = config
+        if max_workers is None:
+            max_workers = config.contact_discovery.extraction_workers
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self.local_extractor = PageExtractor(config)
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    async def extract(self, payload: PagePayload) -> PageExtraction:
+        """
+        Extract a page without blocking the event loop.
+        
+        Args:
+            payload: Page to extract from
+        
+        Returns:
+            PageExtraction of the page
+        """
+        if self.max_workers == 0:
+            return self.local_extractor.extract(payload)
+        
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), _extract_in_worker, payload)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory); extract here from now on
+            logger.error(f"Extraction pool failed, extracting in process: {e}")
+            self.shutdown()
+            self.max_workers = 0
+            return self.local_extractor.extract(payload)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the process pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.config,)
+            )
+            logger.info(f"Extraction pool started with {self.max_workers} workers")
+        return self._executor
+    
+    def shutdown(self) -> None:
+        """Stop the worker processes; the next extraction starts new ones."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+    
+    async def aclose(self) -> None:
+        """Stop the worker processes and close the local extractor."""
+        self.shutdown()
+        await self.local_extractor.aclose()
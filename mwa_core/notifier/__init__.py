@@ -17,6 +17,8 @@ from .base import (
 )
 from .factory import NotifierFactory
 from .manager import NotificationManager
+from .queue import NotificationQueue, NotificationQueueFull
+from .digest import ListingDigest
 from .discord import DiscordNotifier
 from .email import EmailNotifier
 from .slack import SlackNotifier
@@ -33,6 +35,9 @@ __all__ = [
     'NotificationFormatter',
     'NotifierFactory',
     'NotificationManager',
+    'NotificationQueue',
+    'NotificationQueueFull',
+    'ListingDigest',
     'DiscordNotifier',
     'EmailNotifier',
     'SlackNotifier',
@@ -5,16 +5,19 @@ Base classes and enums for the MWA Core notification system.
 from __future__ import annotations
 
 import asyncio
-import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
+import httpx
 from pydantic import BaseModel, Field
 
+from mwa_core.ratelimit import TokenBucketLimiter
+
 
 class NotificationStatus(str, Enum):
     """Status of a notification delivery attempt."""
@@ -135,7 +138,13 @@ class BaseNotifier(ABC):
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 1.0)
         self.timeout = config.get("timeout", 30)
-        self._last_send_time = 0.0
+        # Longest server-requested back-off waited out inline; longer ones
+        # are left to the caller (e.g. the notification queue)
+        self.max_inline_retry_after = config.get("max_inline_retry_after", 30)
+        # Shared pooled HTTP clients, set by the owning NotificationManager
+        self.http_clients = None
+        # Per-channel rate limiter, set by the owning NotificationManager
+        self.rate_limiter: Optional[TokenBucketLimiter] = None
         
     @abstractmethod
     async def send_notification(self, message: NotificationMessage) -> NotificationResult:
@@ -170,6 +179,24 @@ class BaseNotifier(ABC):
         """
         pass
     
+    @asynccontextmanager
+    async def _http_client(self, url: str, verify: bool = True):
+        """
+        HTTP client for a request to ``url``.
+        
+        Uses the pooled client of the owning NotificationManager, or a
+        one-off client when the notifier is used on its own.
+        
+        Args:
+            url: Request URL
+            verify: Whether TLS certificates are verified
+        """
+        if self.http_clients is not None:
+            yield self.http_clients.get_client(url, verify=verify)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout, verify=verify) as client:
+                yield client
+    
     async def send_with_retry(self, message: NotificationMessage) -> NotificationResult:
         """
         Send a notification with retry logic and rate limiting.
@@ -188,18 +215,27 @@ class BaseNotifier(ABC):
                 error_message="Notifier is disabled"
             )
         
-        # Rate limiting
-        if self.rate_limit_delay > 0:
-            await self._enforce_rate_limit()
-        
         # Retry logic
         last_error = None
+        last_result = None
         for attempt in range(self.max_retries + 1):
+            # Rate limiting
+            await self._enforce_rate_limit()
             try:
                 result = await self.send_notification(message)
                 if result.is_successful:
                     return result
                 last_error = result.error_message
+                last_result = result
+                
+                retry_after = (result.response_data or {}).get("retry_after")
+                if retry_after is not None:
+                    # The server told us when to come back; the bucket enforces it
+                    self.limiter.penalize(self.rate_limit_key, retry_after)
+                    if retry_after > self.max_inline_retry_after:
+                        break
+                    continue
+                
                 if attempt < self.max_retries:
                     # Exponential backoff
                     delay = self.retry_delay * (2 ** attempt)
@@ -216,16 +252,27 @@ class BaseNotifier(ABC):
             status=NotificationStatus.FAILED,
             channel=message.channel,
             error_message=f"All retry attempts failed. Last error: {last_error}",
-            retry_count=self.max_retries
+            retry_count=self.max_retries,
+            response_data=last_result.response_data if last_result else {}
         )
     
+    @property
+    def rate_limit_key(self) -> str:
+        """Rate limit bucket key; notifiers posting to the same endpoint share it."""
+        target = getattr(self, "webhook_url", None) or getattr(self, "url", None) or self.name
+        return f"{self.get_channel_type().value}:{target}"
+    
+    @property
+    def limiter(self) -> TokenBucketLimiter:
+        """The shared rate limiter, or a private one honouring ``rate_limit_delay``."""
+        if self.rate_limiter is None:
+            rate = 1.0 / self.rate_limit_delay if self.rate_limit_delay > 0 else 0
+            self.rate_limiter = TokenBucketLimiter(rate=rate)
+        return self.rate_limiter
+    
     async def _enforce_rate_limit(self):
-        """Enforce rate limiting between notifications."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_send_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self._last_send_time = time.time()
+        """Wait for a token in this notifier's rate limit bucket."""
+        await self.limiter.acquire(self.rate_limit_key)
     
     def format_message(self, message: NotificationMessage) -> Dict[str, Any]:
         """
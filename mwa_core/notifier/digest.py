@@ -0,0 +1,205 @@
+"""
+Coalescing of new-listing notifications into per-channel digests.
+
+Instead of queueing one message per orchestrator run, new listings are merged
+into an open digest row of the durable notification queue. A digest is
+delivered when its coalescing window ends (measured from the first listing,
+so the added latency never exceeds the window) or as soon as it reaches the
+size a channel can render in one message. Listings already notified recently
+are dropped by the manager's ``NotificationDeduplicator``.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from .base import BaseNotifier, NotificationFormatter, NotificationMessage, NotificationPriority
+from .queue import message_from_payload
+
+if TYPE_CHECKING:
+    from .manager import NotificationManager
+    from .queue import NotificationQueue
+
+logger = logging.getLogger(__name__)
+
+DIGEST_KEY = "new_listings"
+
+# What fits into one message: Discord embed descriptions and Telegram
+# messages take 4096 characters, Slack section blocks 3000
+DEFAULT_DIGEST_LIMITS = {
+    "discord": {"max_listings": 10, "max_characters": 4096},
+    "slack": {"max_listings": 10, "max_characters": 3000},
+    "telegram": {"max_listings": 10, "max_characters": 4096},
+}
+_DEFAULT_LIMITS = {"max_listings": 50, "max_characters": None}
+
+
+def listing_key(listing: Dict[str, Any]) -> str:
+    """
+    Identify a listing across scraping runs.
+
+    Args:
+        listing: Listing dictionary
+
+    Returns:
+        The listing URL, or source, title and price if it has none
+    """
+    url = listing.get("url")
+    if url:
+        return url
+    return "|".join(str(listing.get(field, "")) for field in ("source", "title", "price"))
+
+
+class ListingDigest:
+    """Merges new listings into queued digest messages per notifier."""
+
+    def __init__(self, manager: "NotificationManager", config: Dict[str, Any] = None):
+        """
+        Initialize the digest.
+
+        Args:
+            manager: Notification manager owning the queue and notifiers
+            config: Digest configuration with optional keys ``window``
+                (seconds to collect listings before delivery, default 0 which
+                only splits and deduplicates) and ``limits`` (per-channel
+                ``max_listings`` / ``max_characters`` overriding
+                ``DEFAULT_DIGEST_LIMITS``)
+        """
+        config = config or {}
+        self.manager = manager
+        self.window = config.get("window", 0)
+        self.limits = {**DEFAULT_DIGEST_LIMITS, **(config.get("limits") or {})}
+        self._stats = {"listings": 0, "duplicates": 0, "messages": 0, "coalesced": 0}
+
+    def add(self, listings: List[Dict[str, Any]], notifiers: List[BaseNotifier]) -> List[int]:
+        """
+        Add new listings to the digests of the given notifiers.
+
+        Args:
+            listings: New listings
+            notifiers: Target notifiers
+
+        Returns:
+            IDs of the queue rows that were created or extended
+
+        Raises:
+            NotificationQueueFull: If the queue is at capacity
+        """
+        fresh = self.manager.deduplicator.filter_new_listings(listings)
+        self._stats["duplicates"] += len(listings) - len(fresh)
+        if not fresh or not notifiers:
+            return []
+
+        self._stats["listings"] += len(fresh)
+        queue = self.manager.get_queue()
+        ids: List[int] = []
+        try:
+            for notifier in notifiers:
+                ids.extend(self._add_for_notifier(queue, notifier, fresh))
+        except Exception:
+            # Let a later run notify about the listings that were not queued
+            self.manager.deduplicator.forget_listings(fresh)
+            raise
+        return ids
+
+    def _add_for_notifier(self, queue: "NotificationQueue", notifier: BaseNotifier,
+                          listings: List[Dict[str, Any]]) -> List[int]:
+        now = datetime.now()
+        due_at = now + timedelta(seconds=self.window)
+
+        open_row = queue.open_digest(notifier, DIGEST_KEY) if self.window > 0 else None
+        if open_row is not None:
+            buffered = message_from_payload(open_row.payload).template_data.get("listings", [])
+            seen = {listing_key(listing) for listing in buffered}
+            listings = buffered + [listing for listing in listings if listing_key(listing) not in seen]
+            # The window is counted from the first listing of the digest
+            due_at = open_row.next_attempt_at
+
+        limits = self.get_limits(notifier.get_channel_type().value)
+        chunks = self.split(listings, limits)
+
+        ids = []
+        for i, chunk in enumerate(chunks):
+            full = i < len(chunks) - 1 or len(chunk) >= limits["max_listings"]
+            not_before = now if full else due_at
+            message = self.render(chunk)
+
+            if i == 0 and open_row is not None and queue.update_digest(open_row, message, not_before):
+                ids.append(open_row.id)
+                self._stats["coalesced"] += 1
+                logger.debug(f"Added listings to digest {open_row.id} for {notifier.name} ({len(chunk)} listings)")
+                continue
+
+            ids.extend(queue.enqueue(message, [notifier], not_before=not_before, digest_key=DIGEST_KEY))
+            self._stats["messages"] += 1
+        return ids
+
+    def get_limits(self, channel: str) -> Dict[str, Any]:
+        """
+        Get the message size limits of a channel.
+
+        Args:
+            channel: Notification channel value
+
+        Returns:
+            Dictionary with ``max_listings`` and ``max_characters``
+        """
+        return {**_DEFAULT_LIMITS, **self.limits.get(channel, {})}
+
+    @staticmethod
+    def split(listings: List[Dict[str, Any]], limits: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+        """
+        Split listings into chunks that each fit into one message.
+
+        Args:
+            listings: Listings in notification order
+            limits: ``max_listings`` and ``max_characters`` of the channel
+
+        Returns:
+            Non-empty chunks of listings
+        """
+        max_listings = max(1, limits["max_listings"])
+        max_characters = limits["max_characters"]
+
+        chunks: List[List[Dict[str, Any]]] = []
+        chunk: List[Dict[str, Any]] = []
+        size = 0
+        for listing in listings:
+            # Rendered listings are joined by a newline
+            length = len(NotificationFormatter.format_listings_message([listing]).content) + 1
+            too_long = max_characters is not None and size + length > max_characters
+            if chunk and (len(chunk) >= max_listings or too_long):
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append(listing)
+            size += length
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def render(listings: List[Dict[str, Any]]) -> NotificationMessage:
+        """
+        Render one digest message.
+
+        Args:
+            listings: Listings of the message
+
+        Returns:
+            NotificationMessage for the listings
+        """
+        message = NotificationFormatter.format_listings_message(listings)
+        message.title = f"New Listings Found ({len(listings)})"
+        message.priority = NotificationPriority.NORMAL
+        return message
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get digest statistics.
+
+        Returns:
+            Dictionary with listing, duplicate and message counts
+        """
+        return {"window": self.window, **self._stats}
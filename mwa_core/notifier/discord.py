@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from mwa_core.ratelimit import parse_retry_after
+
 from .base import (
     BaseNotifier,
     NotificationChannel,
@@ -75,8 +77,8 @@ class DiscordNotifier(BaseNotifier):
         try:
             payload = self._build_payload(message)
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.webhook_url, json=payload)
+            async with self._http_client(self.webhook_url) as client:
+                response = await client.post(self.webhook_url, json=payload, timeout=self.timeout)
                 
                 if response.status_code == 204:
                     return NotificationResult(
@@ -88,12 +90,12 @@ class DiscordNotifier(BaseNotifier):
                     )
                 elif response.status_code == 429:
                     # Rate limited
-                    retry_after = int(response.headers.get("X-RateLimit-Reset-After", 60))
+                    retry_after = parse_retry_after(response.headers, default=60.0)
                     return NotificationResult(
                         message_id=message.id,
                         status=NotificationStatus.FAILED,
                         channel=message.channel,
-                        error_message=f"Rate limited. Retry after {retry_after} seconds",
+                        error_message=f"Rate limited. Retry after {retry_after:g} seconds",
                         response_data={"status_code": response.status_code, "retry_after": retry_after}
                     )
                 else:
@@ -26,6 +26,7 @@ from .base import (
     NotificationStatus,
     NotificationFormatter
 )
+from .smtp import SMTPConnectionPool, SMTPServer
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,8 @@ class EmailNotifier(BaseNotifier):
         self.password = config.get("password")
         self.use_tls = config.get("use_tls", True)
         self.use_ssl = config.get("use_ssl", False)
+        # Shared SMTP connection pool, set by the owning NotificationManager
+        self.smtp_pool: Optional[SMTPConnectionPool] = None
         
         # Email Configuration
         self.sender_email = config.get("sender_email", self.username)
@@ -407,6 +410,12 @@ class EmailNotifier(BaseNotifier):
         # Combine all recipients
         all_recipients = self.recipients + self.cc_recipients + self.bcc_recipients
         
+        if self.smtp_pool is not None:
+            errors = await self.smtp_pool.asend_messages(self.smtp_settings, [(message, all_recipients)])
+            if errors[0] is not None:
+                raise errors[0]
+            return
+        
         # Choose SMTP connection method
         if self.use_ssl:
             await self._send_email_ssl(message, all_recipients)
@@ -438,6 +447,64 @@ class EmailNotifier(BaseNotifier):
         
         await loop.run_in_executor(None, _send)
     
+    @property
+    def smtp_settings(self) -> SMTPServer:
+        """SMTP server settings used as the connection pool key."""
+        return SMTPServer(
+            host=self.smtp_server,
+            port=self.smtp_port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            use_ssl=self.use_ssl
+        )
+    
+    async def send_batch(self, messages: List[NotificationMessage]) -> List[NotificationResult]:
+        """
+        Send several notifications over one SMTP connection.
+    
+        Uses the shared connection pool, or a temporary one when the
+        notifier is used on its own.
+    
+        Args:
+            messages: The notification messages to send
+    
+        Returns:
+            One NotificationResult per message, in order
+        """
+        all_recipients = self.recipients + self.cc_recipients + self.bcc_recipients
+        pool = self.smtp_pool or SMTPConnectionPool()
+    
+        try:
+            envelopes = [(await self._build_email_message(m), all_recipients) for m in messages]
+            errors = await pool.asend_messages(self.smtp_settings, envelopes)
+        except Exception as e:
+            errors = [e] * len(messages)
+        finally:
+            if pool is not self.smtp_pool:
+                pool.close()
+    
+        results = []
+        for message, error in zip(messages, errors):
+            if error is None:
+                results.append(NotificationResult(
+                    message_id=message.id,
+                    status=NotificationStatus.DELIVERED,
+                    channel=message.channel,
+                    delivered_at=datetime.now(),
+                    response_data={"recipients": len(self.recipients)}
+                ))
+            else:
+                logger.error(f"Email notification failed: {error}")
+                results.append(NotificationResult(
+                    message_id=message.id,
+                    status=NotificationStatus.FAILED,
+                    channel=message.channel,
+                    error_message=f"SMTP error: {error}"
+                ))
+    
+        return results
+    
     async def _add_attachment(self, msg: MIMEMultipart, attachment: Dict[str, Any]) -> None:
         """Add an attachment to the email message."""
         try:
@@ -0,0 +1,132 @@
+"""
+Shared HTTP client registry for webhook-based notifiers.
+
+Discord, Slack and generic webhook notifiers post to a handful of hosts. The
+registry keeps one pooled ``httpx.AsyncClient`` per origin so consecutive
+notifications reuse keep-alive (and, with the ``h2`` package installed,
+HTTP/2) connections instead of paying a TCP and TLS handshake per message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """Per-origin pooled HTTP clients with connection reuse statistics."""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize the client registry.
+
+        Args:
+            config: Pool configuration with optional keys ``max_connections``
+                (per origin, default 10), ``max_keepalive_connections``
+                (default 5), ``keepalive_expiry`` in seconds (default 30)
+                and ``http2`` (default True, needs the ``h2`` package)
+        """
+        config = config or {}
+        self.limits = httpx.Limits(
+            max_connections=config.get("max_connections", 10),
+            max_keepalive_connections=config.get("max_keepalive_connections", 5),
+            keepalive_expiry=config.get("keepalive_expiry", 30.0),
+        )
+        self.http2 = config.get("http2", True) and HTTP2_AVAILABLE
+        if config.get("http2", True) and not HTTP2_AVAILABLE:
+            logger.debug("h2 package not installed, notifier clients use HTTP/1.1 keep-alive")
+
+        self._clients: Dict[Tuple[str, bool], Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+        self._stats = {"requests": 0, "new_connections": 0, "clients_created": 0}
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parsed = httpx.URL(url)
+        return f"{parsed.scheme}://{parsed.host}:{parsed.port or ''}"
+
+    def get_client(self, url: str, verify: bool = True) -> httpx.AsyncClient:
+        """
+        Get the pooled client for the origin of ``url``.
+
+        Clients are bound to the running event loop; if the loop changed
+        (e.g. a new ``asyncio.run`` call), a fresh client is created.
+
+        Args:
+            url: Request URL
+            verify: Whether TLS certificates are verified
+
+        Returns:
+            Shared AsyncClient; callers must not close it
+        """
+        key = (self._origin(url), verify)
+        loop = asyncio.get_running_loop()
+
+        entry = self._clients.get(key)
+        if entry is not None:
+            client, client_loop = entry
+            if client_loop is loop and not client.is_closed:
+                return client
+            # Connections of another (finished) loop cannot be reused
+
+        client = httpx.AsyncClient(
+            limits=self.limits,
+            http2=self.http2,
+            verify=verify,
+            event_hooks={"request": [self._on_request]},
+        )
+        self._clients[key] = (client, loop)
+        self._stats["clients_created"] += 1
+        return client
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        """Count requests and trace whether they open a new connection."""
+        self._stats["requests"] += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._stats["new_connections"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection statistics.
+
+        Returns:
+            Dictionary with request and connection counts and the reuse rate
+        """
+        requests = self._stats["requests"]
+        new_connections = self._stats["new_connections"]
+        reused = max(0, requests - new_connections)
+        return {
+            "requests": requests,
+            "new_connections": new_connections,
+            "reused_connections": reused,
+            "connection_reuse_rate": reused / requests if requests else 0.0,
+            "clients_created": self._stats["clients_created"],
+            "open_clients": sum(1 for client, _ in self._clients.values() if not client.is_closed),
+            "http2": self.http2,
+        }
+
+    async def aclose(self) -> None:
+        """Close all clients owned by the running event loop and forget the rest."""
+        clients, self._clients = self._clients, {}
+
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        for client, client_loop in clients.values():
+            if client_loop is loop and not client.is_closed:
+                try:
+                    await client.aclose()
+                except Exception as e:
+                    logger.warning(f"Error closing notifier HTTP client: {e}")
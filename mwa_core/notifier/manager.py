@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set
 from uuid import uuid4
@@ -20,10 +22,23 @@ from .base import (
     NotificationType,
     NotificationFormatter
 )
+from mwa_core.ratelimit import TokenBucketLimiter
+
+from .digest import ListingDigest, listing_key
 from .factory import NotifierFactory
+from .http import HttpClientRegistry
+from .queue import NotificationQueue
+from .smtp import SMTPConnectionPool
 
 logger = logging.getLogger(__name__)
 
+# Per-webhook limits of the chat services (requests per second, burst)
+DEFAULT_CHANNEL_RATE_LIMITS = {
+    NotificationChannel.DISCORD.value: {"rate": 2.5, "burst": 5},
+    NotificationChannel.SLACK.value: {"rate": 1.0, "burst": 1},
+    NotificationChannel.TELEGRAM.value: {"rate": 1.0, "burst": 1},
+}
+
 
 class NotificationManager:
     """Manages multiple notifiers and coordinates notification delivery."""
@@ -41,7 +56,20 @@ class NotificationManager:
         self.pending_notifications: Dict[str, NotificationMessage] = {}
         self.failed_notifications: Dict[str, NotificationResult] = {}
         self.rate_limiter = RateLimiter()
-        self.deduplicator = NotificationDeduplicator()
+        # Token buckets per channel, keyed by webhook/endpoint
+        self.channel_limiters: Dict[str, TokenBucketLimiter] = {}
+        digest_config = self.config.get("digest") or {}
+        self.deduplicator = NotificationDeduplicator(
+            listing_window=digest_config.get("dedup_window", 86400)
+        )
+        # Coalesces new listings into per-channel digest messages
+        self.digest = ListingDigest(self, digest_config)
+        # Pooled HTTP clients shared by all webhook-based notifiers
+        self.http_clients = HttpClientRegistry(self.config.get("http_pool"))
+        # Authenticated SMTP connections shared by email notifiers
+        self.smtp_pool = SMTPConnectionPool(self.config.get("smtp_pool"))
+        # Durable outbound queue, created on first use
+        self.queue: Optional[NotificationQueue] = None
         self.enabled = True
         
         # Initialize notifiers from config
@@ -65,9 +93,39 @@ class NotificationManager:
             name: Optional name for the notifier (defaults to notifier name)
         """
         name = name or notifier.name
+        if getattr(notifier, "http_clients", None) is None:
+            notifier.http_clients = self.http_clients
+        if hasattr(notifier, "smtp_pool") and notifier.smtp_pool is None:
+            notifier.smtp_pool = self.smtp_pool
+        if notifier.rate_limiter is None:
+            notifier.rate_limiter = self.get_channel_limiter(notifier.get_channel_type())
+            if notifier.rate_limit_delay > 0:
+                notifier.rate_limiter.configure(notifier.rate_limit_key, 1.0 / notifier.rate_limit_delay)
         self.notifiers[name] = notifier
         logger.info(f"Registered notifier: {name} ({notifier.get_channel_type().value})")
     
+    def get_channel_limiter(self, channel: NotificationChannel) -> TokenBucketLimiter:
+        """
+        Get the rate limiter shared by all notifiers of a channel.
+        
+        Limits come from the ``rate_limits`` config (``{"discord": {"rate":
+        2.5, "burst": 5}}``) or ``DEFAULT_CHANNEL_RATE_LIMITS``; channels
+        without a limit are only throttled by ``Retry-After`` responses.
+        
+        Args:
+            channel: Notification channel
+            
+        Returns:
+            TokenBucketLimiter keyed by notifier endpoint
+        """
+        key = channel.value
+        if key not in self.channel_limiters:
+            limits = (self.config.get("rate_limits") or {}).get(key) or DEFAULT_CHANNEL_RATE_LIMITS.get(key, {})
+            self.channel_limiters[key] = TokenBucketLimiter(
+                rate=limits.get("rate", 0), burst=limits.get("burst", 1)
+            )
+        return self.channel_limiters[key]
+    
     def unregister_notifier(self, name: str):
         """
         Unregister a notifier instance.
@@ -187,6 +245,133 @@ class NotificationManager:
         
         return results
     
+    def get_queue(self) -> NotificationQueue:
+        """
+        Get the durable notification queue, creating it on first use.
+        
+        The queue table lives in the database given by the ``queue.path``
+        config key (default ``data/mwa_core.db``).
+        
+        Returns:
+            NotificationQueue instance
+        """
+        if self.queue is None:
+            from mwa_core.storage.notification_queue import NotificationQueueStore
+            
+            queue_config = self.config.get("queue") or {}
+            store = NotificationQueueStore(queue_config.get("path", "data/mwa_core.db"))
+            self.queue = NotificationQueue(self, store, queue_config)
+        return self.queue
+    
+    def enqueue_notification(
+        self,
+        message: NotificationMessage,
+        channels: List[NotificationChannel] = None,
+        notifiers: List[str] = None,
+        skip_deduplication: bool = False
+    ) -> List[int]:
+        """
+        Queue a notification for background delivery.
+        
+        Returns as soon as the message is stored; queue workers (see
+        ``start_queue_workers``) or ``deliver_queued_notifications`` send it.
+        
+        Args:
+            message: The notification message to send
+            channels: Optional list of channels to use (uses all if None)
+            notifiers: Optional list of specific notifier names to use
+            skip_deduplication: Whether to skip deduplication
+            
+        Returns:
+            IDs of the queue rows (one per target notifier)
+            
+        Raises:
+            NotificationQueueFull: If the queue is at capacity
+        """
+        if not self.enabled:
+            logger.warning("Notification manager is disabled")
+            return []
+        
+        if not skip_deduplication and self.deduplicator.is_duplicate(message):
+            logger.info(f"Skipping duplicate notification: {message.id}")
+            return []
+        
+        selected_notifiers = self._select_notifiers(channels, notifiers)
+        if not selected_notifiers:
+            logger.warning("No notifiers available for notification")
+            return []
+        
+        return self.get_queue().enqueue(message, selected_notifiers)
+    
+    def queue_new_listings(
+        self,
+        listings: List[Dict[str, Any]],
+        channels: List[NotificationChannel] = None,
+        notifiers: List[str] = None
+    ) -> List[int]:
+        """
+        Queue new listings as digest notifications.
+        
+        Listings notified within the deduplication window are dropped, the
+        rest are merged into each notifier's open digest (see ``digest``
+        config) and split at the channel's message size limits.
+        
+        Args:
+            listings: New apartment listings
+            channels: Optional list of channels to use (uses all if None)
+            notifiers: Optional list of specific notifier names to use
+            
+        Returns:
+            IDs of the created or extended queue rows
+            
+        Raises:
+            NotificationQueueFull: If the queue is at capacity
+        """
+        if not self.enabled:
+            logger.warning("Notification manager is disabled")
+            return []
+        
+        selected_notifiers = self._select_notifiers(channels, notifiers)
+        if not selected_notifiers:
+            logger.warning("No notifiers available for notification")
+            return []
+        
+        return self.digest.add(listings, selected_notifiers)
+    
+    def start_queue_workers(self):
+        """Start background queue delivery on the running event loop."""
+        self.get_queue().start()
+    
+    async def deliver_queued_notifications(self, timeout: float = None) -> List[NotificationResult]:
+        """
+        Deliver queued notifications that are due now.
+        
+        Args:
+            timeout: Maximum seconds to spend (defaults to the queue's
+                ``drain_timeout``); the rest stays queued
+            
+        Returns:
+            Results of the delivered notifications
+        """
+        return await self.get_queue().drain(timeout)
+    
+    async def deliver_queued(self, notifier: BaseNotifier, message: NotificationMessage) -> NotificationResult:
+        """
+        Deliver one queued message through a notifier and record the result.
+        
+        Args:
+            notifier: Target notifier
+            message: The notification message
+            
+        Returns:
+            NotificationResult of the attempt
+        """
+        # Global cap across channels; per-endpoint limits are the notifier's token buckets
+        await self.rate_limiter.wait_if_needed(1)
+        result = await self._send_single_notification(notifier, message)
+        self.delivery_history.append(result)
+        return result
+    
     async def _send_single_notification(self, notifier: BaseNotifier, message: NotificationMessage) -> NotificationResult:
         """Send a notification through a single notifier."""
         try:
@@ -344,6 +529,14 @@ class NotificationManager:
         cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
         results = []
         
+        # Failed queue rows are persisted; give them fresh attempts
+        if self.queue is not None or "queue" in self.config:
+            queue = self.get_queue()
+            requeued = queue.requeue_failed(max_age_hours)
+            if requeued:
+                logger.info(f"Requeued {requeued} failed notifications")
+                results.extend(await queue.drain())
+        
         # Find failed notifications to retry
         to_retry = []
         for message_id, failed_result in list(self.failed_notifications.items()):
@@ -402,7 +595,12 @@ class NotificationManager:
                 "failed": 0,
                 "success_rate": 0.0,
                 "by_channel": {},
-                "by_type": {}
+                "by_type": {},
+                "http_connections": self.http_clients.get_stats(),
+                "smtp_connections": self.smtp_pool.get_stats(),
+                "queue": self.queue.get_stats() if self.queue else None,
+                "digest": self.digest.get_stats(),
+                "rate_limits": self._rate_limit_stats()
             }
         
         successful = sum(1 for r in self.delivery_history if r.is_successful)
@@ -431,6 +629,11 @@ class NotificationManager:
             "success_rate": successful / total,
             "by_channel": by_channel,
             "by_type": by_type,
+            "http_connections": self.http_clients.get_stats(),
+            "smtp_connections": self.smtp_pool.get_stats(),
+            "queue": self.queue.get_stats() if self.queue else None,
+            "digest": self.digest.get_stats(),
+            "rate_limits": self._rate_limit_stats(),
             "recent_failures": [
                 {
                     "message_id": r.message_id,
@@ -442,6 +645,9 @@ class NotificationManager:
             ]
         }
     
+    def _rate_limit_stats(self) -> Dict[str, Any]:
+        return {channel: limiter.get_stats() for channel, limiter in self.channel_limiters.items()}
+    
     def cleanup_old_history(self, max_age_days: int = 30):
         """
         Clean up old delivery history.
@@ -460,6 +666,14 @@ class NotificationManager:
         new_count = len(self.delivery_history)
         logger.info(f"Cleaned up delivery history: {old_count - new_count} entries removed")
     
+    async def aclose(self):
+        """Stop queue workers and close pooled connections; call on shutdown."""
+        if self.queue is not None:
+            await self.queue.stop()
+        await self.http_clients.aclose()
+        await asyncio.get_running_loop().run_in_executor(None, self.smtp_pool.close)
+        logger.info("Closed notifier HTTP clients and SMTP connections")
+    
     def enable(self):
         """Enable the notification manager."""
         self.enabled = True
@@ -476,7 +690,7 @@ class NotificationManager:
 
 
 class RateLimiter:
-    """Simple rate limiter for notifications."""
+    """Global sliding-window cap on notifications (N per time window)."""
     
     def __init__(self, max_requests: int = 10, time_window: int = 60):
         """
@@ -488,7 +702,8 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests: List[datetime] = []
+        # Send times, oldest first; expired entries are popped from the left
+        self.requests: deque = deque()
     
     async def wait_if_needed(self, request_count: int = 1):
         """
@@ -497,39 +712,43 @@ class RateLimiter:
         Args:
             request_count: Number of requests to make
         """
-        now = datetime.now()
+        now = time.monotonic()
         
-        # Clean up old requests
-        cutoff = now - timedelta(seconds=self.time_window)
-        self.requests = [req_time for req_time in self.requests if req_time >= cutoff]
+        # Drop requests that left the window
+        cutoff = now - self.time_window
+        while self.requests and self.requests[0] < cutoff:
+            self.requests.popleft()
         
         # Check if we need to wait
-        if len(self.requests) + request_count > self.max_requests:
-            # Calculate wait time
-            oldest_request = min(self.requests)
-            wait_time = (oldest_request + timedelta(seconds=self.time_window) - now).total_seconds()
+        if len(self.requests) + request_count > self.max_requests and self.requests:
+            # Wait until the oldest request leaves the window
+            wait_time = self.requests[0] + self.time_window - now
             
             if wait_time > 0:
                 logger.info(f"Rate limiting: waiting {wait_time:.1f} seconds")
                 await asyncio.sleep(wait_time)
         
         # Record new requests
-        for _ in range(request_count):
-            self.requests.append(now)
+        self.requests.extend([now] * request_count)
 
 
 class NotificationDeduplicator:
     """Deduplicates notifications to prevent spam."""
     
-    def __init__(self, deduplication_window: int = 300):
+    def __init__(self, deduplication_window: int = 300, listing_window: int = 86400):
         """
         Initialize deduplicator.
         
         Args:
             deduplication_window: Time window in seconds for deduplication
+            listing_window: Time window in seconds in which a listing is only
+                notified once
         """
         self.deduplication_window = deduplication_window
+        self.listing_window = listing_window
         self.recent_notifications: List[tuple] = []
+        # Listing key -> first notified, oldest first
+        self.seen_listings: Dict[str, datetime] = {}
     
     def is_duplicate(self, message: NotificationMessage) -> bool:
         """
@@ -562,6 +781,46 @@ class NotificationDeduplicator:
         self.recent_notifications.append((now, dedup_key))
         return False
     
+    def filter_new_listings(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop listings that were already notified within the listing window.
+        
+        The remaining listings are remembered as notified.
+        
+        Args:
+            listings: Listings to notify about
+            
+        Returns:
+            Listings not seen before, in their original order
+        """
+        now = datetime.now()
+        cutoff = now - timedelta(seconds=self.listing_window)
+        
+        # Keys are kept in insertion order, so expired ones are at the front
+        while self.seen_listings:
+            key, seen_at = next(iter(self.seen_listings.items()))
+            if seen_at >= cutoff:
+                break
+            del self.seen_listings[key]
+        
+        fresh = []
+        for listing in listings:
+            key = listing_key(listing)
+            if key not in self.seen_listings:
+                self.seen_listings[key] = now
+                fresh.append(listing)
+        return fresh
+    
+    def forget_listings(self, listings: List[Dict[str, Any]]):
+        """
+        Allow listings to be notified again (e.g. after queueing failed).
+        
+        Args:
+            listings: Listings previously passed to ``filter_new_listings``
+        """
+        for listing in listings:
+            self.seen_listings.pop(listing_key(listing), None)
+    
     def _create_deduplication_key(self, message: NotificationMessage) -> str:
         """Create a deduplication key for the message."""
         # Simple key based on type and content
@@ -591,4 +850,7 @@ async def send_notification(
 ) -> List[NotificationResult]:
     """Send a notification using a temporary notification manager."""
     manager = NotificationManager(config)
-    return await manager.send_notification(message, channels)
\ No newline at end of file
+    try:
+        return await manager.send_notification(message, channels)
+    finally:
+        await manager.aclose()
\ No newline at end of file
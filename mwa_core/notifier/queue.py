@@ -0,0 +1,396 @@
+"""
+Durable notification queue with per-channel delivery workers.
+
+Producers such as the orchestrator only enqueue: each message is written to
+the ``notification_queue`` table once per target notifier and returns
+immediately. Worker coroutines (a bounded number per channel) claim due rows
+in priority order, deliver them and schedule retries with exponential
+backoff, so a slow or failing channel neither blocks the scrape cycle nor
+holds up other channels, and undelivered messages survive restarts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .base import (
+    BaseNotifier,
+    NotificationChannel,
+    NotificationMessage,
+    NotificationPriority,
+    NotificationResult,
+    NotificationStatus,
+    NotificationType
+)
+
+if TYPE_CHECKING:
+    from mwa_core.storage.notification_queue import NotificationQueueStore, QueuedNotification
+    from .manager import NotificationManager
+
+logger = logging.getLogger(__name__)
+
+# Lower rank is delivered first
+PRIORITY_RANK = {
+    NotificationPriority.URGENT: 0,
+    NotificationPriority.HIGH: 1,
+    NotificationPriority.NORMAL: 2,
+    NotificationPriority.LOW: 3,
+}
+
+_DATETIME_FIELDS = ("created_at", "scheduled_for", "expires_at")
+
+
+class NotificationQueueFull(Exception):
+    """Raised when the queue holds ``max_pending`` undelivered messages."""
+
+
+def message_to_payload(message: NotificationMessage) -> str:
+    """
+    Serialize a notification message for the queue table.
+
+    Args:
+        message: Message to serialize
+
+    Returns:
+        JSON string
+    """
+    data = asdict(message)
+    for name in _DATETIME_FIELDS:
+        if data[name] is not None:
+            data[name] = data[name].isoformat()
+    return json.dumps(data, default=str)
+
+
+def message_from_payload(payload: str) -> NotificationMessage:
+    """
+    Restore a notification message stored by ``message_to_payload``.
+
+    Args:
+        payload: JSON string
+
+    Returns:
+        NotificationMessage
+    """
+    data = json.loads(payload)
+    for name in _DATETIME_FIELDS:
+        if data.get(name):
+            data[name] = datetime.fromisoformat(data[name])
+    data["type"] = NotificationType(data["type"])
+    data["channel"] = NotificationChannel(data["channel"])
+    data["priority"] = NotificationPriority(data["priority"])
+    return NotificationMessage(**data)
+
+
+class NotificationQueue:
+    """Persistent outbound queue drained by per-channel worker coroutines."""
+
+    def __init__(self, manager: "NotificationManager", store: "NotificationQueueStore",
+                 config: Dict[str, Any] = None):
+        """
+        Initialize the notification queue.
+
+        Rows left in flight by a previous process are returned to the queue.
+
+        Args:
+            manager: Notification manager owning the notifiers
+            store: Queue table persistence
+            config: Queue configuration with optional keys
+                ``workers_per_channel`` (default 2), ``max_attempts``
+                (default 5), ``retry_base_delay`` and ``retry_max_delay`` in
+                seconds (default 30 and 3600), ``max_pending`` (default 1000),
+                ``poll_interval`` in seconds (default 5) and ``drain_timeout``
+                in seconds (default 60)
+        """
+        config = config or {}
+        self.manager = manager
+        self.store = store
+        self.workers_per_channel = max(1, config.get("workers_per_channel", 2))
+        self.max_attempts = max(1, config.get("max_attempts", 5))
+        self.retry_base_delay = config.get("retry_base_delay", 30.0)
+        self.retry_max_delay = config.get("retry_max_delay", 3600.0)
+        self.max_pending = config.get("max_pending", 1000)
+        self.poll_interval = config.get("poll_interval", 5.0)
+        self.drain_timeout = config.get("drain_timeout", 60.0)
+
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Dict[str, asyncio.Event] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {"enqueued": 0, "delivered": 0, "retried": 0, "failed": 0, "expired": 0}
+
+        recovered = self.store.recover_in_flight()
+        if recovered:
+            logger.info(f"Recovered {recovered} notifications left in flight")
+
+    @property
+    def running(self) -> bool:
+        """Whether worker coroutines are running."""
+        return any(not task.done() for task in self._workers)
+
+    def enqueue(self, message: NotificationMessage, notifiers: List[BaseNotifier],
+                not_before: Optional[datetime] = None, digest_key: Optional[str] = None) -> List[int]:
+        """
+        Queue a message for delivery through the given notifiers.
+
+        Safe to call from any thread; running workers are woken up.
+
+        Args:
+            message: The notification message
+            notifiers: Target notifiers (one queue row each)
+            not_before: Earliest delivery time (defaults to
+                ``message.scheduled_for`` or now)
+            digest_key: Marks the rows as digests that ``update_digest`` may
+                extend until they are due
+
+        Returns:
+            IDs of the queue rows
+
+        Raises:
+            NotificationQueueFull: If ``max_pending`` undelivered rows are queued
+        """
+        if not notifiers:
+            return []
+
+        pending = self.store.pending_count()
+        if pending + len(notifiers) > self.max_pending:
+            raise NotificationQueueFull(
+                f"Notification queue is full ({pending}/{self.max_pending} undelivered)"
+            )
+
+        payload = message_to_payload(message)
+        rows = []
+        for notifier in notifiers:
+            row = {
+                "message_id": message.id,
+                "notifier": notifier.name,
+                "channel": notifier.get_channel_type().value,
+                "priority": PRIORITY_RANK.get(message.priority, 2),
+                "payload": payload,
+                "max_attempts": self.max_attempts,
+            }
+            if not_before or message.scheduled_for:
+                row["next_attempt_at"] = not_before or message.scheduled_for
+            if digest_key:
+                row["digest_key"] = digest_key
+            rows.append(row)
+
+        ids = self.store.enqueue(rows)
+        self._stats["enqueued"] += len(ids)
+        for row in rows:
+            self._wake(row["channel"])
+        return ids
+
+    def open_digest(self, notifier: BaseNotifier, digest_key: str) -> Optional["QueuedNotification"]:
+        """
+        Get the queued digest of a notifier that is still collecting items.
+
+        Args:
+            notifier: Target notifier
+            digest_key: Digest kind
+
+        Returns:
+            The open digest row, or None
+        """
+        return self.store.find_open_digest(notifier.name, digest_key)
+
+    def update_digest(self, item: "QueuedNotification", message: NotificationMessage,
+                      not_before: datetime) -> bool:
+        """
+        Replace the message of an open digest row.
+
+        Args:
+            item: Row returned by ``open_digest``
+            message: Message with the combined items
+            not_before: New delivery time
+
+        Returns:
+            False if a worker claimed the row in the meantime
+        """
+        if not self.store.update_pending(item.id, message_to_payload(message), not_before):
+            return False
+        self._wake(item.channel)
+        return True
+
+    def _wake(self, channel: str):
+        event = self._wakeup.get(channel)
+        if event is None or self._loop is None or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(event.set)
+
+    def _channels(self) -> List[str]:
+        return sorted({n.get_channel_type().value for n in self.manager.notifiers.values()})
+
+    def start(self):
+        """Start the worker coroutines on the running event loop."""
+        if self.running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._workers = []
+        for channel in self._channels():
+            self._wakeup[channel] = asyncio.Event()
+            for _ in range(self.workers_per_channel):
+                self._workers.append(asyncio.create_task(self._worker(channel)))
+        logger.info(f"Started {len(self._workers)} notification queue workers")
+
+    async def stop(self):
+        """Stop the worker coroutines; interrupted deliveries are requeued."""
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._wakeup.clear()
+
+    async def _worker(self, channel: str):
+        """Deliver due rows of one channel until cancelled."""
+        event = self._wakeup[channel]
+        while True:
+            try:
+                if await self.process_next(channel) is not None:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Notification queue worker for {channel} failed: {e}")
+
+            # Sleep until woken by enqueue or until the next retry is due
+            timeout = self.poll_interval
+            next_due = self.store.next_due(channel)
+            if next_due is not None:
+                timeout = min(timeout, max(0.0, (next_due - datetime.now()).total_seconds()))
+            event.clear()
+            # asyncio.wait (unlike wait_for on Python < 3.12) never swallows
+            # a cancellation that races with the wake-up
+            waiter = asyncio.ensure_future(event.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=timeout)
+            finally:
+                waiter.cancel()
+
+    async def process_next(self, channel: str) -> Optional[NotificationResult]:
+        """
+        Claim and deliver the highest priority due row of a channel.
+
+        Args:
+            channel: Notification channel
+
+        Returns:
+            Delivery result, or None if nothing was due
+        """
+        claimed = self.store.claim(channel, limit=1)
+        if not claimed:
+            return None
+        try:
+            return await self._deliver(claimed[0])
+        except asyncio.CancelledError:
+            # Interrupted by stop(); hand the row back
+            self.store.release(claimed[0].id)
+            raise
+
+    def _retry_delay(self, attempts: int) -> float:
+        return min(self.retry_base_delay * (2 ** (attempts - 1)), self.retry_max_delay)
+
+    async def _deliver(self, item: "QueuedNotification") -> NotificationResult:
+        """Deliver a claimed row and record the outcome."""
+        message = message_from_payload(item.payload)
+        channel = NotificationChannel(item.channel)
+
+        if message.expires_at and message.expires_at < datetime.now():
+            self.store.mark_cancelled(item.id, "Message expired")
+            self._stats["expired"] += 1
+            return NotificationResult(message_id=message.id, status=NotificationStatus.CANCELLED,
+                                      channel=channel, error_message="Message expired")
+
+        notifier = self.manager.get_notifier(item.notifier)
+        if notifier is None or not notifier.enabled:
+            result = NotificationResult(message_id=message.id, status=NotificationStatus.FAILED,
+                                        channel=channel, retry_count=item.attempts,
+                                        error_message=f"Notifier {item.notifier} is not available")
+        else:
+            result = await self.manager.deliver_queued(notifier, message)
+            result.retry_count = item.attempts
+
+        if result.is_successful:
+            self.store.mark_sent(item.id)
+            self._stats["delivered"] += 1
+        elif item.attempts < item.max_attempts and notifier is not None:
+            # Never retry before the server's Retry-After
+            delay = max(self._retry_delay(item.attempts), (result.response_data or {}).get("retry_after") or 0)
+            retry_at = datetime.now() + timedelta(seconds=delay)
+            self.store.mark_failed(item.id, result.error_message, retry_at)
+            self._stats["retried"] += 1
+            logger.info(f"Notification {message.id} via {item.notifier} failed, retrying at {retry_at:%H:%M:%S}")
+        else:
+            self.store.mark_failed(item.id, result.error_message)
+            self._stats["failed"] += 1
+            logger.warning(f"Notification {message.id} via {item.notifier} failed permanently: "
+                           f"{result.error_message}")
+
+        return result
+
+    async def drain(self, timeout: Optional[float] = None) -> List[NotificationResult]:
+        """
+        Deliver all rows that are due now, ``workers_per_channel`` at a time.
+
+        Rows scheduled for a later retry stay queued.
+
+        Args:
+            timeout: Maximum seconds to spend (default ``drain_timeout``);
+                undelivered rows stay queued
+
+        Returns:
+            Results of the delivered rows
+        """
+        timeout = self.drain_timeout if timeout is None else timeout
+        results: List[NotificationResult] = []
+
+        async def drain_channel(channel: str):
+            while True:
+                result = await self.process_next(channel)
+                if result is None:
+                    return
+                results.append(result)
+
+        tasks = [
+            drain_channel(channel)
+            for channel in self._channels()
+            for _ in range(self.workers_per_channel)
+        ]
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Notification queue drain timed out after {timeout}s; "
+                           f"{self.store.pending_count()} notifications remain queued")
+        return results
+
+    def requeue_failed(self, max_age_hours: int = 24) -> int:
+        """
+        Give permanently failed rows a fresh set of attempts.
+
+        Args:
+            max_age_hours: Only requeue rows created within this many hours
+
+        Returns:
+            Number of requeued rows
+        """
+        count = self.store.requeue_failed(max_age_hours)
+        for channel in self._channels():
+            self._wake(channel)
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with row counts, delivery counters and worker state
+        """
+        stats = self.store.get_stats()
+        stats.update(self._stats)
+        stats["pending"] = self.store.pending_count()
+        stats["workers"] = sum(1 for task in self._workers if not task.done())
+        return stats
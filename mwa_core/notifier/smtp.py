@@ -0,0 +1,265 @@
+"""
+Pooled SMTP sessions for the email notifier.
+
+Opening an SMTP connection costs a TCP handshake, STARTTLS and AUTH before the
+first message can be sent. After a large scrape the email notifier sends a
+burst of messages to the same server, so the pool keeps authenticated
+connections open, checks idle ones with NOOP before reuse and sends several
+messages per connection. Connections dropped by the server (421, timeouts,
+disconnects) are reopened transparently and the message is retried once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import smtplib
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A message and its envelope recipients
+Envelope = Tuple[Message, List[str]]
+
+
+@dataclass(frozen=True)
+class SMTPServer:
+    """Connection settings identifying a pooled SMTP session."""
+
+    host: str
+    port: int = 587
+    username: Optional[str] = None
+    password: Optional[str] = field(default=None, repr=False)
+    use_tls: bool = True
+    use_ssl: bool = False
+
+
+@dataclass
+class _Session:
+    """An open, authenticated SMTP connection."""
+
+    connection: smtplib.SMTP
+    last_used: float = field(default_factory=time.monotonic)
+    messages: int = 0
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """Whether ``error`` means the connection is gone and a retry may succeed."""
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException) and error.smtp_code == 421:
+        return True
+    return isinstance(error, (socket.timeout, ConnectionError))
+
+
+class SMTPConnectionPool:
+    """Thread-safe pool of authenticated SMTP connections per server."""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize the SMTP connection pool.
+
+        Args:
+            config: Pool configuration with optional keys ``max_connections``
+                (per server, default 2), ``max_idle`` seconds before an idle
+                connection is closed (default 240), ``noop_after`` seconds of
+                idleness before a NOOP health check (default 10),
+                ``max_messages`` per connection (default 100) and ``timeout``
+                in seconds (default 30)
+        """
+        config = config or {}
+        self.max_connections = config.get("max_connections", 2)
+        self.max_idle = config.get("max_idle", 240.0)
+        self.noop_after = config.get("noop_after", 10.0)
+        self.max_messages = config.get("max_messages", 100)
+        self.timeout = config.get("timeout", 30.0)
+
+        self._lock = threading.Lock()
+        self._idle: Dict[SMTPServer, List[_Session]] = {}
+        self._slots: Dict[SMTPServer, threading.BoundedSemaphore] = {}
+        self._stats = {
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "noop_checks": 0,
+            "stale_closed": 0,
+            "reconnects": 0,
+            "messages_sent": 0,
+            "messages_failed": 0,
+        }
+
+    def _slot(self, server: SMTPServer) -> threading.BoundedSemaphore:
+        with self._lock:
+            if server not in self._slots:
+                self._slots[server] = threading.BoundedSemaphore(self.max_connections)
+            return self._slots[server]
+
+    def _open(self, server: SMTPServer) -> _Session:
+        """Connect, upgrade to TLS and authenticate."""
+        if server.use_ssl:
+            connection = smtplib.SMTP_SSL(server.host, server.port, timeout=self.timeout)
+        else:
+            connection = smtplib.SMTP(server.host, server.port, timeout=self.timeout)
+            if server.use_tls:
+                connection.starttls()
+
+        try:
+            if server.username and server.password:
+                connection.login(server.username, server.password)
+        except Exception:
+            self._close_connection(connection)
+            raise
+
+        with self._lock:
+            self._stats["connections_opened"] += 1
+        return _Session(connection)
+
+    @staticmethod
+    def _close_connection(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def _is_healthy(self, session: _Session) -> bool:
+        """NOOP-check a connection that was idle for a while."""
+        idle = time.monotonic() - session.last_used
+        if idle > self.max_idle or session.messages >= self.max_messages:
+            return False
+        if idle < self.noop_after:
+            return True
+
+        with self._lock:
+            self._stats["noop_checks"] += 1
+        try:
+            code, _ = session.connection.noop()
+            return code == 250
+        except Exception:
+            return False
+
+    def _checkout(self, server: SMTPServer) -> _Session:
+        """Get a healthy idle connection or open a new one."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(server)
+                session = idle.pop() if idle else None
+            if session is None:
+                return self._open(server)
+            if self._is_healthy(session):
+                with self._lock:
+                    self._stats["connections_reused"] += 1
+                return session
+            with self._lock:
+                self._stats["stale_closed"] += 1
+            self._close_connection(session.connection)
+
+    def _checkin(self, server: SMTPServer, session: _Session) -> None:
+        session.last_used = time.monotonic()
+        if session.messages >= self.max_messages:
+            self._close_connection(session.connection)
+            return
+        with self._lock:
+            self._idle.setdefault(server, []).append(session)
+
+    def send_messages(self, server: SMTPServer, envelopes: Sequence[Envelope]) -> List[Optional[Exception]]:
+        """
+        Send messages over one pooled connection.
+
+        A message that fails because the connection dropped is retried once
+        on a fresh connection. Other errors (e.g. refused recipients) are
+        reported for that message and the remaining messages are still sent.
+
+        Args:
+            server: SMTP server settings
+            envelopes: Messages with their recipient lists
+
+        Returns:
+            One entry per message: None if sent, otherwise the error
+        """
+        errors: List[Optional[Exception]] = []
+        slot = self._slot(server)
+        slot.acquire()
+        session: Optional[_Session] = None
+
+        try:
+            for message, recipients in envelopes:
+                error = None
+                for attempt in range(2):
+                    try:
+                        if session is None:
+                            session = self._checkout(server)
+                        session.connection.send_message(message, to_addrs=recipients)
+                        session.messages += 1
+                        error = None
+                        break
+                    except Exception as e:
+                        error = e
+                        if session is None or not _is_connection_error(e):
+                            # Connect/login failures and per-message errors
+                            # (smtplib resets the transaction on those)
+                            break
+                        self._close_connection(session.connection)
+                        session = None
+                        if attempt == 0:
+                            with self._lock:
+                                self._stats["reconnects"] += 1
+                            logger.info(f"SMTP connection to {server.host} lost ({e}), reconnecting")
+
+                with self._lock:
+                    self._stats["messages_failed" if error else "messages_sent"] += 1
+                errors.append(error)
+
+            if session is not None:
+                self._checkin(server, session)
+        finally:
+            slot.release()
+
+        return errors
+
+    def send_message(self, server: SMTPServer, message: Message, recipients: List[str]) -> None:
+        """
+        Send a single message over a pooled connection.
+
+        Args:
+            server: SMTP server settings
+            message: Email message
+            recipients: Envelope recipients
+
+        Raises:
+            smtplib.SMTPException: If the message could not be sent
+        """
+        error = self.send_messages(server, [(message, recipients)])[0]
+        if error is not None:
+            raise error
+
+    async def asend_messages(self, server: SMTPServer, envelopes: Sequence[Envelope]) -> List[Optional[Exception]]:
+        """Run ``send_messages`` in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.send_messages, server, list(envelopes))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection statistics.
+
+        Returns:
+            Dictionary with connection and message counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle_connections"] = sum(len(sessions) for sessions in self._idle.values())
+        sent = stats["messages_sent"]
+        stats["messages_per_connection"] = sent / stats["connections_opened"] if stats["connections_opened"] else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for sessions in idle.values():
+            for session in sessions:
+                self._close_connection(session.connection)
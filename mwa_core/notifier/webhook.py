@@ -301,10 +301,12 @@ class WebhookNotifier(BaseNotifier):
     
     async def _send_request(self, request_data: Dict[str, Any]) -> httpx.Response:
         """Send the HTTP request."""
-        async with httpx.AsyncClient() as client:
-            method = request_data.pop("method")
-            url = request_data.pop("url")
-            
+        method = request_data.pop("method")
+        url = request_data.pop("url")
+        # TLS verification is a client setting in httpx, not a request option
+        verify = request_data.pop("verify", True)
+        
+        async with self._http_client(url, verify=verify) as client:
             if method == "GET":
                 response = await client.get(url, **request_data)
             elif method == "POST":
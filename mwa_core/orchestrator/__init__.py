@@ -1,3 +1,4 @@
 from .orchestrator import Orchestrator
+from .runs import RunRegistry, RunStatus, ScraperRun
 
-__all__ = ["Orchestrator"]
\ No newline at end of file
+__all__ = ["Orchestrator", "RunRegistry", "RunStatus", "ScraperRun"]
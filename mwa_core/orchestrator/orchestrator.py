@@ -4,12 +4,22 @@ Enhanced Orchestrator coordinates scraping, persistence, and notifications using
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 from datetime import datetime
 
 from mwa_core.scraper import ScraperEngine, Listing
 from mwa_core.storage import get_storage_manager
-from mwa_core.notifier import NotificationManager, NotificationChannel, NotificationPriority
+from mwa_core.notifier import (
+    NotificationManager,
+    NotificationChannel,
+    NotificationPriority,
+    NotificationFormatter,
+    NotificationMessage,
+    NotificationQueueFull,
+    NotificationResult
+)
 from mwa_core.config import get_settings, Settings
 
 logger = logging.getLogger(__name__)
@@ -39,10 +49,38 @@ class Orchestrator:
             self._settings = get_settings()
         return self._settings
 
-    def run(self, enabled_providers: List[str], config: Dict[str, Any]) -> int:
+    def run(
+        self,
+        enabled_providers: List[str],
+        config: Dict[str, Any],
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> int:
         """
         Execute a full scraping cycle with notifications.
 
+        The cycle is a pipeline: providers stream listings page by page, each
+        micro-batch is deduplicated and inserted as soon as it arrives, and
+        the inserted listings are queued for notification while scraping
+        continues. Queued notifications are delivered in the background
+        during the run, so a new listing is announced within seconds rather
+        than at the end of the cycle. Only counts are kept, so memory does
+        not grow with the number of listings.
+
+        Parameters
+        ----------
+        enabled_providers : list of str
+            Providers to scrape.
+        config : dict
+            Per-provider configuration overrides keyed by provider name,
+            applied on top of ``Settings.get_provider_config``.
+        progress : callable, optional
+            Called after each stored batch with a dict holding the batch's
+            ``provider``, ``listings`` and ``new_listings`` counts and the
+            run totals ``listings_scraped`` and ``new_listings_total``, and
+            once per provider when it is done with its ``provider`` and
+            ``provider_status`` (``completed``, ``failed`` or ``skipped``)
+            and the run totals.
+
         Returns
         -------
         int
@@ -59,54 +97,62 @@ class Orchestrator:
         if len(enabled_providers) == 1:
             job_id = self.storage.create_scraping_job(enabled_providers[0])
         
+        delivery = self._start_notification_delivery()
         try:
-            listings = self.scraper.scrape_all(enabled_providers, config)
-            logger.info(f"[Orchestrator] Scraped {len(listings)} total listings.")
-
+            scraped_count = 0
             new_count = 0
-            new_listings = []
-            
-            for listing in listings:
-                if self.storage.add_listing(listing.__dict__):
-                    new_count += 1
-                    new_listings.append(listing.__dict__)
+            # Contact discovery only needs listings that carry contacts
+            listings_with_contacts: List[Listing] = []
+
+            def on_provider_done(provider_name: str, outcome: str) -> None:
+                if progress is not None:
+                    self._report_progress(progress, {
+                        "provider": provider_name,
+                        "provider_status": outcome,
+                        "listings_scraped": scraped_count,
+                        "new_listings_total": new_count,
+                    })
+
+            provider_configs = self._provider_configs(enabled_providers, config)
+            for provider_name, batch in self.scraper.stream_all(
+                enabled_providers, provider_configs, on_provider_done=on_provider_done
+            ):
+                scraped_count += len(batch)
+                listings_with_contacts.extend(listing for listing in batch if getattr(listing, "contacts", None))
 
+                # Deduplicate and insert the micro-batch in one transaction. Scraped
+                # listings only name their ``source`` site; storage keys rows by the
+                # registered provider that produced them.
+                listing_dicts = [{**listing.__dict__, "provider": provider_name} for listing in batch]
+                added = self.storage.add_listings_batch(listing_dicts)
+                new_listings = [data for data, is_new in zip(listing_dicts, added) if is_new]
+                new_count += len(new_listings)
+
+                # Queue notifications; delivery happens outside the scrape loop
+                if new_listings and self.notification_manager:
+                    self._queue_new_listings_notification(new_listings)
+
+                if progress is not None:
+                    self._report_progress(progress, {
+                        "provider": provider_name,
+                        "listings": len(batch),
+                        "new_listings": len(new_listings),
+                        "listings_scraped": scraped_count,
+                        "new_listings_total": new_count,
+                    })
+
+            logger.info(f"[Orchestrator] Scraped {scraped_count} total listings.")
             logger.info(f"[Orchestrator] Inserted {new_count} new listings.")
 
-            # Send notifications for new listings
-            if new_count > 0 and self.notification_manager:
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # If we're in an async context, create a task
-                        asyncio.create_task(self._send_new_listings_notification(new_listings, enabled_providers))
-                    else:
-                        # If we're not in an async context, run it
-                        asyncio.run(self._send_new_listings_notification(new_listings, enabled_providers))
-                except RuntimeError:
-                    # No event loop, run it
-                    asyncio.run(self._send_new_listings_notification(new_listings, enabled_providers))
-
-            # Send contact discovery notifications if enabled
             if self.settings.contact_discovery.enabled and self.notification_manager:
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # If we're in an async context, create a task
-                        asyncio.create_task(self._send_contact_discovery_notifications(listings))
-                    else:
-                        # If we're not in an async context, run it
-                        asyncio.run(self._send_contact_discovery_notifications(listings))
-                except RuntimeError:
-                    # No event loop, run it
-                    asyncio.run(self._send_contact_discovery_notifications(listings))
+                self._queue_contact_discovery_notifications(listings_with_contacts)
 
             # Update job status if we created one
             if job_id:
                 self.storage.update_scraping_job(
                     job_id=job_id,
                     status="completed",
-                    listings_found=len(listings),
+                    listings_found=scraped_count,
                     new_listings=new_count
                 )
             
@@ -115,28 +161,12 @@ class Orchestrator:
         except Exception as e:
             logger.error(f"[Orchestrator] Scraping failed: {e}")
             
-            # Send error notification
+            # Queue error notification
             if self.notification_manager:
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # If we're in an async context, create a task
-                        asyncio.create_task(self._send_error_notification("Scraping Failed", str(e), {
-                            "providers": enabled_providers,
-                            "error_type": type(e).__name__
-                        }))
-                    else:
-                        # If we're not in an async context, run it
-                        asyncio.run(self._send_error_notification("Scraping Failed", str(e), {
-                            "providers": enabled_providers,
-                            "error_type": type(e).__name__
-                        }))
-                except RuntimeError:
-                    # No event loop, run it
-                    asyncio.run(self._send_error_notification("Scraping Failed", str(e), {
-                        "providers": enabled_providers,
-                        "error_type": type(e).__name__
-                    }))
+                self._queue_error_notification("Scraping Failed", str(e), {
+                    "providers": enabled_providers,
+                    "error_type": type(e).__name__
+                })
             
             if job_id:
                 self.storage.update_scraping_job(
@@ -146,101 +176,206 @@ class Orchestrator:
                 )
             raise
 
-    async def _send_new_listings_notification(self, new_listings: List[Dict[str, Any]], providers: List[str]):
-        """Send notification for new listings."""
-        if not self.notification_manager or not new_listings:
-            return
+        finally:
+            self._finish_notification_delivery(delivery)
+
+    def _provider_configs(
+        self, enabled_providers: List[str], config: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Build the configuration handed to each provider.
+
+        Each provider starts from ``Settings.get_provider_config``; entries
+        under the provider's name in ``config`` take precedence.
+
+        Parameters
+        ----------
+        enabled_providers : list of str
+            Providers to scrape.
+        config : dict
+            Per-provider configuration overrides.
+
+        Returns
+        -------
+        dict
+            Configuration dict per provider name.
+        """
+        provider_configs = {}
+        for name in enabled_providers:
+            provider_config = dict(self.settings.get_provider_config(name))
+            overrides = config.get(name)
+            if isinstance(overrides, dict):
+                provider_config.update(overrides)
+            provider_configs[name] = provider_config
+        return provider_configs
+
+    async def run_async(
+        self,
+        enabled_providers: List[str],
+        config: Dict[str, Any],
+        progress: Optional[Callable[[Dict[str, Any]], Optional[Awaitable[None]]]] = None,
+        executor: Optional[Executor] = None,
+    ) -> int:
+        """
+        Execute a scraping cycle without blocking the event loop.
+
+        The synchronous ``run`` is executed on ``executor`` (the loop's
+        default executor if omitted). Progress events are handed back to the
+        calling loop, so ``progress`` may touch loop-bound state or return a
+        coroutine; such coroutines are awaited before this method returns.
+
+        Parameters
+        ----------
+        enabled_providers : list of str
+            Providers to scrape.
+        config : dict
+            Per-provider configuration overrides, see ``run``.
+        progress : callable, optional
+            Called on the event loop with each progress event of ``run``.
+        executor : concurrent.futures.Executor, optional
+            Worker pool to run the scraping cycle on.
+
+        Returns
+        -------
+        int
+            Number of new listings inserted.
+        """
+        loop = asyncio.get_running_loop()
+        pending: Set[asyncio.Future] = set()
+
+        def deliver(event: Dict[str, Any]) -> None:
+            result = self._report_progress(progress, event)
+            if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+                task = asyncio.ensure_future(result)
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+        def report(event: Dict[str, Any]) -> None:
+            # Runs on the scraping thread
+            loop.call_soon_threadsafe(deliver, event)
 
         try:
-            # Determine which channels to use
-            channels = self._get_notification_channels()
-            
-            # Create notification
-            title = f"New Listings Found ({len(new_listings)})"
-            if len(providers) == 1:
-                title += f" from {providers[0].title()}"
-            
-            results = await self.notification_manager.send_new_listings(
-                listings=new_listings,
-                channels=channels,
-                title=title,
-                priority=NotificationPriority.NORMAL
+            return await loop.run_in_executor(
+                executor, self.run, enabled_providers, config, report if progress else None
             )
-            
-            # Log results
-            successful = sum(1 for r in results if r.is_successful)
-            logger.info(f"Sent new listings notification: {successful}/{len(results)} successful")
-            
-        except Exception as e:
-            logger.error(f"Failed to send new listings notification: {e}")
+        finally:
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
-    async def _send_contact_discovery_notifications(self, listings: List[Listing]):
-        """Send notifications for discovered contacts."""
-        if not self.notification_manager:
-            return
+    @staticmethod
+    def _report_progress(progress: Callable[[Dict[str, Any]], Any], event: Dict[str, Any]) -> Any:
+        """Call a progress callback without letting it abort the run."""
+        try:
+            return progress(event)
+        except Exception as e:
+            logger.warning(f"[Orchestrator] Progress callback failed: {e}")
+            return None
 
+    def _enqueue(self, message: NotificationMessage) -> None:
+        """Queue a message for the configured channels."""
         try:
-            # Collect all discovered contacts
-            all_contacts = []
-            source_urls = set()
-            
-            for listing in listings:
-                if hasattr(listing, 'contacts') and listing.contacts:
-                    all_contacts.extend(listing.contacts)
-                    source_urls.add(listing.url)
-            
-            if not all_contacts:
-                return
-            
-            # Filter high-confidence contacts
-            high_confidence_contacts = [
-                contact for contact in all_contacts
-                if contact.get('confidence', 0) >= 70
-            ]
-            
-            if not high_confidence_contacts:
-                return
-            
-            # Send notification
-            channels = self._get_notification_channels()
-            source_url = list(source_urls)[0] if len(source_urls) == 1 else f"{len(source_urls)} listings"
-            
-            results = await self.notification_manager.send_contact_discovery(
-                contacts=high_confidence_contacts,
-                source_url=source_url,
-                channels=channels,
-                priority=NotificationPriority.NORMAL
+            queued = self.notification_manager.enqueue_notification(
+                message, channels=self._get_notification_channels()
             )
-            
-            # Log results
-            successful = sum(1 for r in results if r.is_successful)
-            logger.info(f"Sent contact discovery notification: {successful}/{len(results)} successful")
-            
+            logger.info(f"Queued {message.type.value} notification for {len(queued)} notifiers")
+        except NotificationQueueFull as e:
+            logger.error(f"Dropping {message.type.value} notification: {e}")
         except Exception as e:
-            logger.error(f"Failed to send contact discovery notification: {e}")
+            logger.error(f"Failed to queue {message.type.value} notification: {e}")
 
-    async def _send_error_notification(self, error_type: str, error_details: str, context: Dict[str, Any] = None):
-        """Send error notification."""
-        if not self.notification_manager:
+    def _start_notification_delivery(self) -> Optional["_BackgroundDelivery"]:
+        """
+        Start delivering queued notifications while the run is in progress.
+
+        Inside a running event loop the queue workers are started on it.
+        Synchronous callers (CLI, scheduler threads) get a background thread
+        running the workers on its own event loop until the run finishes.
+        """
+        manager = self.notification_manager
+        if not manager or (manager.queue is None and "queue" not in manager.config):
+            return None
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                return _BackgroundDelivery(manager)
+            except Exception as e:
+                logger.error(f"Failed to start notification delivery: {e}")
+                return None
+
+        manager.start_queue_workers()
+        return None
+
+    def _finish_notification_delivery(self, delivery: Optional["_BackgroundDelivery"]) -> None:
+        """
+        Deliver what is due now and stop the background delivery thread.
+
+        Bounded by the queue's drain timeout; anything left stays queued for
+        the next run.
+        """
+        if delivery is None:
+            return
+        try:
+            results = delivery.stop()
+        except Exception as e:
+            logger.error(f"Failed to deliver queued notifications: {e}")
+            return
+        if results:
+            successful = sum(1 for r in results if r.is_successful)
+            logger.info(f"Delivered queued notifications: {successful}/{len(results)} successful")
+
+    def _queue_new_listings_notification(self, new_listings: List[Dict[str, Any]]):
+        """Add new listings to the queued listing digests."""
+        if not self.notification_manager or not new_listings:
             return
 
         try:
-            channels = self._get_notification_channels()
-            
-            results = await self.notification_manager.send_system_alert(
-                error_type=error_type,
-                error_details=error_details,
-                context=context,
-                channels=channels,
-                priority=NotificationPriority.HIGH
+            queued = self.notification_manager.queue_new_listings(
+                new_listings, channels=self._get_notification_channels()
             )
-            
-            # Log results
-            successful = sum(1 for r in results if r.is_successful)
-            logger.info(f"Sent error notification: {successful}/{len(results)} successful")
-            
+            logger.info(f"Queued {len(new_listings)} new listings in {len(queued)} digest notifications")
+        except NotificationQueueFull as e:
+            logger.error(f"Dropping new listings notification: {e}")
         except Exception as e:
-            logger.error(f"Failed to send error notification: {e}")
+            logger.error(f"Failed to queue new listings notification: {e}")
+
+    def _queue_contact_discovery_notifications(self, listings: List[Listing]):
+        """Queue notifications for discovered contacts."""
+        if not self.notification_manager:
+            return
+
+        # Collect all discovered contacts
+        all_contacts = []
+        source_urls = set()
+
+        for listing in listings:
+            if hasattr(listing, 'contacts') and listing.contacts:
+                all_contacts.extend(listing.contacts)
+                source_urls.add(listing.url)
+
+        # Filter high-confidence contacts
+        high_confidence_contacts = [
+            contact for contact in all_contacts
+            if contact.get('confidence', 0) >= 70
+        ]
+
+        if not high_confidence_contacts:
+            return
+
+        source_url = list(source_urls)[0] if len(source_urls) == 1 else f"{len(source_urls)} listings"
+        message = NotificationFormatter.format_contact_discovery_message(high_confidence_contacts, source_url)
+        message.priority = NotificationPriority.NORMAL
+        self._enqueue(message)
+
+    def _queue_error_notification(self, error_type: str, error_details: str, context: Dict[str, Any] = None):
+        """Queue error notification."""
+        if not self.notification_manager:
+            return
+
+        message = NotificationFormatter.format_error_message(error_type, error_details, context)
+        message.priority = NotificationPriority.HIGH
+        self._enqueue(message)
 
     def _get_notification_channels(self) -> List[NotificationChannel]:
         """Get notification channels based on configuration."""
@@ -289,6 +424,13 @@ class Orchestrator:
         if hasattr(self.settings, 'notifiers'):
             notifier_config['notifiers'] = self.settings.notifiers
         
+        # Persist outbound notifications next to the listings
+        notifier_config['queue'] = {
+            "path": self.settings.database_path,
+            "max_pending": self.settings.max_notification_queue_size
+        }
+        notifier_config['digest'] = {"window": self.settings.notification_digest_window}
+        
         return NotificationManager(notifier_config)
 
     def test_notifications(self, channels: List[str] = None) -> Dict[str, bool]:
@@ -378,6 +520,63 @@ class Orchestrator:
         return len(results)
 
 
+class _BackgroundDelivery:
+    """Queue delivery workers running on a private event loop thread."""
+
+    def __init__(self, manager: NotificationManager) -> None:
+        self.manager = manager
+        self._ready = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._results: List[NotificationResult] = []
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="notification-delivery", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        try:
+            asyncio.run(self._deliver())
+        except BaseException as e:
+            self._error = e
+            self._ready.set()
+
+    async def _deliver(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        try:
+            self.manager.start_queue_workers()
+        except Exception as e:
+            self._error = e
+            return
+        finally:
+            self._ready.set()
+        try:
+            await self._stop.wait()
+            # Hand the rest to a bounded drain, then release the loop's
+            # pooled connections
+            await self.manager.get_queue().stop()
+            self._results = await self.manager.deliver_queued_notifications()
+        finally:
+            await self.manager.aclose()
+
+    def stop(self) -> List[NotificationResult]:
+        """Stop the workers, deliver what is due and wait for the thread."""
+        if self._loop is not None and self._stop is not None and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._stop.set)
+            except RuntimeError:
+                pass
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._results
+
+
 # Legacy compatibility
 def create_orchestrator_with_notifications(
     scraper: ScraperEngine = None,
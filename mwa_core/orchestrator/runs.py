@@ -0,0 +1,249 @@
+"""
+Registry of scraper runs executed in the background.
+
+The API starts a run, returns its ID right away and executes the
+orchestrator on a worker thread. ``ScraperRun`` records the run's status,
+progress and timings as batches arrive; ``RunRegistry`` keeps the most
+recent runs in memory so clients can poll them by ID.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class RunStatus(str, Enum):
+    """Lifecycle states of a scraper run."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class ScraperRun:
+    """Status, progress and timings of one scraper run."""
+
+    run_id: str
+    providers: List[str]
+    config: Dict[str, Any] = field(default_factory=dict)
+    status: RunStatus = RunStatus.PENDING
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    listings_scraped: int = 0
+    new_listings: int = 0
+    provider_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Outcome of each provider that is done: completed, failed or skipped
+    provider_outcomes: Dict[str, str] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    # Monotonic clock readings; wall-clock timestamps are only for display
+    _started: Optional[float] = field(default=None, repr=False)
+    _completed: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the run has completed or failed."""
+        return self.status in (RunStatus.COMPLETED, RunStatus.FAILED)
+
+    @property
+    def progress(self) -> int:
+        """Percentage of the run's providers that are done (100 once finished)."""
+        if self.is_finished:
+            return 100
+        if not self.providers:
+            return 0
+        return int(100 * len(self.provider_outcomes) / len(self.providers))
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        """Seconds the run took, or has taken so far while it is running."""
+        if self._started is None:
+            return None
+        end = self._completed if self._completed is not None else time.monotonic()
+        return end - self._started
+
+    def start(self) -> None:
+        """Mark the run as started."""
+        self.status = RunStatus.RUNNING
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+
+    def record_progress(self, event: Dict[str, Any]) -> None:
+        """
+        Record a progress event reported by ``Orchestrator.run``.
+
+        Args:
+            event: Dictionary with ``provider``, ``listings`` and
+                ``new_listings`` of the batch and the run's running totals
+                ``listings_scraped`` and ``new_listings_total``; events of a
+                provider that is done carry ``provider_status`` instead of
+                batch counts
+        """
+        self.listings_scraped = event.get("listings_scraped", self.listings_scraped)
+        self.new_listings = event.get("new_listings_total", self.new_listings)
+
+        provider = event.get("provider")
+        if provider is None:
+            return
+        if "provider_status" in event:
+            self.provider_outcomes[provider] = event["provider_status"]
+            return
+        elapsed = self.duration_seconds or 0.0
+        stats = self.provider_stats.setdefault(provider, {
+            "batches": 0,
+            "listings": 0,
+            "new_listings": 0,
+            "first_batch_seconds": elapsed
+        })
+        stats["batches"] += 1
+        stats["listings"] += event.get("listings", 0)
+        stats["new_listings"] += event.get("new_listings", 0)
+        stats["last_batch_seconds"] = elapsed
+
+    def complete(self, new_listings: int) -> None:
+        """
+        Mark the run as completed.
+
+        Args:
+            new_listings: Number of new listings inserted by the run
+        """
+        self.new_listings = new_listings
+        self._finish(RunStatus.COMPLETED)
+
+    def fail(self, error: str) -> None:
+        """
+        Mark the run as failed.
+
+        Args:
+            error: Error description
+        """
+        self.errors.append(error)
+        self._finish(RunStatus.FAILED)
+
+    def _finish(self, status: RunStatus) -> None:
+        if self._started is None:
+            self.start()
+        self.status = status
+        self.completed_at = datetime.now()
+        self._completed = time.monotonic()
+
+    def get_results(self) -> Dict[str, Any]:
+        """
+        Get the run's counts and per-provider timings.
+
+        Returns:
+            Dictionary with listing counts and provider statistics
+        """
+        return {
+            "listings_scraped": self.listings_scraped,
+            "new_listings": self.new_listings,
+            "providers_used": len(self.providers),
+            "providers_done": dict(self.provider_outcomes),
+            "providers": {name: dict(stats) for name, stats in self.provider_stats.items()}
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the run to a dictionary.
+
+        Returns:
+            Dictionary representation of the run
+        """
+        return {
+            "run_id": self.run_id,
+            "status": self.status.value,
+            "providers": list(self.providers),
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "duration_seconds": self.duration_seconds,
+            "results": self.get_results(),
+            "errors": list(self.errors)
+        }
+
+
+class RunRegistry:
+    """In-memory registry of the most recent scraper runs."""
+
+    def __init__(self, max_runs: int = 100):
+        """
+        Initialize the registry.
+
+        Args:
+            max_runs: Number of runs to keep; the oldest finished runs are
+                dropped first, runs in progress are never dropped
+        """
+        self.max_runs = max_runs
+        self._runs: "OrderedDict[str, ScraperRun]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, providers: List[str], config: Dict[str, Any] = None,
+               run_id: Optional[str] = None) -> ScraperRun:
+        """
+        Register a new pending run.
+
+        Args:
+            providers: Providers the run scrapes
+            config: Scraper configuration of the run
+            run_id: Run ID to use, generated if omitted
+
+        Returns:
+            The registered run
+
+        Raises:
+            ValueError: If a run with ``run_id`` is already registered
+        """
+        run = ScraperRun(run_id=run_id or uuid.uuid4().hex, providers=list(providers),
+                         config=dict(config or {}))
+        with self._lock:
+            if run.run_id in self._runs:
+                raise ValueError(f"Run {run.run_id} already exists")
+            self._runs[run.run_id] = run
+            self._evict()
+        return run
+
+    def _evict(self) -> None:
+        excess = len(self._runs) - self.max_runs
+        if excess <= 0:
+            return
+        finished = [run_id for run_id, run in self._runs.items() if run.is_finished]
+        for run_id in finished[:excess]:
+            del self._runs[run_id]
+
+    def get(self, run_id: str) -> Optional[ScraperRun]:
+        """
+        Get a run by ID.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            The run, or None if it is unknown or has been evicted
+        """
+        with self._lock:
+            return self._runs.get(run_id)
+
+    def list_runs(self, active_only: bool = False) -> List[ScraperRun]:
+        """
+        List registered runs, newest first.
+
+        Args:
+            active_only: Only return runs that have not finished
+
+        Returns:
+            List of runs
+        """
+        with self._lock:
+            runs = list(reversed(self._runs.values()))
+        if active_only:
+            runs = [run for run in runs if not run.is_finished]
+        return runs
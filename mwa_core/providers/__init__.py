@@ -1,4 +1,13 @@
-from .immoscout import ImmoScoutProvider
-from .wg_gesucht import WGGesuchtProvider
+"""
+Compatibility names for the scraper providers.
 
-__all__ = ["ImmoScoutProvider", "WGGesuchtProvider"]
\ No newline at end of file
+The providers registered under the ``mwa_core.providers`` entry-point group
+live in ``mwa_core.scraper.providers``; they stream, paginate and fetch over
+HTTP first. These names keep older imports working.
+"""
+
+from mwa_core.scraper.providers import ImmoScoutProvider, WgGesuchtProvider
+
+WGGesuchtProvider = WgGesuchtProvider
+
+__all__ = ["ImmoScoutProvider", "WGGesuchtProvider"]
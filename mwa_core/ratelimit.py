@@ -0,0 +1,210 @@
+"""
+Keyed rate limiting for outbound requests.
+
+``TokenBucketLimiter`` implements a token bucket with the generic cell rate
+algorithm (GCRA): each key only stores its theoretical arrival time, so
+acquiring is O(1) regardless of the request history. Callers reserve a slot
+and sleep outside of any lock, so waiting on one key (a Discord webhook, a
+crawled domain) never delays requests for another key. Server-provided
+``Retry-After`` hints push a key's next slot back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+
+@dataclass
+class _Bucket:
+    """GCRA state of one key."""
+
+    interval: float  # seconds per token
+    burst: int
+    tat: float = 0.0  # theoretical arrival time of the next request
+
+
+def parse_retry_after(headers: Mapping[str, str], default: Optional[float] = None) -> Optional[float]:
+    """
+    Read a server's requested back-off from response headers.
+
+    Understands ``Retry-After`` in seconds or as an HTTP date, and Discord's
+    ``X-RateLimit-Reset-After``.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+        default: Value returned when no hint is present
+
+    Returns:
+        Seconds to wait, or ``default``
+    """
+    for name in ("Retry-After", "X-RateLimit-Reset-After"):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            continue
+    return default
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets with O(1) accounting."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second for each key (0 disables limiting)
+            burst: Requests a key may make back to back before being throttled
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, _Bucket] = {}
+        self._overrides: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "throttled": 0, "waited_seconds": 0.0, "penalties": 0}
+
+    def configure(self, key: str, rate: float, burst: int = 1):
+        """
+        Use a different rate for one key.
+
+        Args:
+            key: Bucket key
+            rate: Requests per second for this key
+            burst: Burst size for this key
+        """
+        with self._lock:
+            self._overrides[key] = (rate, max(1, burst))
+            self._buckets.pop(key, None)
+
+    def _bucket(self, key: str) -> Optional[_Bucket]:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self._overrides.get(key, (self.rate, self.burst))
+            if rate <= 0:
+                return None
+            bucket = self._buckets[key] = _Bucket(interval=1.0 / rate, burst=burst)
+        return bucket
+
+    def reserve(self, key: str = "default", cost: int = 1) -> float:
+        """
+        Take ``cost`` tokens from a bucket and report how long to wait for them.
+
+        Args:
+            key: Bucket key
+            cost: Number of tokens
+
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(key)
+            self._stats["acquired"] += 1
+            if bucket is None:
+                return 0.0
+            tat = max(bucket.tat, now) + cost * bucket.interval
+            wait = max(0.0, tat - bucket.burst * bucket.interval - now)
+            bucket.tat = tat
+            if wait > 0:
+                self._stats["throttled"] += 1
+                self._stats["waited_seconds"] += wait
+            return wait
+
+    async def acquire(self, key: str = "default", cost: int = 1) -> float:
+        """
+        Wait until a bucket has ``cost`` tokens.
+
+        Args:
+            key: Bucket key
+            cost: Number of tokens
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(key, cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def try_acquire(self, key: str = "default", cost: int = 1) -> bool:
+        """
+        Take tokens only if they are available right now.
+
+        Args:
+            key: Bucket key
+            cost: Number of tokens
+
+        Returns:
+            True if the tokens were taken
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(key)
+            if bucket is None:
+                return True
+            tat = max(bucket.tat, now) + cost * bucket.interval
+            if tat - bucket.burst * bucket.interval > now:
+                return False
+            bucket.tat = tat
+            self._stats["acquired"] += 1
+            return True
+
+    def penalize(self, key: str, retry_after: float):
+        """
+        Block a key until the server-requested back-off has passed.
+
+        The bucket is drained so that no request for ``key`` is granted
+        before ``retry_after`` seconds from now.
+
+        Args:
+            key: Bucket key
+            retry_after: Seconds to wait (e.g. from a ``Retry-After`` header)
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(key)
+            if bucket is None:
+                # Unlimited key: a negligible interval keeps only the penalty
+                bucket = self._buckets[key] = _Bucket(interval=1e-9, burst=1)
+            blocked_until = now + retry_after + (bucket.burst - 1) * bucket.interval
+            bucket.tat = max(bucket.tat, blocked_until)
+            self._stats["penalties"] += 1
+
+    def reset(self, key: Optional[str] = None):
+        """
+        Forget the state of one key or of all keys.
+
+        Args:
+            key: Bucket key, or None for all keys
+        """
+        with self._lock:
+            if key is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with acquire, throttle and penalty counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["keys"] = len(self._buckets)
+        stats["rate"] = self.rate
+        stats["burst"] = self.burst
+        return stats
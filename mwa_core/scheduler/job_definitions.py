@@ -248,11 +248,7 @@ async def contact_validation_job(contact_ids: Optional[List[int]] = None,
             config = get_settings()
         
         # Initialize validator
-        validator = ContactValidator(
-            enable_smtp_verification=config.contact_discovery.smtp_verification,
-            enable_dns_verification=config.contact_discovery.dns_verification,
-            rate_limit_seconds=config.contact_discovery.rate_limit_seconds
-        )
+        validator = ContactValidator.from_settings(config.contact_discovery)
         
         # Initialize integration
         integration = ContactDiscoveryIntegration(config)
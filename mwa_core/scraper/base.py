@@ -1,25 +1,8 @@
 from __future__ import annotations
 from typing import Protocol, List, Dict, Any
-from dataclasses import dataclass
-from datetime import datetime
 
-
-@dataclass
-class Listing:
-    """
-    Canonical listing object returned by any provider.
-    """
-    title: str
-    price: str
-    source: str
-    url: str
-    timestamp: datetime
-    external_id: str | None = None
-    description: str | None = None
-    images: list[str] | None = None
-    contact_email: str | None = None
-    contact_phone: str | None = None
-    raw: Dict[str, Any] | None = None  # provider-specific payload for debugging
+# The registered providers and the engine share one listing type
+from .providers.base import Listing
 
 
 class Provider(Protocol):
@@ -3,8 +3,11 @@ ScraperEngine orchestrates multiple providers and aggregates their listings.
 """
 
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 
 from .base import Listing
 from .registry import ProviderRegistry
@@ -12,16 +15,70 @@ from mwa_core.storage import get_storage_manager
 
 logger = logging.getLogger(__name__)
 
+# Called on the calling thread for each batch of listings as soon as it is parsed
+ListingsCallback = Callable[[str, List[Listing]], None]
+
+# Called on the calling thread with a provider's name and outcome
+# ("completed", "failed" or "skipped") once it is done
+ProviderDoneCallback = Callable[[str, str], None]
+
+
+class ProviderTimeoutError(TimeoutError):
+    """Raised when a provider exceeds its time budget."""
+
 
 class ScraperEngine:
     """
     Runs all enabled providers and returns aggregated listings.
+
+    With ``max_workers > 1`` providers run concurrently in a bounded thread
+    pool (each provider drives its own browser, so the work is I/O bound),
+    making a cycle take roughly as long as the slowest provider.
+
+    ``stream_all`` hands listings to the caller in micro-batches (a result
+    page for providers implementing ``stream_listings``) while providers are
+    still scraping. At most ``max_pending_batches`` batches wait for the
+    caller; providers block until it catches up, so memory stays flat no
+    matter how many listings a cycle finds.
     """
 
-    def __init__(self, registry: ProviderRegistry | None = None) -> None:
+    def __init__(
+        self,
+        registry: ProviderRegistry | None = None,
+        max_workers: int = 1,
+        provider_timeout: float | None = None,
+        max_pending_batches: int = 4,
+        batch_size: int = 50,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        registry : ProviderRegistry, optional
+            Provider registry (defaults to the entry-point registry).
+        max_workers : int
+            Maximum number of providers running at the same time; 1 runs them
+            sequentially.
+        provider_timeout : float, optional
+            Seconds a provider may run before it is cancelled and its job is
+            marked as failed. None disables the timeout.
+        max_pending_batches : int
+            Batches buffered between concurrent providers and the caller.
+        batch_size : int
+            Largest batch handed to the caller; bigger provider results are
+            split.
+        """
         self.registry = registry or ProviderRegistry()
+        self.max_workers = max(1, max_workers)
+        self.provider_timeout = provider_timeout
+        self.max_pending_batches = max(1, max_pending_batches)
+        self.batch_size = max(1, batch_size)
 
-    def scrape_all(self, enabled_providers: List[str], config: Dict[str, Any]) -> List[Listing]:
+    def scrape_all(
+        self,
+        enabled_providers: List[str],
+        config: Dict[str, Any],
+        on_listings: Optional[ListingsCallback] = None,
+    ) -> List[Listing]:
         """
         Fetch listings from all enabled providers.
 
@@ -31,54 +88,240 @@ class ScraperEngine:
             Names of providers to run (must be registered).
         config : dict
             Global config passed to each provider (can be overridden per provider).
+        on_listings : callable, optional
+            ``on_listings(provider_name, listings)`` is called for each batch
+            as soon as it is available, e.g. to stream listings into storage
+            while providers are still scraping.
 
         Returns
         -------
         list[Listing]
-            Aggregated listings from all providers.
+            Aggregated listings from all providers, in arrival order.
         """
         all_listings: List[Listing] = []
+        for name, batch in self.stream_all(enabled_providers, config):
+            all_listings.extend(batch)
+            if on_listings is not None:
+                try:
+                    on_listings(name, batch)
+                except Exception as exc:
+                    logger.error(f"[ScraperEngine] Listings callback failed for '{name}': {exc}")
+        return all_listings
+
+    def stream_all(
+        self,
+        enabled_providers: List[str],
+        config: Dict[str, Any],
+        on_provider_done: Optional[ProviderDoneCallback] = None,
+    ) -> Iterator[Tuple[str, List[Listing]]]:
+        """
+        Yield listings of all enabled providers as they are parsed.
+
+        Batches are yielded on the calling thread, so the caller may write
+        them to storage directly. Scraping job records are updated when a
+        provider finishes, fails or times out; batches yielded before a
+        failure are not withdrawn.
+
+        Parameters
+        ----------
+        enabled_providers : list[str]
+            Names of providers to run (must be registered).
+        config : dict
+            Global config passed to each provider (can be overridden per provider).
+        on_provider_done : callable, optional
+            ``on_provider_done(provider_name, outcome)`` is called once per
+            provider with ``"completed"``, ``"failed"`` (including timeouts)
+            or ``"skipped"`` (not registered), e.g. to report run progress.
+
+        Yields
+        ------
+        tuple[str, list[Listing]]
+            Provider name and a non-empty batch of at most ``batch_size`` listings.
+        """
         storage = get_storage_manager()
-        
+
+        def notify_done(name: str, outcome: str) -> None:
+            if on_provider_done is None:
+                return
+            try:
+                on_provider_done(name, outcome)
+            except Exception as exc:
+                logger.error(f"[ScraperEngine] Provider callback failed for '{name}': {exc}")
+
+        # Create all job records up front so no DB write sits between providers
+        jobs = []
         for name in enabled_providers:
             provider_cls = self.registry.get(name)
             if provider_cls is None:
                 logger.warning(f"[ScraperEngine] Provider '{name}' not registered – skipping.")
+                notify_done(name, "skipped")
                 continue
-            
-            # Create scraping job for this provider
-            job_id = storage.create_scraping_job(name)
-            provider = provider_cls()
-            
+            jobs.append((name, provider_cls(), storage.create_scraping_job(name)))
+
+        if not jobs:
+            return
+        providers = {job_id: provider for _, provider, job_id in jobs}
+
+        def handle_result(name: str, job_id: Any, count: int, duration: float) -> None:
+            logger.info(f"[ScraperEngine] Provider '{name}' returned {count} listings.")
+
+            performance_metrics = {"duration": duration, "success": True}
+            get_stats = getattr(providers[job_id], "get_stats", None)
+            if callable(get_stats):
+                # e.g. whether the provider fetched over HTTP or fell back to a browser
+                performance_metrics["provider_stats"] = get_stats()
+
+            # Update job with success
+            storage.update_scraping_job(
+                job_id=job_id,
+                status="completed",
+                listings_found=count,
+                performance_metrics=performance_metrics
+            )
+            notify_done(name, "completed")
+
+        def handle_failure(name: str, job_id: Any, exc: BaseException) -> None:
+            logger.error(f"[ScraperEngine] Provider '{name}' failed: {exc}")
+
+            # Update job with failure; other providers continue
+            storage.update_scraping_job(
+                job_id=job_id,
+                status="failed",
+                errors=[str(exc)],
+                performance_metrics={"success": False}
+            )
+            notify_done(name, "failed")
+
+        if self.max_workers == 1 and self.provider_timeout is None:
+            for name, provider, job_id in jobs:
+                start = time.monotonic()
+                count = 0
+                try:
+                    for batch in self._iter_batches(provider, config.get(name, {})):
+                        count += len(batch)
+                        yield name, batch
+                except Exception as exc:
+                    handle_failure(name, job_id, exc)
+                    continue
+                handle_result(name, job_id, count, time.monotonic() - start)
+            return
+
+        yield from self._stream_concurrently(jobs, config, handle_result, handle_failure)
+
+    def _iter_batches(self, provider: Any, provider_config: Dict[str, Any]) -> Iterator[List[Listing]]:
+        """Yield a provider's listings in batches of at most ``batch_size``."""
+        stream = getattr(provider, "stream_listings", None)
+        pages = stream(provider_config) if callable(stream) else [provider.fetch_listings(provider_config)]
+        for page in pages:
+            for start in range(0, len(page), self.batch_size):
+                yield page[start:start + self.batch_size]
+
+    def _stream_concurrently(
+        self,
+        jobs: List[tuple],
+        config: Dict[str, Any],
+        handle_result: Callable[[str, Any, int, float], None],
+        handle_failure: Callable[[str, Any, BaseException], None],
+    ) -> Iterator[Tuple[str, List[Listing]]]:
+        """
+        Run providers in a bounded thread pool with per-provider timeouts.
+
+        Workers put batches and outcomes on a bounded queue that is consumed
+        on the calling thread, so storage is never touched from worker threads.
+        """
+        events: queue.Queue = queue.Queue(maxsize=self.max_pending_batches)
+        stopped = {job_id: threading.Event() for _, _, job_id in jobs}
+        started_at: Dict[Any, float] = {}
+
+        def emit(job_id: Any, event: tuple) -> bool:
+            # Block while the caller is behind, but give up once the job is stopped
+            while not stopped[job_id].is_set():
+                try:
+                    events.put(event, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(name: str, provider: Any, job_id: Any) -> None:
+            # The timeout clock starts when a worker picks the provider up
+            started_at[job_id] = time.monotonic()
             try:
-                start_time = datetime.utcnow()
-                listings = provider.fetch_listings(config.get(name, {}))
-                end_time = datetime.utcnow()
-                
-                all_listings.extend(listings)
-                logger.info(f"[ScraperEngine] Provider '{name}' returned {len(listings)} listings.")
-                
-                # Update job with success
-                duration = (end_time - start_time).total_seconds()
-                storage.update_scraping_job(
-                    job_id=job_id,
-                    status="completed",
-                    listings_found=len(listings),
-                    performance_metrics={"duration": duration, "success": True}
-                )
-                
+                for batch in self._iter_batches(provider, config.get(name, {})):
+                    if not emit(job_id, ("batch", job_id, batch)):
+                        return
             except Exception as exc:
-                logger.error(f"[ScraperEngine] Provider '{name}' failed: {exc}")
-                
-                # Update job with failure
-                storage.update_scraping_job(
-                    job_id=job_id,
-                    status="failed",
-                    errors=[str(exc)],
-                    performance_metrics={"success": False}
-                )
-                
-                # Continue with other providers even if one fails
-                continue
-        
-        return all_listings
\ No newline at end of file
+                emit(job_id, ("error", job_id, exc))
+                return
+            emit(job_id, ("done", job_id, time.monotonic() - started_at[job_id]))
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(jobs)),
+            thread_name_prefix="scraper-provider",
+        )
+        running = {job_id: (name, provider) for name, provider, job_id in jobs}
+        futures = {}
+        counts = {job_id: 0 for job_id in running}
+
+        try:
+            for name, provider, job_id in jobs:
+                futures[job_id] = executor.submit(produce, name, provider, job_id)
+
+            while running:
+                timeout = None
+                if self.provider_timeout is not None:
+                    now = time.monotonic()
+                    deadlines = [
+                        started_at[j] + self.provider_timeout for j in running if j in started_at
+                    ]
+                    # Re-check at least every second so queued providers get a start time
+                    timeout = max(0.0, min(deadlines + [now + 1.0]) - now)
+
+                try:
+                    kind, job_id, value = events.get(timeout=timeout)
+                except queue.Empty:
+                    kind = job_id = None
+
+                if job_id in running:
+                    name = running[job_id][0]
+                    if kind == "batch":
+                        counts[job_id] += len(value)
+                        yield name, value
+                    elif kind == "done":
+                        del running[job_id]
+                        handle_result(name, job_id, counts[job_id], value)
+                    else:
+                        del running[job_id]
+                        handle_failure(name, job_id, value)
+
+                if self.provider_timeout is not None:
+                    now = time.monotonic()
+                    for job_id in [j for j in running if j in started_at]:
+                        if now - started_at[job_id] >= self.provider_timeout:
+                            name, provider = running.pop(job_id)
+                            stopped[job_id].set()
+                            self._cancel_provider(futures[job_id], provider)
+                            handle_failure(name, job_id, ProviderTimeoutError(
+                                f"Provider '{name}' timed out after {self.provider_timeout}s"
+                            ))
+        finally:
+            # Release blocked workers, ask providers still running (e.g. when
+            # the caller stopped consuming) to stop, and do not wait for
+            # providers that ignored cancellation
+            for event in stopped.values():
+                event.set()
+            for job_id, (_, provider) in running.items():
+                if job_id in futures:
+                    self._cancel_provider(futures[job_id], provider)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _cancel_provider(future: Future, provider: Any) -> None:
+        """Cancel a timed-out provider, asking it to stop if it supports that."""
+        future.cancel()
+        cancel = getattr(provider, "cancel", None)
+        if callable(cancel):
+            try:
+                cancel()
+            except Exception as exc:
+                logger.warning(f"[ScraperEngine] Error cancelling provider: {exc}")
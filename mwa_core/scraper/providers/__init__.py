@@ -5,8 +5,8 @@ This module contains the base provider protocol and implementations
 for different apartment listing websites.
 """
 
-from .base import BaseProvider, Listing
+from .base import BaseProvider, Listing, ProviderCancelledError
 from .immoscout import ImmoScoutProvider
 from .wg_gesucht import WgGesuchtProvider
 
-__all__ = ["BaseProvider", "Listing", "ImmoScoutProvider", "WgGesuchtProvider"]
\ No newline at end of file
+__all__ = ["BaseProvider", "Listing", "ProviderCancelledError", "ImmoScoutProvider", "WgGesuchtProvider"]
\ No newline at end of file
@@ -36,12 +36,20 @@ class Listing:
     raw_data: Dict[str, Any] | None = None  # provider-specific payload for debugging
 
 
+class ProviderCancelledError(RuntimeError):
+    """Raised inside a provider whose scrape was cancelled."""
+
+
 class BaseProvider(Protocol):
     """
     Protocol that all scraper providers must implement.
     
     This defines the standard interface for scraping apartment
-    listings from different websites.
+    listings from different websites. Providers may also implement
+    ``stream_listings(config)``, yielding lists of listings as result pages
+    are parsed; the scraper engine then hands them on page by page. A
+    ``cancel()`` method, if present, is called from another thread when the
+    engine gives up on a provider.
     """
     
     def fetch_listings(self, config: Dict[str, Any]) -> List[Listing]:
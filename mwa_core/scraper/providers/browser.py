@@ -0,0 +1,201 @@
+"""
+Shared result-page fetching for MWA Core scraper providers.
+
+``BrowserProvider`` holds what the site providers have in common: the
+HTTP-first fetch with browser fallback, the browser retry loop and the
+cancellation plumbing. A subclass names the CSS class of its result entries
+and implements ``_extract_listing`` for a single entry.
+"""
+
+from contextlib import contextmanager
+import logging
+import threading
+from typing import Iterator, List, Dict, Any
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from mwa_core.scraper.providers.base import Listing, ProviderCancelledError
+from mwa_core.scraper.providers.static import FetchStats, fetch_static_items
+from mafa.driver import driver_session
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserProvider:
+    """
+    Base class for providers that scrape a paginated result list.
+    
+    Subclasses set ``site_name`` (used in log messages and errors) and
+    ``result_class`` (CSS class of one result entry).
+    """
+    
+    site_name = ""
+    result_class = ""
+    
+    def __init__(self) -> None:
+        """Initialize fetch statistics and cancellation state."""
+        self.fetch_stats = FetchStats()
+        self._stop = threading.Event()
+        self._driver = None
+        self._driver_lock = threading.Lock()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counts of listings pages fetched over HTTP vs. the browser."""
+        return self.fetch_stats.as_dict()
+    
+    def cancel(self) -> None:
+        """
+        Stop a running scrape from another thread.
+        
+        No further page or retry is started, and the browser in use is quit
+        so that a hanging page load returns; the driver pool replaces it.
+        """
+        self._stop.set()
+        with self._driver_lock:
+            driver = self._driver
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.debug(f"Error quitting driver of cancelled scrape: {e}")
+    
+    def _fetch_page(self, url: str, config: Dict[str, Any]) -> List[Listing]:
+        """
+        Fetch the listings of a single result page.
+        
+        Args:
+            url: Result page URL
+            config: Provider configuration (see ``fetch_listings``)
+        
+        Returns:
+            Listings on the page
+        """
+        headless = config.get("headless", True)
+        timeout = config.get("timeout", 30)
+        request_delay = config.get("request_delay", 1.0)
+        max_retries = config.get("max_retries", 3)
+        user_agent = config.get("user_agent")
+        
+        fetch_mode = config.get("fetch_mode", "http_first")
+        
+        if fetch_mode == "http_first":
+            items, reason = fetch_static_items(url, self.result_class, timeout, user_agent)
+            if items is not None:
+                listings = self._extract_listings(items)
+                if listings:
+                    self.fetch_stats.record("http")
+                    logger.info(f"Extracted {len(listings)} listings from static HTML")
+                    return listings
+                reason = "no listings extracted from static HTML"
+            self.fetch_stats.record_fallback(reason)
+            logger.info(f"Falling back to browser for {self.site_name}: {reason}")
+        
+        listings: List[Listing] = []
+        retry_count = 0
+        
+        while retry_count < max_retries:
+            if self._stop.is_set():
+                raise ProviderCancelledError(f"{self.site_name} scraping was cancelled")
+            try:
+                logger.info(f"Starting {self.site_name} scraping (attempt {retry_count + 1})")
+                
+                with driver_session(headless=headless, user_agent=user_agent,
+                                    pooled=config.get("use_driver_pool", True),
+                                    pool_size=config.get("driver_pool_size", 2),
+                                    max_uses=config.get("driver_max_uses", 50)) as driver, \
+                        self._tracked(driver):
+                    driver.set_page_load_timeout(timeout)
+                    
+                    # Navigate to search page
+                    logger.debug(f"Navigating to: {url}")
+                    driver.get(url)
+                    
+                    # Wait for results to load
+                    wait = WebDriverWait(driver, timeout)
+                    wait.until(EC.presence_of_element_located((By.CLASS_NAME, self.result_class)))
+                    
+                    # Add delay to respect rate limiting; returns early on cancel
+                    if self._stop.wait(request_delay):
+                        raise ProviderCancelledError(f"{self.site_name} scraping was cancelled")
+                    
+                    # Extract listings
+                    items = driver.find_elements(By.CLASS_NAME, self.result_class)
+                    logger.info(f"Found {len(items)} listing elements")
+                    listings = self._extract_listings(items)
+                    
+                    logger.info(f"Successfully extracted {len(listings)} listings")
+                    self.fetch_stats.record("browser")
+                    break  # Success, exit retry loop
+            
+            except TimeoutException:
+                if self._stop.is_set():
+                    raise ProviderCancelledError(f"{self.site_name} scraping was cancelled")
+                retry_count += 1
+                logger.warning(f"Timeout on attempt {retry_count}, retrying...")
+                if retry_count < max_retries:
+                    self._stop.wait(request_delay * retry_count)  # Exponential backoff
+                else:
+                    logger.error(f"Max retries exceeded for {self.site_name} scraping")
+                    raise
+            
+            except ProviderCancelledError:
+                raise
+            
+            except Exception as e:
+                if self._stop.is_set():
+                    raise ProviderCancelledError(f"{self.site_name} scraping was cancelled") from e
+                retry_count += 1
+                logger.error(f"Error on attempt {retry_count}: {e}")
+                if retry_count >= max_retries:
+                    logger.error(f"Max retries exceeded for {self.site_name} scraping")
+                    raise
+                self._stop.wait(request_delay * retry_count)  # Exponential backoff
+        
+        return listings
+    
+    @contextmanager
+    def _tracked(self, driver) -> Iterator[None]:
+        """Expose the driver in use to ``cancel`` until it is released."""
+        with self._driver_lock:
+            self._driver = driver
+        try:
+            yield
+        finally:
+            with self._driver_lock:
+                self._driver = None
+    
+    def _extract_listings(self, items) -> List[Listing]:
+        """
+        Extract listings from result elements, skipping ones that fail.
+        
+        Args:
+            items: Selenium WebElements or StaticElements of the result list
+        
+        Returns:
+            Extracted listings
+        """
+        listings: List[Listing] = []
+        for item in items:
+            try:
+                listing = self._extract_listing(item)
+                if listing:
+                    listings.append(listing)
+            except Exception as e:
+                logger.warning(f"Error extracting individual listing: {e}")
+                continue
+        return listings
+    
+    def _extract_listing(self, item_element) -> Listing | None:
+        """
+        Extract listing data from a single result element.
+        
+        Args:
+            item_element: Selenium WebElement or StaticElement for the listing
+        
+        Returns:
+            Listing object or None if extraction fails
+        """
+        raise NotImplementedError
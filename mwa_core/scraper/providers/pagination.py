@@ -0,0 +1,131 @@
+"""
+Paginated result crawling for MWA Core scraper providers.
+
+Result lists are sorted newest first, so a provider only has to read pages
+until it meets listings that are already stored. After each page the URLs
+are checked against the ``listings`` table in one batched lookup; once a page
+contains enough known listings the crawl stops. A cold start (empty
+database) therefore backfills up to ``max_pages``, while steady-state cycles
+usually read a single page. ``iter_pages`` yields each page as soon as it is
+parsed so callers can store and notify while later pages are still loading.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Iterator, List, Optional, Set
+
+from mwa_core.scraper.providers.base import Listing
+
+logger = logging.getLogger(__name__)
+
+# Returns the subset of the given URLs that is already stored
+KnownUrlsLookup = Callable[[List[str]], Set[str]]
+
+
+def stored_listing_urls(urls: List[str]) -> Set[str]:
+    """Look up which URLs are already in storage."""
+    from mwa_core.storage import get_storage_manager
+
+    return get_storage_manager().get_known_listing_urls(urls)
+
+
+def iter_pages(
+    fetch_page: Callable[[int], List[Listing]],
+    max_pages: int = 10,
+    stop_at_known: int = 3,
+    known_urls: Optional[KnownUrlsLookup] = None,
+    page_delay: float = 0.0,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[List[Listing]]:
+    """
+    Yield result pages until known listings or the last page is reached.
+
+    Parameters
+    ----------
+    fetch_page : callable
+        ``fetch_page(page_number)`` returns the listings of a 1-based page.
+    max_pages : int
+        Upper bound on pages read, i.e. the backfill depth of a cold start.
+    stop_at_known : int
+        Stop after a page with this many already stored listings (or a page
+        that is entirely known). A threshold above one keeps pinned or
+        promoted old listings on the first page from ending the crawl early.
+        0 disables the cutoff.
+    known_urls : callable, optional
+        Batch lookup of stored URLs; defaults to the storage manager.
+    page_delay : float
+        Seconds to wait between pages.
+    stop : threading.Event, optional
+        Set from another thread to stop before the next page.
+
+    Yields
+    ------
+    list[Listing]
+        The listings of each page not yielded before, in page order.
+    """
+    known_urls = known_urls or stored_listing_urls
+    seen: Set[str] = set()
+
+    for page in range(1, max(1, max_pages) + 1):
+        if page > 1 and page_delay:
+            if stop is not None:
+                stop.wait(page_delay)
+            else:
+                time.sleep(page_delay)
+        if stop is not None and stop.is_set():
+            logger.info(f"Pagination cancelled before page {page}")
+            return
+
+        try:
+            page_listings = fetch_page(page)
+        except Exception as e:
+            if page == 1:
+                raise
+            if stop is None or not stop.is_set():
+                logger.warning(f"Stopping pagination, page {page} failed: {e}")
+            return
+
+        fresh = [listing for listing in page_listings if listing.url not in seen]
+        if not fresh:
+            # Empty page or the site repeating its last page
+            logger.debug(f"Page {page} has no new entries, stopping")
+            return
+        seen.update(listing.url for listing in fresh)
+
+        if page == max_pages or not stop_at_known:
+            yield fresh
+            continue
+
+        # Look up known URLs before the caller gets to store this page
+        known = known_urls([listing.url for listing in fresh if listing.url])
+        yield fresh
+        if len(known) >= min(stop_at_known, len(fresh)):
+            logger.info(f"Page {page} contains {len(known)} known listings, stopping")
+            return
+
+
+def crawl_pages(
+    fetch_page: Callable[[int], List[Listing]],
+    max_pages: int = 10,
+    stop_at_known: int = 3,
+    known_urls: Optional[KnownUrlsLookup] = None,
+    page_delay: float = 0.0,
+) -> List[Listing]:
+    """
+    Fetch result pages until known listings or the last page is reached.
+
+    Parameters are the same as for ``iter_pages``.
+
+    Returns
+    -------
+    list[Listing]
+        All listings read, in page order, without repeats.
+    """
+    return [
+        listing
+        for page in iter_pages(fetch_page, max_pages, stop_at_known, known_urls, page_delay)
+        for listing in page
+    ]
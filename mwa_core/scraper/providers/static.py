@@ -0,0 +1,216 @@
+"""
+HTTP-first page fetching for MWA Core scraper providers.
+
+Result-list pages are mostly server-rendered, so providers first fetch them
+with a shared, connection-pooled ``httpx.Client`` and parse them with lxml.
+Parsed nodes are wrapped in ``StaticElement``, which mimics the small part of
+the Selenium ``WebElement`` API the providers' extraction code uses, so the
+same extraction runs on both paths. When the static fetch fails, finds no
+results or hits a bot/JavaScript challenge, providers fall back to a browser.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+import httpx
+import lxml.html
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+# Status codes and page fragments that indicate an anti-bot interstitial
+CHALLENGE_STATUS_CODES = {202, 401, 403, 429, 503}
+CHALLENGE_MARKERS = (
+    "captcha",
+    "cf-challenge",
+    "challenge-platform",
+    "just a moment...",
+    "ich bin kein roboter",
+    "enable javascript",
+    "javascript aktivieren",
+)
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Shared HTTP client; keeps connections to the listing sites alive across runs."""
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                headers={"Accept-Language": "de-DE,de;q=0.9,en;q=0.8"},
+            )
+        return _client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def is_js_challenge(status_code: int, html: str) -> bool:
+    """
+    Detect bot-protection or JavaScript challenge pages.
+
+    Parameters
+    ----------
+    status_code : int
+        HTTP status of the response.
+    html : str
+        Response body.
+
+    Returns
+    -------
+    bool
+        True if the page has to be rendered by a real browser.
+    """
+    if status_code in CHALLENGE_STATUS_CODES:
+        return True
+    head = html[:20000].lower()
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+class StaticElement:
+    """Read-only ``WebElement`` look-alike backed by an lxml element."""
+
+    def __init__(self, element: lxml.html.HtmlElement) -> None:
+        self._element = element
+
+    @property
+    def text(self) -> str:
+        """Whitespace-normalized text content."""
+        return " ".join(self._element.text_content().split())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Attribute value, or the serialized element for ``outerHTML``."""
+        if name == "outerHTML":
+            return lxml.html.tostring(self._element, encoding="unicode")
+        return self._element.get(name)
+
+    def find_elements(self, by: str, value: str) -> List["StaticElement"]:
+        """Find descendants by class name, tag name or a simple ``tag.class`` selector."""
+        return [StaticElement(e) for e in self._element.xpath(_to_xpath(by, value))]
+
+    def find_element(self, by: str, value: str) -> "StaticElement":
+        """First descendant matching the locator; raises like Selenium when missing."""
+        matches = self._element.xpath(_to_xpath(by, value))
+        if not matches:
+            raise NoSuchElementException(f"No element matching {by}={value!r}")
+        return StaticElement(matches[0])
+
+
+def _class_predicate(class_name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def _to_xpath(by: str, value: str) -> str:
+    if by == By.CLASS_NAME:
+        return f".//*[{_class_predicate(value)}]"
+    if by == By.TAG_NAME:
+        return f".//{value}"
+    if by == By.CSS_SELECTOR and " " not in value.strip():
+        tag, *classes = value.strip().split(".")
+        predicates = "".join(f"[{_class_predicate(c)}]" for c in classes)
+        return f".//{tag or '*'}{predicates}"
+    raise ValueError(f"Unsupported static locator: {by}={value!r}")
+
+
+def parse_items(html: str, base_url: str, class_name: str) -> List[StaticElement]:
+    """
+    Parse a result page and return its listing elements.
+
+    Links are made absolute so ``href``/``src`` match what a browser reports.
+    """
+    document = lxml.html.fromstring(html)
+    document.make_links_absolute(base_url, resolve_base_href=True)
+    return StaticElement(document).find_elements(By.CLASS_NAME, class_name)
+
+
+def fetch_static_items(
+    url: str,
+    class_name: str,
+    timeout: float = 30,
+    user_agent: str | None = None,
+) -> tuple[Optional[List[StaticElement]], str]:
+    """
+    Fetch a result page over HTTP and parse its listing elements.
+
+    Parameters
+    ----------
+    url : str
+        Search page URL.
+    class_name : str
+        CSS class of a listing element.
+    timeout : float
+        Request timeout in seconds.
+    user_agent : str, optional
+        User agent header.
+
+    Returns
+    -------
+    tuple
+        ``(items, reason)``; ``items`` is None when the page has to be
+        rendered by a browser, and ``reason`` says why.
+    """
+    headers = {"User-Agent": user_agent} if user_agent else {}
+    try:
+        response = get_http_client().get(url, headers=headers, timeout=timeout)
+    except httpx.HTTPError as e:
+        return None, f"request failed: {e}"
+
+    if is_js_challenge(response.status_code, response.text):
+        return None, f"challenge detected (HTTP {response.status_code})"
+    if response.status_code >= 400:
+        return None, f"HTTP {response.status_code}"
+
+    try:
+        items = parse_items(response.text, str(response.url), class_name)
+    except Exception as e:
+        return None, f"parse failed: {e}"
+
+    if not items:
+        return None, "no listings in static HTML"
+    return items, "ok"
+
+
+class FetchStats:
+    """Counts which fetch path a provider used."""
+
+    def __init__(self) -> None:
+        self.http = 0
+        self.browser = 0
+        self.fallbacks = 0
+        self.last_path: Optional[str] = None
+        self.last_fallback_reason: Optional[str] = None
+
+    def record(self, path: str) -> None:
+        """Record a successful fetch via ``"http"`` or ``"browser"``."""
+        setattr(self, path, getattr(self, path) + 1)
+        self.last_path = path
+
+    def record_fallback(self, reason: str) -> None:
+        """Record a static fetch that had to fall back to the browser."""
+        self.fallbacks += 1
+        self.last_fallback_reason = reason
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Stats as a plain dictionary."""
+        return {
+            "http": self.http,
+            "browser": self.browser,
+            "fallbacks": self.fallbacks,
+            "last_path": self.last_path,
+            "last_fallback_reason": self.last_fallback_reason,
+        }
@@ -7,21 +7,20 @@ from WG-Gesucht.de.
 
 from datetime import datetime
 import logging
-import time
-from typing import List, Dict, Any
+import re
+from typing import Iterator, List, Dict, Any
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException
 
 from mwa_core.scraper.providers.base import BaseProvider, Listing
-from mafa.driver import SeleniumDriver
+from mwa_core.scraper.providers.browser import BrowserProvider
+from mwa_core.scraper.providers.pagination import iter_pages
 
 logger = logging.getLogger(__name__)
 
 
-class WgGesuchtProvider:
+class WgGesuchtProvider(BrowserProvider):
     """
     Scrapes listings from WG-Gesucht.de.
     
@@ -29,6 +28,9 @@ class WgGesuchtProvider:
     apartment listings from WG-Gesucht.
     """
     
+    site_name = "WG-Gesucht"
+    result_class = "wgg_card"
+    
     def __init__(self, base_url: str | None = None) -> None:
         """
         Initialize the WG-Gesucht provider.
@@ -36,6 +38,7 @@ class WgGesuchtProvider:
         Args:
             base_url: Custom base URL for WG-Gesucht searches
         """
+        super().__init__()
         self.base_url = base_url or (
             "https://www.wg-gesucht.de/wohnungen-in-Muenchen.90.2.1.0.html"
         )
@@ -79,81 +82,73 @@ class WgGesuchtProvider:
             - request_delay: float (default 1.0) - Delay between requests
             - max_retries: int (default 3) - Maximum retry attempts
             - base_url: str - Override base search URL
+            - use_driver_pool: bool (default True) - Lease a warm browser from the shared pool
+            - fetch_mode: str (default "http_first") - "http_first" tries a plain HTTP
+              fetch before the browser; "browser" always uses the browser
+            - max_pages: int (default 10) - Maximum result pages read (backfill depth)
+            - stop_at_known: int (default 3) - Stop after a page with this many
+              already stored listings; 0 reads all max_pages
             
         Returns
         -------
         list[Listing]
             Canonical listing objects extracted from WG-Gesucht.
         """
+        return [listing for page in self.stream_listings(config) for listing in page]
+    
+    def stream_listings(self, config: Dict[str, Any]) -> Iterator[List[Listing]]:
+        """
+        Yield listings from WG-Gesucht one result page at a time.
+        
+        Parameters
+        ----------
+        config : dict
+            Provider configuration, see ``fetch_listings``.
+            
+        Yields
+        ------
+        list[Listing]
+            The listings of each result page as soon as it is parsed.
+        """
         base_url = config.get("base_url", self.base_url)
-        headless = config.get("headless", True)
-        timeout = config.get("timeout", 30)
-        request_delay = config.get("request_delay", 1.0)
-        max_retries = config.get("max_retries", 3)
-        user_agent = config.get("user_agent")
         
-        listings: List[Listing] = []
-        retry_count = 0
+        def fetch_page(page: int) -> List[Listing]:
+            url = self._page_url(base_url, page)
+            return self._fetch_page(url, config) if url else []
         
-        while retry_count < max_retries:
-            try:
-                logger.info(f"Starting WG-Gesucht scraping (attempt {retry_count + 1})")
-                
-                with SeleniumDriver(headless=headless, user_agent=user_agent) as driver:
-                    driver.set_page_load_timeout(timeout)
-                    
-                    # Navigate to search page
-                    logger.debug(f"Navigating to: {base_url}")
-                    driver.get(base_url)
-                    
-                    # Wait for results to load
-                    wait = WebDriverWait(driver, timeout)
-                    wait.until(EC.presence_of_element_located((By.CLASS_NAME, "wgg_card")))
-                    
-                    # Add delay to respect rate limiting
-                    time.sleep(request_delay)
-                    
-                    # Extract listings
-                    items = driver.find_elements(By.CLASS_NAME, "wgg_card")
-                    logger.info(f"Found {len(items)} listing elements")
-                    
-                    for item in items:
-                        try:
-                            listing = self._extract_listing(item)
-                            if listing:
-                                listings.append(listing)
-                        except Exception as e:
-                            logger.warning(f"Error extracting individual listing: {e}")
-                            continue
-                    
-                    logger.info(f"Successfully extracted {len(listings)} listings")
-                    break  # Success, exit retry loop
-                    
-            except TimeoutException:
-                retry_count += 1
-                logger.warning(f"Timeout on attempt {retry_count}, retrying...")
-                if retry_count < max_retries:
-                    time.sleep(request_delay * retry_count)  # Exponential backoff
-                else:
-                    logger.error("Max retries exceeded for WG-Gesucht scraping")
-                    raise
-                    
-            except Exception as e:
-                retry_count += 1
-                logger.error(f"Error on attempt {retry_count}: {e}")
-                if retry_count >= max_retries:
-                    logger.error("Max retries exceeded for WG-Gesucht scraping")
-                    raise
-                time.sleep(request_delay * retry_count)  # Exponential backoff
+        return iter_pages(
+            fetch_page,
+            max_pages=config.get("max_pages", 10),
+            stop_at_known=config.get("stop_at_known", 3),
+            page_delay=config.get("request_delay", 1.0),
+            stop=self._stop,
+        )
+    
+    def _page_url(self, base_url: str, page: int) -> str | None:
+        """
+        URL of a 1-based result page.
         
-        return listings
+        WG-Gesucht search URLs end in a 0-based page index, e.g.
+        ``wohnungen-in-Muenchen.90.2.1.0.html``.
+        
+        Args:
+            base_url: Search URL of the first page
+            page: Page number
+            
+        Returns:
+            Page URL, or None if the URL does not support pagination
+        """
+        if page == 1:
+            return base_url
+        url, count = re.subn(r"\.\d+\.html$", f".{page - 1}.html", base_url)
+        return url if count else None
     
     def _extract_listing(self, item_element) -> Listing | None:
         """
         Extract listing data from a single result element.
         
         Args:
-            item_element: Selenium WebElement for the listing
+            item_element: Selenium WebElement or StaticElement for the listing
             
         Returns:
             Listing object or None if extraction fails
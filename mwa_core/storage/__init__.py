@@ -8,10 +8,15 @@ from .models import (
     Contact, 
     ScrapingRun, 
     ListingScrapingRun, 
+    ListingBlockingKey, 
     ContactValidation, 
     JobStore, 
     Configuration, 
     BackupMetadata,
+    NotificationHistoryRecord,
+    NotificationQueueRecord,
+    HTTPCacheRecord,
+    MXCacheRecord,
     ListingStatus,
     ContactType,
     ContactStatus,
@@ -19,6 +24,7 @@ from .models import (
     DeduplicationStatus
 )
 from .operations import CRUDOperations
+from .pagination import InvalidCursorError, encode_cursor, decode_cursor
 from .backup import BackupManager
 from .notification_history import (
     NotificationHistoryManager,
@@ -26,6 +32,9 @@ from .notification_history import (
     get_notification_history_manager,
     get_notification_history
 )
+from .notification_queue import NotificationQueueStore, QueuedNotification
+from .http_cache import HTTPCacheStore, CachedHTTPResponse
+from .mx_cache import MXCacheStore, CachedMXLookup
 
 __all__ = [
     'StorageManager',
@@ -36,19 +45,33 @@ __all__ = [
     'Contact',
     'ScrapingRun',
     'ListingScrapingRun',
+    'ListingBlockingKey',
     'ContactValidation',
     'JobStore',
     'Configuration',
     'BackupMetadata',
+    'NotificationHistoryRecord',
+    'NotificationQueueRecord',
+    'HTTPCacheRecord',
+    'MXCacheRecord',
     'ListingStatus',
     'ContactType',
     'ContactStatus',
     'JobStatus',
     'DeduplicationStatus',
     'CRUDOperations',
+    'InvalidCursorError',
+    'encode_cursor',
+    'decode_cursor',
     'BackupManager',
     'NotificationHistoryManager',
     'NotificationHistoryEntry',
     'get_notification_history_manager',
     'get_notification_history',
+    'NotificationQueueStore',
+    'QueuedNotification',
+    'HTTPCacheStore',
+    'CachedHTTPResponse',
+    'MXCacheStore',
+    'CachedMXLookup',
 ]
\ No newline at end of file
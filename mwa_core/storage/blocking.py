@@ -0,0 +1,196 @@
+"""
+Blocking keys for fuzzy listing deduplication in MWA Core storage system.
+
+Each listing is indexed under a small set of keys so that duplicate candidates
+can be fetched with one indexed ``IN`` lookup instead of scanning recent rows:
+
+* a composite block of postcode + logarithmic price bucket + size bucket
+* MinHash/LSH band signatures of the normalized title's character shingles
+
+Two listings that the deduplication engine could consider similar share at
+least one key with high probability, regardless of how old they are.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import re
+from typing import List, Optional, Set
+
+# Bucket widths are derived from the deduplication variance thresholds so that
+# values within tolerance always land in the same or an adjacent bucket.
+PRICE_TOLERANCE = 0.1
+SIZE_TOLERANCE = 0.15
+
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_POSTCODE_PATTERN = re.compile(r"\b(\d{5})\b")
+
+# Fixed seed: signatures must be identical across processes and restarts
+_rng = random.Random(20240501)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Lowercase a title, strip punctuation and collapse whitespace."""
+    if not title:
+        return ""
+    title = re.sub(r"[^\w\s]", "", title.lower())
+    return re.sub(r"\s+", " ", title).strip()
+
+
+def extract_postcode(address: Optional[str]) -> Optional[str]:
+    """Return the first five-digit postcode in an address, if any."""
+    if not address:
+        return None
+    match = _POSTCODE_PATTERN.search(address)
+    return match.group(1) if match else None
+
+
+def value_bucket(value: Optional[float], tolerance: float) -> Optional[int]:
+    """
+    Map a positive value onto a logarithmic bucket.
+
+    Buckets are ``-log(1 - tolerance)`` wide, so two values whose relative
+    difference is within ``tolerance`` are at most one bucket apart.
+
+    Args:
+        value: Numeric value (e.g. price in EUR)
+        tolerance: Relative variance considered similar
+
+    Returns:
+        Bucket number or None for missing/non-positive values
+    """
+    if value is None or value <= 0:
+        return None
+    return math.floor(math.log(value) / -math.log(1.0 - tolerance))
+
+
+def title_shingles(title: Optional[str]) -> Set[str]:
+    """Character shingles of the normalized title."""
+    normalized = normalize_title(title)
+    if not normalized:
+        return set()
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized}
+    return {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(shingles: Set[str]) -> List[int]:
+    """
+    Compute the MinHash signature of a shingle set.
+
+    Args:
+        shingles: Set of title shingles
+
+    Returns:
+        List of MINHASH_PERMUTATIONS minimum hash values (empty for no shingles)
+    """
+    if not shingles:
+        return []
+
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles
+    ]
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def lsh_band_keys(signature: List[int]) -> List[str]:
+    """Split a MinHash signature into LSH bands and hash each band to a key."""
+    if not signature:
+        return []
+
+    rows = len(signature) // LSH_BANDS
+    keys = []
+    for band in range(LSH_BANDS):
+        band_values = signature[band * rows:(band + 1) * rows]
+        digest = hashlib.blake2b(
+            ",".join(map(str, band_values)).encode("ascii"), digest_size=8
+        ).hexdigest()
+        keys.append(f"lsh:{band}:{digest}")
+    return keys
+
+
+def _block_key(postcode: Optional[str], price_bucket: int, size_bucket: Optional[int]) -> str:
+    size_part = "-" if size_bucket is None else str(size_bucket)
+    return f"blk:{postcode or '-'}:{price_bucket}:{size_part}"
+
+
+def listing_blocking_keys(
+    title: Optional[str],
+    address: Optional[str],
+    price_eur: Optional[float],
+    size_sqm: Optional[float]
+) -> List[str]:
+    """
+    Keys a listing is stored under in the blocking index.
+
+    Args:
+        title: Listing title
+        address: Listing address
+        price_eur: Parsed price
+        size_sqm: Parsed size
+
+    Returns:
+        List of unique blocking keys
+    """
+    keys = []
+
+    price_bucket = value_bucket(price_eur, PRICE_TOLERANCE)
+    if price_bucket is not None:
+        keys.append(_block_key(
+            extract_postcode(address), price_bucket, value_bucket(size_sqm, SIZE_TOLERANCE)
+        ))
+
+    keys.extend(lsh_band_keys(minhash_signature(title_shingles(title))))
+    return keys
+
+
+def candidate_blocking_keys(
+    title: Optional[str],
+    address: Optional[str],
+    price_eur: Optional[float],
+    size_sqm: Optional[float]
+) -> List[str]:
+    """
+    Keys to look up when searching duplicate candidates for a listing.
+
+    Same as :func:`listing_blocking_keys`, but the composite block is expanded
+    to the neighbouring price and size buckets so that values close to a
+    bucket boundary still meet.
+
+    Args:
+        title: Listing title
+        address: Listing address
+        price_eur: Parsed price
+        size_sqm: Parsed size
+
+    Returns:
+        List of unique blocking keys
+    """
+    keys = []
+
+    price_bucket = value_bucket(price_eur, PRICE_TOLERANCE)
+    if price_bucket is not None:
+        postcode = extract_postcode(address)
+        size_bucket = value_bucket(size_sqm, SIZE_TOLERANCE)
+        size_buckets = [None] if size_bucket is None else [size_bucket - 1, size_bucket, size_bucket + 1]
+        for p in (price_bucket - 1, price_bucket, price_bucket + 1):
+            for s in size_buckets:
+                keys.append(_block_key(postcode, p, s))
+
+    keys.extend(lsh_band_keys(minhash_signature(title_shingles(title))))
+    return keys
@@ -2,7 +2,8 @@
 Advanced deduplication logic for MWA Core storage system.
 
 Provides SHA-256 hash-based duplicate prevention, fuzzy matching for similar listings,
-and configurable deduplication rules with performance optimization.
+and configurable deduplication rules with performance optimization. Fuzzy and
+content comparisons only consider candidates from the blocking index.
 """
 
 from __future__ import annotations
@@ -10,14 +11,18 @@ from __future__ import annotations
 import hashlib
 import logging
 import re
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set, Tuple
-from difflib import SequenceMatcher
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple, Union
 
 from sqlalchemy import and_, or_, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
-from .models import Listing, Contact, DeduplicationStatus, ListingStatus
+from .blocking import candidate_blocking_keys, listing_blocking_keys
+from .similarity import get_similarity_backend
+from .models import (
+    Listing, ListingBlockingKey, Contact, DeduplicationStatus, ListingStatus, parse_numeric_value
+)
 from .operations import CRUDOperations
 
 logger = logging.getLogger(__name__)
@@ -47,6 +52,7 @@ class DeduplicationEngine:
             "enable_fuzzy_matching": True,
             "enable_price_normalization": True,
             "enable_address_normalization": True,
+            "similarity_backend": "difflib",  # or "trigram" (vectorized, needs numpy)
         }
     
     def check_duplicate(self, listing_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -69,6 +75,9 @@ class DeduplicationEngine:
         }
         
         try:
+            # Parse price/size/rooms once instead of on every comparison
+            listing_data = self._with_numeric_fields(listing_data)
+            
             # Strategy 1: Exact hash match
             exact_match = self._check_exact_hash_match(listing_data)
             if exact_match["is_duplicate"]:
@@ -101,6 +110,207 @@ class DeduplicationEngine:
             logger.error(f"Error in duplicate check: {e}")
             return result
     
+    def check_duplicates_batch(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Check a whole batch of listings for duplicates.
+        
+        Hash, provider+external ID and URL matches are resolved for the entire
+        batch with one ``IN`` query each. Fuzzy and content checks only run for
+        the remaining listings and share a single session. A listing repeating
+        an earlier entry of the same batch is reported as a duplicate with
+        ``duplicate_of_index`` set instead of ``duplicate_of_id``.
+        
+        Args:
+            listings: Listing data dictionaries to check
+            
+        Returns:
+            Duplicate information for each listing, in input order
+        """
+        results = [self._no_duplicate_result() for _ in listings]
+        if not listings:
+            return results
+        
+        try:
+            enriched = [self._with_numeric_fields(listing_data) for listing_data in listings]
+            hashes = [self._generate_hash_signature(listing_data) for listing_data in enriched]
+            
+            with self.crud.get_session() as session:
+                active = session.query(Listing).filter(Listing.status == ListingStatus.ACTIVE)
+                by_hash = {
+                    existing.hash_signature: existing
+                    for existing in self.crud.query_in_chunks(active, Listing.hash_signature, hashes)
+                }
+                by_external_id = {
+                    (existing.provider, existing.external_id): existing
+                    for existing in self.crud.query_in_chunks(
+                        active, Listing.external_id,
+                        [listing_data.get("external_id") for listing_data in enriched if listing_data.get("provider")]
+                    )
+                }
+                by_url = {
+                    existing.url: existing
+                    for existing in self.crud.query_in_chunks(
+                        active, Listing.url, [listing_data.get("url") for listing_data in enriched]
+                    )
+                }
+                
+                batch_seen: Dict[Tuple[str, Any], int] = {}
+                accepted_by_key: Dict[str, List[int]] = {}
+                
+                for index, listing_data in enumerate(enriched):
+                    exact_keys = [("exact_hash", hashes[index])]
+                    if listing_data.get("provider") and listing_data.get("external_id"):
+                        exact_keys.append((
+                            "provider_external_id",
+                            (listing_data["provider"], listing_data["external_id"])
+                        ))
+                    if listing_data.get("url"):
+                        exact_keys.append(("url_match", listing_data["url"]))
+                    
+                    result = self._match_existing(exact_keys, by_hash, by_external_id, by_url)
+                    
+                    if result is None:
+                        result = self._match_batch_entry(exact_keys, batch_seen)
+                    
+                    if result is None and self.config["enable_fuzzy_matching"]:
+                        fuzzy_match = self._check_fuzzy_match(listing_data, session)
+                        if fuzzy_match["is_duplicate"]:
+                            result = fuzzy_match
+                    
+                    if result is None:
+                        content_match = self._check_content_similarity(listing_data, session)
+                        if content_match["is_duplicate"]:
+                            result = content_match
+                    
+                    if result is None and self.config["enable_fuzzy_matching"]:
+                        result = self._match_batch_fuzzy(index, enriched, accepted_by_key)
+                    
+                    for key in exact_keys:
+                        batch_seen.setdefault(key, index)
+                    
+                    if result is None:
+                        for key in listing_blocking_keys(
+                            listing_data.get("title"), listing_data.get("address"),
+                            listing_data.get("price_eur"), listing_data.get("size_sqm")
+                        ):
+                            accepted_by_key.setdefault(key, []).append(index)
+                    else:
+                        results[index] = result
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in batch duplicate check: {e}")
+            return results
+    
+    @staticmethod
+    def _no_duplicate_result() -> Dict[str, Any]:
+        """Result returned for a listing that is not a duplicate."""
+        return {
+            "is_duplicate": False,
+            "duplicate_strategy": None,
+            "duplicate_of_id": None,
+            "confidence": 0.0,
+            "reason": None,
+            "similar_listings": []
+        }
+    
+    @staticmethod
+    def _match_existing(exact_keys: List[Tuple[str, Any]],
+                        by_hash: Dict[str, Listing],
+                        by_external_id: Dict[Tuple[str, str], Listing],
+                        by_url: Dict[str, Listing]) -> Optional[Dict[str, Any]]:
+        """Resolve exact matches against prefetched stored listings."""
+        lookups = {
+            "exact_hash": (by_hash, 1.0, "Exact hash match"),
+            "provider_external_id": (by_external_id, 0.95, "Provider+External ID match"),
+            "url_match": (by_url, 0.95, "URL match"),
+        }
+        for strategy, value in exact_keys:
+            existing_by_value, confidence, reason = lookups[strategy]
+            existing = existing_by_value.get(value)
+            if existing:
+                return {
+                    "is_duplicate": True,
+                    "duplicate_strategy": strategy,
+                    "duplicate_of_id": existing.id,
+                    "confidence": confidence,
+                    "reason": f"{reason} with listing {existing.id}",
+                    "similar_listings": [existing.to_dict()]
+                }
+        return None
+    
+    @staticmethod
+    def _match_batch_entry(exact_keys: List[Tuple[str, Any]],
+                           batch_seen: Dict[Tuple[str, Any], int]) -> Optional[Dict[str, Any]]:
+        """Resolve exact matches against earlier entries of the same batch."""
+        for strategy, value in exact_keys:
+            earlier = batch_seen.get((strategy, value))
+            if earlier is not None:
+                return {
+                    "is_duplicate": True,
+                    "duplicate_strategy": strategy,
+                    "duplicate_of_id": None,
+                    "duplicate_of_index": earlier,
+                    "confidence": 1.0 if strategy == "exact_hash" else 0.95,
+                    "reason": f"Repeats batch entry {earlier}",
+                    "similar_listings": []
+                }
+        return None
+    
+    def _match_batch_fuzzy(self, index: int, enriched: List[Dict[str, Any]],
+                           accepted_by_key: Dict[str, List[int]]) -> Optional[Dict[str, Any]]:
+        """Fuzzy-match a listing against accepted earlier entries of the same batch."""
+        listing_data = enriched[index]
+        candidates = set()
+        for key in candidate_blocking_keys(
+            listing_data.get("title"), listing_data.get("address"),
+            listing_data.get("price_eur"), listing_data.get("size_sqm")
+        ):
+            candidates.update(accepted_by_key.get(key, []))
+        
+        candidate_indexes = [
+            candidate_index for candidate_index in sorted(candidates)
+            if not listing_data.get("provider")
+            or enriched[candidate_index].get("provider") == listing_data["provider"]
+        ]
+        similar = self._filter_potentially_similar(
+            listing_data, [enriched[candidate_index] for candidate_index in candidate_indexes]
+        )
+        similar_ids = {id(candidate) for candidate in similar}
+        candidate_indexes = [i for i in candidate_indexes if id(enriched[i]) in similar_ids]
+        
+        best_index = None
+        best_score = 0.0
+        scores = self._calculate_similarity_scores(
+            listing_data, [enriched[candidate_index] for candidate_index in candidate_indexes]
+        )
+        for candidate_index, score in zip(candidate_indexes, scores):
+            if score > best_score:
+                best_score = score
+                best_index = candidate_index
+        
+        if best_index is not None and best_score >= self.config["fuzzy_match_threshold"]:
+            return {
+                "is_duplicate": True,
+                "duplicate_strategy": "fuzzy_match",
+                "duplicate_of_id": None,
+                "duplicate_of_index": best_index,
+                "confidence": best_score,
+                "reason": f"Fuzzy match with batch entry {best_index} ({best_score:.2f} similarity score)",
+                "similar_listings": []
+            }
+        return None
+    
+    @contextmanager
+    def _session_scope(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """Reuse an open session, or open a new one for a single check."""
+        if session is not None:
+            yield session
+        else:
+            with self.crud.get_session() as new_session:
+                yield new_session
+    
     def _check_exact_hash_match(self, listing_data: Dict[str, Any]) -> Dict[str, Any]:
         """Check for exact hash signature match."""
         try:
@@ -191,23 +401,21 @@ class DeduplicationEngine:
             logger.error(f"Error in URL check: {e}")
             return {"is_duplicate": False}
     
-    def _check_fuzzy_match(self, listing_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_fuzzy_match(self, listing_data: Dict[str, Any],
+                           session: Optional[Session] = None) -> Dict[str, Any]:
         """Check for fuzzy matches using various criteria."""
         try:
-            similar_listings = self._find_similar_listings(listing_data)
+            similar_listings = self._find_similar_listings(listing_data, session)
             
             if not similar_listings:
                 return {"is_duplicate": False}
             
-            # Calculate similarity scores
+            # Calculate similarity scores against all candidates at once
             best_match = None
             best_score = 0.0
             
-            for similar_listing in similar_listings:
-                similarity_score = self._calculate_similarity_score(
-                    listing_data, similar_listing
-                )
-                
+            similarity_scores = self._calculate_similarity_scores(listing_data, similar_listings)
+            for similar_listing, similarity_score in zip(similar_listings, similarity_scores):
                 if similarity_score > best_score:
                     best_score = similarity_score
                     best_match = similar_listing
@@ -232,15 +440,20 @@ class DeduplicationEngine:
             logger.error(f"Error in fuzzy match check: {e}")
             return {"is_duplicate": False}
     
-    def _check_content_similarity(self, listing_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_content_similarity(self, listing_data: Dict[str, Any],
+                                  session: Optional[Session] = None) -> Dict[str, Any]:
         """Check for content-based similarity."""
         try:
             # Normalize and compare key fields
             normalized_new = self._normalize_listing_data(listing_data)
             
-            with self.crud.get_session() as session:
-                # Get recent listings for comparison
-                recent_listings = session.query(Listing).filter(
+            with self._session_scope(session) as session:
+                # Get recent listings sharing a blocking key for comparison
+                query = self._candidate_query(session, listing_data)
+                if query is None:
+                    return {"is_duplicate": False}
+                
+                recent_listings = query.filter(
                     Listing.status == ListingStatus.ACTIVE,
                     Listing.scraped_at >= datetime.utcnow() - timedelta(days=30)
                 ).limit(100).all()
@@ -248,25 +461,25 @@ class DeduplicationEngine:
                 best_match = None
                 best_score = 0.0
                 
-                for existing_listing in recent_listings:
-                    normalized_existing = self._normalize_listing_data(existing_listing.to_dict())
-                    
-                    similarity_score = self._calculate_content_similarity(
-                        normalized_new, normalized_existing
-                    )
-                    
+                candidates = [existing_listing.to_dict() for existing_listing in recent_listings]
+                similarity_scores = self._calculate_content_similarities(
+                    normalized_new,
+                    [self._normalize_listing_data(candidate) for candidate in candidates]
+                )
+                
+                for candidate, similarity_score in zip(candidates, similarity_scores):
                     if similarity_score > best_score:
                         best_score = similarity_score
-                        best_match = existing_listing
+                        best_match = candidate
                 
                 if best_match and best_score >= self.config["exact_match_threshold"]:
                     return {
                         "is_duplicate": True,
                         "duplicate_strategy": "content_similarity",
-                        "duplicate_of_id": best_match.id,
+                        "duplicate_of_id": best_match["id"],
                         "confidence": best_score,
                         "reason": f"Content similarity with {best_score:.2f} score",
-                        "similar_listings": [best_match.to_dict()]
+                        "similar_listings": [best_match]
                     }
             
             return {"is_duplicate": False}
@@ -275,11 +488,16 @@ class DeduplicationEngine:
             logger.error(f"Error in content similarity check: {e}")
             return {"is_duplicate": False}
     
-    def _find_similar_listings(self, listing_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _find_similar_listings(self, listing_data: Dict[str, Any],
+                               session: Optional[Session] = None) -> List[Dict[str, Any]]:
         """Find potentially similar listings based on key criteria."""
         try:
-            with self.crud.get_session() as session:
-                query = session.query(Listing).filter(
+            with self._session_scope(session) as session:
+                query = self._candidate_query(session, listing_data)
+                if query is None:
+                    return []
+                
+                query = query.filter(
                     Listing.status == ListingStatus.ACTIVE,
                     Listing.scraped_at >= datetime.utcnow() - timedelta(days=self.config["max_duplicate_age_days"])
                 )
@@ -288,90 +506,165 @@ class DeduplicationEngine:
                 if listing_data.get("provider"):
                     query = query.filter(Listing.provider == listing_data["provider"])
                 
-                # Filter by price range if available
+                # Filter by price range if available (uses idx_listings_status_price_eur)
                 if listing_data.get("price") and self.config["enable_price_normalization"]:
-                    price_range = self._get_price_range(listing_data["price"])
+                    price_range = self._get_price_range(
+                        self._numeric_or_raw(listing_data, "price_eur", "price")
+                    )
                     if price_range:
                         query = query.filter(
-                            Listing.price >= price_range[0],
-                            Listing.price <= price_range[1]
+                            Listing.price_eur >= price_range[0],
+                            Listing.price_eur <= price_range[1]
                         )
                 
                 # Filter by size range if available
                 if listing_data.get("size"):
-                    size_range = self._get_size_range(listing_data["size"])
+                    size_range = self._get_size_range(
+                        self._numeric_or_raw(listing_data, "size_sqm", "size")
+                    )
                     if size_range:
                         query = query.filter(
-                            Listing.size >= size_range[0],
-                            Listing.size <= size_range[1]
+                            Listing.size_sqm >= size_range[0],
+                            Listing.size_sqm <= size_range[1]
                         )
                 
                 # Get candidates for similarity comparison
                 candidates = query.limit(50).all()
                 
-                similar_listings = []
-                for candidate in candidates:
-                    # Quick similarity check
-                    if self._is_potentially_similar(listing_data, candidate.to_dict()):
-                        similar_listings.append(candidate.to_dict())
-                
-                return similar_listings
+                # Quick similarity check
+                return self._filter_potentially_similar(
+                    listing_data, [candidate.to_dict() for candidate in candidates]
+                )
                 
         except Exception as e:
             logger.error(f"Error finding similar listings: {e}")
             return []
     
+    def _candidate_query(self, session: Session, listing_data: Dict[str, Any]) -> Optional[Query]:
+        """
+        Build a query over listings sharing at least one blocking key.
+        
+        Candidates are ordered by the number of shared keys, so the closest
+        matches survive the comparison limit no matter how old they are.
+        
+        Args:
+            session: Database session
+            listing_data: Listing data enriched with numeric fields
+            
+        Returns:
+            Listing query, or None if the listing yields no blocking keys
+        """
+        keys = candidate_blocking_keys(
+            listing_data.get("title"),
+            listing_data.get("address"),
+            listing_data.get("price_eur"),
+            listing_data.get("size_sqm")
+        )
+        if not keys:
+            return None
+        
+        hits = session.query(
+            ListingBlockingKey.listing_id.label("listing_id"),
+            func.count(ListingBlockingKey.id).label("shared_keys")
+        ).filter(
+            ListingBlockingKey.key.in_(keys)
+        ).group_by(ListingBlockingKey.listing_id).subquery()
+        
+        return session.query(Listing).join(
+            hits, hits.c.listing_id == Listing.id
+        ).order_by(hits.c.shared_keys.desc(), Listing.id.desc())
+    
+    @property
+    def similarity(self):
+        """Text similarity backend selected by ``config["similarity_backend"]``."""
+        return get_similarity_backend(self.config.get("similarity_backend", "difflib"))
+    
+    def _field_ratios(self, value: Optional[str],
+                      others: List[Optional[str]]) -> List[Optional[float]]:
+        """
+        Score one text field against many candidates with a single backend call.
+        
+        Args:
+            value: Text of the listing being checked, or None if absent
+            others: Candidate texts, None where the candidate lacks the field
+            
+        Returns:
+            Ratio per candidate, None where either side is absent
+        """
+        scores: List[Optional[float]] = [None] * len(others)
+        if value is None:
+            return scores
+        
+        indexes = [i for i, other in enumerate(others) if other is not None]
+        if indexes:
+            ratios = self.similarity.ratios(value, [others[i] for i in indexes])
+            for i, ratio in zip(indexes, ratios):
+                scores[i] = ratio
+        return scores
+    
     def _calculate_similarity_score(self, listing1: Dict[str, Any], 
                                   listing2: Dict[str, Any]) -> float:
         """Calculate similarity score between two listings."""
+        return self._calculate_similarity_scores(listing1, [listing2])[0]
+    
+    def _calculate_similarity_scores(self, listing1: Dict[str, Any],
+                                     candidates: List[Dict[str, Any]]) -> List[float]:
+        """Calculate similarity scores between a listing and each candidate."""
         try:
-            scores = []
-            
-            # Title similarity
-            if listing1.get("title") and listing2.get("title"):
-                title_score = SequenceMatcher(
-                    None, 
-                    self._normalize_text(listing1["title"]),
-                    self._normalize_text(listing2["title"])
-                ).ratio()
-                scores.append(title_score * 0.3)  # Weight: 30%
-            
-            # Price similarity
-            if listing1.get("price") and listing2.get("price"):
-                price_score = self._calculate_price_similarity(
-                    listing1["price"], listing2["price"]
-                )
-                scores.append(price_score * 0.25)  # Weight: 25%
-            
-            # Size similarity
-            if listing1.get("size") and listing2.get("size"):
-                size_score = self._calculate_size_similarity(
-                    listing1["size"], listing2["size"]
-                )
-                scores.append(size_score * 0.2)  # Weight: 20%
+            # Title and address similarity for all candidates at once
+            title_scores = self._field_ratios(
+                self._normalize_text(listing1["title"]) if listing1.get("title") else None,
+                [self._normalize_text(c["title"]) if c.get("title") else None for c in candidates]
+            )
+            address_scores = self._field_ratios(
+                self._normalize_address(listing1["address"]) if listing1.get("address") else None,
+                [self._normalize_address(c["address"]) if c.get("address") else None for c in candidates]
+            )
             
-            # Address similarity
-            if listing1.get("address") and listing2.get("address"):
-                address_score = SequenceMatcher(
-                    None,
-                    self._normalize_address(listing1["address"]),
-                    self._normalize_address(listing2["address"])
-                ).ratio()
-                scores.append(address_score * 0.15)  # Weight: 15%
-            
-            # Rooms similarity
-            if listing1.get("rooms") and listing2.get("rooms"):
-                rooms_score = 1.0 if listing1["rooms"] == listing2["rooms"] else 0.0
-                scores.append(rooms_score * 0.1)  # Weight: 10%
+            results = []
+            for listing2, title_score, address_score in zip(candidates, title_scores, address_scores):
+                scores = []
+                
+                # Title similarity
+                if title_score is not None:
+                    scores.append(title_score * 0.3)  # Weight: 30%
+                
+                # Price similarity
+                if listing1.get("price") and listing2.get("price"):
+                    price_score = self._calculate_price_similarity(
+                        self._numeric_or_raw(listing1, "price_eur", "price"),
+                        self._numeric_or_raw(listing2, "price_eur", "price")
+                    )
+                    scores.append(price_score * 0.25)  # Weight: 25%
+                
+                # Size similarity
+                if listing1.get("size") and listing2.get("size"):
+                    size_score = self._calculate_size_similarity(
+                        self._numeric_or_raw(listing1, "size_sqm", "size"),
+                        self._numeric_or_raw(listing2, "size_sqm", "size")
+                    )
+                    scores.append(size_score * 0.2)  # Weight: 20%
+                
+                # Address similarity
+                if address_score is not None:
+                    scores.append(address_score * 0.15)  # Weight: 15%
+                
+                # Rooms similarity
+                if listing1.get("rooms") and listing2.get("rooms"):
+                    rooms_score = 1.0 if listing1["rooms"] == listing2["rooms"] else 0.0
+                    scores.append(rooms_score * 0.1)  # Weight: 10%
+                
+                results.append(sum(scores) if scores else 0.0)
             
-            return sum(scores) if scores else 0.0
+            return results
             
         except Exception as e:
             logger.error(f"Error calculating similarity score: {e}")
-            return 0.0
+            return [0.0] * len(candidates)
     
-    def _calculate_price_similarity(self, price1: str, price2: str) -> float:
-        """Calculate similarity between two price strings."""
+    def _calculate_price_similarity(self, price1: Union[str, float], 
+                                    price2: Union[str, float]) -> float:
+        """Calculate similarity between two prices (strings or parsed numbers)."""
         try:
             # Extract numeric values
             num1 = self._extract_numeric_price(price1)
@@ -395,8 +688,9 @@ class DeduplicationEngine:
             logger.error(f"Error calculating price similarity: {e}")
             return 0.0
     
-    def _calculate_size_similarity(self, size1: str, size2: str) -> float:
-        """Calculate similarity between two size strings."""
+    def _calculate_size_similarity(self, size1: Union[str, float], 
+                                   size2: Union[str, float]) -> float:
+        """Calculate similarity between two sizes (strings or parsed numbers)."""
         try:
             # Extract numeric values
             num1 = self._extract_numeric_size(size1)
@@ -425,8 +719,8 @@ class DeduplicationEngine:
         try:
             # Create normalized string for hashing
             hash_components = [
-                listing_data.get("provider", ""),
-                listing_data.get("external_id", ""),
+                listing_data.get("provider") or "",
+                listing_data.get("external_id") or "",
                 self._normalize_text(listing_data.get("title", "")),
                 self._normalize_price(listing_data.get("price", "")),
                 self._normalize_size(listing_data.get("size", "")),
@@ -512,30 +806,29 @@ class DeduplicationEngine:
         
         return address
     
-    def _extract_numeric_price(self, price: str) -> Optional[float]:
+    def _extract_numeric_price(self, price: Union[str, float]) -> Optional[float]:
         """Extract numeric value from price string."""
-        try:
-            # Find all numbers in the string
-            numbers = re.findall(r'[\d,]+', price)
-            if numbers:
-                # Take the first number and remove commas
-                return float(numbers[0].replace(',', ''))
-            return None
-        except (ValueError, TypeError):
-            return None
+        return parse_numeric_value(price)
     
-    def _extract_numeric_size(self, size: str) -> Optional[float]:
+    def _extract_numeric_size(self, size: Union[str, float]) -> Optional[float]:
         """Extract numeric value from size string."""
-        try:
-            # Find all decimal numbers
-            numbers = re.findall(r'[\d.]+', size)
-            if numbers:
-                return float(numbers[0])
-            return None
-        except (ValueError, TypeError):
-            return None
+        return parse_numeric_value(size)
     
-    def _get_price_range(self, price: str) -> Optional[Tuple[str, str]]:
+    @staticmethod
+    def _numeric_or_raw(listing: Dict[str, Any], numeric_key: str, raw_key: str) -> Any:
+        """Prefer a stored numeric column over re-parsing the raw string."""
+        value = listing.get(numeric_key)
+        return value if value is not None else listing.get(raw_key)
+    
+    def _with_numeric_fields(self, listing_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of listing data with parsed price/size/rooms values."""
+        enriched = dict(listing_data)
+        for numeric_key, raw_key in (("price_eur", "price"), ("size_sqm", "size"), ("rooms_num", "rooms")):
+            if enriched.get(numeric_key) is None:
+                enriched[numeric_key] = parse_numeric_value(enriched.get(raw_key))
+        return enriched
+    
+    def _get_price_range(self, price: Union[str, float]) -> Optional[Tuple[float, float]]:
         """Get price range for filtering."""
         try:
             numeric_price = self._extract_numeric_price(price)
@@ -544,14 +837,11 @@ class DeduplicationEngine:
             
             # Allow 10% variance
             variance = numeric_price * self.config["price_variance_threshold"]
-            min_price = numeric_price - variance
-            max_price = numeric_price + variance
-            
-            return (str(int(min_price)), str(int(max_price)))
+            return (numeric_price - variance, numeric_price + variance)
         except Exception:
             return None
     
-    def _get_size_range(self, size: str) -> Optional[Tuple[str, str]]:
+    def _get_size_range(self, size: Union[str, float]) -> Optional[Tuple[float, float]]:
         """Get size range for filtering."""
         try:
             numeric_size = self._extract_numeric_size(size)
@@ -560,71 +850,97 @@ class DeduplicationEngine:
             
             # Allow 15% variance
             variance = numeric_size * self.config["size_variance_threshold"]
-            min_size = numeric_size - variance
-            max_size = numeric_size + variance
-            
-            return (str(min_size), str(max_size))
+            return (numeric_size - variance, numeric_size + variance)
         except Exception:
             return None
     
     def _is_potentially_similar(self, listing1: Dict[str, Any], 
                                listing2: Dict[str, Any]) -> bool:
         """Quick check if two listings might be similar."""
+        return bool(self._filter_potentially_similar(listing1, [listing2]))
+    
+    def _filter_potentially_similar(self, listing1: Dict[str, Any],
+                                    candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Quick check keeping only candidates that might be similar to a listing."""
         try:
-            # Check title similarity (quick check)
-            if (listing1.get("title") and listing2.get("title") and
-                len(listing1["title"]) > 10 and len(listing2["title"]) > 10):
-                title_ratio = SequenceMatcher(
-                    None,
-                    listing1["title"][:50],  # Compare first 50 chars
-                    listing2["title"][:50]
-                ).ratio()
-                if title_ratio < 0.5:  # Titles are very different
-                    return False
+            # Check title similarity (quick check, first 50 chars)
+            def quick_title(listing: Dict[str, Any]) -> Optional[str]:
+                title = listing.get("title")
+                return title[:50] if title and len(title) > 10 else None
             
-            # Check price similarity (if both have prices)
-            if (listing1.get("price") and listing2.get("price") and
-                self.config["enable_price_normalization"]):
-                price_similarity = self._calculate_price_similarity(
-                    listing1["price"], listing2["price"]
-                )
-                if price_similarity < 0.5:  # Prices are very different
-                    return False
+            title_ratios = self._field_ratios(
+                quick_title(listing1), [quick_title(candidate) for candidate in candidates]
+            )
+            
+            similar = []
+            for listing2, title_ratio in zip(candidates, title_ratios):
+                if title_ratio is not None and title_ratio < 0.5:  # Titles are very different
+                    continue
+                
+                # Check price similarity (if both have prices)
+                if (listing1.get("price") and listing2.get("price") and
+                    self.config["enable_price_normalization"]):
+                    price_similarity = self._calculate_price_similarity(
+                        self._numeric_or_raw(listing1, "price_eur", "price"),
+                        self._numeric_or_raw(listing2, "price_eur", "price")
+                    )
+                    if price_similarity < 0.5:  # Prices are very different
+                        continue
+                
+                similar.append(listing2)
             
-            return True
+            return similar
             
         except Exception as e:
             logger.error(f"Error in potential similarity check: {e}")
-            return True  # Default to checking further
+            return list(candidates)  # Default to checking further
     
     def _calculate_content_similarity(self, normalized1: Dict[str, Any], 
                                     normalized2: Dict[str, Any]) -> float:
         """Calculate content-based similarity score."""
+        return self._calculate_content_similarities(normalized1, [normalized2])[0]
+    
+    def _calculate_content_similarities(self, normalized1: Dict[str, Any],
+                                        candidates: List[Dict[str, Any]]) -> List[float]:
+        """Calculate content-based similarity scores against each normalized candidate."""
         try:
-            scores = []
+            weights = {"title": 0.3, "price": 0.25, "size": 0.2, "rooms": 0.15, "address": 0.1}
+            
+            # Text similarity for all candidates at once
+            text_scores = {
+                field: self._field_ratios(
+                    normalized1.get(field) or None,
+                    [candidate.get(field) or None for candidate in candidates]
+                )
+                for field in ["title", "rooms", "address"]
+            }
             
-            # Compare each field
-            for field in ["title", "price", "size", "rooms", "address"]:
-                val1 = normalized1.get(field, "")
-                val2 = normalized2.get(field, "")
+            results = []
+            for index, normalized2 in enumerate(candidates):
+                scores = []
                 
-                if val1 and val2:
-                    if field in ["price", "size"]:
-                        # Exact match for numeric fields
-                        score = 1.0 if val1 == val2 else 0.0
-                    else:
-                        # Text similarity
-                        score = SequenceMatcher(None, val1, val2).ratio()
+                # Compare each field
+                for field in ["title", "price", "size", "rooms", "address"]:
+                    val1 = normalized1.get(field, "")
+                    val2 = normalized2.get(field, "")
                     
-                    # Weight the scores
-                    weights = {"title": 0.3, "price": 0.25, "size": 0.2, "rooms": 0.15, "address": 0.1}
-                    scores.append(score * weights.get(field, 0.1))
+                    if val1 and val2:
+                        if field in ["price", "size"]:
+                            # Exact match for numeric fields
+                            score = 1.0 if val1 == val2 else 0.0
+                        else:
+                            score = text_scores[field][index]
+                        
+                        # Weight the scores
+                        scores.append(score * weights.get(field, 0.1))
+                
+                results.append(sum(scores) if scores else 0.0)
             
-            return sum(scores) if scores else 0.0
+            return results
             
         except Exception as e:
             logger.error(f"Error calculating content similarity: {e}")
-            return 0.0
+            return [0.0] * len(candidates)
     
     def mark_as_duplicate(self, duplicate_id: int, original_id: int, 
                          confidence: float, strategy: str) -> bool:
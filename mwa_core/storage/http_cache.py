@@ -0,0 +1,219 @@
+"""
+On-disk HTTP response cache for MWA Core.
+
+Each row of the ``http_cache`` table holds one response body together with
+the validators (``ETag``, ``Last-Modified``) needed to revalidate it and the
+time it expires. Expired rows are kept so that they can be revalidated with
+a conditional request; the table is bounded by entry count and total body
+size, evicting the least recently used rows first.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session, sessionmaker
+
+from .models import Base, HTTPCacheRecord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedHTTPResponse:
+    """A cached response."""
+    
+    key: str
+    url: str
+    kind: str
+    status_code: int
+    headers: Optional[str]
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: datetime
+    expires_at: datetime
+    
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the response can be used without revalidation."""
+        return self.expires_at > datetime.now()
+
+
+class HTTPCacheStore:
+    """
+    SQLite persistence for cached HTTP responses.
+    
+    Rows are looked up by key (a hash of the normalized URL) and evicted in
+    ``accessed_at`` order using the ``idx_http_cache_accessed`` index.
+    """
+    
+    def __init__(self, storage_path: str = "data/contact_discovery/http_cache.db",
+                 max_entries: int = 5000, max_bytes: int = 100 * 1024 * 1024):
+        """
+        Initialize the cache store.
+        
+        Args:
+            storage_path: Path to the SQLite database holding the cache table
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies in bytes
+        """
+        self.storage_path = Path(storage_path)
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        
+        self.engine = create_engine(f"sqlite:///{self.storage_path}")
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)
+        Base.metadata.create_all(self.engine, tables=[HTTPCacheRecord.__table__])
+    
+    @contextmanager
+    def get_session(self) -> Iterator[Session]:
+        """
+        Get a database session that commits on success.
+        
+        Yields:
+            SQLAlchemy session
+        """
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _to_item(record: HTTPCacheRecord) -> CachedHTTPResponse:
+        return CachedHTTPResponse(
+            key=record.key,
+            url=record.url,
+            kind=record.kind,
+            status_code=record.status_code,
+            headers=record.headers,
+            body=record.body,
+            etag=record.etag,
+            last_modified=record.last_modified,
+            fetched_at=record.fetched_at,
+            expires_at=record.expires_at,
+        )
+    
+    def get(self, key: str) -> Optional[CachedHTTPResponse]:
+        """
+        Look up a cached response and mark it as recently used.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The cached response, fresh or expired, or None
+        """
+        with self.get_session() as session:
+            record = session.get(HTTPCacheRecord, key)
+            if record is None:
+                return None
+            record.accessed_at = datetime.now()
+            return self._to_item(record)
+    
+    def put(self, item: CachedHTTPResponse) -> int:
+        """
+        Store a response, replacing an older one with the same key.
+        
+        Args:
+            item: Response to store
+        
+        Returns:
+            Number of rows evicted to stay within the limits
+        """
+        now = datetime.now()
+        with self.get_session() as session:
+            session.merge(HTTPCacheRecord(
+                key=item.key,
+                url=item.url,
+                kind=item.kind,
+                status_code=item.status_code,
+                headers=item.headers,
+                body=item.body,
+                etag=item.etag,
+                last_modified=item.last_modified,
+                size=len(item.body.encode("utf-8")),
+                fetched_at=item.fetched_at,
+                expires_at=item.expires_at,
+                accessed_at=now,
+            ))
+            session.flush()
+            return self._evict(session)
+    
+    def refresh(self, key: str, expires_at: datetime) -> bool:
+        """
+        Extend the lifetime of a response that the server confirmed unchanged.
+        
+        Args:
+            key: Cache key
+            expires_at: New expiry time
+        
+        Returns:
+            True if the row exists
+        """
+        now = datetime.now()
+        with self.get_session() as session:
+            updated = session.query(HTTPCacheRecord).filter(HTTPCacheRecord.key == key).update(
+                {"expires_at": expires_at, "fetched_at": now, "accessed_at": now},
+                synchronize_session=False,
+            )
+            return updated > 0
+    
+    def _evict(self, session: Session) -> int:
+        count, total = session.query(
+            func.count(HTTPCacheRecord.key), func.coalesce(func.sum(HTTPCacheRecord.size), 0)
+        ).one()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return 0
+        
+        evicted = []
+        rows = session.query(HTTPCacheRecord.key, HTTPCacheRecord.size).order_by(
+            HTTPCacheRecord.accessed_at.asc()
+        ).all()
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evicted.append(key)
+            count -= 1
+            total -= size
+        if evicted:
+            session.query(HTTPCacheRecord).filter(HTTPCacheRecord.key.in_(evicted)).delete(
+                synchronize_session=False
+            )
+            logger.debug(f"Evicted {len(evicted)} cached responses")
+        return len(evicted)
+    
+    def clear(self) -> int:
+        """
+        Delete all cached responses.
+        
+        Returns:
+            Number of deleted rows
+        """
+        with self.get_session() as session:
+            return session.query(HTTPCacheRecord).delete(synchronize_session=False)
+    
+    def get_size(self) -> Dict[str, int]:
+        """
+        Get the number of cached responses and their total size.
+        
+        Returns:
+            Dictionary with ``entries`` and ``size_bytes``
+        """
+        with self.get_session() as session:
+            count, total = session.query(
+                func.count(HTTPCacheRecord.key), func.coalesce(func.sum(HTTPCacheRecord.size), 0)
+            ).one()
+        return {"entries": count, "size_bytes": int(total)}
@@ -11,7 +11,9 @@ import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
+
+from sqlalchemy import inspect
 
 from .models import (
     Listing, Contact, ScrapingRun, ListingStatus, ContactType, ContactStatus, 
@@ -23,6 +25,8 @@ from .deduplication import DeduplicationEngine
 from .backup import BackupManager
 from .relationships import RelationshipManager
 from .migrations import MigrationManager
+from .migrations import migration_2_2_0, migration_2_3_0
+from .pagination import InvalidCursorError
 
 logger = logging.getLogger(__name__)
 
@@ -69,9 +73,14 @@ class EnhancedStorageManager:
     def _initialize_database(self, auto_migrate: bool) -> None:
         """Initialize database with schema and migrations."""
         try:
+            existing_tables = set(inspect(self.schema.engine).get_table_names())
+            
             # Create all tables
             self.schema.create_all_tables()
             
+            # Bring tables of older databases up to the current models
+            self._upgrade_existing_tables(existing_tables)
+            
             # Run migrations if enabled
             if auto_migrate:
                 self.migrations.initialize_database()
@@ -82,6 +91,39 @@ class EnhancedStorageManager:
             logger.error(f"Error initializing database: {e}")
             raise
     
+    def _upgrade_existing_tables(self, existing_tables: Set[str]) -> None:
+        """
+        Add the columns, indexes and derived rows newer versions rely on.
+        
+        ``create_all_tables`` only creates missing tables, so a listings table
+        from an older version lacks the numeric columns and blocking keys.
+        Every step checks the live schema and is safe to repeat, so this does
+        not depend on the version recorded by the migrations.
+        
+        Args:
+            existing_tables: Tables that existed before ``create_all_tables``
+        """
+        if "listings" not in existing_tables:
+            return
+        
+        session = self.schema.get_session()
+        try:
+            added = migration_2_2_0.add_numeric_columns(session)
+            if added:
+                logger.info(f"Added listing columns {', '.join(added)}")
+                migration_2_2_0.backfill_numeric_columns(session)
+            migration_2_2_0.create_indexes(session)
+            
+            # The blocking key table was just created and is empty
+            if "listing_blocking_keys" not in existing_tables:
+                migration_2_3_0.backfill_blocking_keys(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
     # Legacy compatibility methods
     def add_listing(self, listing_data: Dict[str, Any]) -> bool:
         """
@@ -128,6 +170,39 @@ class EnhancedStorageManager:
             logger.error(f"Error adding listing: {e}")
             return False
     
+    def add_listings_batch(self, listings: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Add a batch of listings with one duplicate check and one insert transaction.
+        
+        Args:
+            listings: Listing data dictionaries
+            
+        Returns:
+            For each input listing, True if it was added
+        """
+        try:
+            duplicate_checks = self.deduplication.check_duplicates_batch(listings)
+            
+            survivor_indexes = [
+                index for index, check in enumerate(duplicate_checks)
+                if not check["is_duplicate"]
+            ]
+            created_ids = self.crud.create_listings_batch(
+                [listings[index] for index in survivor_indexes]
+            )
+            
+            added = [False] * len(listings)
+            for index, listing_id in zip(survivor_indexes, created_ids):
+                added[index] = listing_id is not None
+            
+            logger.info(f"Added {sum(added)} of {len(listings)} listings "
+                       f"({len(listings) - len(survivor_indexes)} rejected as duplicates)")
+            return added
+            
+        except Exception as e:
+            logger.error(f"Error adding listings batch: {e}")
+            return [False] * len(listings)
+    
     def get_listing_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Get a listing by its URL (legacy compatibility).
@@ -144,6 +219,24 @@ class EnhancedStorageManager:
             logger.error(f"Error getting listing by URL {url}: {e}")
             return None
     
+    def get_known_listing_urls(self, urls: List[str]) -> Set[str]:
+        """
+        Get the subset of URLs that are already stored.
+        
+        Used by paginated scrapers to stop once they reach known listings.
+        
+        Args:
+            urls: Listing URLs to check
+            
+        Returns:
+            Set of stored URLs
+        """
+        try:
+            return self.crud.get_existing_listing_urls(urls)
+        except Exception as e:
+            logger.error(f"Error checking known listing URLs: {e}")
+            return set()
+    
     def get_listings(self, limit: int = 100, offset: int = 0,
                     provider: Optional[str] = None,
                     status: str = "active") -> List[Dict[str, Any]]:
@@ -174,6 +267,118 @@ class EnhancedStorageManager:
             logger.error(f"Error getting listings: {e}")
             return []
     
+    def get_listings_page(self, limit: int = 100, offset: int = 0,
+                          provider: Optional[str] = None,
+                          status: Optional[str] = None,
+                          price_min: Optional[float] = None,
+                          price_max: Optional[float] = None,
+                          date_from: Optional[datetime] = None,
+                          date_to: Optional[datetime] = None,
+                          sort_by: str = "scraped_at",
+                          sort_order: str = "desc") -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get a filtered, sorted page of listings plus the total match count.
+        
+        Args:
+            limit: Maximum number of listings to return
+            offset: Number of listings to skip
+            provider: Filter by provider name
+            status: Filter by status
+            price_min: Minimum price
+            price_max: Maximum price
+            date_from: Only listings scraped at or after this time
+            date_to: Only listings scraped at or before this time
+            sort_by: Sort field (``created_at`` is an alias for ``scraped_at``)
+            sort_order: ``asc`` or ``desc``
+        
+        Returns:
+            Tuple of (listing dictionaries, total matching listings)
+        """
+        try:
+            status_enum = ListingStatus(status) if status else None
+            order_by = "scraped_at" if sort_by == "created_at" else sort_by
+            
+            return self.crud.get_listings_page(
+                limit=limit,
+                offset=offset,
+                provider=provider,
+                status=status_enum,
+                min_price=price_min,
+                max_price=price_max,
+                date_from=date_from,
+                date_to=date_to,
+                order_by=order_by,
+                order_desc=sort_order == "desc"
+            )
+        
+        except Exception as e:
+            logger.error(f"Error getting listings page: {e}")
+            return [], 0
+    
+    def get_listings_by_cursor(self, cursor: Optional[str] = None, limit: int = 100,
+                               provider: Optional[str] = None,
+                               status: Optional[str] = None,
+                               price_min: Optional[float] = None,
+                               price_max: Optional[float] = None,
+                               date_from: Optional[datetime] = None,
+                               date_to: Optional[datetime] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get listings newest first using an opaque keyset cursor.
+        
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of listings to return
+            provider: Filter by provider name
+            status: Filter by status
+            price_min: Minimum price
+            price_max: Maximum price
+            date_from: Only listings scraped at or after this time
+            date_to: Only listings scraped at or before this time
+            
+        Returns:
+            Tuple of (listing dictionaries, cursor for the next page or None)
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        try:
+            status_enum = ListingStatus(status) if status else None
+            
+            return self.crud.get_listings_by_cursor(
+                cursor=cursor,
+                limit=limit,
+                provider=provider,
+                status=status_enum,
+                min_price=price_min,
+                max_price=price_max,
+                date_from=date_from,
+                date_to=date_to
+            )
+            
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting listings by cursor: {e}")
+            return [], None
+    
+    def iter_listings(self, batch_size: int = 500, provider: Optional[str] = None,
+                      status: Optional[str] = "active") -> Iterator[Dict[str, Any]]:
+        """
+        Stream every matching listing without loading them all at once.
+        
+        Args:
+            batch_size: Number of listings fetched per query
+            provider: Filter by provider name
+            status: Filter by status
+            
+        Yields:
+            Listing dictionaries, newest first
+        """
+        status_enum = ListingStatus(status) if status else None
+        yield from self.crud.iter_listings(
+            batch_size=batch_size, provider=provider, status=status_enum
+        )
+    
     def update_listing_status(self, url: str, status: str) -> bool:
         """
         Update the status of a listing (legacy compatibility).
@@ -248,6 +453,68 @@ class EnhancedStorageManager:
             logger.error(f"Error getting contacts: {e}")
             return []
     
+    def get_contacts_by_cursor(self, cursor: Optional[str] = None, limit: int = 100,
+                               listing_id: Optional[int] = None,
+                               contact_type: Optional[str] = None,
+                               status: Optional[str] = None,
+                               confidence_min: Optional[float] = None,
+                               confidence_max: Optional[float] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get contacts newest first using an opaque keyset cursor.
+        
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of contacts to return
+            listing_id: Filter by listing ID
+            contact_type: Filter by contact type
+            status: Filter by contact status
+            confidence_min: Minimum confidence
+            confidence_max: Maximum confidence
+            
+        Returns:
+            Tuple of (contact dictionaries, cursor for the next page or None)
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        try:
+            contact_type_enum = ContactType(contact_type) if contact_type else None
+            status_enum = ContactStatus(status) if status else None
+            
+            return self.crud.get_contacts_by_cursor(
+                cursor=cursor,
+                limit=limit,
+                listing_id=listing_id,
+                contact_type=contact_type_enum,
+                status=status_enum,
+                min_confidence=confidence_min,
+                max_confidence=confidence_max
+            )
+            
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting contacts by cursor: {e}")
+            return [], None
+    
+    def iter_contacts(self, batch_size: int = 500, listing_id: Optional[int] = None,
+                      contact_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every matching contact without loading them all at once.
+        
+        Args:
+            batch_size: Number of contacts fetched per query
+            listing_id: Filter by listing ID
+            contact_type: Filter by contact type
+            
+        Yields:
+            Contact dictionaries, newest first
+        """
+        contact_type_enum = ContactType(contact_type) if contact_type else None
+        yield from self.crud.iter_contacts(
+            batch_size=batch_size, listing_id=listing_id, contact_type=contact_type_enum
+        )
+    
     def create_scraping_job(self, provider: str) -> int:
         """
         Create a new scraping job record (legacy compatibility).
@@ -298,6 +565,37 @@ class EnhancedStorageManager:
             logger.error(f"Error updating scraping job: {e}")
             return False
     
+    def get_scraping_runs_by_cursor(self, cursor: Optional[str] = None, limit: int = 50,
+                                    provider: Optional[str] = None,
+                                    status: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get scraping runs newest first using an opaque keyset cursor.
+        
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of runs to return
+            provider: Filter by provider name
+            status: Filter by job status
+            
+        Returns:
+            Tuple of (scraping run dictionaries, cursor for the next page or None)
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        try:
+            status_enum = JobStatus(status) if status else None
+            
+            return self.crud.get_scraping_runs_by_cursor(
+                cursor=cursor, limit=limit, provider=provider, status=status_enum
+            )
+            
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting scraping runs by cursor: {e}")
+            return [], None
+    
     def cleanup_old_data(self, days_to_keep: int = 90) -> int:
         """
         Clean up old data based on retention policy (legacy compatibility).
@@ -341,6 +639,18 @@ class EnhancedStorageManager:
         """
         return self.deduplication.check_duplicate(listing_data)
     
+    def check_duplicates_batch(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Check a batch of listings for duplicates with a handful of queries.
+        
+        Args:
+            listings: Listing data to check
+            
+        Returns:
+            Duplicate information for each listing, in input order
+        """
+        return self.deduplication.check_duplicates_batch(listings)
+    
     def get_duplicate_statistics(self) -> Dict[str, Any]:
         """
         Get deduplication statistics.
@@ -0,0 +1,171 @@
+"""
+Migration to version 2.2.0 - Typed numeric listing columns.
+
+This migration adds normalized numeric columns (price_eur, size_sqm, rooms_num)
+to the listings table, backfills them from the textual price/size/rooms values
+in chunks, and creates composite indexes so range filters become index scans.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import text
+
+from mwa_core.storage.models import parse_numeric_value
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_SIZE = 1000
+
+NUMERIC_COLUMNS = {
+    "price_eur": "price",
+    "size_sqm": "size",
+    "rooms_num": "rooms",
+}
+
+INDEXES = {
+    "idx_listings_status_price_eur": "listings(status, price_eur)",
+    "idx_listings_status_size_sqm": "listings(status, size_sqm)",
+    "idx_listings_status_rooms_num": "listings(status, rooms_num)",
+}
+
+
+def upgrade(session) -> None:
+    """
+    Apply migration to version 2.2.0.
+
+    Args:
+        session: Database session
+    """
+    try:
+        logger.info("Applying migration to version 2.2.0 - Typed numeric listing columns")
+
+        add_numeric_columns(session)
+        backfilled = backfill_numeric_columns(session)
+        create_indexes(session)
+
+        logger.info(f"Successfully applied migration to version 2.2.0 ({backfilled} listings backfilled)")
+
+    except Exception as e:
+        logger.error(f"Error applying migration to version 2.2.0: {e}")
+        raise
+
+
+def add_numeric_columns(session) -> list:
+    """
+    Add the numeric columns the listings table is missing.
+
+    Tables created from the current models already have them.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Names of the added columns
+    """
+    existing_columns = {
+        row[1] for row in session.execute(text("PRAGMA table_info(listings)"))
+    }
+    added = [column for column in NUMERIC_COLUMNS if column not in existing_columns]
+    for column in added:
+        session.execute(text(f"ALTER TABLE listings ADD COLUMN {column} FLOAT"))
+    return added
+
+
+def create_indexes(session) -> None:
+    """
+    Create the status/numeric range indexes if they do not exist.
+
+    Args:
+        session: Database session
+    """
+    for index_name, definition in INDEXES.items():
+        session.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {definition}"))
+
+
+def backfill_numeric_columns(session, chunk_size: int = BACKFILL_CHUNK_SIZE) -> int:
+    """
+    Populate the numeric columns for existing listings in id-ordered chunks.
+
+    Each chunk is committed on its own so the write lock is held only briefly
+    and progress survives an interruption; re-running skips finished rows.
+
+    Args:
+        session: Database session
+        chunk_size: Number of listings processed per chunk
+
+    Returns:
+        Number of listings updated
+    """
+    updated = 0
+    last_id = 0
+
+    while True:
+        rows = session.execute(
+            text("""
+                SELECT id, price, size, rooms FROM listings
+                WHERE id > :last_id
+                  AND price_eur IS NULL AND size_sqm IS NULL AND rooms_num IS NULL
+                ORDER BY id
+                LIMIT :chunk_size
+            """),
+            {"last_id": last_id, "chunk_size": chunk_size}
+        ).fetchall()
+
+        if not rows:
+            break
+
+        params = [
+            {
+                "id": row[0],
+                "price_eur": parse_numeric_value(row[1]),
+                "size_sqm": parse_numeric_value(row[2]),
+                "rooms_num": parse_numeric_value(row[3]),
+            }
+            for row in rows
+        ]
+        session.execute(
+            text("""
+                UPDATE listings
+                SET price_eur = :price_eur, size_sqm = :size_sqm, rooms_num = :rooms_num
+                WHERE id = :id
+            """),
+            params
+        )
+        session.commit()
+
+        updated += len(rows)
+        last_id = rows[-1][0]
+        logger.info(f"Backfilled numeric columns for {updated} listings")
+
+    return updated
+
+
+def downgrade(session) -> None:
+    """
+    Rollback migration from version 2.2.0.
+
+    Args:
+        session: Database session
+    """
+    try:
+        logger.info("Rolling back migration from version 2.2.0")
+
+        for index_name in INDEXES:
+            try:
+                session.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            except Exception as e:
+                logger.warning(f"Could not drop index {index_name}: {e}")
+
+        for column in NUMERIC_COLUMNS:
+            try:
+                session.execute(text(f"ALTER TABLE listings DROP COLUMN {column}"))
+            except Exception as e:
+                logger.warning(f"Could not drop column {column}: {e}")
+
+        logger.info("Successfully rolled back migration from version 2.2.0")
+
+    except Exception as e:
+        logger.error(f"Error rolling back migration from version 2.2.0: {e}")
+        raise
@@ -0,0 +1,122 @@
+"""
+Migration to version 2.3.0 - Deduplication blocking index.
+
+This migration creates the listing_blocking_keys table used to look up fuzzy
+duplicate candidates and backfills it for existing listings in chunks.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import text
+
+from mwa_core.storage.blocking import listing_blocking_keys
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_SIZE = 1000
+
+INDEXES = {
+    "idx_listing_blocking_keys_key_listing": "listing_blocking_keys(key, listing_id)",
+    "idx_listing_blocking_keys_listing": "listing_blocking_keys(listing_id)",
+}
+
+
+def upgrade(session) -> None:
+    """
+    Apply migration to version 2.3.0.
+
+    Args:
+        session: Database session
+    """
+    try:
+        logger.info("Applying migration to version 2.3.0 - Deduplication blocking index")
+
+        session.execute(text("""
+            CREATE TABLE IF NOT EXISTS listing_blocking_keys (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                listing_id INTEGER NOT NULL REFERENCES listings(id) ON DELETE CASCADE,
+                key VARCHAR(64) NOT NULL
+            )
+        """))
+
+        for index_name, definition in INDEXES.items():
+            session.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {definition}"))
+
+        backfilled = backfill_blocking_keys(session)
+
+        logger.info(f"Successfully applied migration to version 2.3.0 ({backfilled} listings indexed)")
+
+    except Exception as e:
+        logger.error(f"Error applying migration to version 2.3.0: {e}")
+        raise
+
+
+def backfill_blocking_keys(session, chunk_size: int = BACKFILL_CHUNK_SIZE) -> int:
+    """
+    Index existing listings that have no blocking keys yet, in id-ordered chunks.
+
+    Each chunk is committed on its own; re-running skips indexed listings.
+
+    Args:
+        session: Database session
+        chunk_size: Number of listings processed per chunk
+
+    Returns:
+        Number of listings indexed
+    """
+    indexed = 0
+    last_id = 0
+
+    while True:
+        rows = session.execute(
+            text("""
+                SELECT l.id, l.title, l.address, l.price_eur, l.size_sqm FROM listings l
+                WHERE l.id > :last_id
+                  AND NOT EXISTS (SELECT 1 FROM listing_blocking_keys k WHERE k.listing_id = l.id)
+                ORDER BY l.id
+                LIMIT :chunk_size
+            """),
+            {"last_id": last_id, "chunk_size": chunk_size}
+        ).fetchall()
+
+        if not rows:
+            break
+
+        params = [
+            {"listing_id": row[0], "key": key}
+            for row in rows
+            for key in listing_blocking_keys(row[1], row[2], row[3], row[4])
+        ]
+        if params:
+            session.execute(
+                text("INSERT INTO listing_blocking_keys (listing_id, key) VALUES (:listing_id, :key)"),
+                params
+            )
+        session.commit()
+
+        indexed += len(rows)
+        last_id = rows[-1][0]
+        logger.info(f"Built blocking keys for {indexed} listings")
+
+    return indexed
+
+
+def downgrade(session) -> None:
+    """
+    Rollback migration from version 2.3.0.
+
+    Args:
+        session: Database session
+    """
+    try:
+        logger.info("Rolling back migration from version 2.3.0")
+
+        session.execute(text("DROP TABLE IF EXISTS listing_blocking_keys"))
+
+        logger.info("Successfully rolled back migration from version 2.3.0")
+
+    except Exception as e:
+        logger.error(f"Error rolling back migration from version 2.3.0: {e}")
+        raise
@@ -10,6 +10,7 @@ from __future__ import annotations
 import enum
 import hashlib
 import json
+import re
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -22,8 +23,58 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker, Session
 from sqlalchemy.sql import func
 
+from .blocking import listing_blocking_keys
+
 Base = declarative_base()
 
+_NUMBER_PATTERN = re.compile(r"\d[\d.,]*")
+_GROUPED_THOUSANDS = {
+    ".": re.compile(r"^\d{1,3}(\.\d{3})+$"),
+    ",": re.compile(r"^\d{1,3}(,\d{3})+$"),
+}
+
+
+def parse_numeric_value(value: Any) -> Optional[float]:
+    """
+    Parse the first number in a scraped price, size or rooms string.
+    
+    Handles German and English separators: "1.250,50 €" -> 1250.5,
+    "1,100 €" -> 1100, "75,5 m²" -> 75.5, "3.5" -> 3.5.
+    
+    Args:
+        value: Raw value (string or number)
+        
+    Returns:
+        Parsed float or None if no number is present
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    
+    match = _NUMBER_PATTERN.search(str(value))
+    if not match:
+        return None
+    
+    number = match.group(0).rstrip(".,")
+    if "." in number and "," in number:
+        # The separator that comes last is the decimal separator
+        decimal_sep = "," if number.rfind(",") > number.rfind(".") else "."
+        thousands_sep = "." if decimal_sep == "," else ","
+        number = number.replace(thousands_sep, "").replace(decimal_sep, ".")
+    elif "," in number:
+        if _GROUPED_THOUSANDS[","].match(number):
+            number = number.replace(",", "")
+        else:
+            number = number.replace(",", ".")
+    elif "." in number and _GROUPED_THOUSANDS["."].match(number):
+        number = number.replace(".", "")
+    
+    try:
+        return float(number)
+    except ValueError:
+        return None
+
 
 class ListingStatus(enum.Enum):
     """Enumeration for listing statuses."""
@@ -88,6 +139,11 @@ class Listing(Base):
     status = Column(SQLEnum(ListingStatus), nullable=False, default=ListingStatus.ACTIVE, index=True)
     raw_data = Column(Text, nullable=True)  # JSON for provider-specific data
     
+    # Normalized numeric values parsed from price/size/rooms
+    price_eur = Column(Float, nullable=True)
+    size_sqm = Column(Float, nullable=True)
+    rooms_num = Column(Float, nullable=True)
+    
     # Enhanced fields for PR C
     hash_signature = Column(String(64), nullable=True, unique=True, index=True)  # SHA-256 hash
     deduplication_status = Column(SQLEnum(DeduplicationStatus), nullable=False, 
@@ -100,6 +156,8 @@ class Listing(Base):
     # Relationships
     duplicate_listings = relationship("Listing", remote_side=[id])
     contact_entries = relationship("Contact", back_populates="listing", cascade="all, delete-orphan")
+    blocking_keys = relationship("ListingBlockingKey", back_populates="listing",
+                                 cascade="all, delete-orphan")
     scraping_runs = relationship("ScrapingRun", secondary="listing_scraping_runs", 
                                 back_populates="listings")
     
@@ -109,6 +167,9 @@ class Listing(Base):
         Index("idx_listings_scraped_at_desc", "scraped_at", postgresql_using="btree", 
               postgresql_ops={"scraped_at": "DESC"}),
         Index("idx_listings_hash_signature", "hash_signature"),
+        Index("idx_listings_status_price_eur", "status", "price_eur"),
+        Index("idx_listings_status_size_sqm", "status", "size_sqm"),
+        Index("idx_listings_status_rooms_num", "status", "rooms_num"),
     )
     
     def __repr__(self) -> str:
@@ -125,6 +186,9 @@ class Listing(Base):
             "price": self.price,
             "size": self.size,
             "rooms": self.rooms,
+            "price_eur": self.price_eur,
+            "size_sqm": self.size_sqm,
+            "rooms_num": self.rooms_num,
             "address": self.address,
             "description": self.description,
             "images": self.get_images(),
@@ -189,6 +253,17 @@ class Listing(Base):
     def update_hash_signature(self) -> None:
         """Update the hash signature."""
         self.hash_signature = self.generate_hash_signature()
+    
+    def update_numeric_fields(self) -> None:
+        """Update the normalized numeric columns from price, size and rooms."""
+        self.price_eur = parse_numeric_value(self.price)
+        self.size_sqm = parse_numeric_value(self.size)
+        self.rooms_num = parse_numeric_value(self.rooms)
+    
+    def update_blocking_keys(self) -> None:
+        """Rebuild the deduplication blocking keys (requires numeric fields)."""
+        keys = listing_blocking_keys(self.title, self.address, self.price_eur, self.size_sqm)
+        self.blocking_keys = [ListingBlockingKey(key=key) for key in keys]
 
 
 class Contact(Base):
@@ -470,6 +545,24 @@ class ListingScrapingRun(Base):
     )
 
 
+class ListingBlockingKey(Base):
+    """Blocking index entry used to find fuzzy duplicate candidates."""
+    
+    __tablename__ = "listing_blocking_keys"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    listing_id = Column(Integer, ForeignKey("listings.id", ondelete="CASCADE"), nullable=False)
+    key = Column(String(64), nullable=False)
+    
+    # Relationships
+    listing = relationship("Listing", back_populates="blocking_keys")
+    
+    __table_args__ = (
+        Index("idx_listing_blocking_keys_key_listing", "key", "listing_id"),
+        Index("idx_listing_blocking_keys_listing", "listing_id"),
+    )
+
+
 class ContactValidation(Base):
     """Model for contact validation history."""
     
@@ -589,4 +682,93 @@ class BackupMetadata(Base):
     
     __table_args__ = (
         Index("idx_backup_metadata_created_at", "created_at"),
-    )
\ No newline at end of file
+    )
+
+class NotificationHistoryRecord(Base):
+    """Model for notification delivery history (append-only)."""
+    
+    __tablename__ = "notification_history"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    message_id = Column(String(255), nullable=False)
+    channel = Column(String(50), nullable=False)
+    status = Column(String(50), nullable=False)
+    sent_at = Column(DateTime, nullable=False)
+    delivered_at = Column(DateTime, nullable=True)
+    error_message = Column(Text, nullable=True)
+    retry_count = Column(Integer, nullable=False, default=0)
+    response_data = Column(Text, nullable=True)  # JSON object
+    delivery_confirmation = Column(String(255), nullable=True)
+    message_type = Column(String(100), nullable=True)
+    message_title = Column(Text, nullable=True)
+    recipients = Column(Text, nullable=True)  # JSON array
+    
+    __table_args__ = (
+        Index("idx_notification_history_sent_at", "sent_at"),
+        Index("idx_notification_history_channel_status", "channel", "status"),
+        Index("idx_notification_history_message_id", "message_id"),
+    )
+
+
+class NotificationQueueRecord(Base):
+    """Model for outbound notifications waiting for (re)delivery."""
+    
+    __tablename__ = "notification_queue"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    message_id = Column(String(255), nullable=False, index=True)
+    notifier = Column(String(100), nullable=False)  # Registered notifier name
+    channel = Column(String(50), nullable=False)
+    priority = Column(Integer, nullable=False, default=2)  # 0 = urgent ... 3 = low
+    payload = Column(Text, nullable=False)  # JSON serialized NotificationMessage
+    status = Column(String(20), nullable=False, default="pending")  # pending, in_flight, sent, failed, cancelled
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    next_attempt_at = Column(DateTime, nullable=False)
+    last_error = Column(Text, nullable=True)
+    digest_key = Column(String(100), nullable=True)  # Rows of one digest kind can absorb more items
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        Index("idx_notification_queue_due", "status", "channel", "priority", "next_attempt_at"),
+    )
+
+
+class HTTPCacheRecord(Base):
+    """Model for cached HTTP responses (pages and robots.txt) of contact discovery."""
+    
+    __tablename__ = "http_cache"
+    
+    key = Column(String(64), primary_key=True)  # SHA-256 of the normalized URL
+    url = Column(Text, nullable=False)
+    kind = Column(String(20), nullable=False, default="page")  # page, robots
+    status_code = Column(Integer, nullable=False)
+    headers = Column(Text, nullable=True)  # JSON of the headers needed to rebuild the response
+    body = Column(Text, nullable=False)
+    etag = Column(String(255), nullable=True)
+    last_modified = Column(String(100), nullable=True)
+    size = Column(Integer, nullable=False, default=0)
+    fetched_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    accessed_at = Column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        Index("idx_http_cache_accessed", "accessed_at"),
+    )
+
+
+class MXCacheRecord(Base):
+    """Model for cached MX lookups of contact validation."""
+    
+    __tablename__ = "mx_cache"
+    
+    domain = Column(String(255), primary_key=True)
+    hosts = Column(Text, nullable=False, default="[]")  # JSON list of mail hosts in preference order
+    accepts_mail = Column(Boolean, nullable=False, default=False)
+    resolved_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        Index("idx_mx_cache_expires", "expires_at"),
+    )
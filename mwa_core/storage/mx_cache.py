@@ -0,0 +1,160 @@
+"""
+On-disk MX lookup cache for MWA Core.
+
+Each row of the ``mx_cache`` table holds the mail hosts of one domain and the
+time the DNS answer expires, so that contact validation resolves a domain
+like gmx.de once per TTL instead of once per contact and per run.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from .models import Base, MXCacheRecord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedMXLookup:
+    """A cached MX lookup."""
+    
+    domain: str
+    accepts_mail: bool
+    expires_at: datetime
+    hosts: List[str] = field(default_factory=list)
+    resolved_at: datetime = field(default_factory=datetime.now)
+    
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the lookup can be used without resolving again."""
+        return self.expires_at > datetime.now()
+
+
+class MXCacheStore:
+    """
+    SQLite persistence for cached MX lookups.
+    
+    Rows are keyed by lowercase domain; expired rows are replaced on the
+    next lookup and removed by ``purge_expired``.
+    """
+    
+    def __init__(self, storage_path: str = "data/contact_discovery/mx_cache.db"):
+        """
+        Initialize the cache store.
+        
+        Args:
+            storage_path: Path to the SQLite database holding the cache table
+        """
+        self.storage_path = Path(storage_path)
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.engine = create_engine(f"sqlite:///{self.storage_path}")
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)
+        Base.metadata.create_all(self.engine, tables=[MXCacheRecord.__table__])
+    
+    @contextmanager
+    def get_session(self) -> Iterator[Session]:
+        """
+        Get a database session that commits on success.
+        
+        Yields:
+            SQLAlchemy session
+        """
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _to_item(record: MXCacheRecord) -> CachedMXLookup:
+        return CachedMXLookup(
+            domain=record.domain,
+            accepts_mail=record.accepts_mail,
+            expires_at=record.expires_at,
+            hosts=json.loads(record.hosts) if record.hosts else [],
+            resolved_at=record.resolved_at,
+        )
+    
+    def get(self, domain: str) -> Optional[CachedMXLookup]:
+        """
+        Look up a cached domain.
+        
+        Args:
+            domain: Lowercase domain
+        
+        Returns:
+            The cached lookup, fresh or expired, or None
+        """
+        with self.get_session() as session:
+            record = session.get(MXCacheRecord, domain)
+            return self._to_item(record) if record is not None else None
+    
+    def get_many(self, domains: Iterable[str]) -> List[CachedMXLookup]:
+        """
+        Look up several cached domains in one query.
+        
+        Args:
+            domains: Lowercase domains
+        
+        Returns:
+            Cached lookups found, fresh or expired
+        """
+        domains = list(domains)
+        if not domains:
+            return []
+        with self.get_session() as session:
+            records = session.query(MXCacheRecord).filter(MXCacheRecord.domain.in_(domains)).all()
+            return [self._to_item(record) for record in records]
+    
+    def put(self, item: CachedMXLookup) -> None:
+        """
+        Store a lookup, replacing an older one for the same domain.
+        
+        Args:
+            item: Lookup to store
+        """
+        with self.get_session() as session:
+            session.merge(MXCacheRecord(
+                domain=item.domain,
+                hosts=json.dumps(item.hosts),
+                accepts_mail=item.accepts_mail,
+                resolved_at=item.resolved_at,
+                expires_at=item.expires_at,
+            ))
+    
+    def purge_expired(self) -> int:
+        """
+        Delete expired lookups.
+        
+        Returns:
+            Number of deleted rows
+        """
+        with self.get_session() as session:
+            return session.query(MXCacheRecord).filter(
+                MXCacheRecord.expires_at <= datetime.now()
+            ).delete(synchronize_session=False)
+    
+    def clear(self) -> int:
+        """
+        Delete all cached lookups.
+        
+        Returns:
+            Number of deleted rows
+        """
+        with self.get_session() as session:
+            return session.query(MXCacheRecord).delete(synchronize_session=False)
@@ -1,17 +1,24 @@
 """
 Notification history tracking and storage for MWA Core.
+
+History entries are stored in the ``notification_history`` SQLite table.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
+from sqlalchemy import case, create_engine, func, insert
+from sqlalchemy.orm import Session, sessionmaker
+
 from mwa_core.notifier.base import NotificationResult, NotificationStatus, NotificationChannel
+from .models import Base, NotificationHistoryRecord
 
 logger = logging.getLogger(__name__)
 
@@ -82,67 +89,138 @@ class NotificationHistoryEntry:
 
 
 class NotificationHistoryManager:
-    """Manages notification history storage and retrieval."""
+    """
+    Manages notification history storage and retrieval.
+    
+    Entries are appended to the ``notification_history`` table, so recording a
+    notification is a single insert. Lookups use the ``sent_at``,
+    ``(channel, status)`` and ``message_id`` indexes, and statistics are
+    computed with SQL aggregations.
+    """
     
-    def __init__(self, storage_path: str = "data/notification_history.json", 
+    SUCCESS_STATUSES = (NotificationStatus.SENT.value, NotificationStatus.DELIVERED.value)
+    
+    def __init__(self, storage_path: str = "data/notification_history.db", 
                  max_entries: int = 10000,
-                 retention_days: int = 30):
+                 retention_days: int = 30,
+                 legacy_json_path: Optional[str] = None,
+                 prune_interval: int = 100):
         """
         Initialize notification history manager.
         
         Args:
-            storage_path: Path to the history file
+            storage_path: Path to the SQLite database holding the history table
             max_entries: Maximum number of entries to keep
             retention_days: Number of days to retain entries
+            legacy_json_path: JSON history file to import once (defaults to
+                ``storage_path`` with a ``.json`` suffix)
+            prune_interval: Number of inserts between ``max_entries`` enforcement
         """
         self.storage_path = Path(storage_path)
         self.max_entries = max_entries
         self.retention_days = retention_days
-        self.history: List[NotificationHistoryEntry] = []
+        self.prune_interval = max(1, prune_interval)
+        self._inserts_since_prune = 0
         
         # Ensure directory exists
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Load existing history
-        self._load_history()
+        self.engine = create_engine(f"sqlite:///{self.storage_path}")
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)
+        Base.metadata.create_all(self.engine, tables=[NotificationHistoryRecord.__table__])
+        
+        legacy_path = Path(legacy_json_path) if legacy_json_path else self.storage_path.with_suffix('.json')
+        self._import_legacy_json(legacy_path)
     
-    def _load_history(self):
-        """Load notification history from file."""
-        if not self.storage_path.exists():
-            logger.info(f"Notification history file not found at {self.storage_path}")
+    @contextmanager
+    def get_session(self) -> Iterator[Session]:
+        """
+        Get a database session that commits on success.
+        
+        Yields:
+            SQLAlchemy session
+        """
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def _import_legacy_json(self, legacy_path: Path):
+        """Import a JSON history file written by earlier versions, then rename it."""
+        if not legacy_path.exists():
             return
         
         try:
-            with open(self.storage_path, 'r', encoding='utf-8') as f:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            self.history = [
-                NotificationHistoryEntry.from_dict(entry) 
+            entries = [
+                NotificationHistoryEntry.from_dict(entry)
                 for entry in data.get('entries', [])
             ]
+            with self.get_session() as session:
+                session.bulk_insert_mappings(
+                    NotificationHistoryRecord, [self._to_row(entry) for entry in entries]
+                )
             
-            logger.info(f"Loaded {len(self.history)} notification history entries")
+            legacy_path.rename(legacy_path.with_name(legacy_path.name + '.migrated'))
+            logger.info(f"Imported {len(entries)} notification history entries from {legacy_path}")
             
         except Exception as e:
-            logger.error(f"Failed to load notification history: {e}")
-            self.history = []
+            logger.error(f"Failed to import notification history from {legacy_path}: {e}")
     
-    def _save_history(self):
-        """Save notification history to file."""
-        try:
-            data = {
-                'last_updated': datetime.now().isoformat(),
-                'total_entries': len(self.history),
-                'entries': [entry.to_dict() for entry in self.history]
-            }
-            
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            logger.debug(f"Saved {len(self.history)} notification history entries")
-            
-        except Exception as e:
-            logger.error(f"Failed to save notification history: {e}")
+    @staticmethod
+    def _to_row(entry: NotificationHistoryEntry) -> Dict[str, Any]:
+        """Convert an entry to column values."""
+        return {
+            "message_id": entry.message_id,
+            "channel": entry.channel,
+            "status": entry.status,
+            "sent_at": entry.sent_at,
+            "delivered_at": entry.delivered_at,
+            "error_message": entry.error_message,
+            "retry_count": entry.retry_count or 0,
+            "response_data": json.dumps(entry.response_data, default=str) if entry.response_data else None,
+            "delivery_confirmation": entry.delivery_confirmation,
+            "message_type": entry.message_type,
+            "message_title": entry.message_title,
+            "recipients": json.dumps(entry.recipients) if entry.recipients else None,
+        }
+    
+    @staticmethod
+    def _to_entry(record: NotificationHistoryRecord) -> NotificationHistoryEntry:
+        """Convert a stored record to an entry."""
+        return NotificationHistoryEntry(
+            message_id=record.message_id,
+            channel=record.channel,
+            status=record.status,
+            sent_at=record.sent_at,
+            delivered_at=record.delivered_at,
+            error_message=record.error_message,
+            retry_count=record.retry_count,
+            response_data=json.loads(record.response_data) if record.response_data else {},
+            delivery_confirmation=record.delivery_confirmation,
+            message_type=record.message_type,
+            message_title=record.message_title,
+            recipients=json.loads(record.recipients) if record.recipients else [],
+        )
+    
+    def _query_entries(self, session: Session, since: Optional[datetime] = None,
+                       channel: Optional[str] = None, status: Optional[str] = None):
+        """Build an entry query in insertion order."""
+        query = session.query(NotificationHistoryRecord)
+        if since is not None:
+            query = query.filter(NotificationHistoryRecord.sent_at >= since)
+        if channel is not None:
+            query = query.filter(NotificationHistoryRecord.channel == channel)
+        if status is not None:
+            query = query.filter(NotificationHistoryRecord.status == status)
+        return query.order_by(NotificationHistoryRecord.id)
     
     def add_entry(self, entry: NotificationHistoryEntry):
         """
@@ -151,17 +229,37 @@ class NotificationHistoryManager:
         Args:
             entry: Notification history entry to add
         """
-        self.history.append(entry)
+        try:
+            with self.get_session() as session:
+                session.execute(insert(NotificationHistoryRecord), [self._to_row(entry)])
+        except Exception as e:
+            logger.error(f"Failed to save notification history entry: {e}")
+            return
         
-        # Maintain size limit
-        if len(self.history) > self.max_entries:
-            # Remove oldest entries
-            remove_count = len(self.history) - self.max_entries
-            self.history = self.history[remove_count:]
+        # Maintain size limit (amortized over several inserts)
+        self._inserts_since_prune += 1
+        if self._inserts_since_prune >= self.prune_interval:
+            self._inserts_since_prune = 0
+            self._enforce_max_entries()
+    
+    def _enforce_max_entries(self):
+        """Delete the oldest entries beyond ``max_entries``."""
+        try:
+            with self.get_session() as session:
+                boundary = session.query(NotificationHistoryRecord.id).order_by(
+                    NotificationHistoryRecord.id.desc()
+                ).offset(self.max_entries).limit(1).scalar()
+                
+                if boundary is None:
+                    return
+                
+                remove_count = session.query(NotificationHistoryRecord).filter(
+                    NotificationHistoryRecord.id <= boundary
+                ).delete(synchronize_session=False)
+            
             logger.info(f"Removed {remove_count} old notification history entries")
-        
-        # Save to file
-        self._save_history()
+        except Exception as e:
+            logger.error(f"Failed to prune notification history: {e}")
     
     def add_result(self, result: NotificationResult, 
                    message_type: str = None,
@@ -197,14 +295,23 @@ class NotificationHistoryManager:
         """
         cutoff_time = datetime.now() - timedelta(hours=hours)
         
-        filtered_entries = [
-            entry for entry in self.history
-            if entry.sent_at >= cutoff_time
-            and (channel is None or entry.channel == channel.value)
-            and (status is None or entry.status == status.value)
-        ]
+        with self.get_session() as session:
+            records = self._query_entries(
+                session, cutoff_time,
+                channel.value if channel else None,
+                status.value if status else None
+            ).all()
+            return [self._to_entry(record) for record in records]
+    
+    def get_all_entries(self) -> List[NotificationHistoryEntry]:
+        """
+        Get all stored notification history entries.
         
-        return filtered_entries
+        Returns:
+            List of history entries, oldest first
+        """
+        with self.get_session() as session:
+            return [self._to_entry(record) for record in self._query_entries(session).all()]
     
     def get_entries_by_message_id(self, message_id: str) -> List[NotificationHistoryEntry]:
         """
@@ -216,7 +323,11 @@ class NotificationHistoryManager:
         Returns:
             List of matching entries
         """
-        return [entry for entry in self.history if entry.message_id == message_id]
+        with self.get_session() as session:
+            records = session.query(NotificationHistoryRecord).filter(
+                NotificationHistoryRecord.message_id == message_id
+            ).order_by(NotificationHistoryRecord.id).all()
+            return [self._to_entry(record) for record in records]
     
     def get_failed_entries(self, max_age_hours: int = 24) -> List[NotificationHistoryEntry]:
         """
@@ -228,13 +339,13 @@ class NotificationHistoryManager:
         Returns:
             List of failed entries
         """
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-        
-        return [
-            entry for entry in self.history
-            if entry.status == NotificationStatus.FAILED.value
-            and entry.sent_at >= cutoff_time
-        ]
+        return self.get_recent_entries(max_age_hours, status=NotificationStatus.FAILED)
+    
+    def _success_column(self):
+        """SQL expression counting successful deliveries."""
+        return func.sum(case(
+            (NotificationHistoryRecord.status.in_(self.SUCCESS_STATUSES), 1), else_=0
+        ))
     
     def get_success_rate(self, hours: int = 24, 
                         channel: NotificationChannel = None) -> float:
@@ -248,17 +359,20 @@ class NotificationHistoryManager:
         Returns:
             Success rate as a float (0.0 to 1.0)
         """
-        recent_entries = self.get_recent_entries(hours, channel)
+        cutoff_time = datetime.now() - timedelta(hours=hours)
         
-        if not recent_entries:
-            return 0.0
+        with self.get_session() as session:
+            query = session.query(
+                func.count(NotificationHistoryRecord.id), self._success_column()
+            ).filter(NotificationHistoryRecord.sent_at >= cutoff_time)
+            if channel is not None:
+                query = query.filter(NotificationHistoryRecord.channel == channel.value)
+            total, successful = query.one()
         
-        successful_count = sum(
-            1 for entry in recent_entries
-            if entry.status in [NotificationStatus.SENT.value, NotificationStatus.DELIVERED.value]
-        )
+        if not total:
+            return 0.0
         
-        return successful_count / len(recent_entries)
+        return (successful or 0) / total
     
     def get_channel_stats(self, hours: int = 24) -> Dict[str, Dict[str, Any]]:
         """
@@ -270,25 +384,29 @@ class NotificationHistoryManager:
         Returns:
             Dictionary with channel statistics
         """
-        recent_entries = self.get_recent_entries(hours)
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        
+        with self.get_session() as session:
+            rows = session.query(
+                NotificationHistoryRecord.channel,
+                func.count(NotificationHistoryRecord.id),
+                self._success_column()
+            ).filter(
+                NotificationHistoryRecord.sent_at >= cutoff_time
+            ).group_by(NotificationHistoryRecord.channel).all()
+        
+        counts = {channel: (total, successful or 0) for channel, total, successful in rows}
         
         stats = {}
         
+        # Keep the enum order of the original implementation
         for channel in NotificationChannel:
-            channel_entries = [e for e in recent_entries if e.channel == channel.value]
-            
-            if channel_entries:
-                total = len(channel_entries)
-                successful = sum(
-                    1 for e in channel_entries
-                    if e.status in [NotificationStatus.SENT.value, NotificationStatus.DELIVERED.value]
-                )
-                failed = total - successful
-                
+            if channel.value in counts:
+                total, successful = counts[channel.value]
                 stats[channel.value] = {
                     "total": total,
                     "successful": successful,
-                    "failed": failed,
+                    "failed": total - successful,
                     "success_rate": successful / total if total > 0 else 0.0
                 }
         
@@ -298,17 +416,17 @@ class NotificationHistoryManager:
         """Remove old entries based on retention policy."""
         cutoff_time = datetime.now() - timedelta(days=self.retention_days)
         
-        original_count = len(self.history)
-        self.history = [
-            entry for entry in self.history
-            if entry.sent_at >= cutoff_time
-        ]
-        
-        removed_count = original_count - len(self.history)
+        try:
+            with self.get_session() as session:
+                removed_count = session.query(NotificationHistoryRecord).filter(
+                    NotificationHistoryRecord.sent_at < cutoff_time
+                ).delete(synchronize_session=False)
+        except Exception as e:
+            logger.error(f"Failed to clean up notification history: {e}")
+            return
         
         if removed_count > 0:
             logger.info(f"Removed {removed_count} old notification history entries")
-            self._save_history()
     
     def get_summary(self, hours: int = 24) -> Dict[str, Any]:
         """
@@ -320,9 +438,10 @@ class NotificationHistoryManager:
         Returns:
             Dictionary with summary statistics
         """
-        recent_entries = self.get_recent_entries(hours)
+        by_channel = self.get_channel_stats(hours)
+        total = sum(stats["total"] for stats in by_channel.values())
         
-        if not recent_entries:
+        if not total:
             return {
                 "total": 0,
                 "successful": 0,
@@ -332,28 +451,28 @@ class NotificationHistoryManager:
                 "recent_failures": []
             }
         
-        total = len(recent_entries)
-        successful = sum(
-            1 for entry in recent_entries
-            if entry.status in [NotificationStatus.SENT.value, NotificationStatus.DELIVERED.value]
-        )
+        successful = sum(stats["successful"] for stats in by_channel.values())
         failed = total - successful
         
-        by_channel = self.get_channel_stats(hours)
-        
-        # Get recent failures
-        recent_failures = [
-            {
-                "message_id": entry.message_id,
-                "channel": entry.channel,
-                "message_type": entry.message_type,
-                "message_title": entry.message_title,
-                "error_message": entry.error_message,
-                "sent_at": entry.sent_at.isoformat()
-            }
-            for entry in recent_entries
-            if entry.status == NotificationStatus.FAILED.value
-        ][-5:]  # Last 5 failures
+        # Get recent failures (last 5, oldest first)
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        with self.get_session() as session:
+            records = session.query(NotificationHistoryRecord).filter(
+                NotificationHistoryRecord.sent_at >= cutoff_time,
+                NotificationHistoryRecord.status == NotificationStatus.FAILED.value
+            ).order_by(NotificationHistoryRecord.id.desc()).limit(5).all()
+            
+            recent_failures = [
+                {
+                    "message_id": record.message_id,
+                    "channel": record.channel,
+                    "message_type": record.message_type,
+                    "message_title": record.message_title,
+                    "error_message": record.error_message,
+                    "sent_at": record.sent_at.isoformat()
+                }
+                for record in reversed(records)
+            ]
         
         return {
             "total": total,
@@ -378,7 +497,7 @@ class NotificationHistoryManager:
         try:
             import csv
             
-            entries = self.get_recent_entries(hours) if hours else self.history
+            entries = self.get_recent_entries(hours) if hours else self.get_all_entries()
             
             if not entries:
                 logger.warning("No entries to export")
@@ -418,9 +537,14 @@ class NotificationHistoryManager:
     
     def clear_history(self):
         """Clear all notification history."""
-        self.history.clear()
-        self._save_history()
+        with self.get_session() as session:
+            session.query(NotificationHistoryRecord).delete(synchronize_session=False)
         logger.info("Cleared all notification history")
+    
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        with self.get_session() as session:
+            return session.query(func.count(NotificationHistoryRecord.id)).scalar()
 
 
 # Convenience functions
@@ -430,8 +554,11 @@ def get_notification_history_manager(storage_path: str = None,
     """
     Get or create a notification history manager.
     
+    The history table lives in the main database by default; a JSON history
+    written by earlier versions is imported on first use.
+    
     Args:
-        storage_path: Path to storage file
+        storage_path: Path to the SQLite database
         max_entries: Maximum entries to keep
         retention_days: Retention period in days
         
@@ -443,14 +570,16 @@ def get_notification_history_manager(storage_path: str = None,
     settings = get_settings()
     
     # Use settings if parameters not provided
+    legacy_json_path = settings.database_path.replace('.db', '_notification_history.json')
     if storage_path is None:
-        storage_path = settings.database_path.replace('.db', '_notification_history.json')
+        storage_path = settings.database_path
     if max_entries is None:
         max_entries = settings.max_notification_queue_size
     if retention_days is None:
         retention_days = settings.notification_history_retention_days
     
-    return NotificationHistoryManager(storage_path, max_entries, retention_days)
+    return NotificationHistoryManager(storage_path, max_entries, retention_days,
+                                      legacy_json_path=legacy_json_path)
 
 
 # Global history manager instance
@@ -0,0 +1,363 @@
+"""
+Durable outbound notification queue for MWA Core.
+
+Each row of the ``notification_queue`` table is one message addressed to one
+notifier. Rows move from ``pending`` to ``in_flight`` when a worker claims
+them and end as ``sent``, ``failed`` (retries exhausted) or ``cancelled``
+(expired). Because the queue lives in SQLite, messages that were not
+delivered before the process exited are picked up again on the next start.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session, sessionmaker
+
+from .models import Base, NotificationQueueRecord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedNotification:
+    """A claimed queue row."""
+    
+    id: int
+    message_id: str
+    notifier: str
+    channel: str
+    priority: int
+    payload: str
+    attempts: int
+    max_attempts: int
+    next_attempt_at: Optional[datetime] = None
+
+
+class NotificationQueueStore:
+    """
+    SQLite persistence for queued notifications.
+    
+    Due rows are claimed in priority order (lowest ``priority`` value first,
+    then by due time) using the ``(status, channel, priority,
+    next_attempt_at)`` index.
+    """
+    
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    SENT = "sent"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    
+    def __init__(self, storage_path: str = "data/mwa_core.db"):
+        """
+        Initialize the queue store.
+        
+        Args:
+            storage_path: Path to the SQLite database holding the queue table
+        """
+        self.storage_path = Path(storage_path)
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.engine = create_engine(f"sqlite:///{self.storage_path}")
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)
+        Base.metadata.create_all(self.engine, tables=[NotificationQueueRecord.__table__])
+    
+    @contextmanager
+    def get_session(self) -> Iterator[Session]:
+        """
+        Get a database session that commits on success.
+        
+        Yields:
+            SQLAlchemy session
+        """
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _to_item(record: NotificationQueueRecord) -> QueuedNotification:
+        return QueuedNotification(
+            id=record.id,
+            message_id=record.message_id,
+            notifier=record.notifier,
+            channel=record.channel,
+            priority=record.priority,
+            payload=record.payload,
+            attempts=record.attempts,
+            max_attempts=record.max_attempts,
+            next_attempt_at=record.next_attempt_at,
+        )
+    
+    def enqueue(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add messages to the queue.
+        
+        Args:
+            rows: Column values with ``message_id``, ``notifier``, ``channel``,
+                ``priority``, ``payload`` and optionally ``max_attempts``,
+                ``next_attempt_at`` and ``digest_key``
+        
+        Returns:
+            IDs of the inserted rows
+        """
+        now = datetime.now()
+        records = [
+            NotificationQueueRecord(
+                status=self.PENDING,
+                attempts=0,
+                created_at=now,
+                updated_at=now,
+                **{"next_attempt_at": now, **row}
+            )
+            for row in rows
+        ]
+        with self.get_session() as session:
+            session.add_all(records)
+            session.flush()
+            return [record.id for record in records]
+    
+    def claim(self, channel: str, limit: int = 1) -> List[QueuedNotification]:
+        """
+        Claim due pending rows of a channel for delivery.
+        
+        Args:
+            channel: Notification channel
+            limit: Maximum number of rows to claim
+        
+        Returns:
+            Claimed rows, highest priority first
+        """
+        now = datetime.now()
+        with self.get_session() as session:
+            records = session.query(NotificationQueueRecord).filter(
+                NotificationQueueRecord.status == self.PENDING,
+                NotificationQueueRecord.channel == channel,
+                NotificationQueueRecord.next_attempt_at <= now
+            ).order_by(
+                NotificationQueueRecord.priority,
+                NotificationQueueRecord.next_attempt_at,
+                NotificationQueueRecord.id
+            ).limit(limit).all()
+            
+            claimed = []
+            for record in records:
+                record.status = self.IN_FLIGHT
+                record.attempts += 1
+                record.updated_at = now
+                claimed.append(self._to_item(record))
+            return claimed
+    
+    def find_open_digest(self, notifier: str, digest_key: str) -> Optional[QueuedNotification]:
+        """
+        Find a digest row that can still absorb more items.
+        
+        A digest row is open while it is pending, has not been attempted yet
+        and its coalescing window (``next_attempt_at``) has not passed.
+        
+        Args:
+            notifier: Registered notifier name
+            digest_key: Digest kind (e.g. ``new_listings``)
+        
+        Returns:
+            The most recent open row, or None
+        """
+        with self.get_session() as session:
+            record = session.query(NotificationQueueRecord).filter(
+                NotificationQueueRecord.notifier == notifier,
+                NotificationQueueRecord.digest_key == digest_key,
+                NotificationQueueRecord.status == self.PENDING,
+                NotificationQueueRecord.attempts == 0,
+                NotificationQueueRecord.next_attempt_at > datetime.now()
+            ).order_by(NotificationQueueRecord.id.desc()).first()
+            if record is None:
+                return None
+            return self._to_item(record)
+    
+    def update_pending(self, row_id: int, payload: str, next_attempt_at: datetime) -> bool:
+        """
+        Replace the payload of a row that no worker has claimed yet.
+        
+        Args:
+            row_id: Queue row ID
+            payload: New serialized message
+            next_attempt_at: New due time
+        
+        Returns:
+            True if the row was updated, False if it was claimed meanwhile
+        """
+        with self.get_session() as session:
+            updated = session.query(NotificationQueueRecord).filter(
+                NotificationQueueRecord.id == row_id,
+                NotificationQueueRecord.status == self.PENDING,
+                NotificationQueueRecord.attempts == 0
+            ).update({
+                NotificationQueueRecord.payload: payload,
+                NotificationQueueRecord.next_attempt_at: next_attempt_at,
+                NotificationQueueRecord.updated_at: datetime.now(),
+            }, synchronize_session=False)
+            return updated == 1
+    
+    def _finish(self, row_id: int, status: str, error: Optional[str] = None,
+                next_attempt_at: Optional[datetime] = None):
+        with self.get_session() as session:
+            record = session.get(NotificationQueueRecord, row_id)
+            if record is None:
+                return
+            record.status = status
+            record.last_error = error
+            record.updated_at = datetime.now()
+            if next_attempt_at is not None:
+                record.next_attempt_at = next_attempt_at
+    
+    def release(self, row_id: int):
+        """Return a claimed row to the queue without counting the attempt."""
+        with self.get_session() as session:
+            record = session.get(NotificationQueueRecord, row_id)
+            if record is not None:
+                record.status = self.PENDING
+                record.attempts = max(0, record.attempts - 1)
+                record.updated_at = datetime.now()
+    
+    def mark_sent(self, row_id: int):
+        """Mark a claimed row as delivered."""
+        self._finish(row_id, self.SENT)
+    
+    def mark_cancelled(self, row_id: int, reason: str):
+        """Mark a claimed row as cancelled (e.g. expired)."""
+        self._finish(row_id, self.CANCELLED, reason)
+    
+    def mark_failed(self, row_id: int, error: str, retry_at: Optional[datetime] = None):
+        """
+        Record a failed delivery attempt.
+        
+        Args:
+            row_id: Claimed row ID
+            error: Error message of the attempt
+            retry_at: When to try again; None marks the row as permanently failed
+        """
+        if retry_at is None:
+            self._finish(row_id, self.FAILED, error)
+        else:
+            self._finish(row_id, self.PENDING, error, retry_at)
+    
+    def recover_in_flight(self) -> int:
+        """
+        Return rows left in flight by a previous process to the queue.
+        
+        Returns:
+            Number of recovered rows
+        """
+        with self.get_session() as session:
+            return session.query(NotificationQueueRecord).filter(
+                NotificationQueueRecord.status == self.IN_FLIGHT
+            ).update({
+                NotificationQueueRecord.status: self.PENDING,
+                NotificationQueueRecord.updated_at: datetime.now(),
+            }, synchronize_session=False)
+    
+    def requeue_failed(self, max_age_hours: int = 24) -> int:
+        """
+        Put permanently failed rows back into the queue with fresh attempts.
+        
+        Args:
+            max_age_hours: Only requeue rows created within this many hours
+        
+        Returns:
+            Number of requeued rows
+        """
+        now = datetime.now()
+        with self.get_session() as session:
+            return session.query(NotificationQueueRecord).filter(
+                NotificationQueueRecord.status == self.FAILED,
+                NotificationQueueRecord.created_at >= now - timedelta(hours=max_age_hours)
+            ).update({
+                NotificationQueueRecord.status: self.PENDING,
+                NotificationQueueRecord.attempts: 0,
+                NotificationQueueRecord.next_attempt_at: now,
+                NotificationQueueRecord.updated_at: now,
+            }, synchronize_session=False)
+    
+    def pending_count(self, channel: Optional[str] = None) -> int:
+        """
+        Count rows waiting for delivery (pending or in flight).
+        
+        Args:
+            channel: Only count this channel (optional)
+        
+        Returns:
+            Number of undelivered rows
+        """
+        with self.get_session() as session:
+            query = session.query(func.count(NotificationQueueRecord.id)).filter(
+                NotificationQueueRecord.status.in_([self.PENDING, self.IN_FLIGHT])
+            )
+            if channel is not None:
+                query = query.filter(NotificationQueueRecord.channel == channel)
+            return query.scalar() or 0
+    
+    def next_due(self, channel: str) -> Optional[datetime]:
+        """
+        Get the earliest due time of pending rows of a channel.
+        
+        Args:
+            channel: Notification channel
+        
+        Returns:
+            Earliest ``next_attempt_at`` or None if nothing is pending
+        """
+        with self.get_session() as session:
+            return session.query(func.min(NotificationQueueRecord.next_attempt_at)).filter(
+                NotificationQueueRecord.status == self.PENDING,
+                NotificationQueueRecord.channel == channel
+            ).scalar()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get row counts by status and channel.
+        
+        Returns:
+            Dictionary with ``by_status`` and ``by_channel`` counts
+        """
+        with self.get_session() as session:
+            rows = session.query(
+                NotificationQueueRecord.channel,
+                NotificationQueueRecord.status,
+                func.count(NotificationQueueRecord.id)
+            ).group_by(NotificationQueueRecord.channel, NotificationQueueRecord.status).all()
+        
+        by_status: Dict[str, int] = {}
+        by_channel: Dict[str, Dict[str, int]] = {}
+        for channel, status, count in rows:
+            by_status[status] = by_status.get(status, 0) + count
+            by_channel.setdefault(channel, {})[status] = count
+        return {"by_status": by_status, "by_channel": by_channel}
+    
+    def purge_finished(self, older_than_days: int = 7) -> int:
+        """
+        Delete sent and cancelled rows older than the given age.
+        
+        Args:
+            older_than_days: Age in days
+        
+        Returns:
+            Number of deleted rows
+        """
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+        with self.get_session() as session:
+            return session.query(NotificationQueueRecord).filter(
+                NotificationQueueRecord.status.in_([self.SENT, self.CANCELLED]),
+                NotificationQueueRecord.updated_at < cutoff
+            ).delete(synchronize_session=False)
@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta
 import json
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Set, Union, Tuple
 from contextlib import contextmanager
 
 from sqlalchemy import and_, or_, func, text
@@ -21,13 +21,13 @@ from sqlalchemy.sql import expression
 from .models import (
     Listing, Contact, ScrapingRun, ListingScrapingRun, ContactValidation,
     JobStore, Configuration, BackupMetadata, ListingStatus, ContactType,
-    ContactStatus, JobStatus, DeduplicationStatus
+    ContactStatus, JobStatus, DeduplicationStatus, parse_numeric_value
 )
 from .schema import DatabaseSchema
+from .pagination import InvalidCursorError, keyset_page
 
 logger = logging.getLogger(__name__)
 
-
 class CRUDOperations:
     """Comprehensive CRUD operations for all entities."""
     
@@ -99,6 +99,8 @@ class CRUDOperations:
                 
                 # Generate hash signature for deduplication
                 listing.update_hash_signature()
+                listing.update_numeric_fields()
+                listing.update_blocking_keys()
                 
                 session.add(listing)
                 session.flush()  # Get the ID
@@ -149,6 +151,95 @@ class CRUDOperations:
             logger.error(f"Error getting listing by URL {url}: {e}")
             return None
     
+    def get_existing_listing_urls(self, urls: List[str]) -> Set[str]:
+        """
+        Get the subset of URLs that are already stored, in one batched lookup.
+        
+        Args:
+            urls: Listing URLs to check
+            
+        Returns:
+            Set of stored URLs
+        """
+        try:
+            with self.get_session() as session:
+                return self._existing_values(session, Listing.url, urls)
+        except Exception as e:
+            logger.error(f"Error checking existing listing URLs: {e}")
+            return set()
+    
+    def _build_listings_query(
+        self,
+        session: Session,
+        provider: Optional[str] = None,
+        status: Optional[ListingStatus] = None,
+        search_query: Optional[str] = None,
+        min_price: Optional[Union[str, float]] = None,
+        max_price: Optional[Union[str, float]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        columns: Tuple[Any, ...] = ()
+    ):
+        """
+        Build a filtered listings query without ordering or pagination.
+        
+        Args:
+            session: Active database session
+            provider: Filter by provider
+            status: Filter by status
+            search_query: Search in title and description
+            min_price: Minimum price (number or price string like "1000 €")
+            max_price: Maximum price (number or price string like "1500 €")
+            date_from: Only listings scraped at or after this time
+            date_to: Only listings scraped at or before this time
+            columns: Extra columns to select alongside the Listing entity
+            
+        Returns:
+            SQLAlchemy query
+        """
+        query = session.query(Listing, *columns)
+        
+        if provider:
+            query = query.filter(Listing.provider == provider)
+        
+        if status:
+            query = query.filter(Listing.status == status)
+        
+        if search_query:
+            search_filter = or_(
+                Listing.title.ilike(f"%{search_query}%"),
+                Listing.description.ilike(f"%{search_query}%")
+            )
+            query = query.filter(search_filter)
+        
+        min_price_value = parse_numeric_value(min_price)
+        if min_price_value is not None:
+            query = query.filter(Listing.price_eur >= min_price_value)
+        
+        max_price_value = parse_numeric_value(max_price)
+        if max_price_value is not None:
+            query = query.filter(Listing.price_eur <= max_price_value)
+        
+        if date_from:
+            query = query.filter(Listing.scraped_at >= date_from)
+        
+        if date_to:
+            query = query.filter(Listing.scraped_at <= date_to)
+        
+        return query
+    
+    @staticmethod
+    def _listing_order_clauses(order_by: str, order_desc: bool) -> List[Any]:
+        """Resolve a sort key into ORDER BY clauses with a stable ``id`` tie-breaker."""
+        if order_by == "price":
+            order_field = Listing.price_eur
+        else:
+            order_field = getattr(Listing, order_by, Listing.scraped_at)
+        
+        if order_desc:
+            return [order_field.desc(), Listing.id.desc()]
+        return [order_field.asc(), Listing.id.asc()]
+    
     def get_listings(
         self,
         limit: int = 100,
@@ -156,10 +247,12 @@ class CRUDOperations:
         provider: Optional[str] = None,
         status: Optional[ListingStatus] = None,
         search_query: Optional[str] = None,
-        min_price: Optional[str] = None,
-        max_price: Optional[str] = None,
+        min_price: Optional[Union[str, float]] = None,
+        max_price: Optional[Union[str, float]] = None,
         order_by: str = "scraped_at",
-        order_desc: bool = True
+        order_desc: bool = True,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """
         Get listings with various filters and options.
@@ -174,40 +267,20 @@ class CRUDOperations:
             max_price: Maximum price filter
             order_by: Field to order by
             order_desc: Order descending
+            date_from: Only listings scraped at or after this time
+            date_to: Only listings scraped at or before this time
             
         Returns:
             List of Listing objects
         """
         try:
             with self.get_session() as session:
-                query = session.query(Listing)
-                
-                # Apply filters
-                if provider:
-                    query = query.filter(Listing.provider == provider)
-                
-                if status:
-                    query = query.filter(Listing.status == status)
-                
-                if search_query:
-                    search_filter = or_(
-                        Listing.title.ilike(f"%{search_query}%"),
-                        Listing.description.ilike(f"%{search_query}%")
-                    )
-                    query = query.filter(search_filter)
-                
-                if min_price:
-                    query = query.filter(Listing.price >= min_price)
-                
-                if max_price:
-                    query = query.filter(Listing.price <= max_price)
-                
-                # Apply ordering
-                order_field = getattr(Listing, order_by, Listing.scraped_at)
-                if order_desc:
-                    order_field = order_field.desc()
-                
-                query = query.order_by(order_field)
+                query = self._build_listings_query(
+                    session, provider=provider, status=status, search_query=search_query,
+                    min_price=min_price, max_price=max_price,
+                    date_from=date_from, date_to=date_to
+                )
+                query = query.order_by(*self._listing_order_clauses(order_by, order_desc))
                 
                 # Apply pagination
                 query = query.limit(limit).offset(offset)
@@ -219,6 +292,146 @@ class CRUDOperations:
             logger.error(f"Error getting listings: {e}")
             return []
     
+    def get_listings_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        provider: Optional[str] = None,
+        status: Optional[ListingStatus] = None,
+        search_query: Optional[str] = None,
+        min_price: Optional[Union[str, float]] = None,
+        max_price: Optional[Union[str, float]] = None,
+        order_by: str = "scraped_at",
+        order_desc: bool = True,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of listings together with the total number of matches.
+        
+        Filtering, sorting and counting all happen in the database. The total
+        is computed with a ``COUNT(*) OVER ()`` window on the page query, so
+        the page and the count come back in a single round trip.
+        
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip
+            provider: Filter by provider
+            status: Filter by status
+            search_query: Search in title and description
+            min_price: Minimum price filter
+            max_price: Maximum price filter
+            order_by: Field to order by ("price" sorts numerically)
+            order_desc: Order descending
+            date_from: Only listings scraped at or after this time
+            date_to: Only listings scraped at or before this time
+            
+        Returns:
+            Tuple of (listing dictionaries, total matching listings)
+        """
+        filters = {
+            "provider": provider,
+            "status": status,
+            "search_query": search_query,
+            "min_price": min_price,
+            "max_price": max_price,
+            "date_from": date_from,
+            "date_to": date_to,
+        }
+        try:
+            with self.get_session() as session:
+                total_column = func.count(Listing.id).over().label("total_count")
+                query = self._build_listings_query(session, columns=(total_column,), **filters)
+                query = query.order_by(*self._listing_order_clauses(order_by, order_desc))
+                rows = query.limit(limit).offset(offset).all()
+                
+                if rows:
+                    return [listing.to_dict() for listing, _ in rows], rows[0].total_count
+                
+                if offset == 0:
+                    return [], 0
+                
+                # Page is past the end; the window count is unavailable without rows
+                total = self._build_listings_query(session, **filters).count()
+                return [], total
+                
+        except Exception as e:
+            logger.error(f"Error getting listings page: {e}")
+            return [], 0
+    
+    def get_listings_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        provider: Optional[str] = None,
+        status: Optional[ListingStatus] = None,
+        search_query: Optional[str] = None,
+        min_price: Optional[Union[str, float]] = None,
+        max_price: Optional[Union[str, float]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get listings newest first using keyset pagination on ``(scraped_at, id)``.
+        
+        Each page is a range scan on ``idx_listings_scraped_at_desc`` starting
+        after the cursor, so the cost does not grow with the page depth.
+        
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of results
+            provider: Filter by provider
+            status: Filter by status
+            search_query: Search in title and description
+            min_price: Minimum price filter
+            max_price: Maximum price filter
+            date_from: Only listings scraped at or after this time
+            date_to: Only listings scraped at or before this time
+            
+        Returns:
+            Tuple of (listing dictionaries, cursor for the next page or None)
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        try:
+            with self.get_session() as session:
+                query = self._build_listings_query(
+                    session, provider=provider, status=status, search_query=search_query,
+                    min_price=min_price, max_price=max_price,
+                    date_from=date_from, date_to=date_to
+                )
+                listings, next_cursor = keyset_page(
+                    query, Listing.scraped_at, Listing.id, cursor, limit
+                )
+                return [listing.to_dict() for listing in listings], next_cursor
+                
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting listings by cursor: {e}")
+            return [], None
+    
+    def iter_listings(self, batch_size: int = 500, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all matching listings newest first, one keyset page at a time.
+        
+        Args:
+            batch_size: Number of listings fetched per query
+            **filters: Filters accepted by :meth:`get_listings_by_cursor`
+            
+        Yields:
+            Listing dictionaries
+        """
+        cursor = None
+        while True:
+            listings, cursor = self.get_listings_by_cursor(
+                cursor=cursor, limit=batch_size, **filters
+            )
+            yield from listings
+            if not cursor:
+                break
+    
     def update_listing(self, listing_id: int, update_data: Dict[str, Any]) -> bool:
         """
         Update a listing.
@@ -247,6 +460,12 @@ class CRUDOperations:
                 if any(key in update_data for key in ["title", "price", "size", "rooms", "address"]):
                     listing.update_hash_signature()
                 
+                if any(key in update_data for key in ["price", "size", "rooms"]):
+                    listing.update_numeric_fields()
+                
+                if any(key in update_data for key in ["title", "price", "size", "address"]):
+                    listing.update_blocking_keys()
+                
                 listing.updated_at = datetime.utcnow()
                 
                 logger.info(f"Updated listing: {listing_id}")
@@ -293,20 +512,40 @@ class CRUDOperations:
         Returns:
             Number of listings created
         """
+        created_ids = self.create_listings_batch(listings_data)
+        created_count = sum(1 for listing_id in created_ids if listing_id is not None)
+        
+        logger.info(f"Bulk created {created_count} listings")
+        return created_count
+    
+    def create_listings_batch(self, listings_data: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Create many listings in a single transaction.
+        
+        Existing URLs, hash signatures and provider/external ID pairs are looked
+        up with one ``IN`` query each; listings that would violate a unique
+        constraint (including repeats within the batch) are skipped.
+        
+        Args:
+            listings_data: List of listing data dictionaries
+            
+        Returns:
+            Created listing ID for each input listing, or None if it was skipped
+        """
+        created: List[Optional[Listing]] = [None] * len(listings_data)
+        if not listings_data:
+            return []
+        
         try:
             with self.get_session() as session:
-                created_count = 0
-                
+                listings: List[Optional[Listing]] = []
                 for listing_data in listings_data:
-                    # Check for existing listing by URL
-                    existing = session.query(Listing).filter_by(
-                        url=listing_data["url"]
-                    ).first()
-                    
-                    if existing:
+                    missing = [f for f in ("provider", "title", "url") if not listing_data.get(f)]
+                    if missing:
+                        logger.warning(f"Skipping listing without {', '.join(missing)}")
+                        listings.append(None)
                         continue
                     
-                    # Create new listing
                     listing = Listing(
                         provider=listing_data["provider"],
                         external_id=listing_data.get("external_id"),
@@ -321,19 +560,81 @@ class CRUDOperations:
                         contacts=json.dumps(listing_data.get("contacts", [])),
                         raw_data=json.dumps(listing_data.get("raw_data", {})),
                     )
-                    
-                    # Generate hash signature
                     listing.update_hash_signature()
+                    listings.append(listing)
+                
+                valid = [listing for listing in listings if listing is not None]
+                seen_urls = self._existing_values(
+                    session, Listing.url, [listing.url for listing in valid]
+                )
+                seen_hashes = self._existing_values(
+                    session, Listing.hash_signature, [listing.hash_signature for listing in valid]
+                )
+                seen_external_ids = {
+                    (provider, external_id)
+                    for provider, external_id in self.query_in_chunks(
+                        session.query(Listing.provider, Listing.external_id),
+                        Listing.external_id,
+                        [listing.external_id for listing in valid if listing.external_id]
+                    )
+                }
+                
+                for index, listing in enumerate(listings):
+                    if listing is None:
+                        continue
+                    
+                    external_key = (listing.provider, listing.external_id)
+                    if (listing.url in seen_urls or listing.hash_signature in seen_hashes or
+                            (listing.external_id and external_key in seen_external_ids)):
+                        continue
                     
+                    seen_urls.add(listing.url)
+                    seen_hashes.add(listing.hash_signature)
+                    if listing.external_id:
+                        seen_external_ids.add(external_key)
+                    
+                    listing.update_numeric_fields()
+                    listing.update_blocking_keys()
                     session.add(listing)
-                    created_count += 1
+                    created[index] = listing
+                
+                session.flush()  # Get the IDs
                 
-                logger.info(f"Bulk created {created_count} listings")
-                return created_count
+                created_ids = [listing.id if listing else None for listing in created]
+                logger.info(f"Batch created {len(created_ids) - created_ids.count(None)} "
+                           f"of {len(listings_data)} listings")
+                return created_ids
                 
         except Exception as e:
-            logger.error(f"Error bulk creating listings: {e}")
-            return 0
+            logger.error(f"Error batch creating listings: {e}")
+            return [None] * len(listings_data)
+    
+    @staticmethod
+    def query_in_chunks(query: Any, column: Any, values: List[Any], chunk_size: int = 500) -> List[Any]:
+        """
+        Run ``query`` filtered by ``column IN values``.
+        
+        Values are de-duplicated and sent in chunks to stay below SQLite's
+        bound-parameter limit.
+        
+        Args:
+            query: Query to filter
+            column: Column to match
+            values: Values to look up (None values are ignored)
+            chunk_size: Maximum number of values per statement
+            
+        Returns:
+            All matching rows
+        """
+        rows = []
+        values = list(dict.fromkeys(v for v in values if v is not None))
+        for start in range(0, len(values), chunk_size):
+            rows.extend(query.filter(column.in_(values[start:start + chunk_size])).all())
+        return rows
+    
+    def _existing_values(self, session: Session, column: Any, values: List[Any]) -> Set[Any]:
+        """Return the subset of ``values`` already stored in ``column``."""
+        return {row[0] for row in self.query_in_chunks(session.query(column), column, values)}
     
     # Contact Operations
     def create_contact(self, listing_id: int, contact_data: Dict[str, Any]) -> Optional[Contact]:
@@ -392,6 +693,39 @@ class CRUDOperations:
             logger.error(f"Error creating contact: {e}")
             return None
     
+    def _build_contacts_query(
+        self,
+        session: Session,
+        listing_id: Optional[int] = None,
+        contact_type: Optional[ContactType] = None,
+        status: Optional[ContactStatus] = None,
+        validated_only: bool = False,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None
+    ):
+        """Build a filtered contacts query without ordering or pagination."""
+        query = session.query(Contact)
+        
+        if listing_id:
+            query = query.filter(Contact.listing_id == listing_id)
+        
+        if contact_type:
+            query = query.filter(Contact.type == contact_type)
+        
+        if status:
+            query = query.filter(Contact.status == status)
+        
+        if validated_only:
+            query = query.filter(Contact.status == ContactStatus.VALID)
+        
+        if min_confidence is not None:
+            query = query.filter(Contact.confidence >= min_confidence)
+        
+        if max_confidence is not None:
+            query = query.filter(Contact.confidence <= max_confidence)
+        
+        return query
+    
     def get_contacts(
         self,
         listing_id: Optional[int] = None,
@@ -415,19 +749,10 @@ class CRUDOperations:
         """
         try:
             with self.get_session() as session:
-                query = session.query(Contact)
-                
-                if listing_id:
-                    query = query.filter(Contact.listing_id == listing_id)
-                
-                if contact_type:
-                    query = query.filter(Contact.type == contact_type)
-                
-                if status:
-                    query = query.filter(Contact.status == status)
-                
-                if validated_only:
-                    query = query.filter(Contact.status == ContactStatus.VALID)
+                query = self._build_contacts_query(
+                    session, listing_id=listing_id, contact_type=contact_type,
+                    status=status, validated_only=validated_only
+                )
                 
                 query = query.order_by(Contact.created_at.desc())
                 query = query.limit(limit)
@@ -438,6 +763,74 @@ class CRUDOperations:
             logger.error(f"Error getting contacts: {e}")
             return []
     
+    def get_contacts_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        listing_id: Optional[int] = None,
+        contact_type: Optional[ContactType] = None,
+        status: Optional[ContactStatus] = None,
+        validated_only: bool = False,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get contacts newest first using keyset pagination on ``(created_at, id)``.
+        
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum number of results
+            listing_id: Filter by listing ID
+            contact_type: Filter by contact type
+            status: Filter by status
+            validated_only: Only validated contacts
+            min_confidence: Minimum confidence
+            max_confidence: Maximum confidence
+            
+        Returns:
+            Tuple of (contact dictionaries, cursor for the next page or None)
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        try:
+            with self.get_session() as session:
+                query = self._build_contacts_query(
+                    session, listing_id=listing_id, contact_type=contact_type,
+                    status=status, validated_only=validated_only,
+                    min_confidence=min_confidence, max_confidence=max_confidence
+                )
+                contacts, next_cursor = keyset_page(
+                    query, Contact.created_at, Contact.id, cursor, limit
+                )
+                return [contact.to_dict() for contact in contacts], next_cursor
+                
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting contacts by cursor: {e}")
+            return [], None
+    
+    def iter_contacts(self, batch_size: int = 500, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all matching contacts newest first, one keyset page at a time.
+        
+        Args:
+            batch_size: Number of contacts fetched per query
+            **filters: Filters accepted by :meth:`get_contacts_by_cursor`
+            
+        Yields:
+            Contact dictionaries
+        """
+        cursor = None
+        while True:
+            contacts, cursor = self.get_contacts_by_cursor(
+                cursor=cursor, limit=batch_size, **filters
+            )
+            yield from contacts
+            if not cursor:
+                break
+    
     def update_contact_status(self, contact_id: int, status: ContactStatus, 
                             validation_metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -588,6 +981,49 @@ class CRUDOperations:
             logger.error(f"Error getting scraping runs: {e}")
             return []
     
+    def get_scraping_runs_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        provider: Optional[str] = None,
+        status: Optional[JobStatus] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get scraping runs newest first using keyset pagination on ``(started_at, id)``.
+        
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Maximum results
+            provider: Filter by provider
+            status: Filter by status
+            
+        Returns:
+            Tuple of (scraping run dictionaries, cursor for the next page or None)
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        try:
+            with self.get_session() as session:
+                query = session.query(ScrapingRun)
+                
+                if provider:
+                    query = query.filter(ScrapingRun.provider == provider)
+                
+                if status:
+                    query = query.filter(ScrapingRun.status == status)
+                
+                runs, next_cursor = keyset_page(
+                    query, ScrapingRun.started_at, ScrapingRun.id, cursor, limit
+                )
+                return [run.to_dict() for run in runs], next_cursor
+                
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting scraping runs by cursor: {e}")
+            return [], None
+    
     # Statistics and Analytics
     def get_statistics(self) -> Dict[str, Any]:
         """
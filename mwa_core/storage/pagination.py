@@ -0,0 +1,121 @@
+"""
+Keyset (cursor) pagination helpers for MWA Core storage system.
+
+Pages are addressed by the ``(sort value, id)`` pair of the last row that was
+returned instead of a row offset, so every page is an index range scan no
+matter how deep the client has paged.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import String, and_, or_, type_coerce
+from sqlalchemy.orm import Query
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(sort_value: str, row_id: int) -> str:
+    """
+    Encode a keyset position as an opaque URL-safe cursor.
+
+    Args:
+        sort_value: Sort column value of the last row, as stored in the database
+        row_id: Primary key of the last row
+
+    Returns:
+        Opaque cursor string
+    """
+    payload = json.dumps([sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (sort value, row id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(sort_value, str) or not isinstance(row_id, int):
+            raise TypeError("unexpected cursor payload")
+        return sort_value, row_id
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def keyset_page(
+    query: Query,
+    sort_column: Any,
+    id_column: Any,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    descending: bool = True
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one keyset page from a query selecting a single entity.
+
+    The sort column is compared as the raw value stored in the database
+    (``type_coerce`` to ``String`` renders the bare column, so the index is
+    still used). This keeps the ``(sort value, id)`` tie-break exact even
+    for SQLite timestamps written without fractional seconds.
+
+    Args:
+        query: Filtered query selecting one entity
+        sort_column: Indexed column to page on (e.g. ``Listing.scraped_at``)
+        id_column: Primary key column used as the tie-breaker
+        cursor: Cursor returned with the previous page, or None for the first page
+        limit: Maximum number of rows in the page
+        descending: Page from newest to oldest
+
+    Returns:
+        Tuple of (entities, cursor for the next page or None when exhausted)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    sort_key = type_coerce(sort_column, String)
+
+    if cursor:
+        last_value, last_id = decode_cursor(cursor)
+        if descending:
+            query = query.filter(or_(
+                sort_key < last_value,
+                and_(sort_key == last_value, id_column < last_id)
+            ))
+        else:
+            query = query.filter(or_(
+                sort_key > last_value,
+                and_(sort_key == last_value, id_column > last_id)
+            ))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.add_columns(sort_key.label("cursor_value")).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows:
+        last_entity, last_value = rows[-1]
+        next_cursor = encode_cursor(last_value, last_entity.id)
+
+    return [entity for entity, _ in rows], next_cursor
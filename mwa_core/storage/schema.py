@@ -91,7 +91,7 @@ class DatabaseSchema:
             # Check for required tables
             required_tables = [
                 "listings", "contacts", "scraping_runs", "listing_scraping_runs",
-                "contact_validations", "job_store", "configuration", "backup_metadata"
+                "listing_blocking_keys", "contact_validations", "job_store", "configuration", "backup_metadata"
             ]
             
             existing_tables = inspector.get_table_names()
@@ -134,7 +134,8 @@ class DatabaseSchema:
                 "id", "provider", "external_id", "title", "url", "price", "size", 
                 "rooms", "address", "description", "images", "contacts", "scraped_at", 
                 "updated_at", "status", "raw_data", "hash_signature", "deduplication_status", 
-                "duplicate_of_id", "first_seen_at", "last_seen_at", "view_count"
+                "duplicate_of_id", "first_seen_at", "last_seen_at", "view_count",
+                "price_eur", "size_sqm", "rooms_num"
             ],
             "contacts": [
                 "id", "listing_id", "type", "value", "confidence", "source", "status", 
@@ -150,6 +151,9 @@ class DatabaseSchema:
             "listing_scraping_runs": [
                 "id", "listing_id", "scraping_run_id", "discovered_at"
             ],
+            "listing_blocking_keys": [
+                "id", "listing_id", "key"
+            ],
             "contact_validations": [
                 "id", "contact_id", "validation_method", "validation_result", 
                 "confidence_score", "validation_metadata", "validated_at", "validator_version"
@@ -174,7 +178,9 @@ class DatabaseSchema:
         expected_indexes = {
             "listings": [
                 "idx_listings_provider", "idx_listings_status", "idx_listings_scraped_at",
-                "idx_listings_provider_status", "idx_listings_hash_signature"
+                "idx_listings_provider_status", "idx_listings_hash_signature",
+                "idx_listings_status_price_eur", "idx_listings_status_size_sqm",
+                "idx_listings_status_rooms_num"
             ],
             "contacts": [
                 "idx_contacts_listing_id", "idx_contacts_type", "idx_contacts_status",
@@ -183,6 +189,9 @@ class DatabaseSchema:
             "scraping_runs": [
                 "idx_scraping_runs_provider", "idx_scraping_runs_status", 
                 "idx_scraping_runs_started_at", "idx_scraping_runs_provider_status"
+            ],
+            "listing_blocking_keys": [
+                "idx_listing_blocking_keys_key_listing", "idx_listing_blocking_keys_listing"
             ]
         }
         return expected_indexes.get(table_name, [])
@@ -330,6 +339,8 @@ class SchemaMigration:
                     
                     # Generate hash signature
                     listing.update_hash_signature()
+                    listing.update_numeric_fields()
+                    listing.update_blocking_keys()
                     
                     session.add(listing)
                     session.flush()  # Get the ID
@@ -0,0 +1,139 @@
+"""
+Text similarity backends for MWA Core deduplication.
+
+The deduplication engine scores one listing against many candidates. The
+``difflib`` backend keeps the original pairwise ``SequenceMatcher`` ratios;
+the ``trigram`` backend turns each string into a hashed character-trigram
+count vector once (cached) and scores all candidates with a single NumPy
+operation using the Dice coefficient ``2 * |A & B| / (|A| + |B|)``, which is
+on the same 0..1 scale as ``SequenceMatcher.ratio()``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Dict, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+class DifflibSimilarity:
+    """Pairwise ``difflib.SequenceMatcher`` ratios."""
+
+    name = "difflib"
+
+    def ratio(self, text: str, other: str) -> float:
+        """Similarity of two strings."""
+        return SequenceMatcher(None, text, other).ratio()
+
+    def ratios(self, text: str, others: Sequence[str]) -> List[float]:
+        """Similarity of ``text`` to each string in ``others``."""
+        return [SequenceMatcher(None, text, other).ratio() for other in others]
+
+
+class TrigramSimilarity:
+    """Vectorized character-trigram Dice similarity backed by NumPy."""
+
+    name = "trigram"
+
+    def __init__(self, dimensions: int = 1024, cache_size: int = 20000):
+        """
+        Initialize the trigram backend.
+
+        Args:
+            dimensions: Size of the hashed trigram vectors
+            cache_size: Maximum number of cached string vectors
+        """
+        if np is None:
+            raise ImportError("numpy is required for the trigram similarity backend")
+
+        self.dimensions = dimensions
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _vector(self, text: str) -> "np.ndarray":
+        """Hashed trigram count vector of a string (cached, LRU)."""
+        with self._lock:
+            vector = self._cache.get(text)
+            if vector is not None:
+                self._cache.move_to_end(text)
+                return vector
+
+        padded = f"  {text} "
+        buckets = [
+            zlib.crc32(padded[i:i + 3].encode("utf-8")) % self.dimensions
+            for i in range(len(padded) - 2)
+        ]
+        vector = np.bincount(buckets, minlength=self.dimensions).astype(np.float32)
+
+        with self._lock:
+            self._cache[text] = vector
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vector
+
+    def ratio(self, text: str, other: str) -> float:
+        """Similarity of two strings."""
+        return self.ratios(text, [other])[0]
+
+    def ratios(self, text: str, others: Sequence[str]) -> List[float]:
+        """Similarity of ``text`` to each string in ``others`` in one vector operation."""
+        if not others:
+            return []
+
+        query = self._vector(text)
+        matrix = np.vstack([self._vector(other) for other in others])
+
+        overlap = np.minimum(matrix, query).sum(axis=1)
+        total = matrix.sum(axis=1) + query.sum()
+        scores = np.divide(2.0 * overlap, total, out=np.zeros_like(total), where=total > 0)
+        return scores.tolist()
+
+
+_BACKENDS = {
+    DifflibSimilarity.name: DifflibSimilarity,
+    TrigramSimilarity.name: TrigramSimilarity,
+}
+_instances: Dict[str, object] = {}
+
+
+def get_similarity_backend(name: str):
+    """
+    Get the shared similarity backend instance for a configured name.
+
+    Unknown names, or ``trigram`` without NumPy installed, fall back to
+    ``difflib`` with a warning.
+
+    Args:
+        name: Backend name ("difflib" or "trigram")
+
+    Returns:
+        Backend instance providing ``ratio`` and ``ratios``
+    """
+    backend = _instances.get(name)
+    if backend is not None:
+        return backend
+
+    backend_class = _BACKENDS.get(name)
+    if backend_class is None:
+        logger.warning(f"Unknown similarity backend '{name}', using difflib")
+        backend_class = DifflibSimilarity
+
+    try:
+        backend = backend_class()
+    except ImportError as e:
+        logger.warning(f"{e}; using difflib")
+        backend = DifflibSimilarity()
+
+    _instances[name] = backend
+    return backend
@@ -450,4 +450,35 @@ class TestPerformance:
         
         # Thread safety assertions
         assert len(errors) == 0, f"Thread safety errors: {errors}"
-        assert len(results) == 10, f"Expected 10 successful runs, got {len(results)}"
\ No newline at end of file
+        assert len(results) == 10, f"Expected 10 successful runs, got {len(results)}"
+    
+    def test_dedup_similarity_backend_performance(self, large_listing_dataset):
+        """Benchmark vectorized trigram similarity against the difflib path."""
+        from mwa_core.storage.deduplication import DeduplicationEngine
+        
+        engine = DeduplicationEngine(Mock())
+        candidates = [
+            engine._with_numeric_fields(dict(listing, address=f"Teststraße {i}, 8033{i % 10} München"))
+            for i, listing in enumerate(large_listing_dataset[:500])
+        ]
+        query = dict(candidates[0], title="Test Apartment 0 in Munich 80330!")
+        
+        timings = {}
+        for backend in ("difflib", "trigram"):
+            engine.config["similarity_backend"] = backend
+            engine._calculate_similarity_scores(query, candidates)  # warm caches
+            
+            start_time = time.time()
+            for _ in range(5):
+                scores = engine._calculate_similarity_scores(query, candidates)
+            timings[backend] = (time.time() - start_time) / 5
+            
+            # Same decision with either backend
+            best = max(range(len(scores)), key=scores.__getitem__)
+            assert best == 0
+            assert scores[0] >= engine.config["fuzzy_match_threshold"]
+        
+        # Wall-clock comparisons are too noisy on shared runners to assert on,
+        # so the timings are only reported
+        print(f"\nSimilarity scoring, 1 x {len(candidates)} candidates: "
+              f"difflib {timings['difflib'] * 1000:.1f}ms, trigram {timings['trigram'] * 1000:.1f}ms")
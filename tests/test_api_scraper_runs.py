@@ -0,0 +1,146 @@
+"""
+Tests for background scraper runs started through the API.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers import scraper as scraper_router
+from mwa_core.config.settings import get_settings
+from mwa_core.orchestrator import Orchestrator, RunRegistry, RunStatus
+
+
+class SlowOrchestrator(Orchestrator):
+    """Orchestrator whose run scrapes two slow batches."""
+
+    def __init__(self, delay=0.2, error=None):
+        self.delay = delay
+        self.error = error
+        self.threads = []
+
+    def run(self, enabled_providers, config, progress=None):
+        self.threads.append(threading.current_thread().name)
+        for i, provider in enumerate(enabled_providers, start=1):
+            time.sleep(self.delay)
+            if self.error:
+                raise RuntimeError(self.error)
+            if progress:
+                progress({"provider": provider, "listings": 10, "new_listings": 4,
+                          "listings_scraped": 10 * i, "new_listings_total": 4 * i})
+                progress({"provider": provider, "provider_status": "completed",
+                          "listings_scraped": 10 * i, "new_listings_total": 4 * i})
+        return 4 * len(enabled_providers)
+
+
+def make_client(orchestrator, registry):
+    app = FastAPI()
+    app.include_router(scraper_router.router, prefix="/api/v1/scraper")
+    app.dependency_overrides[scraper_router.get_orchestrator_instance] = lambda: orchestrator
+    app.dependency_overrides[scraper_router.get_run_registry] = lambda: registry
+    app.dependency_overrides[get_settings] = lambda: SimpleNamespace(
+        scraper=SimpleNamespace(dict=lambda: {"timeout_seconds": 30}),
+        get_provider_config=lambda provider, overrides=None: {"timeout": 30},
+    )
+    return TestClient(app)
+
+
+def wait_for_run(client, run_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        run = client.get(f"/api/v1/scraper/runs/{run_id}").json()
+        if run["status"] in ("completed", "failed"):
+            return run
+        time.sleep(0.02)
+    raise AssertionError(f"Run {run_id} did not finish")
+
+
+def test_start_returns_before_run_finishes():
+    orchestrator = SlowOrchestrator(delay=0.3)
+    registry = RunRegistry()
+    broadcast = AsyncMock()
+
+    with patch.object(scraper_router.websocket_manager, "broadcast_scraper_progress", broadcast), \
+            make_client(orchestrator, registry) as client:
+        start = time.monotonic()
+        response = client.post("/api/v1/scraper/start",
+                               json={"providers": ["immoscout", "wg_gesucht"], "job_id": "run-1"})
+        assert time.monotonic() - start < 0.25
+        assert response.status_code == 202
+        assert response.json()["run_id"] == "run-1"
+        assert response.json()["status"] in ("pending", "running")
+
+        run = wait_for_run(client, "run-1")
+
+    assert run["status"] == "completed"
+    assert run["duration_seconds"] >= 0.55
+    assert run["results"]["new_listings"] == 8
+    assert run["results"]["listings_scraped"] == 20
+    providers = run["results"]["providers"]
+    assert providers["wg_gesucht"]["last_batch_seconds"] > providers["immoscout"]["last_batch_seconds"]
+    assert orchestrator.threads[0].startswith("scraper-run")
+
+    assert providers["immoscout"]["batches"] == 1
+    assert run["results"]["providers_done"] == {"immoscout": "completed", "wg_gesucht": "completed"}
+
+    statuses = [call.args[0]["status"] for call in broadcast.await_args_list]
+    assert statuses == ["running"] * 5 + ["completed"]
+    # Progress follows the providers that are done
+    assert [call.args[0]["progress"] for call in broadcast.await_args_list] == [0, 0, 50, 50, 100, 100]
+
+
+def test_failed_run_reports_error():
+    registry = RunRegistry()
+    with make_client(SlowOrchestrator(delay=0.01, error="blocked"), registry) as client:
+        run_id = client.post("/api/v1/scraper/start", json={"providers": ["immoscout"]}).json()["run_id"]
+        run = wait_for_run(client, run_id)
+
+    assert run["status"] == "failed"
+    assert run["error_details"] == ["blocked"]
+    assert run["duration_seconds"] is not None
+
+
+def test_unknown_run_and_duplicate_id():
+    registry = RunRegistry()
+    registry.create(["immoscout"], run_id="taken")
+    with make_client(SlowOrchestrator(), registry) as client:
+        assert client.get("/api/v1/scraper/runs/missing").status_code == 404
+        response = client.post("/api/v1/scraper/start",
+                               json={"providers": ["immoscout"], "job_id": "taken"})
+        assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_run_async_hands_progress_to_the_loop():
+    loop_thread = threading.current_thread()
+    seen = []
+
+    async def on_progress(event):
+        await asyncio.sleep(0.05)
+        seen.append((event["provider"], threading.current_thread() is loop_thread))
+
+    orchestrator = SlowOrchestrator(delay=0.05)
+    new_count = await orchestrator.run_async(["immoscout", "wg_gesucht"], {}, progress=on_progress)
+
+    assert new_count == 8
+    # Progress coroutines are awaited before run_async returns
+    assert seen == [("immoscout", True)] * 2 + [("wg_gesucht", True)] * 2
+
+
+def test_registry_evicts_oldest_finished_runs():
+    registry = RunRegistry(max_runs=2)
+    running = registry.create(["immoscout"])
+    running.start()
+    done = registry.create(["immoscout"])
+    done.complete(0)
+    latest = registry.create(["wg_gesucht"])
+
+    assert registry.get(done.run_id) is None
+    assert [run.run_id for run in registry.list_runs()] == [latest.run_id, running.run_id]
+    assert registry.list_runs(active_only=True)[-1].status == RunStatus.RUNNING
@@ -0,0 +1,126 @@
+"""
+Tests for the warm Selenium driver pool.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from mafa.driver import SeleniumDriverError, SeleniumDriverPool
+
+
+def make_factory():
+    """Driver factory returning healthy mock drivers; keeps track of created drivers."""
+    created = []
+
+    def factory():
+        driver = MagicMock(name=f"driver-{len(created)}")
+        driver.execute_script.return_value = 1
+        driver.window_handles = ["main"]
+        created.append(driver)
+        return driver
+
+    return factory, created
+
+
+def test_lease_reuses_warm_driver_and_resets_state():
+    factory, created = make_factory()
+    pool = SeleniumDriverPool(size=2, driver_factory=factory)
+
+    with pool.lease() as first:
+        first.get("https://example.com")
+    with pool.lease() as second:
+        pass
+
+    assert second is first
+    assert len(created) == 1
+    first.execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+    first.get.assert_called_with("about:blank")
+
+    metrics = pool.get_metrics()
+    assert metrics["created"] == 1
+    assert metrics["leases"] == 2
+    assert metrics["warm_leases"] == 1
+    assert metrics["idle"] == 1
+    assert metrics["leased"] == 0
+
+
+def test_warm_up_launches_drivers_ahead_of_leases():
+    factory, created = make_factory()
+    pool = SeleniumDriverPool(size=3, driver_factory=factory)
+
+    assert pool.warm_up(2) == 2
+    with pool.lease() as driver:
+        assert driver in created
+
+    metrics = pool.get_metrics()
+    assert metrics["created"] == 2
+    assert metrics["warm_lease_ratio"] == 1.0
+
+
+def test_driver_recycled_after_max_uses():
+    factory, created = make_factory()
+    pool = SeleniumDriverPool(size=1, max_uses=2, driver_factory=factory)
+
+    for _ in range(3):
+        with pool.lease():
+            pass
+
+    assert len(created) == 2
+    created[0].quit.assert_called_once()
+    assert pool.get_metrics()["recycled"] == 1
+
+
+def test_crashed_driver_replaced_but_healthy_one_kept_after_error():
+    factory, created = make_factory()
+    pool = SeleniumDriverPool(size=1, driver_factory=factory)
+
+    # A page timeout leaves the browser healthy: it goes back to the pool
+    with pytest.raises(TimeoutException):
+        with pool.lease():
+            raise TimeoutException("slow page")
+    assert pool.get_metrics()["idle"] == 1
+
+    # A crashed browser fails the health check and is replaced
+    with pytest.raises(WebDriverException):
+        with pool.lease() as driver:
+            driver.execute_script.side_effect = WebDriverException("chrome not reachable")
+            raise WebDriverException("chrome not reachable")
+    created[0].quit.assert_called_once()
+
+    with pool.lease() as driver:
+        assert driver is created[1]
+    assert pool.get_metrics()["crashed"] == 1
+
+
+def test_lease_waits_for_free_driver_and_times_out():
+    factory, created = make_factory()
+    pool = SeleniumDriverPool(size=1, driver_factory=factory)
+    leased = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.lease():
+            leased.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    leased.wait(5)
+
+    with pytest.raises(SeleniumDriverError):
+        with pool.lease(timeout=0.05):
+            pass
+
+    threading.Timer(0.05, release.set).start()
+    with pool.lease(timeout=5) as driver:
+        assert driver is created[0]
+    holder.join()
+
+    pool.close()
+    created[0].quit.assert_called_once()
+    with pytest.raises(SeleniumDriverError):
+        with pool.lease():
+            pass
@@ -0,0 +1,156 @@
+"""
+Tests for the on-disk response cache shared by crawler and discovery engine.
+"""
+
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from mwa_core.config.settings import Settings
+from mwa_core.contact.cache import HTTPResponseCache
+from mwa_core.contact.crawler import ContactCrawler
+from mwa_core.contact.discovery import ContactDiscoveryEngine
+from mwa_core.contact.models import DiscoveryContext
+from mwa_core.storage.http_cache import CachedHTTPResponse, HTTPCacheStore
+
+
+class Server:
+    """Mock server answering conditional requests."""
+
+    def __init__(self, pages, etag='"v1"', cache_control=None):
+        self.pages = pages
+        self.etag = etag
+        self.cache_control = cache_control
+        self.requests = []
+
+    def handler(self, request):
+        self.requests.append(request)
+        body = self.pages.get(str(request.url))
+        if body is None:
+            return httpx.Response(404, text="not found")
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        headers = {"content-type": "text/html; charset=iso-8859-1"}
+        if self.etag:
+            headers["etag"] = self.etag
+        if self.cache_control:
+            headers["cache-control"] = self.cache_control
+        return httpx.Response(200, headers=headers, content=body.encode("iso-8859-1"))
+
+    def client(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "http_cache.db")
+
+
+def expire_all(cache):
+    with cache.store.get_session() as session:
+        from mwa_core.storage.models import HTTPCacheRecord
+        session.query(HTTPCacheRecord).update({"expires_at": datetime.now() - timedelta(seconds=1)})
+
+
+@pytest.mark.asyncio
+async def test_fresh_hits_survive_restart(cache_path):
+    server = Server({"https://hv.de/kontakt": "Tel. 089 123, Grüße"})
+    async with server.client() as client:
+        first = await HTTPResponseCache(cache_path).get(client, "https://hv.de/kontakt")
+        restarted = HTTPResponseCache(cache_path)
+        second = await restarted.get(client, "https://HV.de/kontakt/")
+
+    assert len(server.requests) == 1
+    assert second.status_code == 200
+    assert second.text == first.text == "Tel. 089 123, Grüße"
+    assert restarted.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_revalidated(cache_path):
+    server = Server({"https://hv.de/": "<p>Impressum</p>"})
+    cache = HTTPResponseCache(cache_path)
+    async with server.client() as client:
+        await cache.get(client, "https://hv.de/")
+        expire_all(cache)
+        response = await cache.get(client, "https://hv.de/")
+        await cache.get(client, "https://hv.de/")
+
+    assert response.text == "<p>Impressum</p>"
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+    # The 304 renewed the entry, so the third lookup is a plain hit
+    assert len(server.requests) == 2
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["revalidated"], stats["hits"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_no_store_and_errors_are_not_cached(cache_path):
+    server = Server({"https://hv.de/private": "secret"}, cache_control="private, no-store")
+    cache = HTTPResponseCache(cache_path)
+    async with server.client() as client:
+        await cache.get(client, "https://hv.de/private")
+        await cache.get(client, "https://hv.de/private")
+        await cache.get(client, "https://hv.de/missing")
+        await cache.get(client, "https://hv.de/missing")
+
+    assert len(server.requests) == 4
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_store_evicts_least_recently_used(cache_path):
+    store = HTTPCacheStore(cache_path, max_entries=2, max_bytes=1000)
+    now = datetime.now()
+
+    def item(key, body="x"):
+        return CachedHTTPResponse(key=key, url=key, kind="page", status_code=200, headers=None,
+                                  body=body, etag=None, last_modified=None, fetched_at=now,
+                                  expires_at=now + timedelta(hours=1))
+
+    store.put(item("a"))
+    store.put(item("b"))
+    store.get("a")
+    assert store.put(item("c")) == 1
+    assert store.get("b") is None
+    assert store.get("a") is not None
+
+    # A large body pushes out older entries to stay within max_bytes
+    assert store.put(item("d", body="y" * 1000)) == 2
+    assert store.get_size() == {"entries": 1, "size_bytes": 1000}
+
+
+@pytest.mark.asyncio
+async def test_crawler_and_engine_share_cached_robots_and_pages(cache_path):
+    robots = "User-agent: *\nDisallow: /intern\n"
+    server = Server({"https://hv.de/robots.txt": robots,
+                     "https://hv.de/": '<a href="/kontakt">Kontakt</a><a href="/intern">Intern</a>',
+                     "https://hv.de/kontakt": "<p>Kontakt</p>"}, etag=None)
+
+    settings = Settings()
+    settings.contact_discovery.cache_path = cache_path
+    settings.contact_discovery.max_concurrent_requests = 1
+    settings.contact_discovery.rate_limit_seconds = 0.1
+
+    engine = ContactDiscoveryEngine(settings)
+    engine.crawler.session = server.client()
+    context = DiscoveryContext(base_url="https://hv.de/", domain="hv.de")
+    async with engine.crawler:
+        assert (await engine._fetch_url("https://hv.de/", context)).status_code == 200
+        await engine.crawler.crawl_for_contacts("https://hv.de/")
+
+    fetched = [str(request.url) for request in server.requests]
+    assert fetched.count("https://hv.de/") == 1
+    assert fetched.count("https://hv.de/robots.txt") == 1
+    assert "https://hv.de/intern" not in fetched
+
+    # A new crawler, e.g. in the next scheduler run, needs no requests
+    crawler = ContactCrawler(settings)
+    crawler.session = server.client()
+    async with crawler:
+        await crawler.crawl_for_contacts("https://hv.de/")
+    assert len(server.requests) == len(fetched)
+
+    info = engine.get_cache_info()["http_cache"]
+    assert info["entries"] == 3
+    assert info["hits"] >= 1
@@ -0,0 +1,148 @@
+"""
+Tests for the concurrent contact crawler frontier.
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+import pytest
+
+from mwa_core.config.settings import Settings
+from mwa_core.contact.crawler import ContactCrawler, CrawlFrontier, normalize_url
+from mwa_core.contact.models import DiscoveryContext
+from mwa_core.ratelimit import TokenBucketLimiter
+
+
+def page(*links, text=""):
+    anchors = "".join(f'<a href="{href}">{label}</a>' for href, label in links)
+    return f"<html><body><p>{text}</p>{anchors}</body></html>"
+
+
+class FakeSite:
+    """Serves pages by URL and records fetch order and concurrency."""
+
+    def __init__(self, pages, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.fetched = []
+        self.active = Counter()
+        self.max_active = Counter()
+        self.max_total = 0
+
+    async def handler(self, request):
+        host = request.url.host
+        self.fetched.append(str(request.url))
+        self.active[host] += 1
+        self.max_active[host] = max(self.max_active[host], self.active[host])
+        self.max_total = max(self.max_total, sum(self.active.values()))
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active[host] -= 1
+        html = self.pages.get(str(request.url))
+        if html is None:
+            return httpx.Response(404)
+        return httpx.Response(200, text=html)
+
+
+def make_crawler(site, workers=5, per_domain=2, rate=0):
+    settings = Settings()
+    settings.contact_discovery.respect_robots_txt = False
+    settings.contact_discovery.cache_enabled = False
+    settings.contact_discovery.max_concurrent_requests = workers
+    settings.contact_discovery.max_requests_per_domain = per_domain
+    # Extract on the event loop; these tests time fetching, not worker start-up
+    settings.contact_discovery.extraction_workers = 0
+    crawler = ContactCrawler(settings)
+    crawler.session = httpx.AsyncClient(transport=httpx.MockTransport(site.handler))
+    crawler.rate_limiter = TokenBucketLimiter(rate=rate)
+    return crawler
+
+
+def context_for(domains, max_depth=2):
+    return DiscoveryContext(base_url=f"https://{domains[0]}/", domain=domains[0],
+                            allowed_domains=list(domains), max_depth=max_depth)
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.com:443/kontakt/#team") == "https://example.com/kontakt"
+    assert normalize_url("http://example.com") == "http://example.com/"
+    assert normalize_url("https://example.com:8443/a?x=1") == "https://example.com:8443/a?x=1"
+
+
+@pytest.mark.asyncio
+async def test_frontier_prefers_priority_and_skips_busy_domains():
+    frontier = CrawlFrontier(max_per_domain=1)
+    frontier.add("https://a.example/low", 1, priority=1.0)
+    frontier.add("https://a.example/high", 1, priority=9.0)
+    frontier.add("https://b.example/mid", 1, priority=5.0)
+    assert frontier.add("https://A.example/high/", 1, priority=9.0) is False
+
+    assert await frontier.get() == ("https://a.example/high", 1)
+    # a.example is busy, so the next URL comes from b.example
+    assert await frontier.get() == ("https://b.example/mid", 1)
+
+    await frontier.task_done("https://a.example/high")
+    assert await frontier.get() == ("https://a.example/low", 1)
+    await frontier.task_done("https://b.example/mid")
+    await frontier.task_done("https://a.example/low")
+    assert await frontier.get() is None
+
+
+@pytest.mark.asyncio
+async def test_crawl_runs_domains_concurrently_within_slots():
+    domains = ["hausverwaltung-a.de", "hausverwaltung-b.de", "hausverwaltung-c.de"]
+    pages = {f"https://{domains[0]}/": page(*[(f"https://{d}/p{i}", f"page {i}")
+                                          for d in domains for i in range(4)])}
+    for d in domains:
+        for i in range(4):
+            pages[f"https://{d}/p{i}"] = page()
+    site = FakeSite(pages, delay=0.1)
+
+    async with make_crawler(site, workers=6, per_domain=2) as crawler:
+        start = time.monotonic()
+        _, _, stats = await crawler.crawl_for_contacts(f"https://{domains[0]}/", context_for(domains))
+        elapsed = time.monotonic() - start
+
+    assert stats.urls_crawled == 13
+    assert sorted(site.fetched) == sorted(pages)
+    assert max(site.max_active.values()) == 2
+    assert site.max_total > 2
+    # 13 pages of 0.1s each crawled sequentially would take 1.3s
+    assert elapsed < 0.9
+
+
+@pytest.mark.asyncio
+async def test_crawl_orders_by_link_score_and_deduplicates():
+    pages = {
+        "https://example.com/": page(("/gallery", "Bilder"), ("/kontakt", "Kontakt"),
+                                     ("/kontakt/", "Kontakt"), ("/kontakt#form", "Formular"),
+                                     ("https://example.com/impressum", "Impressum")),
+        "https://example.com/kontakt": page(text="vermieter@example.com"),
+        "https://example.com/impressum": page(text="info@example.com"),
+        "https://example.com/gallery": page(text="nothing here"),
+    }
+    site = FakeSite(pages)
+
+    async with make_crawler(site, workers=1, per_domain=1) as crawler:
+        await crawler.crawl_for_contacts("https://example.com/", context_for(["example.com"]))
+
+    fetched = [normalize_url(url) for url in site.fetched]
+    assert len(fetched) == len(set(fetched)) == 4
+    assert fetched[-1] == "https://example.com/gallery"
+
+
+@pytest.mark.asyncio
+async def test_crawl_respects_per_domain_rate():
+    pages = {"https://example.com/": page(*[(f"/p{i}", "x") for i in range(3)])}
+    pages.update({f"https://example.com/p{i}": page() for i in range(3)})
+    site = FakeSite(pages)
+
+    async with make_crawler(site, workers=4, per_domain=4, rate=10) as crawler:
+        start = time.monotonic()
+        await crawler.crawl_for_contacts("https://example.com/", context_for(["example.com"]))
+
+    # Four requests at 10 per second
+    assert time.monotonic() - start >= 0.28
@@ -0,0 +1,165 @@
+"""
+Tests for cached asynchronous MX lookups and concurrent contact validation.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import dns.exception
+import dns.resolver
+import pytest
+
+from mwa_core.config.settings import Settings
+from mwa_core.contact.models import Contact, ContactMethod, ConfidenceLevel
+from mwa_core.contact.mx import MXResolver
+from mwa_core.contact.validators import ContactValidator
+
+
+class FakeResolver:
+    """Stand-in for ``dns.asyncresolver.Resolver`` answering from a zone dict."""
+
+    def __init__(self, mx=None, a=(), missing=(), failing=(), ttl=600, delay=0.01):
+        self.mx = mx or {}
+        self.a = set(a)
+        self.missing = set(missing)
+        self.failing = set(failing)
+        self.ttl = ttl
+        self.delay = delay
+        self.queries = []
+
+    async def resolve(self, domain, rdtype, lifetime=None):
+        self.queries.append((domain, rdtype))
+        await asyncio.sleep(self.delay)
+        if domain in self.failing:
+            raise dns.exception.Timeout()
+        if domain in self.missing:
+            raise dns.resolver.NXDOMAIN()
+        if rdtype == "MX" and domain in self.mx:
+            records = [SimpleNamespace(preference=preference, exchange=host + ".")
+                       for preference, host in self.mx[domain]]
+            return FakeAnswer(records, self.ttl)
+        if rdtype == "A" and domain in self.a:
+            return FakeAnswer([SimpleNamespace(address="192.0.2.1")], self.ttl)
+        raise dns.resolver.NoAnswer()
+
+
+class FakeAnswer(list):
+    def __init__(self, records, ttl):
+        super().__init__(records)
+        self.rrset = SimpleNamespace(ttl=ttl)
+
+
+def email(value):
+    return Contact(method=ContactMethod.EMAIL, value=value, confidence=ConfidenceLevel.HIGH,
+                   source_url="https://example.com")
+
+
+@pytest.mark.asyncio
+async def test_lookup_orders_hosts_and_falls_back_to_a_record():
+    fake = FakeResolver(mx={"hv-huber.de": [(20, "mx2.hv-huber.de"), (10, "mx1.hv-huber.de")]},
+                        a={"makler-only-a.de"}, missing={"gibtsnicht.de"})
+    resolver = MXResolver(storage_path=None, resolver=fake)
+
+    mx = await resolver.lookup("HV-Huber.de")
+    implicit = await resolver.lookup("makler-only-a.de")
+    missing = await resolver.lookup("gibtsnicht.de")
+
+    assert mx.hosts == ["mx1.hv-huber.de", "mx2.hv-huber.de"] and mx.accepts_mail
+    assert implicit.hosts == ["makler-only-a.de"] and implicit.accepts_mail
+    assert missing.hosts == [] and not missing.accepts_mail
+
+
+@pytest.mark.asyncio
+async def test_ttl_is_clamped_and_failures_are_not_cached():
+    fake = FakeResolver(mx={"hv-huber.de": [(10, "mx.hv-huber.de")]}, failing={"flaky.de"}, ttl=5)
+    resolver = MXResolver(storage_path=None, resolver=fake, min_ttl=300)
+
+    result = await resolver.lookup("hv-huber.de")
+    assert (result.expires_at - result.resolved_at).total_seconds() == 300
+
+    assert await resolver.lookup("flaky.de") is None
+    assert await resolver.lookup("flaky.de") is None
+    assert fake.queries.count(("flaky.de", "MX")) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_of_a_domain_share_one_query():
+    fake = FakeResolver(mx={"gmx.de": [(10, "mx00.gmx.net")]}, delay=0.05)
+    resolver = MXResolver(storage_path=None, resolver=fake)
+
+    results = await asyncio.gather(*(resolver.lookup("gmx.de") for _ in range(20)))
+
+    assert fake.queries == [("gmx.de", "MX")]
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cache_is_shared_across_runs_on_disk(tmp_path):
+    path = str(tmp_path / "mx_cache.db")
+    fake = FakeResolver(mx={"web.de": [(100, "mx-ha03.web.de")]}, missing={"gibtsnicht.de"})
+    await MXResolver(storage_path=path, resolver=fake).lookup_many(["web.de", "gibtsnicht.de"])
+
+    second_fake = FakeResolver()
+    second = MXResolver(storage_path=path, resolver=second_fake)
+    results = await second.lookup_many(["web.de", "gibtsnicht.de"])
+
+    assert second_fake.queries == []
+    assert results["web.de"].hosts == ["mx-ha03.web.de"]
+    assert not results["gibtsnicht.de"].accepts_mail
+
+
+@pytest.mark.asyncio
+async def test_batch_resolves_each_domain_once():
+    domains = [f"hausverwaltung{i}.de" for i in range(50)]
+    fake = FakeResolver(mx={domain: [(10, f"mx.{domain}")] for domain in domains})
+    validator = ContactValidator(rate_limit_seconds=0, mx_resolver=MXResolver(storage_path=None, resolver=fake))
+    contacts = [email(f"kontakt{i}@{domains[i % 50]}") for i in range(1000)]
+
+    results = await validator.validate_contacts_batch(contacts, "standard")
+
+    assert len(fake.queries) == 50
+    assert all(result.is_valid for result in results)
+    assert [result.contact for result in results] == contacts
+
+
+@pytest.mark.asyncio
+async def test_batch_validates_concurrently_in_order():
+    fake = FakeResolver(mx={"hv.de": [(10, "mx.hv.de")]}, missing={"weg.de"})
+    validator = ContactValidator(rate_limit_seconds=0, max_concurrency=5,
+                                 mx_resolver=MXResolver(storage_path=None, resolver=fake))
+    active = []
+    peak = []
+    original = validator._validate_email
+
+    async def slow_validate(contact, level):
+        active.append(contact)
+        peak.append(len(active))
+        await asyncio.sleep(0.05)
+        active.remove(contact)
+        return await original(contact, level)
+
+    validator._validate_email = slow_validate
+    progress = []
+    contacts = [email(f"a{i}@hv.de") for i in range(9)] + [email("b@weg.de")]
+
+    start = time.monotonic()
+    results = await validator.validate_contacts_batch(
+        contacts, "standard", progress_callback=lambda pct, done, total: progress.append(done)
+    )
+
+    assert time.monotonic() - start < 0.4
+    assert max(peak) == 5
+    assert [result.is_valid for result in results] == [True] * 9 + [False]
+    assert progress == list(range(1, 11))
+
+
+def test_validator_from_settings(tmp_path):
+    settings = Settings()
+    settings.contact_discovery.validation_concurrency = 4
+    settings.contact_discovery.mx_cache_path = str(tmp_path / "mx_cache.db")
+
+    validator = ContactValidator.from_settings(settings.contact_discovery)
+
+    assert validator.max_concurrency == 4
+    assert validator.mx_resolver.storage_path == settings.contact_discovery.mx_cache_path
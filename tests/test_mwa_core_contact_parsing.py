@@ -0,0 +1,140 @@
+"""
+Parity tests for the contact crawler's HTML parser backends.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from bs4 import BeautifulSoup
+
+from mwa_core.config.settings import Settings
+from mwa_core.contact import parsing
+from mwa_core.contact.crawler import ContactCrawler
+from mwa_core.contact.extractors import EmailExtractor, FormExtractor, PhoneExtractor, SocialMediaExtractor
+from mwa_core.contact.models import DiscoveryContext
+from mwa_core.contact.parsing import LxmlPageParser, SoupPageParser, get_page_parser
+from mwa_core.ratelimit import TokenBucketLimiter
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+PAGES = sorted(path.name for path in FIXTURES.glob("*.html"))
+# libxml2 closes the <a> at the next table cell like a browser does, so the
+# link text differs from html.parser's
+MALFORMED = "contact_malformed.html"
+
+
+def parse_both(name):
+    html = (FIXTURES / name).read_text(encoding="utf-8")
+    return SoupPageParser().parse(html), LxmlPageParser().parse(html)
+
+
+def contacts(text):
+    settings = Settings()
+    context = SimpleNamespace(discovery_path=[], cultural_context="german")
+    url = "https://huber-hausverwaltung.de/kontakt"
+    found = EmailExtractor(settings).extract_emails(text, url, context)
+    found += PhoneExtractor(settings).extract_phones(text, url, context)
+    found += [profile.to_contact() for profile in SocialMediaExtractor(settings).extract_social_media(text, url, context)]
+    return [(contact.method, contact.value, contact.confidence) for contact in found]
+
+
+def analyzed(forms):
+    results = FormExtractor(Settings()).analyze_forms(forms, "https://huber-hausverwaltung.de/kontakt", None)
+    return [(form.action_url, form.method, form.fields, form.required_fields, form.csrf_token,
+             form.confidence, form.complexity_score, form.user_friendly_score, form.metadata) for form in results]
+
+
+@pytest.mark.parametrize("name", PAGES)
+def test_backends_agree_on_fixture_pages(name):
+    soup_page, lxml_page = parse_both(name)
+
+    # libxml2 drops the whitespace between the doctype and <html>
+    assert lxml_page.text.strip() == soup_page.text.strip()
+    assert lxml_page.forms == soup_page.forms
+    assert lxml_page.images == soup_page.images
+    if name != MALFORMED:
+        assert lxml_page.links == soup_page.links
+    assert [link.href for link in lxml_page.links] == [link.href for link in soup_page.links]
+    assert contacts(lxml_page.text) == contacts(soup_page.text)
+
+
+def test_contact_page_content():
+    _, page = parse_both("contact_hausverwaltung.html")
+
+    assert "analytics@tracker.example" not in page.text
+    assert "vorlage@" not in page.text
+    assert "alt@huber" not in page.text
+    assert "Leopoldstraße 1280802 München" in page.text
+    assert ("/wohnungen", "AktuelleWohnungen") in [(link.href, link.text) for link in page.links]
+
+    forms = analyzed(page.forms)
+    assert len(forms) == 1
+    action, method, fields, required, csrf, _, _, friendly, metadata = forms[0]
+    assert action == "https://huber-hausverwaltung.de/kontakt/senden"
+    assert method == "POST"
+    assert fields == ["csrf_token", "name", "email", "telefon", "nachricht", "betreff"]
+    assert required == ["name", "email"]
+    assert csrf == "abc123"
+    assert friendly == pytest.approx(1.0)
+    assert metadata["form_class"] == ["form", "form--kontakt"]
+
+
+@pytest.mark.parametrize("name", PAGES)
+def test_extract_forms_from_soup_matches_parsed_forms(name):
+    html = (FIXTURES / name).read_text(encoding="utf-8")
+    soup = BeautifulSoup(html, "html.parser")
+    context = DiscoveryContext(base_url="https://huber-hausverwaltung.de/", domain="huber-hausverwaltung.de")
+    from_soup = FormExtractor(Settings()).extract_forms(soup, "https://huber-hausverwaltung.de/kontakt", context)
+
+    assert [form.fields for form in from_soup] == [form[2] for form in analyzed(LxmlPageParser().parse(html).forms)]
+
+
+def test_get_page_parser(monkeypatch):
+    assert isinstance(get_page_parser(), LxmlPageParser)
+    assert isinstance(get_page_parser("html.parser"), SoupPageParser)
+    with pytest.raises(ValueError):
+        get_page_parser("selectolax")
+
+    monkeypatch.setattr(parsing, "LXML_AVAILABLE", False)
+    assert isinstance(get_page_parser("auto"), SoupPageParser)
+    assert isinstance(get_page_parser("lxml"), SoupPageParser)
+
+
+def test_lxml_failures_fall_back_to_beautifulsoup(monkeypatch):
+    def broken_parser(**kwargs):
+        raise RuntimeError("parser unavailable")
+
+    monkeypatch.setattr(parsing.etree, "HTMLParser", broken_parser)
+    page = LxmlPageParser().parse('<p>Tel. 089 1234567</p><a href="/kontakt">Kontakt</a>')
+
+    assert page.text == "Tel. 089 1234567Kontakt"
+    assert page.links[0].href == "/kontakt"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["lxml", "html.parser"])
+async def test_crawler_results_do_not_depend_on_backend(backend):
+    html = (FIXTURES / "contact_hausverwaltung.html").read_text(encoding="utf-8")
+
+    def handler(request):
+        return httpx.Response(200, text=html)
+
+    settings = Settings()
+    settings.contact_discovery.html_parser = backend
+    settings.contact_discovery.respect_robots_txt = False
+    settings.contact_discovery.cache_enabled = False
+    crawler = ContactCrawler(settings)
+    crawler.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    crawler.rate_limiter = TokenBucketLimiter(rate=0)
+    context = DiscoveryContext(base_url="https://huber-hausverwaltung.de/", domain="huber-hausverwaltung.de")
+
+    async with crawler:
+        result = await crawler._crawl_page("https://huber-hausverwaltung.de/kontakt", context)
+
+    assert crawler.extraction_pool.local_extractor.page_parser.name == backend
+    assert result.error is None
+    assert result.links_found[:2] == ["https://huber-hausverwaltung.de/kontakt/",
+                                      "https://huber-hausverwaltung.de/impressum"]
+    assert "https://andere-firma.de/kontakt" not in result.links_found
+    assert [form.action_url for form in result.forms] == ["https://huber-hausverwaltung.de/kontakt/senden"]
@@ -0,0 +1,113 @@
+"""
+Tests for the single-pass contact pattern scanner.
+"""
+
+import re
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mwa_core.config.settings import Settings
+from mwa_core.contact.extractors import EmailExtractor, PhoneExtractor, SocialMediaExtractor
+from mwa_core.contact.scanner import PatternScanner
+
+
+EMAIL_PATTERNS = [("standard", EmailExtractor.EMAIL_PATTERNS["standard"])] + [
+    ("obfuscated_text", pattern) for pattern in EmailExtractor.EMAIL_PATTERNS["obfuscated_text"]
+]
+
+CORPUS = [
+    "",
+    "Kontakt: verwaltung@huber-immobilien.de, a.b-c@d.e.de und first.last+tag@sub.domain-x.de",
+    "info [at] hv-muenchen.de oder team (at) makler.de bzw. office at verwaltung.de",
+    "max [dot] mustermann (dot) de; müller@hv.de; 0@0.de; x@y@z.de",
+    "mailto:Team@HV.de?subject=Hi vermieter@wohnung.de.",
+]
+
+
+def large_page(repeat=300):
+    filler = "Die Wohnung liegt zentral in Schwabing, Miete warm inklusive Nebenkosten, Besichtigung nach Vereinbarung. "
+    block = filler * 20 + "Kontakt: verwaltung@huber-immobilien.de, Tel. 089 1234567, facebook.com/huberimmobilien. "
+    return block * repeat
+
+
+def finditer_reference(patterns, text):
+    return [(name, match.span()) for name, pattern in patterns
+            for match in re.finditer(pattern, text, re.IGNORECASE)]
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_single_pass_matches_finditer_per_pattern(text):
+    normalized = EmailExtractor(Settings()).normalize_text(text)
+    for candidate in (text, normalized):
+        found = [(name, match.span()) for name, match in EmailExtractor.EMAIL_SCANNER.scan(candidate)]
+        assert found == finditer_reference(EMAIL_PATTERNS, candidate)
+
+
+def test_overlapping_matches_of_different_patterns_are_kept():
+    scanner = PatternScanner([("word", r"\b\w+\b"), ("pair", r"\b\w+ \w+\b")], trigger=r"\b\w")
+    found = [(name, match.group()) for name, match in scanner.scan("ab cd ef")]
+
+    assert found == [("word", "ab"), ("word", "cd"), ("word", "ef"), ("pair", "ab cd")]
+    assert scanner.scan_by_name("") == {"word": [], "pair": []}
+
+
+def test_normalize_text_resolves_obfuscations():
+    extractor = EmailExtractor(Settings())
+
+    assert extractor.normalize_text("  Mail:\n max [at] hv-muenchen [dot] de ") == "Mail: max@hv-muenchen.de"
+    assert extractor.normalize_text("anfrage (AT) makler (Dot) de") == "anfrage@makler.de"
+    assert extractor.normalize_text("x dot at y") == "x dot@y"
+    assert extractor.normalize_text("info&#64;hv&#46;de &amp; Co") == "info@hv.de & Co"
+    assert extractor.normalize_text("NoReply-Adresse: no-reply@hv.de") == "-Adresse: @hv.de"
+    assert extractor.normalize_text("Büro\xa0 München\tTel.") == "Büro München Tel."
+
+
+def test_extractors_results():
+    settings = Settings()
+    context = SimpleNamespace(discovery_path=[], cultural_context="german")
+    url = "https://huber-immobilien.de/kontakt"
+    page = ("Hausverwaltung Huber, Kontakt: verwaltung@huber-immobilien.de oder "
+            "info [at] huber-immobilien [dot] de. "
+            "<a href=\"mailto:Vermietung@Huber-Immobilien.de?subject=Anfrage\">Mail</a> "
+            "Tel. (089) 123 4567, mobil 0171 2345678, international +43 1 234 5678. "
+            "facebook.com/pages/HuberImmobilien linkedin.com/company/huber-verwaltung")
+
+    emails = EmailExtractor(settings).extract_emails(page, url, context)
+    assert [(c.method.value, c.value, c.metadata["extraction_pattern"]) for c in emails] == [
+        ("email", "verwaltung@huber-immobilien.de", "standard"),
+        ("email", "info@huber-immobilien.de", "standard"),
+        ("email", "vermietung@huber-immobilien.de", "standard"),
+        ("mailto", "Vermietung@Huber-Immobilien.de", "mailto_link"),
+    ]
+
+    phones = PhoneExtractor(settings).extract_phones(page, url, context)
+    assert [(c.value, c.metadata["extraction_pattern"]) for c in phones] == [
+        ("0891234567", "munich_local"),
+        ("01712345678", "german_mobile"),
+    ]
+
+    profiles = SocialMediaExtractor(settings).extract_social_media(page, url, context)
+    assert [(p.platform.value, p.username) for p in profiles] == [
+        ("facebook", "pages"), ("facebook", "HuberImmobilien"), ("linkedin", "huber-verwaltung"),
+    ]
+
+
+def test_single_pass_is_faster_on_large_pages():
+    text = EmailExtractor(Settings()).normalize_text(large_page())
+    compiled = [(name, re.compile(pattern, re.IGNORECASE)) for name, pattern in EMAIL_PATTERNS]
+
+    def best_of(runs, func):
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    per_pattern = best_of(3, lambda: [list(pattern.finditer(text)) for _, pattern in compiled])
+    single_pass = best_of(3, lambda: EmailExtractor.EMAIL_SCANNER.scan(text))
+
+    assert len(EmailExtractor.EMAIL_SCANNER.scan(text)) == 300
+    assert single_pass < per_pattern
@@ -0,0 +1,198 @@
+"""
+Tests for SMTP mailbox probing against a local SMTP stand-in.
+"""
+
+import socketserver
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from mwa_core.contact.models import Contact, ContactMethod, ConfidenceLevel
+from mwa_core.contact.smtp_probe import SMTPProber
+from mwa_core.contact.validators import ContactValidator
+from mwa_core.storage.mx_cache import CachedMXLookup
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal receiving SMTP server answering RCPT TO from a mailbox list."""
+
+    def reply(self, line):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost ESMTP test")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii").strip()
+            verb = command.split(" ")[0].upper()
+            server.commands.append(verb)
+
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif verb == "RCPT":
+                address = command.split("<", 1)[1].rstrip(">").lower()
+                server.recipients.append(address)
+                domain = address.rsplit("@", 1)[1]
+                if domain in server.catch_all or address in server.mailboxes:
+                    self.reply("250 OK")
+                elif address in server.greylisted:
+                    self.reply("450 Greylisted, try again later")
+                else:
+                    self.reply("550 No such user")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                # MAIL, RSET, NOOP
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.commands = []
+    server.recipients = []
+    server.mailboxes = {"vermietung@hv-huber.de", "info@hv-huber.de", "kontakt@makler-schmidt.de"}
+    server.catch_all = {"alles-an.de"}
+    server.greylisted = {"spaeter@hv-huber.de"}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class StaticMXResolver:
+    """MX resolver stand-in pointing every domain at the local server."""
+
+    def __init__(self, no_mail=()):
+        self.no_mail = set(no_mail)
+        self.lookups = []
+
+    async def lookup_many(self, domains):
+        self.lookups.extend(domains)
+        expires_at = datetime.now() + timedelta(hours=1)
+        return {domain: CachedMXLookup(domain=domain, accepts_mail=domain not in self.no_mail,
+                                       hosts=[] if domain in self.no_mail else ["127.0.0.1"],
+                                       expires_at=expires_at)
+                for domain in domains}
+
+    async def lookup(self, domain):
+        return (await self.lookup_many([domain]))[domain]
+
+
+def make_prober(server, **kwargs):
+    return SMTPProber(StaticMXResolver(kwargs.pop("no_mail", ())), port=server.server_address[1], **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_one_session_per_mail_host(smtp_server):
+    prober = make_prober(smtp_server)
+
+    verdicts = await prober.probe_many([
+        "Vermietung@hv-huber.de", "info@hv-huber.de", "gibtsnicht@hv-huber.de", "spaeter@hv-huber.de",
+        "kontakt@makler-schmidt.de", "weg@makler-schmidt.de",
+    ])
+    prober.shutdown()
+
+    assert {email: verdict.status for email, verdict in verdicts.items()} == {
+        "vermietung@hv-huber.de": "deliverable",
+        "info@hv-huber.de": "deliverable",
+        "gibtsnicht@hv-huber.de": "undeliverable",
+        "spaeter@hv-huber.de": "unknown",
+        "kontakt@makler-schmidt.de": "deliverable",
+        "weg@makler-schmidt.de": "undeliverable",
+    }
+    assert smtp_server.connections == 1
+    # One transaction per domain, each opened by a catch-all probe
+    assert smtp_server.commands.count("MAIL") == 2
+    assert smtp_server.commands.count("RCPT") == 8
+    assert verdicts["gibtsnicht@hv-huber.de"].code == 550
+
+
+@pytest.mark.asyncio
+async def test_catch_all_domains_are_detected_once(smtp_server):
+    prober = make_prober(smtp_server)
+
+    first = await prober.probe_many(["a@alles-an.de", "b@alles-an.de"])
+    second = await prober.probe_many(["c@alles-an.de"])
+    prober.shutdown()
+
+    assert {verdict.status for verdict in first.values()} == {"catch_all"}
+    assert second["c@alles-an.de"].status == "catch_all"
+    # Only the random catch-all probe reached the server
+    assert len(smtp_server.recipients) == 1
+    assert smtp_server.recipients[0].startswith("mwa-probe-")
+
+
+@pytest.mark.asyncio
+async def test_verdicts_are_cached_with_ttls(smtp_server):
+    prober = make_prober(smtp_server, verdict_ttl=3600, unknown_ttl=0)
+
+    await prober.probe_many(["info@hv-huber.de", "spaeter@hv-huber.de"])
+    rcpts = smtp_server.commands.count("RCPT")
+    cached = await prober.probe("info@hv-huber.de")
+    assert smtp_server.commands.count("RCPT") == rcpts
+    assert cached.is_deliverable
+
+    # Inconclusive verdicts expire at once; the domain is known not to be catch-all
+    await prober.probe("spaeter@hv-huber.de")
+    prober.shutdown()
+    assert smtp_server.commands.count("RCPT") == rcpts + 1
+    assert prober.get_stats()["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_recycled_after_recipient_limit(smtp_server):
+    prober = make_prober(smtp_server, max_recipients_per_session=3)
+
+    verdicts = await prober.probe_many([f"user{i}@hv-huber.de" for i in range(5)] + ["info@hv-huber.de"])
+    prober.shutdown()
+
+    assert smtp_server.connections == 3
+    assert verdicts["info@hv-huber.de"].is_deliverable
+    assert all(verdict.status == "undeliverable" for email, verdict in verdicts.items()
+               if email.startswith("user"))
+
+
+@pytest.mark.asyncio
+async def test_unreachable_host_and_domains_without_mail(smtp_server):
+    prober = make_prober(smtp_server, no_mail={"kein-mx.de"})
+    prober.port = 1  # nothing listens here
+
+    verdicts = await prober.probe_many(["info@hv-huber.de", "info@kein-mx.de"])
+    prober.shutdown()
+
+    assert verdicts["info@hv-huber.de"].status == "unknown"
+    assert verdicts["info@kein-mx.de"].status == "undeliverable"
+
+
+@pytest.mark.asyncio
+async def test_comprehensive_batch_validation_probes_together(smtp_server):
+    prober = make_prober(smtp_server)
+    validator = ContactValidator(enable_smtp_verification=True, rate_limit_seconds=0,
+                                 mx_resolver=prober.mx_resolver, smtp_prober=prober)
+
+    async def accepts_mail(domain):
+        return True
+
+    validator.mx_resolver.accepts_mail = accepts_mail
+    contacts = [Contact(method=ContactMethod.EMAIL, value=value, confidence=ConfidenceLevel.HIGH,
+                        source_url="https://hv-huber.de/kontakt")
+                for value in ("vermietung@hv-huber.de", "info@hv-huber.de", "x@alles-an.de")]
+
+    results = await validator.validate_contacts_batch(contacts, "comprehensive")
+    prober.shutdown()
+
+    assert smtp_server.connections == 1
+    assert [result.validation_method for result in results] == ["smtp", "smtp", "dns+smtp"]
+    assert results[2].metadata["smtp_status"] == "catch_all"
+    assert "Domain accepts any address (catch-all)" in results[2].warnings
@@ -0,0 +1,159 @@
+"""
+Tests for the contact extraction process pool.
+"""
+
+import asyncio
+import time
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from mwa_core.config.settings import Settings
+from mwa_core.contact.discovery import ContactDiscoveryEngine
+from mwa_core.contact.models import DiscoveryContext
+from mwa_core.contact.workers import ExtractionPool, PagePayload
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+URL = "https://huber-hausverwaltung.de/kontakt"
+
+
+def payload(html=None, methods=None):
+    html = html or (FIXTURES / "contact_hausverwaltung.html").read_text(encoding="utf-8")
+    context = SimpleNamespace(discovery_path=[], cultural_context="german")
+    if methods is None:
+        return PagePayload(url=URL, html=html, context=context)
+    return PagePayload(url=URL, html=html, context=context, methods=methods)
+
+
+def summary(extraction):
+    return ([(c.method, c.value, c.confidence, c.metadata) for c in extraction.contacts],
+            [(f.action_url, f.fields, f.required_fields, f.csrf_token) for f in extraction.forms],
+            [(p.platform, p.username) for p in extraction.social_profiles],
+            extraction.links, extraction.images)
+
+
+def large_page(repeat=500):
+    body = (FIXTURES / "contact_makler_impressum.html").read_text(encoding="utf-8")
+    return "<html><body>" + body * repeat + "</body></html>"
+
+
+async def longest_stall(coro):
+    """Run a coroutine and measure the longest gap between event loop ticks."""
+    gaps = []
+
+    async def heartbeat():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    try:
+        await coro
+        # Let the heartbeat record the gap the coroutine may have caused
+        await asyncio.sleep(0.02)
+    finally:
+        task.cancel()
+    return max(gaps)
+
+
+@pytest.mark.asyncio
+async def test_worker_results_match_in_process_extraction():
+    settings = Settings()
+    pool = ExtractionPool(settings, max_workers=1)
+    local = ExtractionPool(settings, max_workers=0)
+    try:
+        from_worker = await pool.extract(payload())
+        in_process = await local.extract(payload())
+        only_forms = await pool.extract(payload(methods=["form"]))
+    finally:
+        await pool.aclose()
+        await local.aclose()
+
+    assert summary(from_worker) == summary(in_process)
+    assert {"vermietung@huber-hausverwaltung.de", "01712345678"} <= {c.value for c in from_worker.contacts}
+    assert len(from_worker.forms) == 1
+    assert only_forms.contacts == [] and len(only_forms.forms) == 1
+
+
+@pytest.mark.asyncio
+async def test_extraction_in_workers_keeps_event_loop_responsive():
+    pool = ExtractionPool(Settings(), max_workers=1)
+    local = ExtractionPool(Settings(), max_workers=0)
+    page = payload(large_page())
+    try:
+        # Start the worker process before measuring
+        await pool.extract(payload())
+        in_process = await longest_stall(local.extract(page))
+        in_workers = await longest_stall(pool.extract(page))
+    finally:
+        await pool.aclose()
+        await local.aclose()
+
+    assert in_workers < in_process / 2
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_to_in_process_extraction(monkeypatch):
+    class BrokenExecutor:
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("worker killed")
+
+        def shutdown(self, **kwargs):
+            pass
+
+    pool = ExtractionPool(Settings(), max_workers=2)
+    monkeypatch.setattr(pool, "_get_executor", lambda: BrokenExecutor())
+
+    extraction = await pool.extract(payload())
+    await pool.aclose()
+
+    assert pool.max_workers == 0
+    assert len(extraction.forms) == 1
+
+
+def test_worker_count_setting():
+    settings = Settings()
+    settings.contact_discovery.extraction_workers = 3
+    assert ExtractionPool(settings).max_workers == 3
+
+    settings.contact_discovery.extraction_workers = None
+    assert ExtractionPool(settings).max_workers >= 1
+
+
+@pytest.mark.asyncio
+async def test_engine_hands_pages_to_the_extraction_pool(tmp_path):
+    html = (FIXTURES / "contact_makler_impressum.html").read_text(encoding="utf-8")
+    html += '<a href="/downloads/Preisliste.PDF">Preise</a>'
+
+    def handler(request):
+        return httpx.Response(200, text=html)
+
+    settings = Settings()
+    settings.contact_discovery.cache_path = str(tmp_path / "http_cache.db")
+    settings.contact_discovery.extraction_workers = 1
+    engine = ContactDiscoveryEngine(settings)
+    engine.crawler.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    engine.crawler.rate_limiter.rate = 0
+
+    requested = []
+
+    async def extract_from_pdf(pdf_url, source_url, context):
+        requested.append(pdf_url)
+        return []
+
+    engine.pdf_extractor.extract_from_pdf = extract_from_pdf
+    context = DiscoveryContext(base_url=URL, domain="huber-hausverwaltung.de",
+                               extraction_methods=["email", "form", "pdf"])
+    async with engine:
+        result = await engine._extract_from_url(URL, context)
+
+    assert result.source_url == URL
+    assert requested == ["https://huber-hausverwaltung.de/downloads/Preisliste.PDF"]
+    assert result.metadata["extraction_methods"] == ["email", "form", "pdf"]
@@ -0,0 +1,121 @@
+"""
+Tests for coalescing new listings into digest notifications.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mwa_core.notifier import (
+    BaseNotifier,
+    ListingDigest,
+    NotificationChannel,
+    NotificationManager,
+    NotificationResult,
+    NotificationStatus
+)
+from mwa_core.notifier.queue import message_from_payload
+from mwa_core.storage.models import NotificationQueueRecord
+
+
+class RecordingNotifier(BaseNotifier):
+    """Webhook-channel notifier recording message titles."""
+
+    def __init__(self):
+        super().__init__({"max_retries": 0}, name="recorder")
+        self.sent = []
+
+    async def send_notification(self, message):
+        self.sent.append(message.title)
+        return NotificationResult(message_id=message.id, status=NotificationStatus.SENT,
+                                  channel=message.channel)
+
+    def validate_config(self):
+        return True
+
+    def get_channel_type(self):
+        return NotificationChannel.WEBHOOK
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield str(Path(tmp) / "queue.db")
+
+
+def make_manager(db_path, notifier, **digest_config):
+    manager = NotificationManager({"queue": {"path": db_path, "retry_base_delay": 0},
+                                   "digest": digest_config})
+    manager.register_notifier(notifier)
+    return manager
+
+
+def listing(i):
+    return {"title": f"Wohnung {i}", "price": f"{1000 + i} €", "source": "immoscout",
+            "url": f"https://www.immobilienscout24.de/expose/{i}"}
+
+
+def queued_listings(manager):
+    with manager.get_queue().store.get_session() as session:
+        rows = session.query(NotificationQueueRecord).order_by(NotificationQueueRecord.id).all()
+        return [[listing["title"] for listing in message_from_payload(r.payload).template_data["listings"]]
+                for r in rows]
+
+
+@pytest.mark.asyncio
+async def test_runs_within_window_coalesce_into_one_message(db_path):
+    notifier = RecordingNotifier()
+    manager = make_manager(db_path, notifier, window=0.3)
+
+    manager.queue_new_listings([listing(1), listing(2)])
+    manager.queue_new_listings([listing(2), listing(3)])
+
+    assert queued_listings(manager) == [["Wohnung 1", "Wohnung 2", "Wohnung 3"]]
+    # Nothing is sent before the window ends
+    assert await manager.deliver_queued_notifications() == []
+
+    await asyncio.sleep(0.35)
+    results = await manager.deliver_queued_notifications()
+
+    assert [r.is_successful for r in results] == [True]
+    assert notifier.sent == ["New Listings Found (3)"]
+    stats = manager.get_delivery_stats()["digest"]
+    assert stats["listings"] == 3
+    assert stats["duplicates"] == 1
+    assert stats["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_digests_are_split_and_sent_immediately(db_path):
+    notifier = RecordingNotifier()
+    manager = make_manager(db_path, notifier, window=60, limits={"webhook": {"max_listings": 2}})
+
+    manager.queue_new_listings([listing(i) for i in range(3)])
+    manager.queue_new_listings([listing(3), listing(4)])
+
+    assert queued_listings(manager) == [["Wohnung 0", "Wohnung 1"], ["Wohnung 2", "Wohnung 3"],
+                                        ["Wohnung 4"]]
+    await manager.deliver_queued_notifications()
+    assert notifier.sent == ["New Listings Found (2)", "New Listings Found (2)"]
+    assert manager.get_queue().get_stats()["pending"] == 1
+
+
+def test_listings_are_not_notified_twice(db_path):
+    manager = make_manager(db_path, RecordingNotifier())
+
+    assert len(manager.queue_new_listings([listing(1)])) == 1
+    assert manager.queue_new_listings([listing(1)]) == []
+    assert len(manager.queue_new_listings([listing(1), listing(2)])) == 1
+    assert queued_listings(manager) == [["Wohnung 1"], ["Wohnung 2"]]
+
+
+def test_split_respects_character_limit():
+    listings = [listing(i) for i in range(6)]
+    size = len(ListingDigest.render(listings[:1]).content) + 1
+
+    chunks = ListingDigest.split(listings, {"max_listings": 10, "max_characters": 2 * size})
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 2]
+    assert all(len(ListingDigest.render(chunk).content) <= 2 * size for chunk in chunks)
@@ -0,0 +1,88 @@
+"""
+Tests for the shared HTTP client registry used by webhook-based notifiers.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mwa_core.notifier import NotificationManager, NotificationMessage, NotificationType, WebhookNotifier
+from mwa_core.notifier.http import HttpClientRegistry
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    """Keep-alive webhook endpoint recording received payloads."""
+
+    protocol_version = "HTTP/1.1"
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        type(self).received.append(json.loads(body))
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_url():
+    WebhookHandler.received = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/hook"
+    server.shutdown()
+    server.server_close()
+
+
+def make_message(i):
+    return NotificationMessage(type=NotificationType.SYSTEM_ALERT, title=f"Alert {i}", content=f"Message {i}")
+
+
+@pytest.mark.asyncio
+async def test_manager_notifiers_reuse_pooled_connections(webhook_url):
+    manager = NotificationManager({"http_pool": {"max_keepalive_connections": 2}})
+    manager.register_notifier(WebhookNotifier({"url": webhook_url, "verify_ssl": False}, name="hook"))
+
+    for i in range(4):
+        results = await manager.send_notification(make_message(i))
+        assert results[0].is_successful, results[0].error_message
+
+    assert len(WebhookHandler.received) == 4
+    stats = manager.get_delivery_stats()["http_connections"]
+    assert stats["requests"] == 4
+    assert stats["new_connections"] == 1
+    assert stats["connection_reuse_rate"] == 0.75
+    assert stats["clients_created"] == 1
+
+    await manager.aclose()
+    assert manager.get_delivery_stats()["http_connections"]["open_clients"] == 0
+
+
+@pytest.mark.asyncio
+async def test_standalone_notifier_uses_one_off_client(webhook_url):
+    notifier = WebhookNotifier({"url": webhook_url})
+
+    result = await notifier.send_notification(make_message(1))
+
+    assert result.is_successful, result.error_message
+    assert notifier.http_clients is None
+
+
+@pytest.mark.asyncio
+async def test_registry_keys_clients_by_origin_and_tls_verification():
+    registry = HttpClientRegistry({"http2": False})
+
+    first = registry.get_client("https://discord.com/api/webhooks/1/a")
+    assert registry.get_client("https://discord.com/api/webhooks/2/b") is first
+    assert registry.get_client("https://hooks.slack.com/services/x") is not first
+    assert registry.get_client("https://discord.com/other", verify=False) is not first
+    assert registry.get_stats()["open_clients"] == 3
+
+    await registry.aclose()
+    assert first.is_closed
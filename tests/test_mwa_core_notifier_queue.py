@@ -0,0 +1,231 @@
+"""
+Tests for the durable notification queue.
+"""
+
+import asyncio
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from mwa_core.notifier import (
+    BaseNotifier,
+    NotificationChannel,
+    NotificationManager,
+    NotificationMessage,
+    NotificationPriority,
+    NotificationQueueFull,
+    NotificationResult,
+    NotificationStatus,
+    NotificationType
+)
+from mwa_core.orchestrator import Orchestrator
+from mwa_core.scraper import Listing
+
+
+class RecordingNotifier(BaseNotifier):
+    """Webhook-channel notifier recording titles and failing on demand."""
+
+    def __init__(self, name="recorder", failures=0, delay=0.0):
+        super().__init__({"max_retries": 0, "retry_delay": 0}, name=name)
+        self.sent = []
+        self.failures = failures
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def send_notification(self, message):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.failures:
+            self.failures -= 1
+            return NotificationResult(message_id=message.id, status=NotificationStatus.FAILED,
+                                      channel=message.channel, error_message="503 from webhook")
+        self.sent.append(message.title)
+        return NotificationResult(message_id=message.id, status=NotificationStatus.SENT,
+                                  channel=message.channel)
+
+    def validate_config(self):
+        return True
+
+    def get_channel_type(self):
+        return NotificationChannel.WEBHOOK
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield str(Path(tmp) / "queue.db")
+
+
+def make_manager(db_path, notifier, **queue_config):
+    manager = NotificationManager({"queue": {"path": db_path, "retry_base_delay": 0, **queue_config}})
+    manager.register_notifier(notifier)
+    return manager
+
+
+def make_message(title, priority=NotificationPriority.NORMAL):
+    return NotificationMessage(type=NotificationType.SYSTEM_ALERT, title=title,
+                               content=title, priority=priority)
+
+
+@pytest.mark.asyncio
+async def test_queued_messages_survive_restart_and_follow_priority(db_path):
+    producer = make_manager(db_path, RecordingNotifier())
+    for title, priority in [("low", NotificationPriority.LOW), ("normal", NotificationPriority.NORMAL),
+                            ("urgent", NotificationPriority.URGENT), ("high", NotificationPriority.HIGH)]:
+        assert len(producer.enqueue_notification(make_message(title, priority))) == 1
+    assert producer.get_queue().get_stats()["pending"] == 4
+
+    # A new process with the same configuration delivers the backlog
+    notifier = RecordingNotifier()
+    consumer = make_manager(db_path, notifier, workers_per_channel=1)
+    results = await consumer.deliver_queued_notifications()
+
+    assert notifier.sent == ["urgent", "high", "normal", "low"]
+    assert all(r.is_successful for r in results)
+    stats = consumer.get_delivery_stats()["queue"]
+    assert stats["pending"] == 0
+    assert stats["by_status"] == {"sent": 4}
+
+
+@pytest.mark.asyncio
+async def test_queued_deliveries_respect_the_global_cap(db_path):
+    from mwa_core.notifier.manager import RateLimiter
+
+    notifier = RecordingNotifier()
+    manager = make_manager(db_path, notifier, workers_per_channel=1)
+    manager.rate_limiter = RateLimiter(max_requests=2, time_window=1)
+    for title in ("one", "two", "three"):
+        manager.enqueue_notification(make_message(title))
+
+    start = time.monotonic()
+    await manager.deliver_queued_notifications()
+
+    assert notifier.sent == ["one", "two", "three"]
+    # The third message waits for the first to leave the window
+    assert time.monotonic() - start >= 0.9
+
+
+@pytest.mark.asyncio
+async def test_failed_deliveries_are_retried_then_persisted(db_path):
+    notifier = RecordingNotifier(failures=1)
+    manager = make_manager(db_path, notifier, max_attempts=2)
+    manager.enqueue_notification(make_message("flaky"))
+
+    await manager.deliver_queued_notifications()
+    assert notifier.sent == ["flaky"]
+    stats = manager.get_queue().get_stats()
+    assert stats["retried"] == 1
+    assert stats["delivered"] == 1
+
+    broken = RecordingNotifier(name="broken", failures=10)
+    manager = make_manager(db_path, broken, max_attempts=2)
+    manager.enqueue_notification(make_message("down"))
+    await manager.deliver_queued_notifications()
+    assert manager.get_queue().get_stats()["by_status"]["failed"] == 1
+
+    # Failed rows outlive the manager and can be retried later
+    fixed = RecordingNotifier(name="broken")
+    restarted = make_manager(db_path, fixed)
+    results = await restarted.retry_failed_notifications()
+    assert fixed.sent == ["down"]
+    assert [r.is_successful for r in results] == [True]
+
+
+@pytest.mark.asyncio
+async def test_workers_bound_concurrency_and_stop_on_close(db_path):
+    notifier = RecordingNotifier(delay=0.05)
+    manager = make_manager(db_path, notifier, workers_per_channel=2, poll_interval=0.05)
+    manager.start_queue_workers()
+
+    for i in range(5):
+        manager.enqueue_notification(make_message(f"m{i}"))
+
+    for _ in range(100):
+        if len(notifier.sent) == 5:
+            break
+        await asyncio.sleep(0.02)
+
+    assert sorted(notifier.sent) == [f"m{i}" for i in range(5)]
+    assert notifier.max_active == 2
+    await manager.aclose()
+    assert manager.get_queue().get_stats()["workers"] == 0
+
+
+def test_enqueue_applies_backpressure(db_path):
+    manager = make_manager(db_path, RecordingNotifier(), max_pending=2)
+    manager.enqueue_notification(make_message("one"))
+    manager.enqueue_notification(make_message("two"))
+
+    with pytest.raises(NotificationQueueFull):
+        manager.enqueue_notification(make_message("three"))
+
+
+def test_orchestrator_enqueues_and_delivers_after_the_run(db_path):
+    notifier = RecordingNotifier()
+    manager = make_manager(db_path, notifier, retry_base_delay=3600)
+    listing = Listing(title="2-Zimmer in Sendling", price="1.100 €", source="wg_gesucht",
+                      url="https://www.wg-gesucht.de/1.html", timestamp=datetime.utcnow())
+
+    scraper = MagicMock()
+    scraper.stream_all.side_effect = lambda providers, config, on_provider_done=None: iter([("wg_gesucht", [listing])])
+    storage = MagicMock()
+    storage.add_listings_batch.return_value = [True]
+    settings = MagicMock()
+    settings.notification = None
+    settings.contact_discovery.enabled = False
+
+    orchestrator = Orchestrator(scraper=scraper, storage_manager=storage,
+                                notification_manager=manager, settings=settings)
+
+    assert orchestrator.run(["wg_gesucht"], {}) == 1
+    assert notifier.sent == ["New Listings Found (1)"]
+
+    # A failed delivery does not fail the run; the retry stays persisted
+    notifier.failures = 1
+    scraper.stream_all.side_effect = RuntimeError("provider crashed")
+    with pytest.raises(RuntimeError):
+        orchestrator.run(["wg_gesucht"], {})
+
+    assert manager.get_queue().get_stats()["by_status"] == {"sent": 1, "pending": 1}
+
+
+def test_orchestrator_notifies_while_still_scraping(db_path):
+    notifier = RecordingNotifier()
+    manager = make_manager(db_path, notifier, poll_interval=0.05)
+    seen_during_run = []
+
+    def stream_all(providers, config, on_provider_done=None):
+        for i in range(2):
+            yield "wg_gesucht", [Listing(title=f"Wohnung {i}", price="900 €", source="wg_gesucht",
+                                         url=f"https://www.wg-gesucht.de/{i}.html",
+                                         timestamp=datetime.utcnow())]
+            # The previous page is announced before the next one is scraped
+            for _ in range(100):
+                if len(notifier.sent) > i:
+                    break
+                time.sleep(0.02)
+            seen_during_run.append(len(notifier.sent))
+
+    scraper = MagicMock()
+    scraper.stream_all.side_effect = stream_all
+    storage = MagicMock()
+    storage.add_listings_batch.side_effect = lambda listings: [True] * len(listings)
+    settings = MagicMock()
+    settings.notification = None
+    settings.contact_discovery.enabled = False
+
+    orchestrator = Orchestrator(scraper=scraper, storage_manager=storage,
+                                notification_manager=manager, settings=settings)
+
+    assert orchestrator.run(["wg_gesucht"], {}) == 2
+    assert seen_during_run == [1, 2]
+    assert notifier.sent == ["New Listings Found (1)", "New Listings Found (1)"]
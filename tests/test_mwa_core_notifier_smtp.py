@@ -0,0 +1,150 @@
+"""
+Tests for the pooled SMTP sessions used by the email notifier.
+"""
+
+import socketserver
+import threading
+from email.message import EmailMessage
+
+import pytest
+
+from mwa_core.notifier import EmailNotifier, NotificationManager, NotificationMessage, NotificationType
+from mwa_core.notifier.smtp import SMTPConnectionPool
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP server recording connections, logins and messages."""
+
+    def reply(self, line):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost ESMTP test")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii").strip().upper()
+            server.commands.append(command.split(" ")[0])
+
+            if command.startswith("EHLO"):
+                self.reply("250-localhost")
+                self.reply("250 AUTH PLAIN")
+            elif command.startswith("AUTH"):
+                server.logins += 1
+                self.reply("235 Authentication successful")
+            elif command.startswith("MAIL"):
+                if server.fail_next_mail:
+                    server.fail_next_mail = False
+                    self.reply("421 Service closing transmission channel")
+                    return
+                self.reply("250 OK")
+            elif command.startswith("RCPT"):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                server.messages += 1
+                self.reply("250 OK queued")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                # NOOP, RSET
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPHandler)
+    server.daemon_threads = True
+    server.connections = server.logins = server.messages = 0
+    server.commands = []
+    server.fail_next_mail = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def email_config(server):
+    return {
+        "smtp_server": "127.0.0.1",
+        "smtp_port": server.server_address[1],
+        "username": "mwa@example.com",
+        "password": "secret",
+        "use_tls": False,
+        "recipients": ["user@example.com"],
+        "use_html": False,
+    }
+
+
+def email(i):
+    msg = EmailMessage()
+    msg["Subject"] = f"Listing {i}"
+    msg["From"] = "mwa@example.com"
+    msg.set_content(f"Wohnung {i}")
+    return msg
+
+
+def make_message(i):
+    return NotificationMessage(type=NotificationType.NEW_LISTINGS, title=f"Listing {i}", content=f"Wohnung {i}")
+
+
+@pytest.mark.asyncio
+async def test_manager_reuses_authenticated_connection(smtp_server):
+    manager = NotificationManager()
+    manager.register_notifier(EmailNotifier(email_config(smtp_server), name="email"))
+
+    for i in range(3):
+        results = await manager.send_notification(make_message(i))
+        assert results[0].is_successful, results[0].error_message
+
+    assert smtp_server.messages == 3
+    assert smtp_server.connections == 1
+    assert smtp_server.logins == 1
+    stats = manager.get_delivery_stats()["smtp_connections"]
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
+    assert stats["messages_per_connection"] == 3
+
+    await manager.aclose()
+    assert manager.get_delivery_stats()["smtp_connections"]["idle_connections"] == 0
+    assert smtp_server.commands[-1] == "QUIT"
+
+
+@pytest.mark.asyncio
+async def test_standalone_batch_sends_over_one_connection(smtp_server):
+    notifier = EmailNotifier(email_config(smtp_server))
+
+    results = await notifier.send_batch([make_message(i) for i in range(4)])
+
+    assert all(r.is_successful for r in results)
+    assert smtp_server.messages == 4
+    assert smtp_server.connections == 1
+    assert notifier.smtp_pool is None
+
+
+def test_reconnects_on_421_and_noop_checks_idle_connections(smtp_server):
+    notifier = EmailNotifier(email_config(smtp_server))
+    pool = SMTPConnectionPool({"noop_after": 0})
+    pool.send_message(notifier.smtp_settings, email(1), ["user@example.com"])
+    smtp_server.fail_next_mail = True
+    errors = pool.send_messages(notifier.smtp_settings, [(email(i), ["user@example.com"]) for i in (2, 3)])
+
+    assert errors == [None, None]
+    assert smtp_server.messages == 3
+    assert smtp_server.connections == 2
+    assert "NOOP" in smtp_server.commands
+    stats = pool.get_stats()
+    assert stats["reconnects"] == 1
+    assert stats["noop_checks"] == 1
+    assert stats["messages_sent"] == 3
+    assert stats["messages_failed"] == 0
+
+    pool.close()
@@ -0,0 +1,156 @@
+"""
+Tests for the keyed token-bucket rate limiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from mwa_core.contact.validators import ContactValidator
+from mwa_core.contact.models import ConfidenceLevel, Contact, ContactMethod
+from mwa_core.notifier import (
+    BaseNotifier,
+    NotificationChannel,
+    NotificationManager,
+    NotificationMessage,
+    NotificationResult,
+    NotificationStatus,
+    NotificationType
+)
+from mwa_core.ratelimit import TokenBucketLimiter, parse_retry_after
+
+
+class ThrottledNotifier(BaseNotifier):
+    """Discord-channel notifier answering 429 with a Retry-After hint."""
+
+    def __init__(self, retry_after, limited=1, config=None):
+        super().__init__({"max_retries": 2, "retry_delay": 0, **(config or {})}, name="throttled")
+        self.webhook_url = "https://discord.com/api/webhooks/1/abc"
+        self.retry_after = retry_after
+        self.limited = limited
+        self.attempts = []
+
+    async def send_notification(self, message):
+        self.attempts.append(time.monotonic())
+        if self.limited:
+            self.limited -= 1
+            return NotificationResult(message_id=message.id, status=NotificationStatus.FAILED,
+                                      channel=message.channel, error_message="Rate limited",
+                                      response_data={"retry_after": self.retry_after})
+        return NotificationResult(message_id=message.id, status=NotificationStatus.SENT,
+                                  channel=message.channel)
+
+    def validate_config(self):
+        return True
+
+    def get_channel_type(self):
+        return NotificationChannel.DISCORD
+
+
+def make_message():
+    return NotificationMessage(type=NotificationType.SYSTEM_ALERT, title="t", content="c")
+
+
+def test_burst_then_steady_rate():
+    limiter = TokenBucketLimiter(rate=10, burst=3)
+
+    waits = [limiter.reserve("a") for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1, abs=0.01)
+    assert waits[4] == pytest.approx(0.2, abs=0.01)
+    assert limiter.try_acquire("a") is False
+    assert limiter.get_stats()["throttled"] == 2
+
+
+def test_zero_rate_never_waits():
+    limiter = TokenBucketLimiter(rate=0)
+    assert all(limiter.reserve("a") == 0.0 for _ in range(100))
+
+
+@pytest.mark.asyncio
+async def test_keys_do_not_block_each_other():
+    limiter = TokenBucketLimiter(rate=5)
+    limiter.reserve("slow.example")
+
+    start = time.monotonic()
+    await asyncio.gather(limiter.acquire("slow.example"), limiter.acquire("fast.example"))
+    assert time.monotonic() - start == pytest.approx(0.2, abs=0.08)
+
+    start = time.monotonic()
+    await limiter.acquire("other.example")
+    assert time.monotonic() - start < 0.05
+
+
+def test_penalize_pushes_back_next_slot():
+    limiter = TokenBucketLimiter(rate=0)
+    limiter.penalize("webhook", 0.5)
+
+    assert limiter.reserve("webhook") == pytest.approx(0.5, abs=0.05)
+    assert limiter.reserve("unrelated") == 0.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"Retry-After": "2.5"}) == 2.5
+    assert parse_retry_after({"X-RateLimit-Reset-After": "0.75"}) == 0.75
+    assert parse_retry_after({}, default=60.0) == 60.0
+    assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+
+
+@pytest.mark.asyncio
+async def test_send_with_retry_honours_retry_after():
+    notifier = ThrottledNotifier(retry_after=0.3)
+
+    result = await notifier.send_with_retry(make_message())
+
+    assert result.is_successful
+    assert len(notifier.attempts) == 2
+    assert notifier.attempts[1] - notifier.attempts[0] >= 0.28
+
+
+@pytest.mark.asyncio
+async def test_long_retry_after_is_returned_to_caller():
+    notifier = ThrottledNotifier(retry_after=120, config={"max_inline_retry_after": 1})
+
+    result = await notifier.send_with_retry(make_message())
+
+    assert not result.is_successful
+    assert len(notifier.attempts) == 1
+    assert result.response_data["retry_after"] == 120
+
+
+def test_manager_shares_channel_limiter():
+    manager = NotificationManager({"rate_limits": {"discord": {"rate": 4, "burst": 2}}})
+    first = ThrottledNotifier(retry_after=1)
+    second = ThrottledNotifier(retry_after=1)
+    second.name = "second"
+    manager.register_notifier(first)
+    manager.register_notifier(second)
+
+    limiter = manager.get_channel_limiter(NotificationChannel.DISCORD)
+    assert first.rate_limiter is limiter
+    assert second.rate_limiter is limiter
+    assert limiter.rate == 4
+    assert limiter.burst == 2
+    assert "discord" in manager.get_delivery_stats()["rate_limits"]
+
+
+@pytest.mark.asyncio
+async def test_validator_limits_per_domain():
+    validator = ContactValidator(rate_limit_seconds=0.2)
+
+    def email(value):
+        return Contact(method=ContactMethod.EMAIL, value=value, confidence=ConfidenceLevel.HIGH,
+                       source_url="https://example.com")
+
+    contacts = [email("a@one.example"), email("b@two.example"), email("c@three.example")]
+
+    start = time.monotonic()
+    for contact in contacts:
+        await validator._enforce_rate_limit(contact)
+    assert time.monotonic() - start < 0.1
+
+    await validator._enforce_rate_limit(email("d@one.example"))
+    assert time.monotonic() - start >= 0.15
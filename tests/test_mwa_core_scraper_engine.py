@@ -0,0 +1,303 @@
+"""
+Tests for MWA Core ScraperEngine provider execution.
+"""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mwa_core.scraper import ScraperEngine, Listing
+
+
+def make_provider(name, delay=0.0, count=1, error=None, release=None):
+    """Create a provider class that sleeps, then returns listings or raises."""
+
+    class FakeProvider:
+        cancelled = False
+
+        def fetch_listings(self, config):
+            if release is not None:
+                release.wait(5)
+            else:
+                time.sleep(delay)
+            if error:
+                raise error
+            return [
+                Listing(title=f"{name} {i}", price="1000 €", source=name,
+                        url=f"https://example.com/{name}/{i}", timestamp=datetime.utcnow())
+                for i in range(count)
+            ]
+
+        def cancel(self):
+            type(self).cancelled = True
+            if release is not None:
+                release.set()
+
+    return FakeProvider
+
+
+class FakeRegistry:
+    def __init__(self, providers):
+        self.providers = providers
+
+    def get(self, name):
+        return self.providers.get(name)
+
+
+@pytest.fixture
+def storage():
+    storage = MagicMock()
+    storage.create_scraping_job.side_effect = lambda name: f"job-{name}"
+    with patch("mwa_core.scraper.engine.get_storage_manager", return_value=storage):
+        yield storage
+
+
+def job_updates(storage):
+    return {c.kwargs["job_id"]: c.kwargs for c in storage.update_scraping_job.call_args_list}
+
+
+def test_sequential_default(storage):
+    engine = ScraperEngine(registry=FakeRegistry({
+        "a": make_provider("a", count=2),
+        "b": make_provider("b", error=RuntimeError("boom")),
+    }))
+
+    listings = engine.scrape_all(["a", "missing", "b"], {})
+
+    assert [listing.title for listing in listings] == ["a 0", "a 1"]
+    updates = job_updates(storage)
+    assert updates["job-a"]["status"] == "completed"
+    assert updates["job-b"]["status"] == "failed"
+
+
+def test_concurrent_wall_clock_and_streaming(storage):
+    engine = ScraperEngine(
+        registry=FakeRegistry({
+            "slow": make_provider("slow", delay=0.4),
+            "fast": make_provider("fast", delay=0.1),
+            "medium": make_provider("medium", delay=0.25),
+        }),
+        max_workers=3,
+    )
+    streamed = []
+
+    def on_listings(name, listings):
+        assert threading.current_thread() is threading.main_thread()
+        streamed.append(name)
+
+    start = time.monotonic()
+    listings = engine.scrape_all(["slow", "fast", "medium"], {}, on_listings=on_listings)
+    elapsed = time.monotonic() - start
+
+    assert len(listings) == 3
+    assert streamed == ["fast", "medium", "slow"]
+    assert elapsed < 0.7  # max(provider), not sum(provider)
+
+
+def test_provider_timeout_cancels_and_fails_job(storage):
+    release = threading.Event()
+    hanging = make_provider("hanging", release=release)
+    engine = ScraperEngine(
+        registry=FakeRegistry({
+            "hanging": hanging,
+            "ok": make_provider("ok", delay=0.05),
+        }),
+        max_workers=2,
+        provider_timeout=0.3,
+    )
+
+    start = time.monotonic()
+    listings = engine.scrape_all(["hanging", "ok"], {})
+
+    assert time.monotonic() - start < 2.0
+    assert [listing.source for listing in listings] == ["ok"]
+    assert hanging.cancelled is True
+
+    updates = job_updates(storage)
+    assert updates["job-ok"]["status"] == "completed"
+    assert updates["job-hanging"]["status"] == "failed"
+    assert "timed out" in updates["job-hanging"]["errors"][0]
+
+
+def make_streaming_provider(name, pages, page_size=2, produced=None, gate=None):
+    """Create a provider yielding result pages, optionally waiting on a gate after page 1."""
+
+    class StreamingProvider:
+        def stream_listings(self, config):
+            for page in range(pages):
+                if page == 1 and gate is not None:
+                    assert gate.wait(5)
+                if produced is not None:
+                    produced.append(page)
+                yield [
+                    Listing(title=f"{name} {page}.{i}", price="1000 €", source=name,
+                            url=f"https://example.com/{name}/{page}/{i}", timestamp=datetime.utcnow())
+                    for i in range(page_size)
+                ]
+
+        def fetch_listings(self, config):
+            raise AssertionError("streaming providers are not fetched in one piece")
+
+    return StreamingProvider
+
+
+def test_stream_all_yields_pages_before_provider_finishes(storage):
+    gate = threading.Event()
+    engine = ScraperEngine(
+        registry=FakeRegistry({"paged": make_streaming_provider("paged", pages=3, gate=gate)}),
+        max_workers=2,
+    )
+
+    batches = []
+    for name, batch in engine.stream_all(["paged"], {}):
+        assert threading.current_thread() is threading.main_thread()
+        batches.append([listing.title for listing in batch])
+        # The provider only continues once the first page was consumed
+        gate.set()
+
+    assert batches == [["paged 0.0", "paged 0.1"], ["paged 1.0", "paged 1.1"], ["paged 2.0", "paged 2.1"]]
+    assert job_updates(storage)["job-paged"]["listings_found"] == 6
+
+
+def test_stream_all_bounds_buffered_batches(storage):
+    produced = []
+    engine = ScraperEngine(
+        registry=FakeRegistry({"paged": make_streaming_provider("paged", pages=20, produced=produced)}),
+        max_workers=2,
+        max_pending_batches=2,
+    )
+
+    ahead = []
+    for consumed, _ in enumerate(engine.stream_all(["paged"], {}), start=1):
+        time.sleep(0.01)
+        ahead.append(len(produced) - consumed)
+
+    assert len(produced) == 20
+    # Queue capacity plus the page the provider is trying to hand over
+    assert max(ahead) <= 3
+
+
+def test_large_results_are_split_into_micro_batches(storage):
+    engine = ScraperEngine(registry=FakeRegistry({"a": make_provider("a", count=5)}), batch_size=2)
+
+    sizes = [len(batch) for _, batch in engine.stream_all(["a"], {})]
+
+    assert sizes == [2, 2, 1]
+    assert job_updates(storage)["job-a"]["listings_found"] == 5
+
+
+@pytest.fixture
+def entry_point_registry():
+    """A fresh ProviderRegistry loading the entry points declared in pyproject.toml."""
+    import importlib.metadata
+    import tomllib
+    from pathlib import Path
+
+    from mwa_core.scraper import ProviderRegistry
+
+    pyproject = tomllib.loads((Path(__file__).parent.parent / "pyproject.toml").read_text())
+    declared = pyproject["tool"]["poetry"]["plugins"]["mwa_core.providers"]
+    entry_points = importlib.metadata.EntryPoints(
+        importlib.metadata.EntryPoint(name, value, "mwa_core.providers") for name, value in declared.items()
+    )
+
+    ProviderRegistry._instance = None
+    with patch("importlib.metadata.entry_points", return_value=entry_points):
+        yield ProviderRegistry()
+    ProviderRegistry._instance = None
+
+
+def test_registered_providers_stream_pages(storage, entry_point_registry):
+    from mwa_core.scraper.providers import ImmoScoutProvider, WgGesuchtProvider
+
+    assert entry_point_registry.get("immoscout") is ImmoScoutProvider
+    assert entry_point_registry.get("wg_gesucht") is WgGesuchtProvider
+
+    fetched = []
+
+    def fetch_page(self, url, config):
+        fetched.append(url)
+        page = 1 if "pagenumber" not in url else int(url.rsplit("=", 1)[1])
+        return [Listing(title=f"page {page}", price="1000 €", source="ImmobilienScout24",
+                        url=f"https://www.immobilienscout24.de/expose/{page}", timestamp=datetime.utcnow())]
+
+    engine = ScraperEngine(registry=entry_point_registry)
+    config = {"immoscout": {"max_pages": 2, "stop_at_known": 0, "request_delay": 0}}
+    with patch.object(ImmoScoutProvider, "_fetch_page", fetch_page):
+        stream = engine.stream_all(["immoscout"], config)
+        name, first = next(stream)
+        # The first page reaches the caller before the second one is loaded
+        assert len(fetched) == 1
+        rest = [batch for _, batch in stream]
+
+    assert name == "immoscout"
+    assert [listing.title for listing in first] == ["page 1"]
+    assert [[listing.title for listing in batch] for batch in rest] == [["page 2"]]
+    assert "provider_stats" in job_updates(storage)["job-immoscout"]["performance_metrics"]
+
+
+def test_registered_providers_stop_at_known_page(storage, entry_point_registry):
+    from mwa_core.scraper.providers import WgGesuchtProvider
+
+    fetched = []
+
+    def fetch_page(self, url, config):
+        page = int(url.rsplit(".", 2)[-2])
+        fetched.append(page)
+        return [Listing(title=f"page {page} #{i}", price="900 €", source="WG-Gesucht",
+                        url=f"https://www.wg-gesucht.de/wohnungen.{page}{i}.html", timestamp=datetime.utcnow())
+                for i in range(3)]
+
+    # The second page (index 1) only holds stored listings
+    known = {f"https://www.wg-gesucht.de/wohnungen.1{i}.html" for i in range(3)}
+    engine = ScraperEngine(registry=entry_point_registry)
+    with patch.object(WgGesuchtProvider, "_fetch_page", fetch_page), \
+            patch("mwa_core.scraper.providers.pagination.stored_listing_urls",
+                  side_effect=lambda urls: known.intersection(urls)):
+        listings = engine.scrape_all(["wg_gesucht"], {"wg_gesucht": {"max_pages": 5, "request_delay": 0}})
+
+    assert fetched == [0, 1]
+    assert len(listings) == 6
+
+
+def test_timed_out_registered_provider_stops_paginating(storage, entry_point_registry):
+    from mwa_core.scraper.providers import ImmoScoutProvider
+
+    fetched = []
+    finished = threading.Event()
+
+    def fetch_page(self, url, config):
+        page = 1 if "pagenumber" not in url else int(url.rsplit("=", 1)[1])
+        fetched.append(page)
+        if page == 2:
+            # Hangs like a stuck page load until the engine cancels the provider
+            assert self._stop.wait(5)
+            finished.set()
+        return [Listing(title=f"page {page}", price="1000 €", source="ImmobilienScout24",
+                        url=f"https://www.immobilienscout24.de/expose/{page}", timestamp=datetime.utcnow())]
+
+    engine = ScraperEngine(registry=entry_point_registry, max_workers=2, provider_timeout=0.3)
+    config = {"immoscout": {"max_pages": 5, "stop_at_known": 0, "request_delay": 0}}
+    with patch.object(ImmoScoutProvider, "_fetch_page", fetch_page):
+        listings = engine.scrape_all(["immoscout"], config)
+        assert finished.wait(5)
+        time.sleep(0.1)
+
+    assert [listing.title for listing in listings] == ["page 1"]
+    assert fetched == [1, 2]
+    assert job_updates(storage)["job-immoscout"]["status"] == "failed"
+
+
+def test_stream_all_reports_each_provider_outcome(storage):
+    engine = ScraperEngine(registry=FakeRegistry({
+        "a": make_provider("a"),
+        "b": make_provider("b", error=RuntimeError("boom")),
+    }), max_workers=2)
+    outcomes = {}
+
+    list(engine.stream_all(["a", "missing", "b"], {}, on_provider_done=outcomes.__setitem__))
+
+    assert outcomes == {"missing": "skipped", "a": "completed", "b": "failed"}
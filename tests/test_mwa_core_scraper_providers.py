@@ -0,0 +1,273 @@
+"""
+Tests for the HTTP-first fetch mode of MWA Core scraper providers.
+"""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from mwa_core.scraper.providers import ImmoScoutProvider, WgGesuchtProvider
+from mwa_core.scraper.providers.static import is_js_challenge
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+
+def serve(fixture, status_code=200):
+    """Patch the shared HTTP client to answer every request with a saved page."""
+    html = (FIXTURES / fixture).read_text(encoding="utf-8")
+    client = httpx.Client(transport=httpx.MockTransport(
+        lambda request: httpx.Response(status_code, text=html)
+    ))
+    return patch("mwa_core.scraper.providers.static.get_http_client", return_value=client)
+
+
+def no_browser():
+    return patch("mwa_core.scraper.providers.browser.driver_session",
+                 side_effect=AssertionError("browser must not be used"))
+
+
+def test_immoscout_static_fetch():
+    provider = ImmoScoutProvider()
+
+    with serve("immoscout_results.html"), no_browser():
+        listings = provider.fetch_listings({"request_delay": 0, "max_pages": 1})
+
+    assert [listing.title for listing in listings] == [
+        "Helle 2-Zimmer-Wohnung mit Balkon",
+        "Ruhige 3 Zimmer Altbauwohnung",
+    ]
+    first = listings[0]
+    assert first.url == "https://www.immobilienscout24.de/expose/148201001"
+    assert first.external_id == "148201001"
+    assert first.price.startswith("1.250 €")
+    assert first.address == "Schwabing, 80801 München"
+    assert first.size == "65 m²"
+    assert first.rooms == "2 Zi."
+    assert first.images == ["https://pictures.immobilienscout24.de/listings/148201001-0.jpg"]
+    assert provider.get_stats()["http"] == 1
+    assert provider.get_stats()["browser"] == 0
+
+
+def test_wg_gesucht_static_fetch():
+    provider = WgGesuchtProvider()
+
+    with serve("wg_gesucht_results.html"), no_browser():
+        listings = provider.fetch_listings({"request_delay": 0, "max_pages": 1})
+
+    assert len(listings) == 2
+    first = listings[0]
+    assert first.title == "Schöne 1-Zimmer-Wohnung in Sendling"
+    assert first.url == "https://www.wg-gesucht.de/wohnungen-in-Muenchen-Sendling.10987654.html"
+    assert first.external_id == "wohnungen-in-Muenchen-Sendling.10987654"
+    assert first.price == "790 €"
+    assert first.size == "32 m²"
+    assert first.available_from == "ab 01.11.2026"
+    assert listings[1].available_from is None
+    assert provider.get_stats()["last_path"] == "http"
+
+
+@pytest.mark.parametrize("fixture,status_code", [
+    ("challenge.html", 200),
+    ("immoscout_results.html", 403),
+    ("wg_gesucht_results.html", 200),  # no ImmoScout result entries
+])
+def test_falls_back_to_browser(fixture, status_code):
+    provider = ImmoScoutProvider()
+    driver = MagicMock()
+    driver.find_elements.return_value = []
+    session = MagicMock()
+    session.return_value.__enter__.return_value = driver
+
+    with serve(fixture, status_code), \
+            patch("mwa_core.scraper.providers.browser.driver_session", session):
+        listings = provider.fetch_listings({"request_delay": 0, "max_pages": 1})
+
+    assert listings == []
+    session.assert_called_once()
+    stats = provider.get_stats()
+    assert stats["fallbacks"] == 1
+    assert stats["browser"] == 1
+    assert stats["last_path"] == "browser"
+    assert stats["last_fallback_reason"]
+
+
+def test_browser_mode_skips_http():
+    provider = WgGesuchtProvider()
+    session = MagicMock()
+    session.return_value.__enter__.return_value.find_elements.return_value = []
+
+    with patch("mwa_core.scraper.providers.static.get_http_client",
+               side_effect=AssertionError("HTTP must not be used")), \
+            patch("mwa_core.scraper.providers.browser.driver_session", session):
+        provider.fetch_listings({"fetch_mode": "browser", "request_delay": 0, "max_pages": 1})
+
+    assert provider.get_stats() == {
+        "http": 0, "browser": 1, "fallbacks": 0,
+        "last_path": "browser", "last_fallback_reason": None,
+    }
+
+
+def test_cancel_quits_the_browser_without_retrying():
+    """A cancelled scrape releases its browser at once instead of retrying."""
+    import threading
+
+    from mwa_core.scraper.providers import ProviderCancelledError
+
+    provider = ImmoScoutProvider()
+    loading = threading.Event()
+    quit_called = threading.Event()
+    driver = MagicMock()
+    driver.quit.side_effect = quit_called.set
+
+    def get(url):
+        # A page load that hangs until the browser is quit
+        loading.set()
+        assert quit_called.wait(5)
+        raise RuntimeError("browser was closed")
+
+    driver.get.side_effect = get
+    session = MagicMock()
+    session.return_value.__enter__.return_value = driver
+    session.return_value.__exit__.return_value = False
+    errors = []
+
+    def scrape():
+        try:
+            provider.fetch_listings({"fetch_mode": "browser", "max_retries": 3, "request_delay": 0})
+        except Exception as e:
+            errors.append(e)
+
+    with patch("mwa_core.scraper.providers.browser.driver_session", session):
+        worker = threading.Thread(target=scrape)
+        worker.start()
+        assert loading.wait(5)
+        provider.cancel()
+        worker.join(5)
+
+    assert not worker.is_alive()
+    assert driver.quit.call_count == 1
+    assert session.call_count == 1
+    assert isinstance(errors[0], ProviderCancelledError)
+
+
+def test_cancel_interrupts_the_request_delay():
+    """The rate-limit delay after a page load returns as soon as the scrape is cancelled."""
+    import threading
+
+    from mwa_core.scraper.providers import ProviderCancelledError
+
+    provider = WgGesuchtProvider()
+    loaded = threading.Event()
+    driver = MagicMock()
+    driver.find_element.side_effect = lambda *args: loaded.set() or MagicMock()
+    session = MagicMock()
+    session.return_value.__enter__.return_value = driver
+    session.return_value.__exit__.return_value = False
+    errors = []
+
+    def scrape():
+        try:
+            provider.fetch_listings({"fetch_mode": "browser", "request_delay": 60, "max_pages": 1})
+        except Exception as e:
+            errors.append(e)
+
+    with patch("mwa_core.scraper.providers.browser.driver_session", session):
+        worker = threading.Thread(target=scrape)
+        worker.start()
+        assert loaded.wait(5)
+        provider.cancel()
+        worker.join(5)
+
+    assert not worker.is_alive()
+    assert session.call_count == 1
+    assert isinstance(errors[0], ProviderCancelledError)
+
+
+def test_challenge_detection():
+    assert is_js_challenge(503, "")
+    assert is_js_challenge(200, (FIXTURES / "challenge.html").read_text(encoding="utf-8"))
+    assert not is_js_challenge(200, (FIXTURES / "immoscout_results.html").read_text(encoding="utf-8"))
+
+
+def wg_page(page):
+    """WG-Gesucht result page ``page`` (0-based), built from the saved fixture."""
+    html = (FIXTURES / "wg_gesucht_results.html").read_text(encoding="utf-8")
+    return html.replace("10987654", f"2{page:03d}0001").replace("10987655", f"2{page:03d}0002")
+
+
+def wg_listing_urls(page):
+    """URLs of the listings on WG-Gesucht page ``page`` built by ``wg_page``."""
+    return [
+        f"https://www.wg-gesucht.de/wohnungen-in-Muenchen-{area}.2{page:03d}000{i}.html"
+        for i, area in ((1, "Sendling"), (2, "Giesing"))
+    ]
+
+
+def test_pagination_stops_at_known_listings():
+    """Steady-state cycles stop at the first known page; cold starts read all pages."""
+    from mwa_core.storage import EnhancedStorageManager
+
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        page = int(str(request.url).rsplit(".", 2)[-2])
+        return httpx.Response(200, text=wg_page(page))
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    provider = WgGesuchtProvider()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = EnhancedStorageManager(str(Path(tmp) / "listings.db"))
+        # Page 2 (index 1) only holds known listings
+        for i, url in enumerate(wg_listing_urls(1)):
+            storage.add_listing({"provider": "wg_gesucht", "title": f"Bekannte Wohnung {i}",
+                                 "url": url, "price": "900 €"})
+
+        with patch("mwa_core.scraper.providers.static.get_http_client", return_value=client), \
+                patch("mwa_core.storage.get_storage_manager", return_value=storage), \
+                no_browser():
+            steady = provider.fetch_listings({"request_delay": 0})
+            requested_steady = list(requested)
+
+            requested.clear()
+            cold = provider.fetch_listings({"request_delay": 0, "max_pages": 4, "stop_at_known": 0})
+
+    assert [url.rsplit(".", 2)[-2] for url in requested_steady] == ["0", "1"]
+    assert len(steady) == 4
+    assert [url.rsplit(".", 2)[-2] for url in requested] == ["0", "1", "2", "3"]
+    assert len(cold) == 8
+
+
+def test_crawl_pages_stops_on_repeated_page_and_tolerates_late_failures():
+    from mwa_core.scraper.providers.pagination import crawl_pages
+    from mwa_core.scraper.providers.base import Listing
+
+    def listing(n):
+        return Listing(title=str(n), price="1 €", source="test",
+                       url=f"https://example.com/{n}", timestamp=datetime.utcnow())
+
+    lookups = []
+
+    def known_urls(urls):
+        lookups.append(urls)
+        return set()
+
+    # The site repeats its last page: crawling stops without a lookup for it
+    pages = {1: [listing(1), listing(2)], 2: [listing(3)], 3: [listing(3)]}
+    result = crawl_pages(lambda p: pages.get(p, []), max_pages=10, known_urls=known_urls)
+    assert [listing.title for listing in result] == ["1", "2", "3"]
+    assert len(lookups) == 2
+
+    def failing(page):
+        if page == 2:
+            raise RuntimeError("blocked")
+        return [listing(page)]
+
+    assert [listing.title for listing in crawl_pages(failing, known_urls=known_urls)] == ["1"]
+    with pytest.raises(RuntimeError):
+        crawl_pages(lambda p: failing(p + 1), known_urls=known_urls)
@@ -363,6 +363,53 @@ class TestStorageManager:
             assert retrieved["raw_data"]["test"] == "data"
             
             Path(f.name).unlink()
+    
+    def test_existing_database_without_numeric_columns(self):
+        """Test that a database from before the numeric columns is upgraded on open."""
+        import sqlite3
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "legacy.db")
+            storage = StorageManager(path)
+            for i in range(3):
+                storage.add_listing({
+                    "provider": "immoscout",
+                    "title": f"Apartment {i}",
+                    "url": f"https://example.com/legacy{i}",
+                    "price": f"{900 + i * 100} €",
+                    "size": "60 m²",
+                    "rooms": "2"
+                })
+            storage.schema.engine.dispose()
+            
+            # Strip the database back to the schema of the first release
+            conn = sqlite3.connect(path)
+            for column in ("price_eur", "size_sqm", "rooms_num"):
+                conn.execute(f"DROP INDEX idx_listings_status_{column}")
+                conn.execute(f"ALTER TABLE listings DROP COLUMN {column}")
+            conn.execute("DROP TABLE listing_blocking_keys")
+            conn.execute("DROP TABLE schema_migrations")
+            conn.commit()
+            conn.close()
+            
+            storage = StorageManager(path)
+            listings, total = storage.get_listings_page(sort_by="price", sort_order="asc")
+            
+            assert total == 3
+            assert [listing["price_eur"] for listing in listings] == [900.0, 1000.0, 1100.0]
+            assert storage.get_listings_page(price_min=950)[1] == 2
+            
+            with storage.schema.engine.connect() as conn:
+                indexes = {row[0] for row in conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )}
+                keyed = conn.exec_driver_sql(
+                    "SELECT COUNT(DISTINCT listing_id) FROM listing_blocking_keys"
+                ).scalar()
+            storage.schema.engine.dispose()
+            
+            assert "idx_listings_status_price_eur" in indexes
+            assert keyed == 3
 
 
 class TestStorageManagerFunctions:
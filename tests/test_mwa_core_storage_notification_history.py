@@ -0,0 +1,146 @@
+"""
+Tests for the SQLite-backed notification history.
+"""
+
+import json
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, inspect
+
+from mwa_core.notifier.base import NotificationChannel, NotificationResult, NotificationStatus
+from mwa_core.storage.notification_history import NotificationHistoryEntry, NotificationHistoryManager
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+def make_entry(message_id, channel="discord", status="sent", age_hours=0.0, **kwargs):
+    return NotificationHistoryEntry(
+        message_id=message_id,
+        channel=channel,
+        status=status,
+        sent_at=datetime.now() - timedelta(hours=age_hours),
+        **kwargs
+    )
+
+
+class TestNotificationHistoryManager:
+    """Test cases for NotificationHistoryManager."""
+
+    def test_entries_roundtrip_and_indexes(self, tmp_dir):
+        """Test storing entries and looking them up by message ID and age."""
+        history = NotificationHistoryManager(str(tmp_dir / "history.db"))
+
+        history.add_result(
+            NotificationResult(message_id="m1", channel=NotificationChannel.EMAIL,
+                               status=NotificationStatus.FAILED, error_message="SMTP down",
+                               response_data={"code": 421}),
+            message_type="new_listing", message_title="Neue Wohnung", recipients=["a@example.com"]
+        )
+        history.add_entry(make_entry("m1", channel="email", status="sent", retry_count=1))
+        history.add_entry(make_entry("m2", age_hours=48))
+
+        entries = history.get_entries_by_message_id("m1")
+        assert [e.status for e in entries] == ["failed", "sent"]
+        assert entries[0].response_data == {"code": 421}
+        assert entries[0].recipients == ["a@example.com"]
+        assert entries[0].message_title == "Neue Wohnung"
+
+        assert [e.message_id for e in history.get_recent_entries(24)] == ["m1", "m1"]
+        assert len(history.get_failed_entries()) == 1
+        assert len(history) == 3
+
+        index_columns = {
+            tuple(index["column_names"])
+            for index in inspect(history.engine).get_indexes("notification_history")
+        }
+        assert {("sent_at",), ("channel", "status"), ("message_id",)} <= index_columns
+
+    def test_aggregations(self, tmp_dir):
+        """Test success rate, channel stats and summary computed in SQL."""
+        history = NotificationHistoryManager(str(tmp_dir / "history.db"))
+        for i, (channel, status) in enumerate([
+            ("discord", "sent"), ("discord", "delivered"), ("discord", "failed"),
+            ("email", "sent"), ("email", "failed"), ("slack", "pending"),
+        ]):
+            history.add_entry(make_entry(f"m{i}", channel=channel, status=status,
+                                         error_message="boom" if status == "failed" else None))
+        history.add_entry(make_entry("old", channel="email", status="failed", age_hours=72))
+
+        statements = []
+
+        def count_statement(*args):
+            statements.append(args[2])
+
+        event.listen(history.engine, "before_cursor_execute", count_statement)
+        try:
+            stats = history.get_channel_stats(24)
+        finally:
+            event.remove(history.engine, "before_cursor_execute", count_statement)
+
+        assert len(statements) == 1
+        assert "GROUP BY" in statements[0]
+        assert stats["discord"] == {"total": 3, "successful": 2, "failed": 1, "success_rate": 2 / 3}
+        assert stats["email"]["total"] == 2
+        assert stats["slack"]["successful"] == 0
+
+        assert history.get_success_rate(24) == pytest.approx(3 / 6)
+        assert history.get_success_rate(24, NotificationChannel.EMAIL) == 0.5
+        assert history.get_success_rate(24, NotificationChannel.TELEGRAM) == 0.0
+
+        summary = history.get_summary(24)
+        assert summary["total"] == 6
+        assert summary["failed"] == 3
+        assert [f["message_id"] for f in summary["recent_failures"]] == ["m2", "m4"]
+        assert history.get_summary(24 * 7)["total"] == 7
+
+    def test_retention_and_max_entries(self, tmp_dir):
+        """Test retention cleanup and amortized max_entries pruning."""
+        history = NotificationHistoryManager(str(tmp_dir / "history.db"), max_entries=5,
+                                             retention_days=1, prune_interval=4)
+        history.add_entry(make_entry("old", age_hours=48))
+        history.cleanup_old_entries()
+        assert len(history) == 0
+
+        # Pruning runs on every 4th insert ("old" was the first)
+        for i in range(6):
+            history.add_entry(make_entry(f"m{i}"))
+        assert len(history) == 6
+
+        history.add_entry(make_entry("m6"))
+        assert [e.message_id for e in history.get_all_entries()] == ["m2", "m3", "m4", "m5", "m6"]
+
+        history.clear_history()
+        assert len(history) == 0
+
+    def test_imports_legacy_json(self, tmp_dir):
+        """Test that a JSON history file is imported once and renamed."""
+        legacy = tmp_dir / "history.json"
+        legacy.write_text(json.dumps({
+            "entries": [make_entry("legacy", channel="webhook", status="failed").to_dict()]
+        }), encoding="utf-8")
+
+        history = NotificationHistoryManager(str(tmp_dir / "history.db"))
+        assert [e.message_id for e in history.get_all_entries()] == ["legacy"]
+        assert not legacy.exists()
+        assert (tmp_dir / "history.json.migrated").exists()
+
+        reopened = NotificationHistoryManager(str(tmp_dir / "history.db"))
+        assert len(reopened) == 1
+
+    def test_export_to_csv(self, tmp_dir):
+        """Test exporting all entries to CSV."""
+        history = NotificationHistoryManager(str(tmp_dir / "history.db"))
+        history.add_entry(make_entry("m1", recipients=["a@example.com", "b@example.com"]))
+
+        target = tmp_dir / "export.csv"
+        assert history.export_to_csv(str(target))
+        rows = target.read_text(encoding="utf-8").splitlines()
+        assert len(rows) == 2
+        assert "a@example.com, b@example.com" in rows[1]
@@ -13,7 +13,8 @@ from unittest.mock import patch, MagicMock
 
 from mwa_core.storage import (
     EnhancedStorageManager, get_storage_manager, reset_storage_manager,
-    ListingStatus, ContactType, ContactStatus, JobStatus, DeduplicationStatus
+    ListingStatus, ContactType, ContactStatus, JobStatus, DeduplicationStatus,
+    InvalidCursorError
 )
 
 
@@ -518,6 +519,57 @@ class TestDeduplication:
             Path(f.name).unlink()
 
 
+    def test_similarity_backends(self):
+        """Test difflib and trigram similarity backends give the same decisions."""
+        from difflib import SequenceMatcher
+
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            storage = EnhancedStorageManager(f.name)
+            engine = storage.deduplication
+
+            listing = {
+                "title": "Helle 3-Zimmer Wohnung mit Balkon",
+                "address": "Leopoldstraße 12, 80802 München",
+                "price": "1.250 €",
+                "size": "82 m²",
+                "rooms": "3"
+            }
+            candidates = [
+                dict(listing, title="Helle 3 Zimmer Wohnung mit Balkon!"),
+                dict(listing, title="Penthouse mit Dachterrasse", address="Maximilianstraße 1",
+                     price="4.800 €", size="160 m²", rooms="5"),
+            ]
+
+            # difflib backend reproduces the pairwise SequenceMatcher scores
+            engine.config["similarity_backend"] = "difflib"
+            scores = engine._calculate_similarity_scores(listing, candidates)
+            title_ratio = SequenceMatcher(
+                None, engine._normalize_text(listing["title"]),
+                engine._normalize_text(candidates[0]["title"])
+            ).ratio()
+            assert scores[0] == pytest.approx(title_ratio * 0.3 + 0.25 + 0.2 + 0.15 + 0.1)
+            assert scores == [engine._calculate_similarity_score(listing, c) for c in candidates]
+
+            for backend in ("difflib", "trigram"):
+                engine.config["similarity_backend"] = backend
+                assert engine.similarity.name == backend
+
+                scores = engine._calculate_similarity_scores(listing, candidates)
+                assert scores[0] >= engine.config["fuzzy_match_threshold"]
+                assert scores[1] < engine.config["fuzzy_match_threshold"]
+                assert engine._filter_potentially_similar(listing, candidates) == candidates[:1]
+
+                normalized = engine._normalize_listing_data(listing)
+                content = engine._calculate_content_similarities(
+                    normalized, [engine._normalize_listing_data(c) for c in candidates]
+                )
+                assert content[0] > content[1]
+
+            assert engine.similarity.ratios("abc", ["abc", "xyz"]) == [1.0, 0.0]
+
+            Path(f.name).unlink()
+
+
 class TestBackupAndRestore:
     """Test cases for backup and restore functionality."""
     
@@ -808,9 +860,311 @@ class TestAdvancedFeatures:
             # Test price filtering
             price_results = storage.crud.get_listings(max_price="1500 €")
             assert len(price_results) >= 1
-            
+
             Path(f.name).unlink()
-    
+
+    def test_listings_page_filters_sorts_and_counts(self):
+        """Test database-side price filtering, numeric sorting and total count."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            storage = EnhancedStorageManager(f.name)
+
+            for i, price in enumerate(["450 €", "900 €", "1,100 €", "1200 €", "2500 €"]):
+                storage.add_listing({
+                    "provider": "immoscout",
+                    "title": f"Page Listing {i}",
+                    "url": f"https://example.com/page{i}",
+                    "price": price
+                })
+
+            listings, total = storage.get_listings_page(
+                limit=2, price_min=500, price_max=1500,
+                sort_by="price", sort_order="asc"
+            )
+            assert total == 3
+            assert [listing["price"] for listing in listings] == ["900 €", "1,100 €"]
+
+            listings, total = storage.get_listings_page(
+                limit=2, offset=2, price_min=500, price_max=1500,
+                sort_by="price", sort_order="asc"
+            )
+            assert total == 3
+            assert [listing["price"] for listing in listings] == ["1200 €"]
+
+            # Offset past the end still reports the real total
+            listings, total = storage.get_listings_page(limit=2, offset=10)
+            assert listings == []
+            assert total == 5
+
+            # Date window excludes everything in the future
+            listings, total = storage.get_listings_page(
+                date_from=datetime.utcnow() + timedelta(days=1)
+            )
+            assert total == 0
+
+            Path(f.name).unlink()
+
+    def test_keyset_pagination(self):
+        """Test cursor pagination walks every listing exactly once."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            storage = EnhancedStorageManager(f.name)
+
+            # Listings created within the same second share a scraped_at value
+            for i in range(7):
+                storage.add_listing({
+                    "provider": "immoscout",
+                    "title": f"Cursor Listing {i}",
+                    "url": f"https://example.com/cursor{i}",
+                    "price": f"{1000 + i} €"
+                })
+
+            seen = []
+            cursor = None
+            pages = 0
+            while True:
+                listings, cursor = storage.get_listings_by_cursor(cursor=cursor, limit=3)
+                seen.extend(l["id"] for l in listings)
+                pages += 1
+                if not cursor:
+                    break
+
+            assert pages == 3
+            assert len(seen) == 7
+            assert len(set(seen)) == 7
+
+            streamed = [l["id"] for l in storage.iter_listings(batch_size=2)]
+            assert streamed == seen
+
+            runs, next_cursor = storage.get_scraping_runs_by_cursor()
+            assert runs == []
+            assert next_cursor is None
+
+            with pytest.raises(InvalidCursorError):
+                storage.get_listings_by_cursor(cursor="not-a-cursor")
+
+            Path(f.name).unlink()
+
+    def test_numeric_listing_columns(self):
+        """Test numeric price/size/rooms columns are populated on insert."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            storage = EnhancedStorageManager(f.name)
+
+            storage.add_listing({
+                "provider": "immoscout",
+                "title": "German Format Listing",
+                "url": "https://example.com/german",
+                "price": "1.250,50 €",
+                "size": "75,5 m²",
+                "rooms": "2,5"
+            })
+            storage.add_listing({
+                "provider": "immoscout",
+                "title": "Cheap Listing",
+                "url": "https://example.com/cheap",
+                "price": "950 €"
+            })
+
+            listing = storage.get_listing_by_url("https://example.com/german")
+            assert listing["price_eur"] == 1250.5
+            assert listing["size_sqm"] == 75.5
+            assert listing["rooms_num"] == 2.5
+
+            # "1.250,50 €" must not compare lexically below "950 €"
+            listings, total = storage.get_listings_page(price_min=1000)
+            assert total == 1
+            assert listings[0]["url"] == "https://example.com/german"
+
+            Path(f.name).unlink()
+
+    def test_numeric_columns_backfill_migration(self):
+        """Test migration 2.2.0 backfills numeric columns for existing rows."""
+        from sqlalchemy import text
+
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            storage = EnhancedStorageManager(f.name, auto_migrate=False)
+
+            with storage.get_session() as session:
+                for i in range(5):
+                    session.execute(text(
+                        "INSERT INTO listings (provider, title, url, price, size, rooms, scraped_at, "
+                        "updated_at, status, deduplication_status, first_seen_at, last_seen_at, view_count) "
+                        "VALUES ('legacy', :title, :url, :price, '60 m²', '2', CURRENT_TIMESTAMP, "
+                        "CURRENT_TIMESTAMP, 'ACTIVE', 'ORIGINAL', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1)"
+                    ), {"title": f"Legacy {i}", "url": f"https://example.com/legacy{i}",
+                        "price": f"1.{i}00 €"})
+                session.commit()
+
+            migration = storage.migrations._load_migration("2.2.0")
+            with storage.get_session() as session:
+                assert migration.backfill_numeric_columns(session, chunk_size=2) == 5
+                migration.upgrade(session)
+
+            listings = storage.crud.get_listings(order_by="price", order_desc=False)
+            assert [l["price_eur"] for l in listings] == [1000.0, 1100.0, 1200.0, 1300.0, 1400.0]
+            assert all(l["size_sqm"] == 60.0 and l["rooms_num"] == 2.0 for l in listings)
+
+            index_names = storage.get_database_info()["tables"]["listings"]["index_names"]
+            assert "idx_listings_status_price_eur" in index_names
+
+            Path(f.name).unlink()
+
+    def test_blocking_index_candidates(self):
+        """Test fuzzy deduplication finds candidates through the blocking index."""
+        from mwa_core.storage import ListingBlockingKey
+
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            storage = EnhancedStorageManager(f.name)
+
+            # Unrelated listings in the same price range, inserted before the original
+            for i in range(80):
+                storage.crud.create_listing({
+                    "provider": "immoscout",
+                    "title": f"Objekt Nummer {i} mit Balkon und Garten in ruhiger Lage",
+                    "url": f"https://example.com/noise{i}",
+                    "price": "1.200 €",
+                    "size": "70 m²",
+                    "rooms": "2",
+                    "address": f"Nebenweg {i}, 81{i:03d} München"
+                })
+
+            storage.crud.create_listing({
+                "provider": "immoscout",
+                "title": "Helle 3-Zimmer Altbauwohnung in Schwabing",
+                "url": "https://example.com/original",
+                "price": "1.250 €",
+                "size": "82 m²",
+                "rooms": "3",
+                "address": "Leopoldstraße 12, 80802 München"
+            })
+            original_id = storage.get_listing_by_url("https://example.com/original")["id"]
+
+            result = storage.check_duplicate({
+                "provider": "immoscout",
+                "title": "Helle 3 Zimmer Altbauwohnung in Schwabing!",
+                "url": "https://example.com/repost",
+                "price": "1250 €",
+                "size": "82 m²",
+                "rooms": "3",
+                "address": "Leopoldstraße 12, 80802 München"
+            })
+            assert result["is_duplicate"] is True
+            assert result["duplicate_strategy"] == "fuzzy_match"
+            assert result["duplicate_of_id"] == original_id
+
+            # Unrelated listings share no key and are not candidates
+            result = storage.check_duplicate({
+                "provider": "immoscout",
+                "title": "Penthouse mit Dachterrasse",
+                "url": "https://example.com/penthouse",
+                "price": "4.800 €",
+                "size": "160 m²",
+                "address": "Maximilianstraße 1, 80539 München"
+            })
+            assert result["is_duplicate"] is False
+            assert result.get("similar_listings", []) == []
+
+            # Keys follow updates and deletes
+            with storage.get_session() as session:
+                keys_before = {k.key for k in session.query(ListingBlockingKey).filter_by(listing_id=original_id)}
+            assert any(key.startswith("blk:80802:") for key in keys_before)
+
+            storage.crud.update_listing(original_id, {"price": "2.500 €"})
+            with storage.get_session() as session:
+                keys_after = {k.key for k in session.query(ListingBlockingKey).filter_by(listing_id=original_id)}
+            assert keys_after != keys_before
+
+            storage.crud.delete_listing(original_id)
+            with storage.get_session() as session:
+                assert session.query(ListingBlockingKey).filter_by(listing_id=original_id).count() == 0
+
+            Path(f.name).unlink()
+
+    def test_batch_duplicate_check_and_insert(self):
+        """Test batched duplicate check and insert with a bounded number of queries."""
+        from sqlalchemy import event
+
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            storage = EnhancedStorageManager(f.name)
+
+            storage.add_listing({
+                "provider": "immoscout",
+                "external_id": "known_1",
+                "title": "Bestehende Wohnung am Englischen Garten",
+                "url": "https://example.com/known",
+                "price": "1.500 €",
+                "size": "65 m²"
+            })
+
+            batch = [
+                {"provider": "immoscout", "title": f"Neue Wohnung Nummer {i} ruhig gelegen",
+                 "url": f"https://example.com/new{i}", "price": f"{800 + i * 40} €",
+                 "size": f"{40 + i} m²", "address": f"Weg {i}, 8{i:04d} München"}
+                for i in range(40)
+            ]
+            batch.append({"provider": "immoscout", "external_id": "known_1",
+                          "title": "Bestehende Wohnung (aktualisiert)",
+                          "url": "https://example.com/known?ref=1", "price": "1.500 €"})
+            batch.append({"provider": "immoscout", "title": "Erneut eingestellt",
+                          "url": "https://example.com/known", "price": "1.500 €"})
+            batch.append(dict(batch[0]))
+            batch.append({"provider": "immoscout", "title": "Ohne URL"})
+
+            checks = storage.check_duplicates_batch(batch)
+            assert [c["is_duplicate"] for c in checks[:40]] == [False] * 40
+            assert checks[40]["duplicate_strategy"] == "provider_external_id"
+            assert checks[41]["duplicate_strategy"] == "url_match"
+            assert checks[42]["duplicate_of_index"] == 0
+            assert checks[42]["duplicate_of_id"] is None
+
+            added = storage.add_listings_batch(batch)
+            assert added == [True] * 40 + [False] * 4
+            assert len(storage.get_listings(limit=100)) == 41
+
+            # Re-checking a scrape of known listings costs one IN query per exact strategy
+            statements = []
+
+            def count_statement(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            event.listen(storage.schema.engine, "before_cursor_execute", count_statement)
+            try:
+                checks = storage.check_duplicates_batch(batch[:40])
+            finally:
+                event.remove(storage.schema.engine, "before_cursor_execute", count_statement)
+
+            assert all(c["duplicate_strategy"] == "url_match" for c in checks)
+            assert len(statements) <= 3
+
+            Path(f.name).unlink()
+
+    def test_blocking_index_backfill_migration(self):
+        """Test migration 2.3.0 builds blocking keys for listings without them."""
+        from sqlalchemy import text
+        from mwa_core.storage import ListingBlockingKey
+
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            storage = EnhancedStorageManager(f.name, auto_migrate=False)
+
+            for i in range(3):
+                storage.crud.create_listing({
+                    "provider": "immoscout",
+                    "title": f"Wohnung {i}",
+                    "url": f"https://example.com/{i}",
+                    "price": "900 €"
+                })
+
+            with storage.get_session() as session:
+                session.execute(text("DELETE FROM listing_blocking_keys"))
+                session.commit()
+
+            migration = storage.migrations._load_migration("2.3.0")
+            with storage.get_session() as session:
+                assert migration.backfill_blocking_keys(session, chunk_size=2) == 3
+                migration.upgrade(session)
+                indexed = session.query(ListingBlockingKey.listing_id).distinct().count()
+            assert indexed == 3
+
+            Path(f.name).unlink()
+
     def test_contact_validation(self):
         """Test contact validation functionality."""
         with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
@@ -11,4 +11,72 @@ def test_orchestrator_runs_providers():
         "wg_gesucht": {"headless": True},
     }
     new = orch.run(["immoscout", "wg_gesucht"], config)
-    assert isinstance(new, int)
\ No newline at end of file
+    assert isinstance(new, int)
+
+def test_settings_reach_the_provider_driver_session():
+    from unittest.mock import MagicMock, patch
+
+    from mwa_core.config.settings import Settings
+    from mwa_core.scraper.providers import ImmoScoutProvider
+
+    settings = Settings()
+    settings.scraper.driver_pool_size = 5
+    settings.scraper.driver_max_uses = 7
+    settings.scraper.fetch_mode = "browser"
+    settings.scraper.request_delay_seconds = 0.1
+    settings.contact_discovery.enabled = False
+
+    registry = MagicMock()
+    registry.get.return_value = ImmoScoutProvider
+    driver = MagicMock()
+    driver.find_elements.return_value = []
+    session = MagicMock()
+    session.return_value.__enter__.return_value = driver
+
+    orch = Orchestrator(scraper=ScraperEngine(registry=registry), storage_manager=MagicMock(),
+                        settings=settings)
+    with patch.object(Orchestrator, "_create_notification_manager", return_value=None), \
+            patch("mwa_core.scraper.engine.get_storage_manager"), \
+            patch("mwa_core.scraper.providers.browser.driver_session", session), \
+            patch("mwa_core.scraper.providers.browser.fetch_static_items",
+                  side_effect=AssertionError("fetch_mode must be honoured")):
+        orch.run(["immoscout"], {"immoscout": {"driver_max_uses": 9}})
+
+    kwargs = session.call_args.kwargs
+    assert kwargs["pool_size"] == 5
+    assert kwargs["max_uses"] == 9
+    assert kwargs["user_agent"] == settings.scraper.user_agent
+
+
+def test_streamed_listings_are_stored_under_their_provider(tmp_path):
+    from unittest.mock import MagicMock, patch
+
+    from mwa_core.config.settings import Settings
+    from mwa_core.storage import EnhancedStorageManager
+
+    class StreamingProvider:
+        def stream_listings(self, config):
+            titles = ["Altbau in Schwabing", "Penthouse am Westpark", "WG-Zimmer in Giesing"]
+            yield [
+                Listing(title=title, price=f"{700 + i * 600} €", source="ImmobilienScout24",
+                        url=f"https://example.com/expose/{i}", timestamp=datetime.now())
+                for i, title in enumerate(titles)
+            ]
+
+    settings = Settings()
+    settings.contact_discovery.enabled = False
+    storage = EnhancedStorageManager(str(tmp_path / "listings.db"))
+    registry = MagicMock()
+    registry.get.return_value = StreamingProvider
+
+    orch = Orchestrator(scraper=ScraperEngine(registry=registry), storage_manager=storage,
+                        settings=settings)
+    with patch.object(Orchestrator, "_create_notification_manager", return_value=None), \
+            patch("mwa_core.scraper.engine.get_storage_manager", return_value=storage):
+        new = orch.run(["immoscout"], {})
+
+    listings, total = storage.get_listings_page(provider="immoscout")
+    assert new == 3
+    assert total == 3
+    assert {listing["url"] for listing in listings} == {f"https://example.com/expose/{i}" for i in range(3)}
+    storage.schema.engine.dispose()
@@ -1,7 +1,22 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
 import pytest
 from mwa_core.scraper import ProviderRegistry, Listing
 from mwa_core.providers import ImmoScoutProvider, WGGesuchtProvider
 
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+
+def serve(fixture):
+    """Answer the providers' HTTP requests with a saved results page, so no browser starts."""
+    html = (FIXTURES / fixture).read_text(encoding="utf-8")
+    client = httpx.Client(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, text=html)
+    ))
+    return patch("mwa_core.scraper.providers.static.get_http_client", return_value=client)
+
 
 def test_registry_singleton():
     r1 = ProviderRegistry()
@@ -24,8 +39,10 @@ def test_registry_instantiate():
 
 def test_immoscout_provider_returns_listings():
     provider = ImmoScoutProvider()
-    listings = provider.fetch_listings({"headless": True})
+    with serve("immoscout_results.html"):
+        listings = provider.fetch_listings({"headless": True, "request_delay": 0, "max_pages": 1})
     assert isinstance(listings, list)
+    assert listings
     for listing in listings:
         assert isinstance(listing, Listing)
         assert listing.source == "ImmobilienScout24"
@@ -33,8 +50,10 @@ def test_immoscout_provider_returns_listings():
 
 def test_wg_gesucht_provider_returns_listings():
     provider = WGGesuchtProvider()
-    listings = provider.fetch_listings({"headless": True})
+    with serve("wg_gesucht_results.html"):
+        listings = provider.fetch_listings({"headless": True, "request_delay": 0, "max_pages": 1})
     assert isinstance(listings, list)
+    assert listings
     for listing in listings:
         assert isinstance(listing, Listing)
-        assert listing.source == "WG Gesucht"
\ No newline at end of file
+        assert listing.source == "WG-Gesucht"
\ No newline at end of file